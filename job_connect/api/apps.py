@@ -0,0 +1,9 @@
+from django.apps import AppConfig
+
+
+class ApiConfig(AppConfig):
+    """
+    Configuration class for the read-only JSON API.
+    """
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'api'
@@ -0,0 +1,104 @@
+"""
+Resource definitions for the JSON API.
+
+Each resource maps public field names to ORM lookups so responses can be
+built with ``.values()`` (no model instances) and clients can ask for a
+sparse subset of fields with ``fields=``.
+"""
+from applicant.models import Skill
+from job.models import Job
+from recruiter.models import RecruiterProfile
+
+
+class Resource:
+    """
+    Describes how a model is exposed through the API.
+
+    Args:
+        model (django.db.models.Model): The model being exposed.
+        fields (dict): Public field name to ORM lookup (``values()`` expression).
+        default_fields (list): Fields returned when ``fields=`` is not given.
+        many_fields (dict): Public field name to a callable ``(ids) -> {id: [values]}``
+            used for to-many relations, fetched with one extra query per field.
+        queryset (callable, optional): Returns the base queryset; defaults to all rows.
+    """
+
+    def __init__(self, model, fields, default_fields, many_fields=None, queryset=None):
+        self.model = model
+        self.fields = fields
+        self.default_fields = default_fields
+        self.many_fields = many_fields or {}
+        self._queryset = queryset
+
+    @property
+    def allowed_fields(self):
+        """
+        Returns every field name a client may request.
+        """
+        return list(self.fields) + list(self.many_fields)
+
+    def get_queryset(self):
+        """
+        Returns the base queryset for the resource.
+        """
+        if self._queryset is not None:
+            return self._queryset()
+        return self.model.objects.all()
+
+
+def _job_skill_names(job_ids):
+    """
+    Fetches required skill names for a set of jobs in a single query.
+    """
+    rows = Job.skills_required.through.objects.filter(job_id__in=job_ids).values_list('job_id', 'skill__name')
+    skills = {}
+    for job_id, name in rows.order_by('skill__name'):
+        skills.setdefault(job_id, []).append(name)
+    return skills
+
+
+JOBS = Resource(
+    model=Job,
+    fields={
+        'id': 'id',
+        'title': 'title',
+        'description': 'description',
+        'requirements': 'requirements',
+        'location': 'location',
+        'latitude': 'latitude',
+        'longitude': 'longitude',
+        'salary_range': 'salary_range',
+        'employment_type': 'employment_type',
+        'posted_date': 'posted_date',
+        'application_deadline': 'application_deadline',
+        'is_active': 'is_active',
+        'updated_at': 'updated_at',
+        'recruiter': 'recruiter_id',
+        'company_name': 'recruiter__company_name',
+    },
+    default_fields=['id', 'title', 'location', 'company_name', 'employment_type', 'posted_date'],
+    many_fields={'skills': _job_skill_names},
+)
+
+RECRUITERS = Resource(
+    model=RecruiterProfile,
+    fields={
+        'id': 'id',
+        'company_name': 'company_name',
+        'company_website': 'company_website',
+        'description': 'description',
+        'location': 'location',
+        'updated_at': 'updated_at',
+    },
+    default_fields=['id', 'company_name', 'location'],
+    queryset=lambda: RecruiterProfile.objects.complete(),
+)
+
+SKILLS = Resource(
+    model=Skill,
+    fields={
+        'id': 'id',
+        'name': 'name',
+    },
+    default_fields=['id', 'name'],
+)
@@ -0,0 +1,164 @@
+from django.test import TestCase
+from django.urls import reverse
+from django.contrib.auth import get_user_model
+from applicant.models import Skill
+from job.models import Job
+from recruiter.models import RecruiterProfile
+from api.views import encode_cursor
+
+User = get_user_model()
+
+
+class JobApiTest(TestCase):
+    """
+    Tests for the job endpoints of the JSON API.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        """
+        Set up a recruiter with five jobs, two of them with skills.
+        """
+        user = User.objects.create_user(username='apiuser', password='testpassword')
+        cls.recruiter = RecruiterProfile.objects.create(user=user, company_name='API Corp', location='Denver')
+        cls.python = Skill.objects.create(name='Python')
+        cls.sql = Skill.objects.create(name='SQL')
+        cls.jobs = [
+            Job.objects.create(recruiter=cls.recruiter, title=f'Job {i}', description='Work.', location='Denver')
+            for i in range(5)
+        ]
+        cls.jobs[0].skills_required.add(cls.python, cls.sql)
+        cls.jobs[1].skills_required.add(cls.sql)
+
+    def test_list_default_fields(self):
+        """
+        Test that the list endpoint returns the default fieldset newest first.
+        """
+        response = self.client.get(reverse('api:jobs_list'))
+        self.assertEqual(response.status_code, 200)
+        data = response.json()['data']
+        self.assertEqual([row['id'] for row in data], [job.pk for job in reversed(self.jobs)])
+        self.assertEqual(data[0]['company_name'], 'API Corp')
+        self.assertNotIn('description', data[0])
+
+    def test_list_sparse_fieldset(self):
+        """
+        Test that ``fields=`` limits the keys in each row.
+        """
+        response = self.client.get(reverse('api:jobs_list'), {'fields': 'title,location'})
+        self.assertEqual(set(response.json()['data'][0]), {'id', 'title', 'location'})
+
+    def test_list_unknown_field(self):
+        """
+        Test that unknown fields are rejected with a 400.
+        """
+        response = self.client.get(reverse('api:jobs_list'), {'fields': 'title,password'})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('password', response.json()['error'])
+
+    def test_cursor_pagination(self):
+        """
+        Test that following ``next_cursor`` walks every job exactly once.
+        """
+        seen = []
+        params = {'limit': 2, 'fields': 'id'}
+        while True:
+            payload = self.client.get(reverse('api:jobs_list'), params).json()
+            seen += [row['id'] for row in payload['data']]
+            if not payload['next_cursor']:
+                break
+            params['cursor'] = payload['next_cursor']
+        self.assertEqual(seen, [job.pk for job in reversed(self.jobs)])
+
+    def test_invalid_cursor(self):
+        """
+        Test that a malformed cursor is a 400.
+        """
+        response = self.client.get(reverse('api:jobs_list'), {'cursor': '!!!'})
+        self.assertEqual(response.status_code, 400)
+
+    def test_out_of_range_ids(self):
+        """
+        Test that cursors and batch ids outside the primary key range are a 400, not a database error.
+        """
+        for value in (2 ** 63, 10 ** 30, 0, -1):
+            response = self.client.get(reverse('api:jobs_list'), {'cursor': encode_cursor(value)})
+            self.assertEqual(response.status_code, 400)
+            response = self.client.get(reverse('api:jobs_batch'), {'ids': f'{self.jobs[0].pk},{value}'})
+            self.assertEqual(response.status_code, 400)
+        self.assertEqual(self.client.get(reverse('api:jobs_list'), {'cursor': encode_cursor(2 ** 63 - 1)}).status_code, 200)
+
+    def test_skills_are_fetched_in_one_extra_query(self):
+        """
+        Test that the skills field costs one query regardless of page size.
+        """
+        with self.assertNumQueries(2):
+            response = self.client.get(reverse('api:jobs_list'), {'fields': 'title,skills'})
+        rows = {row['id']: row for row in response.json()['data']}
+        self.assertEqual(rows[self.jobs[0].pk]['skills'], ['Python', 'SQL'])
+        self.assertEqual(rows[self.jobs[2].pk]['skills'], [])
+
+    def test_batch_get(self):
+        """
+        Test that the batch endpoint returns rows in request order in a single query.
+        """
+        ids = [self.jobs[3].pk, self.jobs[0].pk, 999999]
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse('api:jobs_batch'), {'ids': ','.join(map(str, ids)), 'fields': 'title'})
+        payload = response.json()
+        self.assertEqual([row['id'] for row in payload['data']], ids[:2])
+        self.assertEqual(payload['missing'], [999999])
+
+    def test_batch_requires_ids(self):
+        """
+        Test that the batch endpoint validates ``ids``.
+        """
+        self.assertEqual(self.client.get(reverse('api:jobs_batch')).status_code, 400)
+        self.assertEqual(self.client.get(reverse('api:jobs_batch'), {'ids': '1,x'}).status_code, 400)
+
+    def test_detail(self):
+        """
+        Test the detail endpoint and its 404.
+        """
+        response = self.client.get(reverse('api:jobs_detail', kwargs={'pk': self.jobs[0].pk}), {'fields': 'title,recruiter'})
+        self.assertEqual(response.json()['data'], {'id': self.jobs[0].pk, 'title': 'Job 0', 'recruiter': self.recruiter.pk})
+        response = self.client.get(reverse('api:jobs_detail', kwargs={'pk': 999999}))
+        self.assertEqual(response.status_code, 404)
+
+    def test_read_only(self):
+        """
+        Test that write methods are not allowed.
+        """
+        response = self.client.post(reverse('api:jobs_list'), {'title': 'x'})
+        self.assertEqual(response.status_code, 405)
+
+
+class RecruiterAndSkillApiTest(TestCase):
+    """
+    Tests for the recruiter and skill endpoints.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        """
+        Set up a recruiter and a skill.
+        """
+        user = User.objects.create_user(username='apirecruiter', password='testpassword')
+        cls.recruiter = RecruiterProfile.objects.create(user=user, company_name='Acme', location='Boston')
+        cls.skill = Skill.objects.create(name='Go')
+
+    def test_recruiter_list_does_not_expose_user(self):
+        """
+        Test that recruiter rows only contain public company fields.
+        """
+        data = self.client.get(reverse('api:recruiters_list')).json()['data']
+        self.assertEqual(data, [{'id': self.recruiter.pk, 'company_name': 'Acme', 'location': 'Boston'}])
+        response = self.client.get(reverse('api:recruiters_list'), {'fields': 'user'})
+        self.assertEqual(response.status_code, 400)
+
+    def test_skill_batch(self):
+        """
+        Test batch fetching skills.
+        """
+        payload = self.client.get(reverse('api:skills_batch'), {'ids': str(self.skill.pk)}).json()
+        self.assertEqual(payload['data'], [{'id': self.skill.pk, 'name': 'Go'}])
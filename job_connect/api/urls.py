@@ -0,0 +1,12 @@
+from django.urls import path
+from api import views
+
+app_name = 'api'
+
+urlpatterns = []
+for name, resource in views.RESOURCES.items():
+    urlpatterns += [
+        path(f'{name}/', views.ResourceListView.as_view(resource=resource), name=f'{name}_list'),
+        path(f'{name}/batch/', views.ResourceBatchView.as_view(resource=resource), name=f'{name}_batch'),
+        path(f'{name}/<int:pk>/', views.ResourceDetailView.as_view(resource=resource), name=f'{name}_detail'),
+    ]
@@ -0,0 +1,216 @@
+import base64
+import binascii
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import JsonResponse
+from django.views import View
+from api.resources import JOBS, RECRUITERS, SKILLS
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+MAX_BATCH_SIZE = 100
+MAX_ID = 2 ** 63 - 1
+"""Largest primary key a ``BigAutoField`` can hold; larger values overflow in the query."""
+
+
+class ApiError(Exception):
+    """
+    Raised for client errors; rendered as a JSON error body.
+
+    Args:
+        message (str): Human readable description of the problem.
+        status (int): HTTP status code to respond with.
+    """
+
+    def __init__(self, message, status=400):
+        super().__init__(message)
+        self.message = message
+        self.status = status
+
+
+def api_response(payload, status=200):
+    """
+    Serializes a payload as compact JSON.
+
+    Args:
+        payload (dict): The response body.
+        status (int): HTTP status code.
+
+    Returns:
+        django.http.JsonResponse: The response.
+    """
+    return JsonResponse(payload, status=status, encoder=DjangoJSONEncoder,
+                        json_dumps_params={'separators': (',', ':')})
+
+
+def valid_id(pk):
+    """
+    Returns whether an integer is within the primary key range.
+    """
+    return 0 < pk <= MAX_ID
+
+
+def encode_cursor(last_id):
+    """
+    Encodes the last returned primary key as an opaque cursor.
+    """
+    return base64.urlsafe_b64encode(str(last_id).encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor):
+    """
+    Decodes a cursor produced by ``encode_cursor``.
+
+    Raises:
+        ApiError: If the cursor is malformed or out of the primary key range.
+    """
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        last_id = int(base64.urlsafe_b64decode(padded.encode()).decode())
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise ApiError('Invalid cursor.')
+    if not valid_id(last_id):
+        raise ApiError('Invalid cursor.')
+    return last_id
+
+
+class ResourceView(View):
+    """
+    Base class for read-only API views over a ``api.resources.Resource``.
+    """
+    resource = None
+    http_method_names = ['get', 'head', 'options']
+
+    def dispatch(self, request, *args, **kwargs):
+        """
+        Converts ``ApiError`` into JSON error responses.
+        """
+        try:
+            return super().dispatch(request, *args, **kwargs)
+        except ApiError as error:
+            return api_response({'error': error.message}, status=error.status)
+
+    def get_fields(self):
+        """
+        Parses the ``fields=`` sparse fieldset parameter.
+
+        Returns:
+            list: The requested public field names, ``id`` always first.
+
+        Raises:
+            ApiError: If an unknown field is requested.
+        """
+        raw = self.request.GET.get('fields')
+        if not raw:
+            fields = list(self.resource.default_fields)
+        else:
+            fields = [name.strip() for name in raw.split(',') if name.strip()]
+            unknown = sorted(set(fields) - set(self.resource.allowed_fields))
+            if unknown:
+                raise ApiError(f"Unknown field(s): {', '.join(unknown)}. "
+                               f"Allowed: {', '.join(self.resource.allowed_fields)}.")
+        if 'id' in fields:
+            fields.remove('id')
+        return ['id'] + list(dict.fromkeys(fields))
+
+    def serialize(self, queryset, fields):
+        """
+        Fetches rows as tuples via ``values_list`` and shapes them into dicts.
+
+        Args:
+            queryset (django.db.models.query.QuerySet): Rows to serialize.
+            fields (list): Public field names to include.
+
+        Returns:
+            list: One dict per row.
+        """
+        scalar = [name for name in fields if name in self.resource.fields]
+        rows = [dict(zip(scalar, row)) for row in
+                queryset.values_list(*[self.resource.fields[name] for name in scalar])]
+        ids = [row['id'] for row in rows]
+        for name in fields:
+            if name in self.resource.many_fields:
+                related = self.resource.many_fields[name](ids) if ids else {}
+                for row in rows:
+                    row[name] = related.get(row['id'], [])
+        return rows
+
+
+class ResourceListView(ResourceView):
+    """
+    Lists a resource newest first with cursor pagination.
+
+    Query parameters: ``fields``, ``limit`` (max 200) and ``cursor`` (from ``next_cursor``).
+    """
+
+    def get(self, request):
+        """
+        Handles GET requests.
+        """
+        fields = self.get_fields()
+        try:
+            limit = min(max(int(request.GET.get('limit', DEFAULT_PAGE_SIZE)), 1), MAX_PAGE_SIZE)
+        except ValueError:
+            raise ApiError('limit must be an integer.')
+        queryset = self.resource.get_queryset().order_by('-pk')
+        cursor = request.GET.get('cursor')
+        if cursor:
+            queryset = queryset.filter(pk__lt=decode_cursor(cursor))
+        rows = self.serialize(queryset[:limit + 1], fields)
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        return api_response({
+            'data': rows,
+            'next_cursor': encode_cursor(rows[-1]['id']) if has_more else None,
+        })
+
+
+class ResourceBatchView(ResourceView):
+    """
+    Fetches up to 100 objects by id in one query: ``?ids=1,2,3``.
+
+    Results follow the order of ``ids``; unknown ids are listed under ``missing``.
+    """
+
+    def get(self, request):
+        """
+        Handles GET requests.
+        """
+        fields = self.get_fields()
+        try:
+            ids = list(dict.fromkeys(int(pk) for pk in request.GET.get('ids', '').split(',') if pk.strip()))
+        except ValueError:
+            raise ApiError('ids must be a comma separated list of integers.')
+        if not all(valid_id(pk) for pk in ids):
+            raise ApiError(f'ids must be between 1 and {MAX_ID}.')
+        if not ids:
+            raise ApiError('ids is required.')
+        if len(ids) > MAX_BATCH_SIZE:
+            raise ApiError(f'At most {MAX_BATCH_SIZE} ids per request.')
+        found = {row['id']: row for row in self.serialize(self.resource.get_queryset().filter(pk__in=ids), fields)}
+        return api_response({
+            'data': [found[pk] for pk in ids if pk in found],
+            'missing': [pk for pk in ids if pk not in found],
+        })
+
+
+class ResourceDetailView(ResourceView):
+    """
+    Returns a single object by id.
+    """
+
+    def get(self, request, pk):
+        """
+        Handles GET requests.
+        """
+        rows = self.serialize(self.resource.get_queryset().filter(pk=pk), self.get_fields()) if valid_id(pk) else []
+        if not rows:
+            raise ApiError('Not found.', status=404)
+        return api_response({'data': rows[0]})
+
+
+RESOURCES = {
+    'jobs': JOBS,
+    'recruiters': RECRUITERS,
+    'skills': SKILLS,
+}
@@ -1,3 +1,19 @@
-#from django.contrib import admin
+from django.contrib import admin
+from applicant.models import Skill, SkillAlias
 
-# Register your models here.
+
+class SkillAliasInline(admin.TabularInline):
+    """
+    Edits the aliases of a skill on the skill's admin page.
+    """
+    model = SkillAlias
+    extra = 1
+
+
+@admin.register(Skill)
+class SkillAdmin(admin.ModelAdmin):
+    """
+    Admin for the skill taxonomy.
+    """
+    search_fields = ['name', 'aliases__alias']
+    inlines = [SkillAliasInline]
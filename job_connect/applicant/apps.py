@@ -7,3 +7,9 @@ class ApplicantConfig(AppConfig):
     """
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'applicant'
+
+    def ready(self):
+        """
+        Registers signal handlers.
+        """
+        from applicant import signals  # noqa: F401
@@ -1,8 +1,74 @@
 from django import forms
-from applicant.models import ApplicantProfile, Experience, Education
+from applicant.models import ApplicantProfile, Experience, Education, Skill
+from applicant.skills import canonical_skill_ids, get_or_create_skill, split_skill_names
 from django.forms.models import inlineformset_factory
 
-class ApplicantProfileForm(forms.ModelForm):
+
+class SkillInputMixin:
+    """
+    Routes a model form's skills through the skill resolver.
+
+    Adds a ``new_skills`` text field for skills missing from the list. When the
+    form is otherwise valid, chosen duplicates and aliases are replaced by
+    their canonical skill and typed names are matched to existing skills or
+    aliases, so ``cleaned_data`` only ever holds canonical skills. Validation
+    does not write: names that match nothing are created by
+    ``create_new_skills`` when the form is saved, inside the saving transaction.
+
+    Attributes:
+        skills_field (str): Name of the many-to-many skills field.
+        new_skill_names (list): Typed names that match no skill or alias yet.
+    """
+    skills_field = 'skills'
+
+    def __init__(self, *args, **kwargs):
+        """
+        Adds the ``new_skills`` field.
+        """
+        super().__init__(*args, **kwargs)
+        self.fields['new_skills'] = forms.CharField(
+            required=False, help_text='Other skills, separated by commas.',
+        )
+        self.new_skill_names = []
+
+    def clean(self):
+        """
+        Replaces the chosen and typed skills with their existing canonical skills.
+        """
+        cleaned_data = super().clean()
+        self.new_skill_names = []
+        if not self.errors:
+            skill_ids, self.new_skill_names = canonical_skill_ids(
+                cleaned_data.get(self.skills_field) or (), split_skill_names(cleaned_data.get('new_skills', '')),
+            )
+            cleaned_data[self.skills_field] = Skill.objects.filter(pk__in=skill_ids)
+        return cleaned_data
+
+    def create_new_skills(self):
+        """
+        Creates the typed skills that matched nothing and adds them to ``cleaned_data``.
+
+        Call it inside the transaction that saves the form.
+
+        Returns:
+            set: Primary keys of the added skills.
+        """
+        skill_ids = {get_or_create_skill(name).pk for name in self.new_skill_names}
+        self.new_skill_names = []
+        if skill_ids:
+            chosen = {skill.pk for skill in self.cleaned_data[self.skills_field]}
+            self.cleaned_data[self.skills_field] = Skill.objects.filter(pk__in=chosen | skill_ids)
+        return skill_ids
+
+    def _save_m2m(self):
+        """
+        Creates the typed skills before the many-to-many links are saved.
+        """
+        self.create_new_skills()
+        super()._save_m2m()
+
+
+class ApplicantProfileForm(SkillInputMixin, forms.ModelForm):
     """
         Form for creating or updating an ApplicantProfile.
 
@@ -13,6 +79,8 @@ class ApplicantProfileForm(forms.ModelForm):
 
             skills (MultipleChoiceField):  The applicant's skills.
 
+            new_skills (CharField):  Other skills, separated by commas.
+
             resume (FileField):  The applicant's resume.
 
         """
@@ -0,0 +1,49 @@
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from applicant.recommendations import DEFAULT_CHUNK_SIZE, DEFAULT_TOP_N, build_digests
+
+
+class Command(BaseCommand):
+    """
+    Builds the nightly job recommendation digest for every applicant.
+
+    Intended to run from cron once a night, e.g.
+    ``python manage.py build_recommendations --top 10``.
+    """
+    help = 'Compute top-N new job recommendations for every applicant by skill overlap.'
+
+    def add_arguments(self, parser):
+        """
+        Adds command line arguments.
+
+        Args:
+            parser (argparse.ArgumentParser): The argument parser.
+        """
+        parser.add_argument('--top', type=int, default=DEFAULT_TOP_N, help='Recommendations kept per applicant.')
+        parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE, help='Applicants scored per chunk.')
+        parser.add_argument('--workers', type=int, default=None, help='Worker processes (default: all CPUs).')
+        parser.add_argument('--notify-from', metavar='USERNAME',
+                            help='Send each matched applicant a message from this user (requires the messaging app).')
+
+    def handle(self, *args, **options):
+        """
+        Runs the digest and prints run statistics.
+        """
+        sender = None
+        if options['notify_from']:
+            try:
+                sender = get_user_model().objects.get(username=options['notify_from'])
+            except get_user_model().DoesNotExist:
+                raise CommandError(f"User '{options['notify_from']}' does not exist.")
+
+        stats = build_digests(
+            top_n=options['top'],
+            chunk_size=options['chunk_size'],
+            workers=options['workers'],
+            sender=sender,
+        )
+        rate = stats['applicants'] / stats['seconds'] if stats['seconds'] else 0
+        self.stdout.write(self.style.SUCCESS(
+            f"Scored {stats['applicants']} applicants against {stats['jobs']} new jobs in {stats['seconds']:.1f}s "
+            f"({rate:,.0f} applicants/s); {stats['matched']} matched, {stats['recommendations']} recommendations stored."
+        ))
@@ -0,0 +1,45 @@
+from django.core.management.base import BaseCommand
+from applicant.models import Skill
+from applicant.skills import add_default_aliases, merge_skills
+
+
+class Command(BaseCommand):
+    """
+    Merges duplicate skills into their canonical skill.
+
+    Skills whose names normalize to the same string, or that match an alias
+    of another skill, are folded into the oldest (or aliased) skill; their
+    links from profiles, jobs and applications are rewritten in bulk and
+    their names are kept as aliases.
+    """
+    help = 'Merge duplicate and aliased skills into canonical skills.'
+
+    def add_arguments(self, parser):
+        """
+        Adds command line arguments.
+
+        Args:
+            parser (argparse.ArgumentParser): The argument parser.
+        """
+        parser.add_argument('--dry-run', action='store_true', help='Only list the merges that would happen.')
+        parser.add_argument('--default-aliases', action='store_true',
+                            help='First add the built-in aliases (py, golang, k8s, ...) for existing skills.')
+
+    def handle(self, *args, **options):
+        """
+        Plans and applies the merges.
+        """
+        if options['default_aliases'] and not options['dry_run']:
+            self.stdout.write(f'Added {add_default_aliases()} default aliases.')
+
+        stats = merge_skills(dry_run=options['dry_run'])
+        merges = stats['merges']
+        names = dict(Skill.objects.filter(pk__in=set(merges.values())).values_list('pk', 'name'))
+        for duplicate, canonical in sorted(merges.items()):
+            self.stdout.write(f'  skill {duplicate} -> {names.get(canonical, canonical)}')
+        if options['dry_run']:
+            self.stdout.write(f'{len(merges)} skills would be merged.')
+        else:
+            self.stdout.write(self.style.SUCCESS(
+                f"Merged {len(merges)} skills; rewrote links for {stats['applicants']} applicants, "
+                f"{stats['jobs']} jobs and {stats['applications']} applications."))
@@ -0,0 +1,37 @@
+# Generated by Django 5.2 on 2026-10-19 10:02
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applicant', '0002_alter_applicantprofile_headline_and_more'),
+        ('applicant', '0002_initial'),
+        ('applicant', '0002_skill_alter_applicantprofile_headline_and_more'),
+        ('job', '0003_job_geo'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='applicantprofile',
+            name='last_digest_at',
+            field=models.DateTimeField(blank=True, editable=False, null=True),
+        ),
+        migrations.CreateModel(
+            name='JobRecommendation',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('score', models.PositiveIntegerField()),
+                ('applicant', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='recommendations', to='applicant.applicantprofile')),
+                ('job', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='job.job')),
+            ],
+            options={
+                'ordering': ['-score', '-created_at'],
+                'unique_together': {('applicant', 'job')},
+            },
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 5.2 on 2026-10-19 13:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applicant', '0003_applicantprofile_last_digest_at_jobrecommendation'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CandidateSearchDocument',
+            fields=[
+                ('applicant_id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('content', models.TextField()),
+                ('indexed_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='CandidateTerm',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('term', models.CharField(max_length=64)),
+                ('applicant_id', models.BigIntegerField(db_index=True)),
+            ],
+            options={
+                'unique_together': {('term', 'applicant_id')},
+            },
+        ),
+    ]
@@ -1,6 +1,7 @@
+from django.core.exceptions import ValidationError
 from django.db import models
 from django.conf import settings
-from core.models import BaseModel
+from core.models import BaseModel, ProfileQuerySet
 
 
 class ApplicantProfile(BaseModel):
@@ -15,6 +16,7 @@ class ApplicantProfile(BaseModel):
             experience (ManyToManyField): Many-to-many relationship with the Experience model.
             education (ManyToManyField): Many-to-many relationship with the Education model.
             resume (FileField): Applicant's resume file.
+            last_digest_at (DateTimeField): When job recommendations were last computed for this applicant.
         """
 
     user = models.OneToOneField(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='applicant_profile')
@@ -24,14 +26,29 @@ class ApplicantProfile(BaseModel):
     experience = models.ManyToManyField('Experience', blank=True)
     education = models.ManyToManyField('Education', blank=True) # :no-index:
     resume = models.FileField(upload_to='resumes/', blank=True, null=True)
+    last_digest_at = models.DateTimeField(null=True, blank=True, editable=False)
     # :no-index: Add other relevant fields like location, contact information, etc.
 
+    COMPLETE_FIELD = 'headline'
+
+    objects = ProfileQuerySet.as_manager()
+
     def __str__(self):
         """
         Returns the username of the associated user.
         """
         return self.user.username
 
+    @property
+    def is_complete(self):
+        """
+        Whether the profile has been filled in; signup creates it empty.
+
+        Returns:
+            bool: True once the headline is set.
+        """
+        return bool(getattr(self, self.COMPLETE_FIELD))
+
 
 class Skill(BaseModel):
     """
@@ -42,12 +59,47 @@ class Skill(BaseModel):
     """
     name = models.CharField(max_length=100, unique=True, db_index=True)
 
+    def clean(self):
+        """
+        Rejects names that already resolve to another skill, e.g. "python3" when "Python" exists.
+        """
+        from applicant.skills import resolve_skill
+        existing = resolve_skill(self.name)
+        if existing is not None and existing != self.pk:
+            raise ValidationError({'name': 'This skill already exists under another name or alias.'})
+
     def __str__(self):
         """
         Returns the name of the skill.
         """
         return self.name
 
+
+class SkillAlias(BaseModel):
+    """
+    Alternative spelling of a canonical skill, e.g. "py" or "python3" for "Python".
+
+    Attributes:
+        alias (CharField): The normalized alternative name.
+        skill (ForeignKey): The canonical skill it stands for.
+    """
+    alias = models.CharField(max_length=100, unique=True)
+    skill = models.ForeignKey(Skill, on_delete=models.CASCADE, related_name='aliases')
+
+    def save(self, *args, **kwargs):
+        """
+        Stores the alias in normalized form.
+        """
+        from applicant.skills import normalize_skill_name
+        self.alias = normalize_skill_name(self.alias)
+        super().save(*args, **kwargs)
+
+    def __str__(self):
+        """
+        Returns a string representation of the alias.
+        """
+        return f"{self.alias} -> {self.skill_id}"
+
 class Experience(BaseModel):
     """
     Experience model.
@@ -97,3 +149,77 @@ class Education(BaseModel):
 
         """
         return f"{self.degree} from {self.institution}"
+
+
+class JobRecommendation(BaseModel):
+    """
+    A job recommended to an applicant by the nightly digest.
+
+    Attributes:
+        applicant (ForeignKey): The applicant the job is recommended to.
+        job (ForeignKey): The recommended job.
+        score (PositiveIntegerField): Number of the job's required skills the applicant has.
+    """
+    applicant = models.ForeignKey(ApplicantProfile, on_delete=models.CASCADE, related_name='recommendations')
+    job = models.ForeignKey('job.Job', on_delete=models.CASCADE, related_name='+')
+    score = models.PositiveIntegerField()
+
+    class Meta:
+        """
+        Metadata for the JobRecommendation model.
+        """
+        unique_together = ('applicant', 'job')
+        ordering = ['-score', '-created_at']
+
+    def __str__(self):
+        """
+        Returns a string representation of the recommendation.
+        """
+        return f"{self.job_id} for {self.applicant_id} ({self.score})"
+
+
+class CandidateSearchDocument(models.Model):
+    """
+    Denormalized, search-ready copy of an applicant profile, maintained from the outbox.
+
+    Attributes:
+        applicant_id (BigIntegerField): Primary key of the indexed applicant profile.
+        content (TextField): Lower-cased headline, summary, skills, experience and education text.
+        indexed_at (DateTimeField): When the document was last written.
+    """
+    applicant_id = models.BigIntegerField(primary_key=True)
+    content = models.TextField()
+    indexed_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        """
+        Returns a string representation of the document.
+        """
+        return f"Search document for applicant {self.applicant_id}"
+
+
+class CandidateTerm(models.Model):
+    """
+    One posting in the candidate inverted index: a term and an applicant containing it.
+
+    Words from the search document are stored as-is; skills are stored as
+    ``skill:<id>`` so skill filters do not depend on spelling.
+
+    Attributes:
+        term (CharField): The indexed term.
+        applicant_id (BigIntegerField): Primary key of the applicant profile containing the term.
+    """
+    term = models.CharField(max_length=64)
+    applicant_id = models.BigIntegerField(db_index=True)
+
+    class Meta:
+        """
+        Metadata for the CandidateTerm model.
+        """
+        unique_together = ('term', 'applicant_id')
+
+    def __str__(self):
+        """
+        Returns a string representation of the posting.
+        """
+        return f"{self.term} -> {self.applicant_id}"
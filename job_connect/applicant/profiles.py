@@ -0,0 +1,268 @@
+"""
+Applicant profile aggregate loading and caching.
+
+A profile is rendered together with its user, skills, experiences and
+educations. ``load_profiles`` fetches that whole graph in a fixed number of
+queries regardless of how many profiles are requested, and the
+``get_profile_snapshot(s)`` helpers keep a serialized copy of each profile in
+the cache so repeated views (recruiters paging through candidates) do not go
+back to the database. Snapshots are dropped by the signals in
+``applicant.signals`` whenever any part of the profile changes.
+
+``save_profile_forms`` writes a submitted profile form and its experience and
+education formsets back as a diff against the current rows: one batched
+statement per kind of change, all in one transaction, and nothing at all if
+the submission matches what is stored.
+"""
+import logging
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.utils import timezone
+
+from applicant.models import ApplicantProfile
+from core.outbox import record_change
+
+logger = logging.getLogger(__name__)
+
+PROFILE_KEY = 'applicant:profile:{}'
+APPLICANT_TOPIC = 'applicant'
+
+
+def get_profile_cache_timeout():
+    """
+    Returns the profile snapshot timeout in seconds; 0 disables caching.
+    """
+    return getattr(settings, 'APPLICANT_PROFILE_CACHE_TIMEOUT', 3600)
+
+
+def profile_queryset():
+    """
+    Returns a profile queryset that loads the whole profile graph.
+
+    One query for profiles and users plus one each for skills, experiences and
+    educations, however many profiles are fetched.
+
+    Returns:
+        django.db.models.query.QuerySet: The profile queryset.
+    """
+    return ApplicantProfile.objects.select_related('user').prefetch_related('skills', 'experiences', 'educations')
+
+
+def serialize_profile(profile):
+    """
+    Converts a loaded profile into a plain dict suitable for caching and templates.
+
+    Args:
+        profile (applicant.models.ApplicantProfile): A profile from ``profile_queryset``.
+
+    Returns:
+        dict: The profile snapshot.
+    """
+    return {
+        'id': profile.pk,
+        'user_id': profile.user_id,
+        'username': profile.user.username,
+        'headline': profile.headline,
+        'summary': profile.summary,
+        'resume_url': profile.resume.url if profile.resume else '',
+        'skills': sorted(skill.name for skill in profile.skills.all()),
+        'experiences': [
+            {
+                'title': exp.title,
+                'company': exp.company,
+                'start_date': exp.start_date,
+                'end_date': exp.end_date,
+                'description': exp.description,
+            }
+            for exp in profile.experiences.all()
+        ],
+        'educations': [
+            {
+                'degree': edu.degree,
+                'institution': edu.institution,
+                'graduation_date': edu.graduation_date,
+                'major': edu.major,
+            }
+            for edu in profile.educations.all()
+        ],
+        'updated_at': profile.updated_at,
+    }
+
+
+def load_profiles(profile_ids):
+    """
+    Loads and serializes several profiles straight from the database.
+
+    Args:
+        profile_ids (iterable): Primary keys of the profiles.
+
+    Returns:
+        dict: Mapping of profile id to snapshot; missing profiles are left out.
+    """
+    return {profile.pk: serialize_profile(profile) for profile in profile_queryset().filter(pk__in=list(profile_ids))}
+
+
+def get_profile_snapshots(profile_ids):
+    """
+    Returns snapshots for several profiles, loading only the ones not cached.
+
+    Args:
+        profile_ids (iterable): Primary keys of the profiles.
+
+    Returns:
+        dict: Mapping of profile id to snapshot; missing profiles are left out.
+    """
+    profile_ids = list(dict.fromkeys(profile_ids))
+    timeout = get_profile_cache_timeout()
+    if not timeout:
+        return load_profiles(profile_ids)
+    cached = cache.get_many([PROFILE_KEY.format(pk) for pk in profile_ids])
+    snapshots = {pk: cached[PROFILE_KEY.format(pk)] for pk in profile_ids if PROFILE_KEY.format(pk) in cached}
+    missing = [pk for pk in profile_ids if pk not in snapshots]
+    if missing:
+        loaded = load_profiles(missing)
+        cache.set_many({PROFILE_KEY.format(pk): snapshot for pk, snapshot in loaded.items()}, timeout)
+        snapshots.update(loaded)
+    return snapshots
+
+
+def get_profile_snapshot(profile_id):
+    """
+    Returns the snapshot of one profile.
+
+    Args:
+        profile_id (int): Primary key of the profile.
+
+    Returns:
+        dict or None: The snapshot, or None if the profile does not exist.
+    """
+    return get_profile_snapshots([profile_id]).get(profile_id)
+
+
+def invalidate_profiles(profile_ids):
+    """
+    Drops cached snapshots now and again once the current transaction commits.
+
+    The second delete discards snapshots that concurrent requests rebuilt
+    from the old rows before the commit.
+
+    Args:
+        profile_ids (iterable): Primary keys of the profiles.
+    """
+    keys = [PROFILE_KEY.format(pk) for pk in set(profile_ids)]
+    if keys:
+        cache.delete_many(keys)
+        transaction.on_commit(lambda: cache.delete_many(keys))
+
+
+def invalidate_profile(profile_id):
+    """
+    Drops the cached snapshot of one profile.
+
+    Args:
+        profile_id (int): Primary key of the profile.
+    """
+    invalidate_profiles([profile_id])
+
+
+def _diff_formset(formset, now):
+    """
+    Splits a validated inline formset into rows to create, update and delete.
+
+    Only forms whose data differs from their initial values are considered,
+    so untouched rows and blank extra forms produce no writes.
+
+    Args:
+        formset (django.forms.BaseInlineFormSet): A validated formset.
+        now (datetime.datetime): Value for ``updated_at`` on updated rows.
+
+    Returns:
+        tuple: ``(to_create, to_update, update_fields, delete_ids)``.
+    """
+    to_create, to_update, update_fields, delete_ids = [], [], set(), []
+    for form in formset.forms:
+        instance = form.instance
+        delete = formset.can_delete and form.cleaned_data.get('DELETE', False)
+        if instance.pk is not None and delete:
+            delete_ids.append(instance.pk)
+        elif not form.has_changed() or delete:
+            continue
+        elif instance.pk is None:
+            setattr(instance, formset.fk.name, formset.instance)
+            to_create.append(instance)
+        else:
+            instance.updated_at = now
+            to_update.append(instance)
+            update_fields.update(form.changed_data)
+    update_fields.discard('DELETE')
+    return to_create, to_update, sorted(update_fields | {'updated_at'}) if to_update else [], delete_ids
+
+
+def save_profile_forms(profile_form, formsets):
+    """
+    Saves a validated profile form and its inline formsets as a diff.
+
+    Changed profile fields are written with one ``UPDATE``; skill links with
+    one ``INSERT`` and one ``DELETE`` for the added and removed skills; and each
+    formset with at most one ``INSERT``, one ``UPDATE`` and one batched delete
+    (which also clears the legacy ``experience``/``education`` links). When
+    nothing changed, no statements are issued and ``updated_at`` is left alone.
+    Typed skills that match no existing skill are created in the same
+    transaction (``SkillInputMixin.create_new_skills``). Bulk writes bypass model signals, so the profile snapshot is invalidated
+    and the search index change is recorded (one outbox ``INSERT``) here.
+    Savepoints are not counted, so the statement count is the same
+    inside and outside an enclosing transaction.
+
+    Args:
+        profile_form (applicant.forms.ApplicantProfileForm): A validated form bound to the profile.
+        formsets (list): Validated inline formsets bound to the same profile.
+
+    Returns:
+        dict: ``changed`` (whether anything was written) and ``statements`` (SQL statements issued).
+    """
+    profile = profile_form.instance
+    now = timezone.now()
+    changed_fields = [name for name in profile_form.changed_data if name not in ('skills', 'new_skills')]
+    add_skills = remove_skills = set()
+    if {'skills', 'new_skills'} & set(profile_form.changed_data):
+        current = {skill.pk for skill in profile_form.initial.get('skills', [])}
+        submitted = {skill.pk for skill in profile_form.cleaned_data['skills']}
+        add_skills, remove_skills = submitted - current, current - submitted
+    diffs = [(formset.model, _diff_formset(formset, now)) for formset in formsets]
+    if not (changed_fields or add_skills or remove_skills or profile_form.new_skill_names
+            or any(any(diff) for _, diff in diffs)):
+        return {'changed': False, 'statements': 0}
+
+    statements = []
+
+    def count(execute, sql, params, many, context):
+        if not sql.startswith(('SAVEPOINT', 'RELEASE SAVEPOINT', 'ROLLBACK TO SAVEPOINT')):
+            statements.append(sql)
+        return execute(sql, params, many, context)
+
+    through = ApplicantProfile.skills.through
+    with connection.execute_wrapper(count), transaction.atomic():
+        if changed_fields:
+            profile.save(update_fields=changed_fields + ['updated_at'])
+        add_skills = add_skills | profile_form.create_new_skills()
+        if add_skills:
+            through.objects.bulk_create([
+                through(applicantprofile_id=profile.pk, skill_id=skill_id) for skill_id in add_skills
+            ], ignore_conflicts=True)
+        if remove_skills:
+            through.objects.filter(applicantprofile_id=profile.pk, skill_id__in=remove_skills).delete()
+
+        for model, (to_create, to_update, update_fields, delete_ids) in diffs:
+            if to_create:
+                model.objects.bulk_create(to_create)
+            if to_update:
+                model.objects.bulk_update(to_update, update_fields)
+            if delete_ids:
+                model.objects.filter(pk__in=delete_ids).delete()
+        record_change(APPLICANT_TOPIC, profile.pk)
+
+    invalidate_profile(profile.pk)
+    logger.debug('Saved profile %s with %d statements.', profile.pk, len(statements))
+    return {'changed': True, 'statements': len(statements)}
@@ -0,0 +1,146 @@
+"""
+Candidate search over applicant profiles.
+
+Each profile is flattened into a ``CandidateSearchDocument`` and an inverted
+index of ``CandidateTerm`` postings (one row per distinct term per
+applicant, plus a ``skill:<id>`` posting per skill). A search for several
+words and skills is the intersection of their posting lists, computed in one
+indexed ``GROUP BY`` over only the postings of the requested terms, so its
+cost depends on how common the terms are rather than on the number of
+profiles.
+
+The index is maintained through the transactional outbox: profile changes
+record an ``applicant`` change (see ``applicant.signals``) and the
+``process_outbox`` consumer calls ``index_applicants``.
+"""
+import re
+
+from django.db import transaction
+from django.db.models import Count
+
+from applicant.models import CandidateSearchDocument, CandidateTerm
+from applicant.profiles import APPLICANT_TOPIC, profile_queryset
+from core.outbox import register_handler
+
+TERM_MAX_LENGTH = 64
+TERM_BATCH_SIZE = 1000
+TOKEN_RE = re.compile(r'[a-z0-9][a-z0-9+#]*')
+STOP_WORDS = frozenset({'a', 'an', 'and', 'at', 'for', 'from', 'in', 'of', 'on', 'or', 'the', 'to', 'with'})
+
+
+def tokenize(text):
+    """
+    Splits text into lower-case search terms.
+
+    Keeps ``+`` and ``#`` inside words so "C++" and "C#" stay searchable, and
+    drops a handful of stop words.
+
+    Args:
+        text (str): The text to split.
+
+    Returns:
+        set: The distinct terms.
+    """
+    return {
+        token[:TERM_MAX_LENGTH]
+        for token in TOKEN_RE.findall(text.lower())
+        if token not in STOP_WORDS
+    }
+
+
+def skill_term(skill_id):
+    """
+    Returns the posting term for a skill.
+
+    Args:
+        skill_id (int): Primary key of the skill.
+
+    Returns:
+        str: The term.
+    """
+    return f'skill:{skill_id}'
+
+
+def build_index_entries(profile):
+    """
+    Builds the search content and postings for a loaded profile.
+
+    Args:
+        profile (applicant.models.ApplicantProfile): A profile from ``profile_queryset``.
+
+    Returns:
+        tuple: ``(content, terms)``.
+    """
+    skills = list(profile.skills.all())
+    parts = [profile.headline, profile.summary]
+    parts.extend(skill.name for skill in skills)
+    for exp in profile.experiences.all():
+        parts.extend([exp.title, exp.company])
+    for edu in profile.educations.all():
+        parts.extend([edu.degree, edu.major])
+    content = '\n'.join(part for part in parts if part).lower()
+    return content, tokenize(content) | {skill_term(skill.pk) for skill in skills}
+
+
+def index_applicants(applicant_ids):
+    """
+    Rebuilds the search documents and postings of the given applicants.
+
+    Applicants that no longer exist or whose profile is not complete are removed from the index.
+
+    Args:
+        applicant_ids (iterable): Primary keys of the applicant profiles that changed.
+
+    Returns:
+        int: Number of applicants indexed.
+    """
+    applicant_ids = set(applicant_ids)
+    documents, postings = [], []
+    for profile in profile_queryset().complete().filter(pk__in=applicant_ids):
+        content, terms = build_index_entries(profile)
+        documents.append(CandidateSearchDocument(applicant_id=profile.pk, content=content))
+        postings.extend(CandidateTerm(term=term, applicant_id=profile.pk) for term in terms)
+
+    with transaction.atomic():
+        CandidateTerm.objects.filter(applicant_id__in=applicant_ids).delete()
+        CandidateTerm.objects.bulk_create(postings, batch_size=TERM_BATCH_SIZE)
+        CandidateSearchDocument.objects.bulk_create(
+            documents,
+            update_conflicts=True,
+            unique_fields=['applicant_id'],
+            update_fields=['content', 'indexed_at'],
+        )
+        missing = applicant_ids - {document.applicant_id for document in documents}
+        if missing:
+            CandidateSearchDocument.objects.filter(applicant_id__in=missing).delete()
+    return len(documents)
+
+
+def search_candidates(query='', skill_ids=(), limit=25, offset=0):
+    """
+    Finds applicants matching every word of ``query`` and having every skill in ``skill_ids``.
+
+    Args:
+        query (str): Free-text query over headline, summary, skills, experience and education.
+        skill_ids (iterable): Primary keys of skills the applicant must have.
+        limit (int): Maximum number of results.
+        offset (int): Number of results to skip.
+
+    Returns:
+        list: Matching applicant profile ids, most recently created profiles first.
+    """
+    terms = tokenize(query) | {skill_term(skill_id) for skill_id in skill_ids}
+    if not terms:
+        return []
+    matches = (
+        CandidateTerm.objects.filter(term__in=terms)
+        .values('applicant_id')
+        .annotate(matched=Count('term'))
+        .filter(matched=len(terms))
+        .order_by('-applicant_id')
+        .values_list('applicant_id', flat=True)
+    )
+    return list(matches[offset:offset + limit])
+
+
+register_handler(APPLICANT_TOPIC, index_applicants)
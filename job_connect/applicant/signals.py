@@ -0,0 +1,139 @@
+from django.contrib.auth import get_user_model
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
+from django.dispatch import receiver
+from applicant.models import ApplicantProfile, Education, Experience, Skill, SkillAlias
+from applicant.profiles import APPLICANT_TOPIC, invalidate_profile, invalidate_profiles
+from applicant import search  # noqa: F401  registers the outbox handler
+from applicant.skills import resolver
+from core.outbox import record_change, record_changes
+from core.roles import invalidate_roles
+
+
+@receiver(post_save, sender=ApplicantProfile)
+@receiver(post_delete, sender=ApplicantProfile)
+def invalidate_profile_on_save(sender, instance, **kwargs):
+    """
+    Drops the cached snapshot of a saved or deleted profile.
+    """
+    invalidate_profile(instance.pk)
+
+
+@receiver(post_save, sender=Experience)
+@receiver(post_delete, sender=Experience)
+@receiver(post_save, sender=Education)
+@receiver(post_delete, sender=Education)
+def invalidate_profile_on_entry_change(sender, instance, **kwargs):
+    """
+    Drops the cached snapshot of the profile an experience or education belongs to.
+    """
+    invalidate_profile(instance.applicant_profile_id)
+
+
+@receiver(m2m_changed, sender=ApplicantProfile.skills.through)
+def invalidate_profile_on_skills_change(sender, instance, action, reverse, pk_set, **kwargs):
+    """
+    Drops cached snapshots of profiles whose skills changed, from either side of the relation.
+    """
+    if not reverse:
+        if action in ('post_add', 'post_remove', 'post_clear'):
+            invalidate_profile(instance.pk)
+    elif action in ('post_add', 'post_remove') and pk_set:
+        invalidate_profiles(pk_set)
+    elif action == 'pre_clear':
+        invalidate_profiles(instance.applicants.values_list('pk', flat=True))
+
+
+@receiver(post_save, sender=Skill)
+@receiver(pre_delete, sender=Skill)
+def invalidate_profiles_on_skill_change(sender, instance, created=False, **kwargs):
+    """
+    Drops cached snapshots of every profile listing a renamed or deleted skill.
+    """
+    if not created:
+        invalidate_profiles(instance.applicants.values_list('pk', flat=True))
+
+
+@receiver(post_save, sender=get_user_model())
+def invalidate_profile_on_user_change(sender, instance, update_fields=None, **kwargs):
+    """
+    Drops the cached snapshot when the profile owner's username may have changed.
+
+    Saves that only touch ``last_login`` (every login) are ignored.
+    """
+    if update_fields is not None and set(update_fields) <= {'last_login'}:
+        return
+    invalidate_profiles(ApplicantProfile.objects.filter(user=instance).values_list('pk', flat=True))
+
+
+@receiver(post_save, sender=ApplicantProfile)
+def record_applicant_saved(sender, instance, **kwargs):
+    """
+    Queues a candidate index update for a saved profile.
+    """
+    if kwargs.get('update_fields') is None or set(kwargs['update_fields']) - {'last_digest_at'}:
+        record_change(APPLICANT_TOPIC, instance.pk)
+
+
+@receiver(post_delete, sender=ApplicantProfile)
+def record_applicant_deleted(sender, instance, **kwargs):
+    """
+    Queues removal of a deleted profile from the candidate index.
+    """
+    record_change(APPLICANT_TOPIC, instance.pk, action='delete')
+
+
+@receiver(post_save, sender=Experience)
+@receiver(post_delete, sender=Experience)
+@receiver(post_save, sender=Education)
+@receiver(post_delete, sender=Education)
+def record_applicant_entry_changed(sender, instance, **kwargs):
+    """
+    Queues a candidate index update when an experience or education changes.
+    """
+    record_change(APPLICANT_TOPIC, instance.applicant_profile_id)
+
+
+@receiver(m2m_changed, sender=ApplicantProfile.skills.through)
+def record_applicant_skills_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    """
+    Queues candidate index updates for profiles whose skills changed.
+    """
+    if not reverse:
+        if action in ('post_add', 'post_remove', 'post_clear'):
+            record_change(APPLICANT_TOPIC, instance.pk)
+    elif action in ('post_add', 'post_remove') and pk_set:
+        record_changes(APPLICANT_TOPIC, pk_set)
+    elif action == 'pre_clear':
+        record_changes(APPLICANT_TOPIC, instance.applicants.values_list('pk', flat=True))
+
+
+@receiver(post_save, sender=Skill)
+@receiver(pre_delete, sender=Skill)
+def record_applicants_skill_changed(sender, instance, created=False, **kwargs):
+    """
+    Queues candidate index updates for profiles listing a renamed or deleted skill.
+    """
+    if not created:
+        record_changes(APPLICANT_TOPIC, instance.applicants.values_list('pk', flat=True))
+
+
+@receiver(post_save, sender=Skill)
+@receiver(post_delete, sender=Skill)
+@receiver(post_save, sender=SkillAlias)
+@receiver(post_delete, sender=SkillAlias)
+def reload_skill_resolver(sender, **kwargs):
+    """
+    Drops this process's skill lookup when skills or aliases change.
+    """
+    resolver.clear()
+
+
+@receiver(post_save, sender=ApplicantProfile)
+@receiver(post_delete, sender=ApplicantProfile)
+def invalidate_roles_on_profile_change(sender, instance, **kwargs):
+    """
+    Makes the owner's sessions re-resolve their roles when a profile is saved or deleted.
+
+    Saves count too because completing the empty profile created at signup grants the role.
+    """
+    invalidate_roles(instance.user_id)
@@ -0,0 +1,344 @@
+"""
+Canonical skill taxonomy.
+
+``Skill.name`` is unique as typed, so "Python", "python " and "PYTHON" could
+all exist, and spellings such as "python3" or "py" are different words
+altogether. ``normalize_skill_name`` folds case, width and separators, and
+``SkillAlias`` rows map other spellings onto a canonical skill. The
+in-process ``resolver`` answers "which skill is this name?" from memory; it
+is loaded on first use, dropped whenever skills or aliases change in this
+process and reloaded after ``SKILL_RESOLVER_TTL`` seconds so other processes
+pick up changes too.
+
+Profile and job forms pass every chosen or typed skill through
+``canonical_skill_ids`` (``applicant.forms.SkillInputMixin``), so new
+duplicates are not attached between merges; typed names that match nothing
+are created only when the form is saved.
+
+``merge_skills`` folds duplicate skills into their canonical skill, rewriting
+the skill through tables of applicants, jobs and applications in bulk.
+"""
+import logging
+import re
+import threading
+import time
+import unicodedata
+from collections import defaultdict
+
+from django.conf import settings
+from django.db import transaction
+
+from applicant.models import ApplicantProfile, Skill, SkillAlias
+from applicant.profiles import APPLICANT_TOPIC, invalidate_profiles
+from application.models import Application, ArchivedApplication
+from core.outbox import record_changes
+from job.cache import invalidate_catalog
+from job.models import Job
+from job.search_index import JOB_TOPIC
+
+logger = logging.getLogger(__name__)
+
+LINK_BATCH_SIZE = 1000
+
+DEFAULT_ALIASES = {
+    'py': 'python',
+    'python3': 'python',
+    'js': 'javascript',
+    'ecmascript': 'javascript',
+    'ts': 'typescript',
+    'golang': 'go',
+    'postgres': 'postgresql',
+    'psql': 'postgresql',
+    'k8s': 'kubernetes',
+    'reactjs': 'react',
+    'react.js': 'react',
+    'nodejs': 'node.js',
+    'node': 'node.js',
+    'cpp': 'c++',
+    'c sharp': 'c#',
+    'csharp': 'c#',
+    'ml': 'machine learning',
+}
+"""Common alternative spellings, applied by ``merge_skills --default-aliases`` when the target skill exists."""
+
+
+def normalize_skill_name(name):
+    """
+    Normalizes a skill name for comparison.
+
+    Applies Unicode compatibility folding and case folding, treats runs of
+    whitespace, underscores and hyphens as a single space, and trims
+    surrounding spaces and dots. Symbols that carry meaning ("c++", "c#",
+    "node.js") are kept.
+
+    Args:
+        name (str): The skill name as entered.
+
+    Returns:
+        str: The normalized name.
+    """
+    name = unicodedata.normalize('NFKC', name).casefold()
+    return re.sub(r'[\s_\-]+', ' ', name).strip(' .')
+
+
+class SkillResolver:
+    """
+    In-memory lookup from normalized names and aliases to skill ids.
+    """
+
+    def __init__(self):
+        """
+        Creates an empty resolver; the lookup is loaded on first use.
+        """
+        self._lookup = None
+        self._loaded_at = 0.0
+        self._lock = threading.Lock()
+
+    def load(self):
+        """
+        Loads every skill name and alias from the database.
+
+        Where several skills normalize to the same name the oldest one wins,
+        and explicit aliases win over names.
+
+        Returns:
+            dict: Mapping of normalized name to skill id.
+        """
+        lookup = {}
+        for pk, name in Skill.objects.order_by('-pk').values_list('pk', 'name'):
+            lookup[normalize_skill_name(name)] = pk
+        lookup.update(SkillAlias.objects.values_list('alias', 'skill_id'))
+        with self._lock:
+            self._lookup = lookup
+            self._loaded_at = time.monotonic()
+        return lookup
+
+    def get_lookup(self):
+        """
+        Returns the lookup, reloading it when missing or older than ``SKILL_RESOLVER_TTL``.
+        """
+        lookup = self._lookup
+        ttl = getattr(settings, 'SKILL_RESOLVER_TTL', 300)
+        if lookup is None or time.monotonic() - self._loaded_at > ttl:
+            lookup = self.load()
+        return lookup
+
+    def resolve(self, name):
+        """
+        Resolves a skill name or alias to a skill id.
+
+        Args:
+            name (str): The name to resolve.
+
+        Returns:
+            int or None: The canonical skill id, or None if the name is unknown.
+        """
+        return self.get_lookup().get(normalize_skill_name(name))
+
+    def clear(self):
+        """
+        Drops the loaded lookup so the next call reloads it.
+        """
+        with self._lock:
+            self._lookup = None
+
+
+resolver = SkillResolver()
+
+
+def resolve_skill(name):
+    """
+    Resolves a skill name or alias to a canonical skill id.
+
+    Args:
+        name (str): The name to resolve.
+
+    Returns:
+        int or None: The skill id, or None if the name is unknown.
+    """
+    return resolver.resolve(name)
+
+
+def get_or_create_skill(name):
+    """
+    Returns the canonical skill for a name, creating it if no skill or alias matches.
+
+    Args:
+        name (str): The skill name as entered.
+
+    Returns:
+        applicant.models.Skill: The canonical skill.
+    """
+    skill_id = resolve_skill(name)
+    if skill_id is not None:
+        skill = Skill.objects.filter(pk=skill_id).first()
+        if skill is not None:
+            return skill
+    skill, _ = Skill.objects.get_or_create(name=' '.join(name.split()))
+    return skill
+
+
+def split_skill_names(text):
+    """
+    Splits comma-separated skill input into names with collapsed whitespace.
+
+    Args:
+        text (str): Skill names as typed, separated by commas.
+
+    Returns:
+        list: The non-empty names.
+    """
+    return [' '.join(name.split()) for name in text.split(',') if name.strip()]
+
+
+def canonical_skill_ids(skills, names=()):
+    """
+    Maps chosen skills and typed names onto existing canonical skill ids.
+
+    Chosen skills that are duplicates or aliases of another skill are replaced
+    by it, and typed names are resolved against existing skills and aliases.
+    Nothing is written: names that match no skill or alias are returned for
+    ``get_or_create_skill`` to create when the form is saved.
+
+    Args:
+        skills (iterable): ``Skill`` instances picked from a list.
+        names (iterable): Skill names typed in.
+
+    Returns:
+        tuple: ``(canonical skill ids, names matching no skill or alias)``.
+    """
+    ids = {resolve_skill(skill.name) or skill.pk for skill in skills}
+    unknown = []
+    for name in names:
+        skill_id = resolve_skill(name)
+        if skill_id is None:
+            unknown.append(name)
+        else:
+            ids.add(skill_id)
+    return ids, unknown
+
+
+def add_default_aliases():
+    """
+    Creates ``DEFAULT_ALIASES`` entries whose target skill exists.
+
+    Returns:
+        int: Number of aliases created.
+    """
+    by_name = {}
+    for pk, name in Skill.objects.order_by('-pk').values_list('pk', 'name'):
+        by_name[normalize_skill_name(name)] = pk
+    existing = set(SkillAlias.objects.values_list('alias', flat=True))
+    aliases = [
+        SkillAlias(alias=alias, skill_id=by_name[target])
+        for alias, target in DEFAULT_ALIASES.items()
+        if target in by_name and alias not in existing
+    ]
+    SkillAlias.objects.bulk_create(aliases)
+    resolver.clear()
+    return len(aliases)
+
+
+def plan_merges():
+    """
+    Works out which skills are duplicates of which canonical skill.
+
+    Returns:
+        dict: Mapping of duplicate skill id to canonical skill id.
+    """
+    aliases = dict(SkillAlias.objects.values_list('alias', 'skill_id'))
+    first_by_name = {}
+    merges = {}
+    for pk, name in Skill.objects.order_by('pk').values_list('pk', 'name'):
+        normalized = normalize_skill_name(name)
+        canonical = aliases.get(normalized) or first_by_name.setdefault(normalized, pk)
+        if canonical != pk:
+            merges[pk] = canonical
+    # :no-index: Follow chains such as an alias pointing at a skill that is itself a duplicate.
+    for duplicate, canonical in merges.items():
+        seen = {duplicate}
+        while canonical in merges and canonical not in seen:
+            seen.add(canonical)
+            canonical = merges[canonical]
+        merges[duplicate] = canonical
+    return {duplicate: canonical for duplicate, canonical in merges.items() if duplicate != canonical}
+
+
+def _rewrite_links(through, owner_field, merges):
+    """
+    Points every link to a duplicate skill at its canonical skill.
+
+    Args:
+        through (type): The auto-created M2M through model.
+        owner_field (str): Name of the column holding the owner id.
+        merges (dict): Mapping of duplicate skill id to canonical skill id.
+
+    Returns:
+        set: Owner ids whose links changed.
+    """
+    owners = set()
+    batch = []
+    links = through.objects.filter(skill_id__in=list(merges)).values_list(owner_field, 'skill_id')
+    for owner_id, skill_id in links.iterator(chunk_size=LINK_BATCH_SIZE):
+        owners.add(owner_id)
+        batch.append(through(**{owner_field: owner_id, 'skill_id': merges[skill_id]}))
+        if len(batch) >= LINK_BATCH_SIZE:
+            through.objects.bulk_create(batch, ignore_conflicts=True)
+            batch = []
+    if batch:
+        through.objects.bulk_create(batch, ignore_conflicts=True)
+    through.objects.filter(skill_id__in=list(merges)).delete()
+    return owners
+
+
+def merge_skills(dry_run=False):
+    """
+    Folds duplicate skills into their canonical skill.
+
+    Links from applicant profiles, jobs and applications are rewritten in
+    bulk (one multi-row INSERT per batch and one DELETE per table), the names
+    of the removed skills are kept as aliases so they keep resolving, and the
+    affected profiles and jobs are queued for re-indexing.
+
+    Args:
+        dry_run (bool): Only report what would be merged.
+
+    Returns:
+        dict: ``merges`` (duplicate id to canonical id), ``applicants``, ``jobs`` and
+        ``applications`` (number of owners whose links changed).
+    """
+    merges = plan_merges()
+    stats = {'merges': merges, 'applicants': 0, 'jobs': 0, 'applications': 0}
+    if dry_run or not merges:
+        return stats
+
+    with transaction.atomic():
+        names = dict(Skill.objects.filter(pk__in=set(merges) | set(merges.values())).values_list('pk', 'name'))
+        applicants = _rewrite_links(ApplicantProfile.skills.through, 'applicantprofile_id', merges)
+        jobs = _rewrite_links(Job.skills_required.through, 'job_id', merges)
+        applications = _rewrite_links(Application.skills.through, 'application_id', merges)
+        applications |= _rewrite_links(ArchivedApplication.skills.through, 'archivedapplication_id', merges)
+
+        duplicates_of = defaultdict(list)
+        for duplicate, canonical in merges.items():
+            duplicates_of[canonical].append(duplicate)
+        existing = set(SkillAlias.objects.values_list('alias', flat=True))
+        new_aliases = {}
+        for canonical, duplicates in duplicates_of.items():
+            SkillAlias.objects.filter(skill_id__in=duplicates).update(skill_id=canonical)
+            for duplicate in duplicates:
+                alias = normalize_skill_name(names[duplicate])
+                if alias != normalize_skill_name(names[canonical]) and alias not in existing:
+                    new_aliases[alias] = canonical
+        SkillAlias.objects.bulk_create([SkillAlias(alias=alias, skill_id=skill_id) for alias, skill_id in new_aliases.items()])
+        Skill.objects.filter(pk__in=list(merges)).delete()
+
+        record_changes(APPLICANT_TOPIC, applicants)
+        record_changes(JOB_TOPIC, jobs)
+        invalidate_profiles(applicants)
+        invalidate_catalog()
+
+    resolver.clear()
+    stats.update(applicants=len(applicants), jobs=len(jobs), applications=len(applications))
+    logger.info('Merged %d skills: %s', len(merges), stats)
+    return stats
@@ -0,0 +1,153 @@
+from datetime import date
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from django.contrib.auth import get_user_model
+from applicant.forms import ApplicantProfileForm, EducationFormSet, ExperienceFormSet
+from applicant.models import ApplicantProfile, Education, Experience, Skill
+from applicant.profiles import get_profile_snapshot, get_profile_snapshots, load_profiles, save_profile_forms
+
+User = get_user_model()
+
+
+class ProfileSnapshotTest(TestCase):
+    """
+    Tests for the profile aggregate loader and its cached snapshots.
+    """
+
+    def setUp(self):
+        """
+        Set up two applicants with skills, experience and education.
+        """
+        cache.clear()
+        self.python = Skill.objects.create(name='Python')
+        self.profiles = []
+        for username in ('snapone', 'snaptwo'):
+            user = User.objects.create_user(username=username, password='testpassword')
+            profile = ApplicantProfile.objects.create(user=user, headline=f'{username} headline', summary='Summary')
+            profile.skills.add(self.python)
+            Experience.objects.create(applicant_profile=profile, title='Developer', company='Acme', start_date=date(2020, 1, 1))
+            Education.objects.create(applicant_profile=profile, degree='BSc', institution='State U')
+            self.profiles.append(profile)
+
+    def test_loader_uses_fixed_number_of_queries(self):
+        """
+        Test that loading any number of profiles takes four queries.
+        """
+        with self.assertNumQueries(4):
+            snapshots = load_profiles([profile.pk for profile in self.profiles])
+        snapshot = snapshots[self.profiles[0].pk]
+        self.assertEqual(snapshot['username'], 'snapone')
+        self.assertEqual(snapshot['skills'], ['Python'])
+        self.assertEqual(snapshot['experiences'][0]['company'], 'Acme')
+        self.assertEqual(snapshot['educations'][0]['degree'], 'BSc')
+
+    def test_snapshots_are_served_from_cache(self):
+        """
+        Test that a second lookup does not touch the database.
+        """
+        ids = [profile.pk for profile in self.profiles]
+        get_profile_snapshots(ids)
+        with self.assertNumQueries(0):
+            self.assertEqual(set(get_profile_snapshots(ids)), set(ids))
+
+    def test_snapshot_invalidated_on_changes(self):
+        """
+        Test that profile, experience, education, skill and username changes drop the snapshot.
+        """
+        profile = self.profiles[0]
+        changes = [
+            lambda: ApplicantProfile.objects.get(pk=profile.pk).save(),
+            lambda: Experience.objects.create(applicant_profile=profile, title='Lead', company='Initech', start_date=date(2022, 1, 1)),
+            lambda: Education.objects.filter(applicant_profile=profile).delete(),
+            lambda: profile.skills.add(Skill.objects.create(name='Django')),
+            lambda: self.python.applicants.remove(profile),
+        ]
+        for change in changes:
+            get_profile_snapshot(profile.pk)
+            change()
+            with self.assertNumQueries(4):
+                get_profile_snapshot(profile.pk)
+
+        profile.user.username = 'renamed'
+        profile.user.save()
+        self.assertEqual(get_profile_snapshot(profile.pk)['username'], 'renamed')
+
+    def test_profile_view_renders_snapshot(self):
+        """
+        Test that the profile page renders the cached snapshot.
+        """
+        self.client.login(username='snapone', password='testpassword')
+        response = self.client.get(reverse('applicant:applicant_profile_view'))
+        self.assertContains(response, 'snapone headline')
+        self.assertContains(response, 'Developer at Acme')
+        self.assertContains(response, 'Python')
+
+
+class ProfileFormSaveTest(TestCase):
+    """
+    Tests for the diff-based profile form save.
+    """
+
+    def setUp(self):
+        """
+        Set up an applicant with one skill, one experience and one education.
+        """
+        self.python, self.sql = Skill.objects.create(name='Python'), Skill.objects.create(name='SQL')
+        self.user = User.objects.create_user(username='diffsave', password='testpassword')
+        self.profile = ApplicantProfile.objects.create(user=self.user, headline='Headline', summary='Summary')
+        self.profile.skills.add(self.python)
+        self.experience = Experience.objects.create(applicant_profile=self.profile, title='Developer', company='Acme',
+                                                    start_date=date(2020, 1, 1))
+        self.education = Education.objects.create(applicant_profile=self.profile, degree='BSc', institution='State U')
+
+    def post_data(self, **overrides):
+        """
+        Builds a POST payload that matches the stored profile.
+        """
+        data = {
+            'headline': 'Headline', 'summary': 'Summary', 'skills': [self.python.pk],
+            'experiences-TOTAL_FORMS': '2', 'experiences-INITIAL_FORMS': '1',
+            'experiences-0-id': self.experience.pk, 'experiences-0-title': 'Developer',
+            'experiences-0-company': 'Acme', 'experiences-0-start_date': '2020-01-01',
+            'educations-TOTAL_FORMS': '2', 'educations-INITIAL_FORMS': '1',
+            'educations-0-id': self.education.pk, 'educations-0-degree': 'BSc',
+            'educations-0-institution': 'State U',
+        }
+        data.update(overrides)
+        return data
+
+    def save(self, data):
+        """
+        Validates and saves the forms for a payload.
+        """
+        profile_form = ApplicantProfileForm(data, instance=self.profile)
+        formsets = [ExperienceFormSet(data, instance=self.profile), EducationFormSet(data, instance=self.profile)]
+        self.assertTrue(profile_form.is_valid() and all(formset.is_valid() for formset in formsets))
+        return save_profile_forms(profile_form, formsets)
+
+    def test_unchanged_submission_writes_nothing(self):
+        """
+        Test that resubmitting the stored profile issues no statements.
+        """
+        updated_at = self.profile.updated_at
+        self.assertEqual(self.save(self.post_data()), {'changed': False, 'statements': 0})
+        self.profile.refresh_from_db()
+        self.assertEqual(self.profile.updated_at, updated_at)
+
+    def test_changes_are_batched(self):
+        """
+        Test that each kind of change is written once and the result matches the submission.
+        """
+        result = self.save(self.post_data(**{
+            'skills': [self.sql.pk],
+            'experiences-0-title': 'Senior Developer',
+            'experiences-1-title': 'Intern', 'experiences-1-company': 'Initech', 'experiences-1-start_date': '2018-06-01',
+            'educations-0-DELETE': 'on',
+        }))
+        self.assertTrue(result['changed'])
+        self.assertLessEqual(result['statements'], 9)
+        self.assertEqual(list(self.profile.skills.all()), [self.sql])
+        self.assertEqual(
+            sorted(self.profile.experiences.values_list('title', flat=True)), ['Intern', 'Senior Developer'])
+        self.assertFalse(self.profile.educations.exists())
@@ -0,0 +1,115 @@
+from datetime import timedelta
+from io import StringIO
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+from django.contrib.auth import get_user_model
+from applicant.models import ApplicantProfile, JobRecommendation, Skill
+from applicant.recommendations import build_digests, load_job_index, score_chunk
+from job.models import Job
+from recruiter.models import RecruiterProfile
+
+User = get_user_model()
+
+
+class RecommendationDigestTest(TestCase):
+    """
+    Tests for the offline recommendation digest.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        """
+        Set up skills, three applicants and a handful of jobs.
+        """
+        cls.python, cls.sql, cls.go = (Skill.objects.create(name=name) for name in ('Python', 'SQL', 'Go'))
+        recruiter = RecruiterProfile.objects.create(
+            user=User.objects.create_user(username='digestrecruiter'), company_name='Digest Corp')
+
+        def job(title, skills, **kwargs):
+            job = Job.objects.create(recruiter=recruiter, title=title, description='Work.', location='Denver', **kwargs)
+            job.skills_required.set(skills)
+            return job
+
+        cls.both = job('Python + SQL', [cls.python, cls.sql])
+        cls.python_only = job('Python', [cls.python])
+        cls.go_only = job('Go', [cls.go])
+        cls.inactive = job('Inactive Python', [cls.python, cls.sql], is_active=False)
+
+        def applicant(username, skills):
+            profile = ApplicantProfile.objects.create(
+                user=User.objects.create_user(username=username, user_type='applicant'), headline='h', summary='s')
+            profile.skills.set(skills)
+            return profile
+
+        cls.pythonista = applicant('pythonista', [cls.python, cls.sql])
+        cls.gopher = applicant('gopher', [cls.go])
+        cls.no_skills = applicant('noskills', [])
+
+    def test_score_chunk_ranks_by_overlap(self):
+        """
+        Test that jobs are ranked by the number of shared skills.
+        """
+        index = load_job_index(timezone.now() - timedelta(days=1))
+        results = dict(score_chunk([(self.pythonista.pk, 0, [self.python.pk, self.sql.pk])], index, top_n=10))
+        self.assertEqual(results[self.pythonista.pk], [(self.both.pk, 2), (self.python_only.pk, 1)])
+
+    def test_build_digests_stores_top_n(self):
+        """
+        Test that digests are stored for matched applicants, honour top-N and skip inactive jobs.
+        """
+        stats = build_digests(top_n=1, workers=1)
+        self.assertEqual(stats['applicants'], 3)
+        self.assertEqual(stats['matched'], 2)
+        self.assertEqual(
+            list(JobRecommendation.objects.filter(applicant=self.pythonista).values_list('job_id', 'score')),
+            [(self.both.pk, 2)],
+        )
+        self.assertEqual(
+            list(JobRecommendation.objects.filter(applicant=self.gopher).values_list('job_id', flat=True)),
+            [self.go_only.pk],
+        )
+        self.pythonista.refresh_from_db()
+        self.no_skills.refresh_from_db()
+        self.assertIsNotNone(self.pythonista.last_digest_at)
+        self.assertIsNotNone(self.no_skills.last_digest_at)
+
+    def test_only_jobs_since_last_digest_are_recommended(self):
+        """
+        Test that a second run only recommends jobs posted after the previous digest.
+        """
+        build_digests(workers=1)
+        build_digests(workers=1)
+        self.assertFalse(JobRecommendation.objects.exists())
+
+        recruiter = self.both.recruiter
+        new_job = Job.objects.create(recruiter=recruiter, title='New Go', description='Go.', location='Denver')
+        new_job.skills_required.add(self.go)
+        build_digests(workers=1)
+        self.assertEqual(list(JobRecommendation.objects.values_list('applicant_id', 'job_id')),
+                         [(self.gopher.pk, new_job.pk)])
+
+    def test_parallel_run_matches_serial_run(self):
+        """
+        Test that scoring in a process pool yields the same digests as in-process scoring.
+        """
+        build_digests(workers=1, chunk_size=1)
+        serial = sorted(JobRecommendation.objects.values_list('applicant_id', 'job_id', 'score'))
+        ApplicantProfile.objects.update(last_digest_at=None)
+        build_digests(workers=2, chunk_size=1)
+        parallel = sorted(JobRecommendation.objects.values_list('applicant_id', 'job_id', 'score'))
+        self.assertEqual(serial, parallel)
+
+    def test_command_and_dashboard(self):
+        """
+        Test the management command and that the dashboard lists the recommendations.
+        """
+        out = StringIO()
+        call_command('build_recommendations', '--workers', '1', stdout=out)
+        self.assertIn('Scored 3 applicants', out.getvalue())
+        self.client.force_login(self.pythonista.user)
+        response = self.client.get(reverse('applicant:applicant_dashboard'))
+        self.assertContains(response, 'New Jobs Matching Your Skills')
+        self.assertContains(response, 'Python + SQL')
+        self.assertNotContains(response, 'Inactive Python')
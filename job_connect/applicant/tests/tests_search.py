@@ -0,0 +1,68 @@
+from datetime import date
+from django.core.cache import cache
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from applicant.models import ApplicantProfile, CandidateTerm, Education, Experience, Skill
+from applicant.search import search_candidates, tokenize
+from core.outbox import process_outbox
+
+User = get_user_model()
+
+
+class CandidateSearchTest(TestCase):
+    """
+    Tests for the candidate inverted index and search.
+    """
+
+    def setUp(self):
+        """
+        Set up three applicants with overlapping skills and histories.
+        """
+        cache.clear()
+        self.python, self.sql, self.go = (Skill.objects.create(name=name) for name in ('Python', 'SQL', 'Go'))
+
+        def applicant(username, headline, skills):
+            profile = ApplicantProfile.objects.create(
+                user=User.objects.create_user(username=username), headline=headline, summary='Summary')
+            profile.skills.set(skills)
+            return profile
+
+        self.ada = applicant('ada', 'Backend engineer', [self.python, self.sql])
+        self.bob = applicant('bob', 'Data analyst', [self.sql])
+        self.cy = applicant('cy', 'Backend developer', [self.go, self.python])
+        Experience.objects.create(applicant_profile=self.bob, title='Analyst', company='Initech', start_date=date(2019, 1, 1))
+        Education.objects.create(applicant_profile=self.cy, degree='MSc', institution='State U', major='Physics')
+        process_outbox()
+
+    def test_tokenize_keeps_language_names(self):
+        """
+        Test that symbols inside words are kept and stop words are dropped.
+        """
+        self.assertEqual(tokenize('C++ and C# for the Web'), {'c++', 'c#', 'web'})
+
+    def test_skill_filter_intersects_postings(self):
+        """
+        Test that requiring several skills returns only applicants with all of them.
+        """
+        self.assertEqual(search_candidates(skill_ids=[self.python.pk]), [self.cy.pk, self.ada.pk])
+        self.assertEqual(search_candidates(skill_ids=[self.python.pk, self.sql.pk]), [self.ada.pk])
+        self.assertEqual(search_candidates(skill_ids=[self.go.pk, self.sql.pk]), [])
+
+    def test_keywords_cover_experience_and_education(self):
+        """
+        Test that words from experience and education are searchable and combine with skills.
+        """
+        self.assertEqual(search_candidates('initech'), [self.bob.pk])
+        self.assertEqual(search_candidates('physics backend'), [self.cy.pk])
+        self.assertEqual(search_candidates('backend', [self.sql.pk]), [self.ada.pk])
+        self.assertEqual(search_candidates(''), [])
+
+    def test_index_follows_profile_changes(self):
+        """
+        Test that skill removal and profile deletion reach the index through the outbox.
+        """
+        self.ada.skills.remove(self.sql)
+        self.cy.delete()
+        process_outbox()
+        self.assertEqual(search_candidates(skill_ids=[self.sql.pk]), [self.bob.pk])
+        self.assertFalse(CandidateTerm.objects.filter(applicant_id=self.cy.pk).exists())
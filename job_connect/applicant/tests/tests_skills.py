@@ -0,0 +1,114 @@
+from io import StringIO
+from django.core.exceptions import ValidationError
+from django.core.management import call_command
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from applicant.forms import ApplicantProfileForm
+from applicant.models import ApplicantProfile, Skill, SkillAlias
+from applicant.profiles import save_profile_forms
+from applicant.skills import get_or_create_skill, normalize_skill_name, plan_merges, resolve_skill
+from job.forms import JobForm
+from job.models import Job
+from recruiter.models import RecruiterProfile
+
+User = get_user_model()
+
+
+class SkillTaxonomyTest(TestCase):
+    """
+    Tests for skill normalization, alias resolution and merging.
+    """
+
+    def setUp(self):
+        """
+        Set up a canonical skill, two duplicates and links to all three.
+        """
+        self.python = Skill.objects.create(name='Python')
+        self.lower = Skill.objects.create(name=' python')
+        self.py3 = Skill.objects.create(name='python3')
+        SkillAlias.objects.create(alias='Python3', skill=self.python)
+
+        self.profile = ApplicantProfile.objects.create(
+            user=User.objects.create_user(username='taxonomy'), headline='Headline', summary='Summary')
+        self.profile.skills.set([self.python, self.py3])
+        recruiter = RecruiterProfile.objects.create(
+            user=User.objects.create_user(username='taxonomyrecruiter'), company_name='Taxonomy Co')
+        self.job = Job.objects.create(recruiter=recruiter, title='Dev', description='Code.', location='Remote')
+        self.job.skills_required.set([self.lower])
+
+    def test_normalize_skill_name(self):
+        """
+        Test that case, width and separators are folded but meaningful symbols kept.
+        """
+        self.assertEqual(normalize_skill_name('  Machine_Learning '), 'machine learning')
+        self.assertEqual(normalize_skill_name('Ｃ++'), 'c++')
+        self.assertEqual(normalize_skill_name('Node.js.'), 'node.js')
+
+    def test_resolver_uses_names_and_aliases(self):
+        """
+        Test that names and aliases resolve to the canonical skill and new aliases are picked up.
+        """
+        self.assertEqual(resolve_skill('PYTHON'), self.python.pk)
+        self.assertEqual(resolve_skill('python3'), self.python.pk)
+        self.assertIsNone(resolve_skill('py'))
+        SkillAlias.objects.create(alias='py', skill=self.python)
+        self.assertEqual(resolve_skill('Py'), self.python.pk)
+        self.assertEqual(get_or_create_skill('py'), self.python)
+
+    def test_clean_rejects_alias_names(self):
+        """
+        Test that a new skill cannot reuse a name that resolves to an existing skill.
+        """
+        with self.assertRaises(ValidationError):
+            Skill(name='PYTHON3').full_clean()
+
+    def test_job_form_attaches_canonical_skills(self):
+        """
+        Test that chosen duplicates and typed aliases are attached as the canonical skill, and only unknown names are created.
+        """
+        form = JobForm({
+            'title': 'Dev', 'description': 'Code.', 'requirements': 'Code.', 'location': 'Remote', 'salary_range': '1',
+            'employment_type': 'full-time', 'is_active': True,
+            'skills_required': [self.lower.pk], 'new_skills': 'PYTHON3, Rust,  rust ',
+        }, instance=self.job)
+        self.assertTrue(form.is_valid(), form.errors)
+        form.save()
+        rust = Skill.objects.get(name='Rust')
+        self.assertEqual(set(self.job.skills_required.all()), {self.python, rust})
+        self.assertEqual(Skill.objects.filter(name__iexact='rust').count(), 1)
+
+    def test_profile_form_attaches_canonical_skills(self):
+        """
+        Test that the profile update path stores the canonical skills for typed names.
+        """
+        form = ApplicantProfileForm(
+            {'headline': 'Headline', 'summary': 'Summary', 'skills': [self.py3.pk], 'new_skills': 'python'},
+            instance=self.profile,
+        )
+        self.assertTrue(form.is_valid(), form.errors)
+        save_profile_forms(form, [])
+        self.assertEqual(list(self.profile.skills.all()), [self.python])
+
+    def test_validation_does_not_create_skills(self):
+        """
+        Test that unknown typed skills are created only when the validated form is saved.
+        """
+        form = ApplicantProfileForm(
+            {'headline': 'Headline', 'summary': 'Summary', 'new_skills': 'Haskell'}, instance=self.profile,
+        )
+        self.assertTrue(form.is_valid(), form.errors)
+        self.assertFalse(Skill.objects.filter(name='Haskell').exists())
+        save_profile_forms(form, [])
+        self.assertEqual(list(self.profile.skills.values_list('name', flat=True)), ['Haskell'])
+
+    def test_merge_rewrites_links_and_keeps_aliases(self):
+        """
+        Test that merging moves links to the canonical skill without duplicates and removes the rest.
+        """
+        self.assertEqual(plan_merges(), {self.lower.pk: self.python.pk, self.py3.pk: self.python.pk})
+        call_command('merge_skills', stdout=StringIO())
+        self.assertEqual(list(Skill.objects.filter(name__icontains='python')), [self.python])
+        self.assertEqual(list(self.profile.skills.all()), [self.python])
+        self.assertEqual(list(self.job.skills_required.all()), [self.python])
+        self.assertEqual(resolve_skill('python3'), self.python.pk)
+        self.assertEqual(plan_merges(), {})
@@ -1,3 +1,4 @@
+from django.conf import settings
 from django.urls import path
 from . import views
 
@@ -7,7 +8,7 @@ urlpatterns = [
     path('dashboard/', views.applicant_dashboard, name='applicant_dashboard'),
     path('profile/create/', views.applicant_profile_create, name='applicant_profile_create'),
     path('profile/update/', views.applicant_profile_update, name='applicant_profile_update'),
-    path('profile/', views.applicant_profile_view, name='applicant_profile_view'),
+    path('profile/', views.aapplicant_profile_view if settings.ASYNC_VIEWS else views.applicant_profile_view, name='applicant_profile_view'),
     path('applications/', views.applicant_applications, name='applicant_applications'),
     #  :no-index:THIS LINE IS CRUCIAL
     #  :no-index:... any other URL patterns for the applicant app
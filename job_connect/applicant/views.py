@@ -1,10 +1,13 @@
+from asgiref.sync import sync_to_async
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth.decorators import login_required
-from .models import ApplicantProfile #, Experience, Education
+from .models import ApplicantProfile, JobRecommendation #, Experience, Education
 from django.db import transaction
 from .forms import ApplicantProfileForm, ExperienceFormSet, EducationFormSet
+from .profiles import get_profile_snapshot, save_profile_forms
 from application.models import Application
 from django.urls import reverse
+from core.roles import aget_roles, get_roles
 
 @login_required
 def applicant_dashboard(request):
@@ -17,7 +20,10 @@ def applicant_dashboard(request):
     Returns:
         HttpResponse: HttpResponse object rendering the applicant dashboard.
     """
-    return render(request, 'applicant/applicant_dashboard.html')
+    recommendations = JobRecommendation.objects.filter(
+        applicant_id=get_roles(request).applicant_id, job__is_active=True
+    ).select_related('job')[:10]
+    return render(request, 'applicant/applicant_dashboard.html', {'recommendations': recommendations})
 
 @login_required
 def applicant_profile_create(request):
@@ -30,17 +36,20 @@ def applicant_profile_create(request):
     Returns:
         HttpResponse: HttpResponse object rendering the profile creation form or redirecting to the profile view.
     """
-    if hasattr(request.user, 'applicant_profile'):
+    profile = ApplicantProfile.objects.filter(user=request.user).first()  # :no-index: May be the empty one from signup
+    if profile is not None and profile.is_complete:
         return redirect('applicant:applicant_profile_update') # :no-index: Profile already exists
     if request.method == 'POST':
-        profile_form = ApplicantProfileForm(request.POST, request.FILES)
+        profile_form = ApplicantProfileForm(request.POST, request.FILES, instance=profile)
         if profile_form.is_valid():
-            profile = profile_form.save(commit=False)
-            profile.user = request.user
-            profile.save()
+            with transaction.atomic():  # :no-index: Profile, new skills and their links commit together
+                profile = profile_form.save(commit=False)
+                profile.user = request.user
+                profile.save()
+                profile_form.save_m2m()
             return redirect('applicant:applicant_dashboard')
     else:
-        profile_form = ApplicantProfileForm()
+        profile_form = ApplicantProfileForm(instance=profile)
     return render(request, 'applicant/applicant_profile_create.html', {'profile_form': profile_form})
 
 @login_required
@@ -71,15 +80,7 @@ def applicant_profile_update(request):
             education_valid = education_formset.is_valid()
 
         if profile_valid and experience_valid and education_valid:
-            profile.headline = profile_form.cleaned_data['headline']
-            profile.summary = profile_form.cleaned_data['summary']
-            if 'skills' in profile_form.cleaned_data:
-                profile.skills.set(profile_form.cleaned_data['skills'])
-            if 'resume' in profile_form.cleaned_data and profile_form.cleaned_data['resume']:
-                profile.resume = profile_form.cleaned_data['resume']
-            profile.save()
-            experience_formset.save()
-            education_formset.save()
+            save_profile_forms(profile_form, [experience_formset, education_formset])
             return redirect(reverse('applicant:applicant_profile_view'))
     else:
         profile_form = ApplicantProfileForm(instance=profile)
@@ -104,11 +105,28 @@ def applicant_profile_view(request):
     Returns:
         HttpResponse: HttpResponse object rendering the applicant profile.
     """
-    try:
-        profile = request.user.applicant_profile
-        return render(request, 'applicant/applicant_profile_view.html', {'profile': profile})
-    except ApplicantProfile.DoesNotExist:
+    profile_id = get_roles(request).applicant_id
+    profile = get_profile_snapshot(profile_id) if profile_id else None
+    if profile is None:
+        return redirect('applicant:applicant_profile_create')
+    return render(request, 'applicant/applicant_profile_view.html', {'profile': profile})
+
+@login_required
+async def aapplicant_profile_view(request):
+    """
+    Async version of ``applicant_profile_view``, routed when ``ASYNC_VIEWS`` is on.
+
+    Args:
+        request (HttpRequest): HttpRequest object.
+
+    Returns:
+        HttpResponse: HttpResponse object rendering the applicant profile.
+    """
+    profile_id = (await aget_roles(request)).applicant_id
+    profile = await sync_to_async(get_profile_snapshot)(profile_id) if profile_id else None
+    if profile is None:
         return redirect('applicant:applicant_profile_create')
+    return render(request, 'applicant/applicant_profile_view.html', {'profile': profile})
 
 @login_required
 def applicant_applications(request):
@@ -122,11 +140,10 @@ def applicant_applications(request):
         HttpResponse: HttpResponse object rendering the list of applications.
     """
 
-    try:
-        applicant_profile = request.user.applicant_profile
-        applications = Application.objects.filter(applicant=applicant_profile).order_by('-application_date')
-        return render(request, 'applicant/applicant_applications_list.html', {'applications': applications})
-    except AttributeError:
+    applicant_id = get_roles(request).applicant_id
+    if applicant_id is not None:
+        applications = Application.objects.filter(applicant_id=applicant_id).order_by('-application_date')
+    else:
         # Handle the case where the user doesn't have an ApplicantProfile
         applications = Application.objects.none()  # Empty queryset
-        return render(request, 'applicant/applicant_applications_list.html', {'applications': applications})
\ No newline at end of file
+    return render(request, 'applicant/applicant_applications_list.html', {'applications': applications})
\ No newline at end of file
@@ -0,0 +1,125 @@
+"""
+Archival of closed applications.
+
+Rejected and offered applications to inactive jobs are never edited again but
+would otherwise stay in ``Application`` forever, growing its indexes and every
+list query over it. ``archive_applications`` moves those unchanged for
+``ARCHIVE_APPLICATIONS_AFTER_DAYS`` into ``ArchivedApplication`` in small
+batches: each batch copies the rows and their skill links and deletes the
+originals in one transaction, so an application is always in exactly one of
+the two tables, and other writers only ever wait for one batch.
+
+Archived rows keep their primary key. ``find_application`` looks an id up in
+the live table first and falls back to the archive, so links to an archived
+application keep working.
+"""
+import logging
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.http import Http404
+from django.utils import timezone
+
+from application.models import Application, ArchivedApplication
+
+logger = logging.getLogger(__name__)
+
+CLOSED_STATUSES = ('rejected', 'offered')
+
+
+def get_archive_age():
+    """
+    Returns how long a closed application stays unchanged before it is archived.
+    """
+    return timedelta(days=getattr(settings, 'ARCHIVE_APPLICATIONS_AFTER_DAYS', 180))
+
+
+def closed_applications(older_than=None):
+    """
+    Returns the applications due for archiving.
+
+    Args:
+        older_than (datetime.timedelta): Minimum time since the last change; defaults to the configured age.
+
+    Returns:
+        django.db.models.query.QuerySet: Closed applications to inactive jobs.
+    """
+    cutoff = timezone.now() - (older_than if older_than is not None else get_archive_age())
+    return Application.objects.filter(status__in=CLOSED_STATUSES, job__is_active=False, updated_at__lt=cutoff)
+
+
+def archive_batch(ids, older_than=None):
+    """
+    Moves the given applications into the archive, re-checking that they are still due.
+
+    Args:
+        ids (list): Application primary keys.
+        older_than (datetime.timedelta): As for ``closed_applications``.
+
+    Returns:
+        int: Number of applications moved.
+    """
+    fields = [field.attname for field in ArchivedApplication._meta.concrete_fields if field.name != 'archived_at']
+    with transaction.atomic():
+        applications = list(closed_applications(older_than).filter(pk__in=ids).select_for_update(of=('self',)))
+        if not applications:
+            return 0
+        moved = [application.pk for application in applications]
+        ArchivedApplication.objects.bulk_create([
+            ArchivedApplication(**{field: getattr(application, field) for field in fields}) for application in applications
+        ])
+        links = Application.skills.through.objects.filter(application_id__in=moved).values_list('application_id', 'skill_id')
+        ArchivedApplication.skills.through.objects.bulk_create([
+            ArchivedApplication.skills.through(archivedapplication_id=application_id, skill_id=skill_id)
+            for application_id, skill_id in links
+        ])
+        Application.objects.filter(pk__in=moved).delete()
+    return len(moved)
+
+
+def archive_applications(older_than=None, batch_size=500, pause=0.0, limit=None):
+    """
+    Moves every application due for archiving, one batch at a time.
+
+    Args:
+        older_than (datetime.timedelta): As for ``closed_applications``.
+        batch_size (int): Applications moved per transaction.
+        pause (float): Seconds to sleep between batches, to leave room for other writers.
+        limit (int): Stop after about this many applications; ``None`` moves them all.
+
+    Returns:
+        int: Number of applications moved.
+    """
+    total = 0
+    while limit is None or total < limit:
+        size = batch_size if limit is None else min(batch_size, limit - total)
+        ids = list(closed_applications(older_than).order_by('pk').values_list('pk', flat=True)[:size])
+        if not ids:
+            break
+        total += archive_batch(ids, older_than)
+        if pause:
+            time.sleep(pause)
+    logger.info('Archived %d applications.', total)
+    return total
+
+
+def find_application(pk):
+    """
+    Returns an application from the live table, or from the archive if it has been archived.
+
+    Args:
+        pk (int): The application's primary key.
+
+    Returns:
+        application.models.Application or application.models.ArchivedApplication: The application.
+
+    Raises:
+        Http404: If the application exists in neither table.
+    """
+    for model in (Application, ArchivedApplication):
+        application = model.objects.select_related('job').filter(pk=pk).first()
+        if application is not None:
+            return application
+    raise Http404('No application matches the given query.')
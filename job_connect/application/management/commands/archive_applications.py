@@ -0,0 +1,39 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from application.archive import archive_applications, closed_applications
+
+
+class Command(BaseCommand):
+    """
+    Moves closed applications to inactive jobs into the archive table.
+
+    Safe to run while the site is live and to interrupt: every batch is its
+    own transaction. Schedule it daily; ``--pause`` spreads a large first run.
+    """
+    help = 'Archive rejected and offered applications to inactive jobs.'
+
+    def add_arguments(self, parser):
+        """
+        Adds command line arguments.
+
+        Args:
+            parser (argparse.ArgumentParser): The argument parser.
+        """
+        parser.add_argument('--days', type=int, default=None,
+                            help='Days unchanged before archiving (default: ARCHIVE_APPLICATIONS_AFTER_DAYS).')
+        parser.add_argument('--batch-size', type=int, default=500, help='Applications moved per transaction.')
+        parser.add_argument('--pause', type=float, default=0.0, help='Seconds to sleep between batches.')
+        parser.add_argument('--limit', type=int, default=None, help='Stop after this many applications.')
+        parser.add_argument('--dry-run', action='store_true', help='Only count the applications due.')
+
+    def handle(self, *args, **options):
+        """
+        Archives the applications due, or counts them with ``--dry-run``.
+        """
+        older_than = timedelta(days=options['days']) if options['days'] is not None else None
+        if options['dry_run']:
+            self.stdout.write(f'{closed_applications(older_than).count()} applications would be archived.')
+            return
+        moved = archive_applications(older_than, options['batch_size'], options['pause'], options['limit'])
+        self.stdout.write(self.style.SUCCESS(f'Archived {moved} applications.'))
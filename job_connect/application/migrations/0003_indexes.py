@@ -0,0 +1,22 @@
+# Generated by Django 5.2 on 2026-10-19 14:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('application', '0002_application_skills'),
+        ('application', '0002_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='application',
+            index=models.Index(fields=['applicant', '-application_date'], name='application_applicant_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='application',
+            index=models.Index(condition=models.Q(('status', 'pending')), fields=['job', 'status'], name='application_pending_idx'),
+        ),
+    ]
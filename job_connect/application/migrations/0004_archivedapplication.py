@@ -0,0 +1,35 @@
+# Generated by Django 5.2 on 2026-10-19 14:23
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applicant', '0005_skillalias'),
+        ('application', '0003_indexes'),
+        ('job', '0005_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArchivedApplication',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('application_date', models.DateTimeField()),
+                ('resume', models.FileField(blank=True, null=True, upload_to='applications/')),
+                ('cover_letter', models.TextField(blank=True)),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('reviewed', 'Reviewed'), ('shortlisted', 'Shortlisted'), ('interviewing', 'Interviewing'), ('offered', 'Offered'), ('rejected', 'Rejected')], max_length=50)),
+                ('created_at', models.DateTimeField()),
+                ('updated_at', models.DateTimeField()),
+                ('archived_at', models.DateTimeField(auto_now_add=True)),
+                ('applicant', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='archived_applications', to='applicant.applicantprofile')),
+                ('job', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='archived_applications', to='job.job')),
+                ('skills', models.ManyToManyField(blank=True, related_name='archived_applications', to='applicant.skill')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['applicant', '-application_date'], name='archived_applicant_date_idx')],
+            },
+        ),
+    ]
@@ -4,6 +4,15 @@ from core.models import BaseModel
 from job.models import Job
 from applicant.models import ApplicantProfile, Skill
 
+STATUS_CHOICES = (
+    ('pending', 'Pending'),
+    ('reviewed', 'Reviewed'),
+    ('shortlisted', 'Shortlisted'),
+    ('interviewing', 'Interviewing'),
+    ('offered', 'Offered'),
+    ('rejected', 'Rejected'),
+)
+
 class Application(BaseModel):
     """
     Represents an application submitted by an applicant for a job.
@@ -23,26 +32,22 @@ class Application(BaseModel):
     skills = models.ManyToManyField(Skill, blank=True, related_name='job_postings')
     resume = models.FileField(upload_to='applications/', blank=True, null=True) # :no-index: Allow re-uploading specific resume
     cover_letter = models.TextField(blank=True)
-    status = models.CharField(
-        max_length=50,
-        choices=(
-            ('pending', 'Pending'),
-            ('reviewed', 'Reviewed'),
-            ('shortlisted', 'Shortlisted'),
-            ('interviewing', 'Interviewing'),
-            ('offered', 'Offered'),
-            ('rejected', 'Rejected'),
-        ),
-        default='pending'
-    )
+    status = models.CharField(max_length=50, choices=STATUS_CHOICES, default='pending')
 
     class Meta:
         """
         Meta class for the Application model.
 
-        Defines unique constraint on applicant and job to prevent duplicate applications.
+        Defines unique constraint on applicant and job to prevent duplicate applications,
+        and indexes the applicant's application list in display order and the pending
+        applications. The pending index includes ``status`` so the pending application
+        count is answered from the index alone.
         """
         unique_together = ('applicant', 'job') # :no-index: Prevent duplicate applications
+        indexes = [
+            models.Index(fields=['applicant', '-application_date'], name='application_applicant_date_idx'),
+            models.Index(fields=['job', 'status'], condition=models.Q(status='pending'), name='application_pending_idx'),
+        ]
 
     def __str__(self):
         """
@@ -51,4 +56,57 @@ class Application(BaseModel):
         Returns:
             str: A string representing the application.
         """
-        return f"{self.applicant.user.username} applying for {self.job.title}"
\ No newline at end of file
+        return f"{self.applicant.user.username} applying for {self.job.title}"
+
+
+class ArchivedApplication(models.Model):
+    """
+    A closed application moved out of the ``Application`` table by ``application.archive``.
+
+    Rows keep the primary key and timestamps of the application they were
+    moved from, so existing links keep resolving through ``find_application``.
+    Archived applications are read-only.
+
+    Args:
+        id (django.db.models.BigIntegerField): Primary key of the original application.
+        applicant (applicant.models.ApplicantProfile): The applicant who submitted the application.
+        job (job.models.Job): The job that was applied for.
+        application_date (django.db.models.DateTimeField): When the application was submitted.
+        skills (django.db.models.ManyToManyField): The skills associated with the application.
+        resume (django.db.models.FileField): The resume uploaded by the applicant.
+        cover_letter (django.db.models.TextField): The cover letter submitted by the applicant.
+        status (django.db.models.CharField): The final status of the application.
+        created_at (django.db.models.DateTimeField): Copy of ``Application.created_at``.
+        updated_at (django.db.models.DateTimeField): Copy of ``Application.updated_at``.
+        archived_at (django.db.models.DateTimeField): When the application was archived.
+    """
+    id = models.BigIntegerField(primary_key=True)
+    applicant = models.ForeignKey(ApplicantProfile, on_delete=models.CASCADE, related_name='archived_applications')
+    job = models.ForeignKey(Job, on_delete=models.CASCADE, related_name='archived_applications')
+    application_date = models.DateTimeField()
+    skills = models.ManyToManyField(Skill, blank=True, related_name='archived_applications')
+    resume = models.FileField(upload_to='applications/', blank=True, null=True)
+    cover_letter = models.TextField(blank=True)
+    status = models.CharField(max_length=50, choices=STATUS_CHOICES)
+    created_at = models.DateTimeField()
+    updated_at = models.DateTimeField()
+    archived_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        """
+        Meta class for the ArchivedApplication model.
+
+        Indexes the applicant's archived applications in display order.
+        """
+        indexes = [
+            models.Index(fields=['applicant', '-application_date'], name='archived_applicant_date_idx'),
+        ]
+
+    def __str__(self):
+        """
+        Returns a string representation of the archived application.
+
+        Returns:
+            str: A string representing the archived application.
+        """
+        return f"{self.applicant.user.username} applied for {self.job.title} (archived)"
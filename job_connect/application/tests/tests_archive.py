@@ -0,0 +1,105 @@
+from datetime import timedelta
+from io import StringIO
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+from applicant.models import ApplicantProfile, Skill
+from application.archive import archive_applications, closed_applications
+from application.models import Application, ArchivedApplication
+from job.models import Job
+from recruiter.models import RecruiterProfile
+
+User = get_user_model()
+
+
+class ArchiveApplicationsTest(TestCase):
+    """
+    Tests for moving closed applications into the archive table.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        """
+        Create applications to an inactive and an active job.
+        """
+        recruiter = RecruiterProfile.objects.create(
+            user=User.objects.create_user(username='archive-recruiter', password='password'), company_name='Test Corp',
+        )
+        cls.closed_job = Job.objects.create(recruiter=recruiter, title='Filled Role', is_active=False)
+        cls.open_job = Job.objects.create(recruiter=recruiter, title='Open Role')
+        cls.skill = Skill.objects.create(name='archive-skill')
+        cls.applicants = [
+            ApplicantProfile.objects.create(
+                user=User.objects.create_user(username=f'archive-applicant-{i}', password='password'), headline='Developer',
+            )
+            for i in range(4)
+        ]
+
+    def apply(self, applicant, job, status, days_ago=365):
+        """
+        Creates an application last changed ``days_ago`` days ago.
+        """
+        application = Application.objects.create(applicant=applicant, job=job, status=status, cover_letter='Hello')
+        application.skills.add(self.skill)
+        Application.objects.filter(pk=application.pk).update(updated_at=timezone.now() - timedelta(days=days_ago))
+        return application
+
+    def test_only_closed_applications_to_inactive_jobs_moved(self):
+        """
+        Test that old rejected/offered applications to inactive jobs are moved with their fields and skills.
+        """
+        rejected = self.apply(self.applicants[0], self.closed_job, 'rejected')
+        offered = self.apply(self.applicants[1], self.closed_job, 'offered')
+        pending = self.apply(self.applicants[2], self.closed_job, 'pending')
+        recent = self.apply(self.applicants[3], self.closed_job, 'rejected', days_ago=1)
+        active = self.apply(self.applicants[0], self.open_job, 'rejected')
+
+        self.assertEqual(archive_applications(batch_size=1), 2)
+
+        self.assertEqual(
+            set(Application.objects.filter(job__recruiter__user__username='archive-recruiter').values_list('pk', flat=True)),
+            {pending.pk, recent.pk, active.pk},
+        )
+        archived = ArchivedApplication.objects.get(pk=rejected.pk)
+        self.assertEqual(archived.applicant_id, self.applicants[0].pk)
+        self.assertEqual(archived.application_date, rejected.application_date)
+        self.assertEqual(archived.created_at, rejected.created_at)
+        self.assertEqual(archived.cover_letter, 'Hello')
+        self.assertEqual(archived.status, 'rejected')
+        self.assertEqual(list(archived.skills.all()), [self.skill])
+        self.assertTrue(ArchivedApplication.objects.filter(pk=offered.pk).exists())
+        self.assertFalse(closed_applications().exists())
+
+    def test_detail_reads_through_to_archive(self):
+        """
+        Test that an archived application is still shown at its original URL.
+        """
+        application = self.apply(self.applicants[0], self.closed_job, 'rejected')
+        call_command('archive_applications', stdout=StringIO())
+        self.client.force_login(self.applicants[0].user)
+        response = self.client.get(reverse('application:application_detail', args=[application.pk]))
+        self.assertContains(response, 'Filled Role')
+        self.assertContains(response, 'This application was archived')
+        self.assertEqual(self.client.get(reverse('application:application_detail', args=[0])).status_code, 404)
+
+    def test_archived_application_blocks_reapplying(self):
+        """
+        Test that an applicant cannot apply again to a job whose application was archived.
+        """
+        self.apply(self.applicants[0], self.closed_job, 'rejected')
+        archive_applications()
+        self.client.force_login(self.applicants[0].user)
+        response = self.client.get(reverse('application:apply_for_job', args=[self.closed_job.pk]))
+        self.assertTemplateUsed(response, 'application/already_applied.html')
+
+    def test_dry_run(self):
+        """
+        Test that --dry-run counts the due applications without moving them.
+        """
+        self.apply(self.applicants[0], self.closed_job, 'offered')
+        out = StringIO()
+        call_command('archive_applications', '--dry-run', stdout=out)
+        self.assertIn('1 applications would be archived.', out.getvalue())
+        self.assertFalse(ArchivedApplication.objects.exists())
@@ -1,11 +1,12 @@
 import os
 from django.test import TestCase, Client
 from django.urls import reverse
+from django.utils import timezone
 from django.contrib.auth import get_user_model
 from applicant.models import ApplicantProfile, Skill
 from recruiter.models import RecruiterProfile
 from job.models import Job
-from application.models import Application
+from application.models import Application, ArchivedApplication
 from django.core.files.uploadedfile import SimpleUploadedFile
 
 User = get_user_model()
@@ -201,9 +202,9 @@ class ApplicationDetailViewTest(TestCase):
     def setUpTestData(cls):
         # Create a user, applicant profile, recruiter profile, and job
         cls.user = User.objects.create_user(username='testuser', password='testpassword')
-        cls.applicant_profile = ApplicantProfile.objects.create(user=cls.user)
+        cls.applicant_profile = ApplicantProfile.objects.create(user=cls.user, headline='Developer')
         cls.recruiter_user = User.objects.create_user(username='recruiter', password='testpassword')
-        cls.recruiter_profile = RecruiterProfile.objects.create(user=cls.recruiter_user)
+        cls.recruiter_profile = RecruiterProfile.objects.create(user=cls.recruiter_user, company_name='Test Corp')
         cls.job = Job.objects.create(
             recruiter=cls.recruiter_profile,
             title='Test Job',
@@ -238,6 +239,37 @@ class ApplicationDetailViewTest(TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertTemplateUsed(response, 'application/application_detail.html')
         self.assertEqual(response.context['application'], self.application)
+        self.assertNotIn('candidate', response.context)
+        self.assertContains(response, 'Applicant: testuser')
+
+    def test_application_detail_view_job_recruiter(self):
+        """
+        Test that the recruiter who owns the job can access the application detail view.
+        """
+        self.client.force_login(self.recruiter_user)
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context['candidate']['headline'], 'Developer')
+
+    def test_application_detail_view_unrelated_users(self):
+        """
+        Test that an unrelated applicant or recruiter gets a 404 for a live or archived application.
+        """
+        other_applicant = User.objects.create_user(username='other-applicant', password='testpassword')
+        ApplicantProfile.objects.create(user=other_applicant, headline='Designer')
+        other_recruiter = User.objects.create_user(username='other-recruiter', password='testpassword')
+        RecruiterProfile.objects.create(user=other_recruiter, company_name='Other Corp')
+        archived = ArchivedApplication.objects.create(
+            pk=self.application.pk + 1000, applicant=self.applicant_profile, job=self.job, status='rejected',
+            application_date=timezone.now(), created_at=timezone.now(), updated_at=timezone.now(),
+        )
+        urls = [self.url, reverse('application:application_detail', kwargs={'application_id': archived.pk})]
+        for user in (other_applicant, other_recruiter):
+            self.client.force_login(user)
+            for url in urls:
+                self.assertEqual(self.client.get(url).status_code, 404)
+        self.client.force_login(self.user)
+        self.assertEqual(self.client.get(urls[1]).status_code, 200)
 
     def test_application_detail_view_unauthenticated_user(self):
         """
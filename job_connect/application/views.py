@@ -1,15 +1,17 @@
 
-from applicant.models import ApplicantProfile
-from application.models import Application
+from applicant.profiles import get_profile_snapshot
+from application.archive import find_application
+from application.models import Application, ArchivedApplication
 from application.forms import ApplicationForm
 from django.shortcuts import render, get_object_or_404, redirect
 from django.contrib.auth.decorators import login_required
-from django.contrib.auth.mixins import LoginRequiredMixin, UserPassesTestMixin
+from core.mixins import RecruiterRequiredMixin
+from core.roles import get_roles
 from django.views.generic import ListView, UpdateView
 from application.models import Application
 from application.forms import ApplicationStatusForm
 from job.models import Job
-from django.http import HttpResponseForbidden
+from django.http import Http404, HttpResponseForbidden
 
 @login_required
 def apply_for_job(request, job_id):
@@ -26,25 +28,28 @@ def apply_for_job(request, job_id):
     Raises:
         HttpResponseForbidden: If a recruiter attempts to apply for a job.
     """
-    if hasattr(request.user, 'recruiter_profile'):
+    roles = get_roles(request)
+    if roles.is_recruiter:
         return HttpResponseForbidden("Recruiters are not allowed to apply for jobs.")
 
     job = get_object_or_404(Job, pk=job_id)
-    applicant_profile = get_object_or_404(ApplicantProfile, user=request.user)
+    if not roles.is_applicant:
+        raise Http404("No applicant profile.")
 
-    if Application.objects.filter(applicant=applicant_profile, job=job).exists():
+    if (Application.objects.filter(applicant_id=roles.applicant_id, job=job).exists()
+            or ArchivedApplication.objects.filter(applicant_id=roles.applicant_id, job=job).exists()):
         return render(request, 'application/already_applied.html', {'job': job})
 
     if request.method == 'POST':
         form = ApplicationForm(request.POST, request.FILES)
         if form.is_valid():
             application = form.save(commit=False)
-            application.applicant = applicant_profile
+            application.applicant_id = roles.applicant_id
             application.job = job
             application.save()
             return redirect('application:application_confirmation', job_id=job.id)
     else:
-        form = ApplicationForm(initial={'applicant': applicant_profile.id, 'job': job.id})
+        form = ApplicationForm(initial={'applicant': roles.applicant_id, 'job': job.id})
     return render(request, 'application/apply_form.html', {'form': form, 'job': job})
 @login_required
 def application_confirmation(request, job_id):
@@ -61,19 +66,6 @@ def application_confirmation(request, job_id):
     job = get_object_or_404(Job, pk=job_id)
     return render(request, 'application/application_confirmation.html', {'job': job})
 
-class RecruiterRequiredMixin(LoginRequiredMixin, UserPassesTestMixin):
-    """
-    Mixin to restrict access to views only to recruiters.
-    """
-    def test_func(self):
-        """
-        Checks if the current user is a recruiter.
-
-        Returns:
-            bool: True if the user is a recruiter, False otherwise.
-        """
-        return hasattr(self.request.user, 'recruiter_profile')
-
 @login_required
 def job_applications_list(request, job_id):
     """
@@ -107,7 +99,7 @@ class ApplicationUpdateStatusView(RecruiterRequiredMixin, UpdateView):
         Returns:
             django.db.models.query.QuerySet: The queryset of applications.
         """
-        return Application.objects.filter(job__recruiter__user=self.request.user)
+        return Application.objects.filter(job__recruiter__user=self.request.user, job__deleted_at__isnull=True)
 
     def get_success_url(self):
         """
@@ -121,7 +113,10 @@ class ApplicationUpdateStatusView(RecruiterRequiredMixin, UpdateView):
 @login_required
 def application_detail(request, application_id):
     """
-    Displays the details of a specific application.
+    Displays the details of a specific application, reading archived applications from the archive.
+
+    Only the recruiter who owns the job and the applicant who applied can see it;
+    the candidate's profile is shown to the recruiter only.
 
     Args:
         request (django.http.HttpRequest): The HTTP request object.
@@ -129,6 +124,15 @@ def application_detail(request, application_id):
 
     Returns:
         django.shortcuts.render: Renders the application detail template.
+
+    Raises:
+        Http404: If the application does not exist or belongs to someone else.
     """
-    application = get_object_or_404(Application, pk=application_id)
-    return render(request, 'application/application_detail.html', {'application': application})
+    application = find_application(application_id)
+    roles = get_roles(request)
+    if roles.recruiter_id != application.job.recruiter_id and roles.applicant_id != application.applicant_id:
+        raise Http404('No application matches the given query.')
+    context = {'application': application}
+    if roles.recruiter_id == application.job.recruiter_id:
+        context['candidate'] = get_profile_snapshot(application.applicant_id)
+    return render(request, 'application/application_detail.html', context)
@@ -4,3 +4,15 @@ from django.apps import AppConfig
 class CoreConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'core'
+
+    def ready(self):
+        """
+        Registers signal handlers, maintained counters, the slow query log and system checks.
+        """
+        from django.db.backends.signals import connection_created
+
+        from core import fragments, hashers, metrics, signals  # noqa: F401
+        from core.counters import connect_counters
+        from core.slow_queries import install_slow_query_logger
+        connect_counters()
+        connection_created.connect(install_slow_query_logger, dispatch_uid='slow-query-logger')
@@ -0,0 +1,197 @@
+"""
+Response compression.
+
+``CompressionMiddleware`` is used instead of Django's ``GZipMiddleware``. It adds
+brotli when the optional ``brotli`` package is installed and picks an
+encoding per request from the client's ``Accept-Encoding`` q-values, using
+``COMPRESSION_ENCODINGS`` order to break ties. Only the media types listed
+in ``COMPRESSION_MIN_SIZES`` are compressed, and each has its own size
+threshold: a few hundred bytes of HTML are not worth the CPU, while images,
+archives and fonts are already compressed. Responses that already carry a
+``Content-Encoding`` or ask for ``no-transform`` are left alone.
+
+Streaming responses (``StreamingHttpResponse``, sync or async) go through
+one compressor per response. It is flushed after every chunk, so each chunk
+still reaches the client as soon as it is produced.
+
+Like ``GZipMiddleware``, gzip bodies use Django's ``compress_string`` with
+random header padding as a BREACH mitigation, and strong ETags are made weak.
+"""
+import re
+import zlib
+
+from django.conf import settings
+from django.utils.cache import patch_vary_headers
+from django.utils.deprecation import MiddlewareMixin
+from django.utils.text import compress_string
+
+try:
+    import brotli
+except ImportError:  # :no-index: Optional; responses fall back to gzip without it
+    brotli = None
+
+ACCEPT_ENCODING_RE = re.compile(r'\s*([\w*-]+)\s*(?:;\s*q\s*=\s*([\d.]+))?\s*')
+MAX_RANDOM_BYTES = 100
+GZIP_LEVEL = 6
+"""Level of the streaming gzip compressor; the same as ``compress_string`` uses for bodies."""
+
+
+def available_encodings():
+    """
+    Returns the configured encodings whose compressor is installed, in preference order.
+
+    Returns:
+        list: Encoding names, e.g. ``['br', 'gzip']``.
+    """
+    return [
+        encoding for encoding in settings.COMPRESSION_ENCODINGS
+        if encoding == 'gzip' or (encoding == 'br' and brotli is not None)
+    ]
+
+
+def negotiate_encoding(accept_encoding, encodings):
+    """
+    Picks the encoding the client prefers among those the server offers.
+
+    Args:
+        accept_encoding (str): The ``Accept-Encoding`` request header.
+        encodings (list): Offered encodings in server preference order.
+
+    Returns:
+        str: The chosen encoding, or ``None`` to send the response uncompressed.
+    """
+    weights = {}
+    for part in accept_encoding.lower().split(','):
+        match = ACCEPT_ENCODING_RE.fullmatch(part)
+        if match:
+            try:
+                weights[match[1]] = float(match[2]) if match[2] else 1.0
+            except ValueError:
+                continue
+    best, best_weight = None, 0
+    for encoding in encodings:
+        weight = weights.get(encoding, weights.get('*', 0))
+        if weight > best_weight:
+            best, best_weight = encoding, weight
+    return best
+
+
+def min_size_for(content_type):
+    """
+    Returns the smallest body worth compressing for a media type.
+
+    Args:
+        content_type (str): The ``Content-Type`` response header.
+
+    Returns:
+        int: Threshold in bytes, or ``None`` if the type is not compressed.
+    """
+    media_type = content_type.split(';')[0].strip().lower()
+    for prefix in sorted(settings.COMPRESSION_MIN_SIZES, key=len, reverse=True):
+        if media_type.startswith(prefix):
+            return settings.COMPRESSION_MIN_SIZES[prefix]
+    return None
+
+
+def compress_body(data, encoding):
+    """
+    Compresses a complete response body.
+
+    Args:
+        data (bytes): The body.
+        encoding (str): ``br`` or ``gzip``.
+
+    Returns:
+        bytes: The compressed body.
+    """
+    if encoding == 'br':
+        return brotli.compress(data, quality=settings.COMPRESSION_BROTLI_QUALITY)
+    return compress_string(data, max_random_bytes=MAX_RANDOM_BYTES)
+
+
+def stream_compressor(encoding):
+    """
+    Returns ``(compress, finish)`` callables that compress a stream chunk by chunk.
+
+    ``compress`` flushes after each chunk so every chunk is sent right away.
+    """
+    if encoding == 'br':
+        compressor = brotli.Compressor(quality=settings.COMPRESSION_BROTLI_QUALITY)
+        return (lambda chunk: compressor.process(chunk) + compressor.flush()), compressor.finish
+    compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+    return (lambda chunk: compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH)), compressor.flush
+
+
+def compress_stream(chunks, encoding):
+    """
+    Compresses a sync streaming body.
+    """
+    compress, finish = stream_compressor(encoding)
+    for chunk in chunks:
+        if chunk:
+            yield compress(chunk)
+    yield finish()
+
+
+async def acompress_stream(chunks, encoding):
+    """
+    Compresses an async streaming body.
+    """
+    compress, finish = stream_compressor(encoding)
+    async for chunk in chunks:
+        if chunk:
+            yield compress(chunk)
+    yield finish()
+
+
+class CompressionMiddleware(MiddlewareMixin):
+    """
+    Compresses responses with the best encoding the client accepts.
+
+    Place it above any middleware that reads or changes the response body.
+    """
+
+    def process_response(self, request, response):
+        """
+        Compresses the response when its type, size and the request allow it.
+
+        Args:
+            request (django.http.HttpRequest): The current request.
+            response (django.http.HttpResponse): The response.
+
+        Returns:
+            django.http.HttpResponse: The response, compressed or unchanged.
+        """
+        if response.has_header('Content-Encoding') or response.status_code in (204, 304):
+            return response
+        if 'no-transform' in response.get('Cache-Control', ''):
+            return response
+        min_size = min_size_for(response.get('Content-Type', ''))
+        if min_size is None:
+            return response
+        if not response.streaming and len(response.content) < min_size:
+            return response
+
+        patch_vary_headers(response, ('Accept-Encoding',))
+        encoding = negotiate_encoding(request.META.get('HTTP_ACCEPT_ENCODING', ''), available_encodings())
+        if encoding is None:
+            return response
+
+        if response.streaming:
+            if response.is_async:
+                response.streaming_content = acompress_stream(response.streaming_content, encoding)
+            else:
+                response.streaming_content = compress_stream(response.streaming_content, encoding)
+            del response.headers['Content-Length']
+        else:
+            compressed = compress_body(response.content, encoding)
+            if len(compressed) >= len(response.content):
+                return response
+            response.content = compressed
+            response.headers['Content-Length'] = str(len(compressed))
+
+        etag = response.get('ETag')
+        if etag and etag.startswith('"'):
+            response.headers['ETag'] = 'W/' + etag
+        response.headers['Content-Encoding'] = encoding
+        return response
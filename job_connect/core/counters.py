@@ -0,0 +1,118 @@
+"""
+Maintained counts of rows matching a condition.
+
+``get_count('active_jobs')`` answers from the cache instead of running
+``COUNT(*)``. The first read, and the first read after ``COUNTER_RECONCILE_SECONDS``,
+counts the rows and caches the result. In between, model signals adjust the
+cached value by the change each save or delete makes, once its transaction
+commits. Every instance remembers whether it matched the condition when it
+was loaded, so no extra query is needed to tell.
+
+Writes that skip signals (``QuerySet.update()``, ``bulk_create``, raw SQL)
+are not counted, and neither are saves of instances loaded with the
+condition's fields deferred; the latter drop the cached value instead. Either
+way the count is exact again after the next reconcile.
+"""
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_delete, post_init, post_save
+
+COUNTER_KEY = 'counter:{name}'
+STATE_ATTR = '_counter_states'
+UNKNOWN = object()
+
+COUNTERS = {
+    'active_jobs': ('job.Job', {'is_active': True}),
+    'pending_applications': ('application.Application', {'status': 'pending'}),
+}
+"""Counter name to ``(model label, field values a counted row has)``."""
+
+
+def get_reconcile_timeout():
+    """
+    Returns how long a count is maintained incrementally before it is recomputed.
+    """
+    return getattr(settings, 'COUNTER_RECONCILE_SECONDS', 3600)
+
+
+def _matches(instance, conditions):
+    """
+    Returns whether an instance satisfies the conditions, or ``UNKNOWN`` if a field is deferred.
+    """
+    for field, value in conditions.items():
+        current = instance.__dict__.get(field, UNKNOWN)
+        if current is UNKNOWN:
+            return UNKNOWN
+        if current != value:
+            return False
+    return True
+
+
+def get_count(name):
+    """
+    Returns the maintained count, recomputing it when it is not cached.
+
+    Args:
+        name (str): A key of ``COUNTERS``.
+
+    Returns:
+        int: Number of rows matching the counter's conditions.
+    """
+    key = COUNTER_KEY.format(name=name)
+    value = cache.get(key)
+    if value is None:
+        label, conditions = COUNTERS[name]
+        value = apps.get_model(label)._default_manager.filter(**conditions).count()
+        cache.set(key, value, get_reconcile_timeout())
+    return value
+
+
+def _adjust(name, delta):
+    """
+    Applies a change to a cached count; a missing count is left for the next read to recompute.
+    """
+    try:
+        cache.incr(COUNTER_KEY.format(name=name), delta)
+    except ValueError:
+        pass
+
+
+def reset_count(name):
+    """
+    Drops a cached count so the next read recomputes it.
+    """
+    cache.delete(COUNTER_KEY.format(name=name))
+
+
+def connect_counters():
+    """
+    Connects the signal handlers that maintain every counter in ``COUNTERS``.
+    """
+    for name, (label, conditions) in COUNTERS.items():
+        model = apps.get_model(label)
+
+        def remember(sender, instance, name=name, conditions=conditions, **kwargs):
+            instance.__dict__.setdefault(STATE_ATTR, {})[name] = _matches(instance, conditions)
+
+        def saved(sender, instance, created, name=name, conditions=conditions, **kwargs):
+            states = instance.__dict__.setdefault(STATE_ATTR, {})
+            before = False if created else states.get(name, UNKNOWN)
+            after = _matches(instance, conditions)
+            states[name] = after
+            if before is UNKNOWN or after is UNKNOWN:
+                transaction.on_commit(lambda: reset_count(name))
+            elif before != after:
+                transaction.on_commit(lambda: _adjust(name, 1 if after else -1))
+
+        def deleted(sender, instance, name=name, conditions=conditions, **kwargs):
+            before = instance.__dict__.get(STATE_ATTR, {}).get(name, UNKNOWN)
+            if before is UNKNOWN:
+                transaction.on_commit(lambda: reset_count(name))
+            elif before:
+                transaction.on_commit(lambda: _adjust(name, -1))
+
+        post_init.connect(remember, sender=model, weak=False, dispatch_uid=f'counter-init-{name}')
+        post_save.connect(saved, sender=model, weak=False, dispatch_uid=f'counter-save-{name}')
+        post_delete.connect(deleted, sender=model, weak=False, dispatch_uid=f'counter-delete-{name}')
@@ -0,0 +1,128 @@
+"""
+Password hashing policy.
+
+``PASSWORD_HASHING_POLICY`` picks the preferred algorithm (``argon2``,
+``scrypt`` or ``pbkdf2``) and the ``PASSWORD_*`` cost settings tune it. Every
+policy keeps the other hashers installed so existing hashes still verify;
+Django re-hashes a password with the preferred hasher and current cost on the
+next successful login (``check_password`` upgrades it when ``must_update``),
+so changing the policy or a cost migrates users as they log in.
+
+Hashing is deliberately CPU-bound. Under ASGI, Django's async authentication
+verifies the password on the event loop, so ``PASSWORD_VERIFY_IN_THREAD_POOL``
+switches the login view to ``core.views.alogin_view``, which validates the
+login form in ``run_in_hash_pool`` instead.
+"""
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.contrib.auth.hashers import (
+    Argon2PasswordHasher,
+    PBKDF2PasswordHasher,
+    ScryptPasswordHasher,
+    get_hasher,
+)
+from django.core import checks
+from django.db import close_old_connections
+
+
+class TunedPBKDF2PasswordHasher(PBKDF2PasswordHasher):
+    """
+    PBKDF2-SHA256 with ``PASSWORD_PBKDF2_ITERATIONS`` iterations.
+    """
+
+    @property
+    def iterations(self):
+        return getattr(settings, 'PASSWORD_PBKDF2_ITERATIONS', PBKDF2PasswordHasher.iterations)
+
+
+class TunedScryptPasswordHasher(ScryptPasswordHasher):
+    """
+    Scrypt with a ``PASSWORD_SCRYPT_WORK_FACTOR`` work factor (a power of two).
+    """
+
+    @property
+    def work_factor(self):
+        return getattr(settings, 'PASSWORD_SCRYPT_WORK_FACTOR', ScryptPasswordHasher.work_factor)
+
+
+class TunedArgon2PasswordHasher(Argon2PasswordHasher):
+    """
+    Argon2id with ``PASSWORD_ARGON2_TIME_COST``, ``PASSWORD_ARGON2_MEMORY_COST`` (KiB)
+    and ``PASSWORD_ARGON2_PARALLELISM``. Requires the ``argon2-cffi`` package.
+    """
+
+    @property
+    def time_cost(self):
+        return getattr(settings, 'PASSWORD_ARGON2_TIME_COST', Argon2PasswordHasher.time_cost)
+
+    @property
+    def memory_cost(self):
+        return getattr(settings, 'PASSWORD_ARGON2_MEMORY_COST', Argon2PasswordHasher.memory_cost)
+
+    @property
+    def parallelism(self):
+        return getattr(settings, 'PASSWORD_ARGON2_PARALLELISM', Argon2PasswordHasher.parallelism)
+
+
+@functools.cache
+def get_hash_pool():
+    """
+    Returns the thread pool used for password verification, sized by ``PASSWORD_VERIFY_THREADS``.
+
+    Returns:
+        concurrent.futures.ThreadPoolExecutor: The shared pool.
+    """
+    return ThreadPoolExecutor(
+        max_workers=getattr(settings, 'PASSWORD_VERIFY_THREADS', 4),
+        thread_name_prefix='password-hash',
+    )
+
+
+def _call_with_connections(func, *args):
+    """
+    Calls ``func`` in a pool thread, retiring that thread's database connection as a request would.
+    """
+    close_old_connections()
+    try:
+        return func(*args)
+    finally:
+        close_old_connections()
+
+
+async def run_in_hash_pool(func, *args):
+    """
+    Runs a blocking, hashing-heavy callable in the password thread pool.
+
+    The callable may use the ORM; each pool thread has its own connection.
+
+    Args:
+        func (callable): The callable, e.g. a bound ``form.is_valid``.
+        *args: Positional arguments for ``func``.
+
+    Returns:
+        object: Whatever ``func`` returns.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_hash_pool(), _call_with_connections, func, *args)
+
+
+@checks.register(checks.Tags.security)
+def check_preferred_hasher(app_configs, **kwargs):
+    """
+    Reports a preferred password hasher whose algorithm library is not installed.
+    """
+    hasher = get_hasher('default')
+    if hasher.library is None:
+        return []
+    try:
+        hasher._load_library()
+    except ValueError as error:
+        return [checks.Error(
+            str(error),
+            hint='Install the library or choose another PASSWORD_HASHING_POLICY.',
+            id='core.E001',
+        )]
+    return []
@@ -0,0 +1,97 @@
+"""
+Liveness and readiness probes.
+
+``HealthCheckMiddleware`` sits first in ``MIDDLEWARE`` and answers
+``HEALTH_CHECK_PATHS`` before any other middleware runs, so a probe never
+loads a session, resolves a user, validates the ``Host`` header (probes hit
+the container address) or opens a database connection. The process answering
+is the only thing being checked; database health is reported by the database
+service itself.
+
+``/healthz`` (liveness) answers ``200`` whenever the worker can serve a
+request. ``/readyz`` (readiness) answers ``503`` while the drain file named by
+``HEALTH_DRAIN_FILE`` exists, so an orchestrator's pre-stop hook can take an
+instance out of rotation before gunicorn is told to shut it down gracefully.
+"""
+import json
+import os
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.http import HttpResponse
+
+
+def is_draining():
+    """
+    Returns whether the instance has been marked for draining.
+
+    Returns:
+        bool: ``True`` when ``HEALTH_DRAIN_FILE`` is set and exists.
+    """
+    drain_file = getattr(settings, 'HEALTH_DRAIN_FILE', '')
+    return bool(drain_file) and os.path.exists(drain_file)
+
+
+def probe_response(probe):
+    """
+    Builds the response for a probe.
+
+    Args:
+        probe (str): ``liveness`` or ``readiness``.
+
+    Returns:
+        django.http.HttpResponse: ``200`` when healthy, ``503`` when draining.
+    """
+    healthy = probe == 'liveness' or not is_draining()
+    body = {'status': 'ok' if healthy else 'draining', 'pid': os.getpid()}
+    response = HttpResponse(json.dumps(body), status=200 if healthy else 503, content_type='application/json')
+    response['Cache-Control'] = 'no-store'
+    return response
+
+
+class HealthCheckMiddleware:
+    """
+    Answers the health probe paths without calling the rest of the stack.
+
+    Works in both sync and async mode so probes are answered on the event
+    loop under ASGI.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        """
+        Initializes the middleware.
+
+        Args:
+            get_response (callable): The next middleware or view.
+        """
+        self.get_response = get_response
+        self.paths = settings.HEALTH_CHECK_PATHS
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        """
+        Returns the probe response for a probe path, otherwise calls the next handler.
+
+        Args:
+            request (django.http.HttpRequest): The current request.
+
+        Returns:
+            django.http.HttpResponse: The response.
+        """
+        probe = self.paths.get(request.path_info)
+        if iscoroutinefunction(self):
+            return self.__acall__(request, probe)
+        if probe is not None:
+            return probe_response(probe)
+        return self.get_response(request)
+
+    async def __acall__(self, request, probe):
+        """
+        Returns the probe response or awaits the next handler in async mode.
+        """
+        if probe is not None:
+            return probe_response(probe)
+        return await self.get_response(request)
@@ -0,0 +1,68 @@
+import statistics
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.test import Client, override_settings
+from django.urls import reverse
+
+from core.compression import available_encodings
+
+
+class Command(BaseCommand):
+    """
+    Measures response size and latency of large pages with each content encoding.
+
+    Every page is requested ``--requests`` times per encoding through the full
+    middleware stack with the anonymous page cache disabled, so the server time
+    includes rendering and compressing. The transfer time is the body size on a
+    ``--mbps`` link; their sum approximates what a client on that link waits for.
+    Run ``seed_data`` first so the listings are large.
+    """
+    help = 'Benchmark bytes on the wire and latency per content encoding.'
+
+    def add_arguments(self, parser):
+        """
+        Adds command line arguments.
+
+        Args:
+            parser (argparse.ArgumentParser): The argument parser.
+        """
+        parser.add_argument('--requests', type=int, default=20, help='Requests per page and encoding.')
+        parser.add_argument('--mbps', type=float, default=10.0, help='Client bandwidth in megabits per second.')
+        parser.add_argument('--query', default='engineer', help='Keyword used for the search page.')
+
+    def handle(self, *args, **options):
+        """
+        Requests each page with each encoding and prints a table.
+        """
+        paths = [reverse('job:job_list'), f"{reverse('job:job_search')}?q={options['query']}"]
+        client = Client()
+        self.stdout.write(
+            f"{'page':<24}{'encoding':<10}{'bytes':>10}{'ratio':>8}{'server ms':>11}{'transfer ms':>13}{'total ms':>10}"
+        )
+        with override_settings(ALLOWED_HOSTS=['testserver'], JOB_PAGE_CACHE_TIMEOUT=0):
+            for path in paths:
+                identity_size = None
+                for encoding in ['identity'] + available_encodings():
+                    size, server = self.measure(client, path, encoding, options['requests'])
+                    identity_size = identity_size or size
+                    transfer = size * 8 / (options['mbps'] * 1000)
+                    self.stdout.write(
+                        f'{path[:23]:<24}{encoding:<10}{size:>10}{size / identity_size:>8.2f}'
+                        f'{server:>11.1f}{transfer:>13.1f}{server + transfer:>10.1f}'
+                    )
+
+    def measure(self, client, path, encoding, requests):
+        """
+        Returns the body size in bytes and the median server time in milliseconds.
+        """
+        timings = []
+        for _ in range(requests):
+            started = time.perf_counter()
+            response = client.get(path, HTTP_ACCEPT_ENCODING=encoding)
+            timings.append(time.perf_counter() - started)
+            if response.status_code != 200:
+                raise CommandError(f'{path} returned {response.status_code}.')
+            if response.get('Content-Encoding', 'identity') != encoding:
+                raise CommandError(f'{path} was not sent with {encoding}.')
+        return len(response.content), statistics.median(timings) * 1000
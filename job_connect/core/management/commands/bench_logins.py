@@ -0,0 +1,69 @@
+import time
+
+from django.conf import settings
+from django.contrib.auth import authenticate, get_user_model
+from django.core.management.base import BaseCommand
+from django.test import override_settings
+
+BENCH_USERNAME = 'bench-logins'
+BENCH_PASSWORD = 'bench-password-123'
+
+
+class Command(BaseCommand):
+    """
+    Measures password logins per second per core for each hashing policy.
+
+    For every policy in ``PASSWORD_HASHING_POLICIES`` a throwaway user is
+    given a password hashed by that policy's preferred hasher at the
+    configured cost, then ``authenticate`` is timed on a single thread (one
+    core). Policies whose algorithm library is not installed are reported as
+    unavailable. Multiply by the number of worker cores to estimate how large
+    a login storm the deployment absorbs.
+    """
+    help = 'Benchmark logins per second per core for each password hashing policy.'
+
+    def add_arguments(self, parser):
+        """
+        Adds command line arguments.
+
+        Args:
+            parser (argparse.ArgumentParser): The argument parser.
+        """
+        parser.add_argument('--logins', type=int, default=20, help='Logins per policy.')
+        parser.add_argument('--policies', default=','.join(settings.PASSWORD_HASHING_POLICIES),
+                            help='Comma-separated names from PASSWORD_HASHING_POLICIES.')
+
+    def handle(self, *args, **options):
+        """
+        Runs the benchmark for each policy and prints a table.
+        """
+        User = get_user_model()
+        user = User.objects.create_user(username=BENCH_USERNAME, user_type='applicant')
+        self.stdout.write(f"{'policy':<10}{'logins/s/core':>16}{'ms/login':>12}")
+        try:
+            for name in options['policies'].split(','):
+                name = name.strip()
+                with override_settings(PASSWORD_HASHERS=settings.PASSWORD_HASHING_POLICIES[name]):
+                    try:
+                        rate = self.run_policy(user, options['logins'])
+                    except ValueError as error:
+                        self.stdout.write(f'{name:<10}{"unavailable":>16}  ({error})')
+                        continue
+                self.stdout.write(f'{name:<10}{rate:>16.1f}{1000 / rate:>12.1f}')
+        finally:
+            user.delete()
+
+    def run_policy(self, user, logins):
+        """
+        Hashes the bench password with the preferred hasher and times ``logins`` authentications.
+
+        Returns:
+            float: Logins per second on one core.
+        """
+        user.set_password(BENCH_PASSWORD)
+        user.save(update_fields=['password'])
+        started = time.perf_counter()
+        for _ in range(logins):
+            if authenticate(username=BENCH_USERNAME, password=BENCH_PASSWORD) is None:
+                raise RuntimeError('Benchmark login failed.')
+        return logins / (time.perf_counter() - started)
@@ -0,0 +1,79 @@
+import time
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.test import Client, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+BENCH_USERNAME = 'bench-sessions'
+
+
+class Command(BaseCommand):
+    """
+    Measures authenticated page throughput for each session backend.
+
+    A throwaway user logs in once per backend and requests the applicant
+    dashboard repeatedly through the full middleware stack. For each backend
+    the command reports requests per second and the number of
+    ``django_session`` queries per request. It runs against the configured
+    database and cache, so run it against a staging copy rather than
+    production.
+    """
+    help = 'Benchmark authenticated page throughput across session backends.'
+
+    def add_arguments(self, parser):
+        """
+        Adds command line arguments.
+
+        Args:
+            parser (argparse.ArgumentParser): The argument parser.
+        """
+        parser.add_argument('--requests', type=int, default=500, help='Requests per backend.')
+        parser.add_argument('--backends', default=','.join(settings.SESSION_BACKENDS),
+                            help='Comma-separated names from SESSION_BACKENDS.')
+
+    def handle(self, *args, **options):
+        """
+        Runs the benchmark for each backend and prints a table.
+        """
+        User = get_user_model()
+        user = User.objects.create_user(username=BENCH_USERNAME, password='bench-password', user_type='applicant')
+        url = reverse('applicant:applicant_dashboard')
+        self.stdout.write(f"{'backend':<16}{'req/s':>10}{'session queries/req':>22}")
+        try:
+            for name in options['backends'].split(','):
+                engine = settings.SESSION_BACKENDS[name.strip()]
+                with override_settings(SESSION_ENGINE=engine, ALLOWED_HOSTS=['testserver']):
+                    rate, queries = self.run_backend(user, url, options['requests'])
+                self.stdout.write(f'{name:<16}{rate:>10.1f}{queries:>22.2f}')
+        finally:
+            user.delete()
+
+    def run_backend(self, user, url, requests):
+        """
+        Times ``requests`` GETs of ``url`` as ``user`` with the current session engine.
+
+        Returns:
+            tuple: ``(requests_per_second, session_queries_per_request)``.
+        """
+        cache.clear()
+        client = Client()
+        client.force_login(user)
+        client.get(url)
+
+        sample = min(requests, 50)
+        with CaptureQueriesContext(connection) as captured:
+            for _ in range(sample):
+                client.get(url)
+        session_queries = sum('django_session' in query['sql'] for query in captured) / sample
+
+        started = time.perf_counter()
+        for _ in range(requests):
+            client.get(url)
+        elapsed = time.perf_counter() - started
+        client.logout()
+        return requests / elapsed, session_queries
@@ -0,0 +1,85 @@
+import time
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.test import Client, override_settings
+from django.urls import reverse
+
+BENCH_PREFIX = 'bench-signup-'
+FAST_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']
+
+
+class Command(BaseCommand):
+    """
+    Measures signup throughput through the full request path.
+
+    Posts ``--count`` signups for each role to the signup views and reports
+    signups per second and SQL statements per signup (user, group membership,
+    profile, outbox, session and login bookkeeping included). Password hashing
+    normally dominates a signup; ``--fast-hasher`` swaps in a cheap hasher to
+    isolate the database path. Rate limiting is switched off for the run and
+    the users created are deleted afterwards. Run it against a staging copy
+    rather than production.
+    """
+    help = 'Benchmark signups per second.'
+
+    def add_arguments(self, parser):
+        """
+        Adds command line arguments.
+
+        Args:
+            parser (argparse.ArgumentParser): The argument parser.
+        """
+        parser.add_argument('--count', type=int, default=200, help='Signups per role.')
+        parser.add_argument('--fast-hasher', action='store_true', help='Hash passwords with MD5 to measure the database path only.')
+
+    def handle(self, *args, **options):
+        """
+        Runs the benchmark for each role and prints a table.
+        """
+        overrides = {'ALLOWED_HOSTS': ['testserver'], 'RATELIMIT_ENABLED': False}
+        if options['fast_hasher']:
+            overrides['PASSWORD_HASHERS'] = FAST_HASHERS
+        self.stdout.write(f"{'role':<12}{'signups/s':>12}{'statements/signup':>20}")
+        try:
+            with override_settings(**overrides):
+                for role in ('applicant', 'recruiter'):
+                    rate, statements = self.run_role(role, options['count'])
+                    self.stdout.write(f'{role:<12}{rate:>12.1f}{statements:>20.1f}')
+        finally:
+            get_user_model().objects.filter(username__startswith=BENCH_PREFIX).delete()
+
+    def run_role(self, role, count):
+        """
+        Times ``count`` signups of ``role`` users.
+
+        Returns:
+            tuple: ``(signups_per_second, statements_per_signup)``.
+        """
+        url = reverse(f'core:{role}_signup')
+
+        def post(index):
+            data = {
+                'username': f'{BENCH_PREFIX}{role}-{index}',
+                'password1': 'bench-password-123',
+                'password2': 'bench-password-123',
+            }
+            response = Client().post(url, data)
+            if response.status_code != 302:
+                raise RuntimeError(f'Signup failed with status {response.status_code}.')
+
+        statements = []
+
+        def record(execute, sql, params, many, context):
+            statements.append(sql)
+            return execute(sql, params, many, context)
+
+        post('warmup')
+        with connection.execute_wrapper(record):
+            post('sample')
+        started = time.perf_counter()
+        for index in range(count):
+            post(index)
+        elapsed = time.perf_counter() - started
+        return count / elapsed, len(statements)
@@ -0,0 +1,110 @@
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+STARTUP_SCRIPT = '''
+import asyncio, json, sys, time
+started = time.perf_counter()
+from wsgiref.util import setup_testing_defaults
+from job_connect.{server} import application
+booted = time.perf_counter()
+
+
+def wsgi_get(path):
+    environ = {{'PATH_INFO': path}}
+    setup_testing_defaults(environ)
+    status = []
+    b''.join(application(environ, lambda code, headers: status.append(code)))
+    return int(status[0].split()[0])
+
+
+async def asgi_get(path):
+    scope = {{
+        'type': 'http', 'asgi': {{'version': '3.0'}}, 'http_version': '1.1', 'method': 'GET',
+        'scheme': 'http', 'path': path, 'raw_path': path.encode(), 'query_string': b'', 'root_path': '',
+        'headers': [(b'host', b'127.0.0.1')], 'client': ('127.0.0.1', 0), 'server': ('127.0.0.1', 8000),
+    }}
+    messages, requests = [], [{{'type': 'http.request', 'body': b'', 'more_body': False}}]
+
+    async def receive():
+        if requests:
+            return requests.pop()
+        await asyncio.Future()  # The client never disconnects; Django cancels this after responding.
+
+    async def send(message):
+        messages.append(message)
+
+    await application(scope, receive, send)
+    return messages[0]['status']
+
+
+timings = {{'boot': booted - started}}
+for name, path in (('health', '/healthz'), ('page', '/jobs/')):
+    request_started = time.perf_counter()
+    status = asyncio.run(asgi_get(path)) if '{server}' == 'asgi' else wsgi_get(path)
+    timings[name] = time.perf_counter() - request_started
+    if status != 200:
+        sys.exit(f'{{path}} returned {{status}}')
+print(json.dumps(timings))
+'''
+"""Run in a fresh interpreter: imports the server module, then times a probe and a page request."""
+
+
+class Command(BaseCommand):
+    """
+    Measures how long a fresh process takes to become able to serve requests.
+
+    Each run starts a new interpreter that imports ``job_connect.wsgi`` or
+    ``job_connect.asgi`` (Django setup, app registry, URLconf-independent
+    middleware), then times the first ``/healthz`` probe, which loads the
+    middleware chain, and the first job list page, which also imports the
+    URLconf and views, compiles templates and opens the database connection.
+    With ``preload_app`` gunicorn pays the import once in the master; the
+    first-request costs are paid by every forked worker. ``--migrate`` also
+    times the ``makemigrations --merge`` and ``migrate`` steps the old
+    entrypoint ran before every server start.
+    """
+    help = 'Benchmark process startup and first-request latency of the WSGI and ASGI applications.'
+
+    def add_arguments(self, parser):
+        """
+        Adds command line arguments.
+
+        Args:
+            parser (argparse.ArgumentParser): The argument parser.
+        """
+        parser.add_argument('--runs', type=int, default=5, help='Fresh processes per server.')
+        parser.add_argument('--migrate', action='store_true', help='Also time the migration steps.')
+
+    def handle(self, *args, **options):
+        """
+        Runs the measurements and prints the medians in milliseconds.
+        """
+        self.stdout.write(f"{'server':<10}{'boot ms':>10}{'probe ms':>10}{'page ms':>10}")
+        for server in ('wsgi', 'asgi'):
+            runs = [self.run_server(server) for _ in range(options['runs'])]
+            medians = {key: statistics.median(run[key] for run in runs) * 1000 for key in runs[0]}
+            self.stdout.write(f"{server:<10}{medians['boot']:>10.0f}{medians['health']:>10.1f}{medians['page']:>10.1f}")
+
+        if options['migrate']:
+            started = time.perf_counter()
+            for command in (['makemigrations', '--merge', '--noinput'], ['migrate', '--noinput']):
+                subprocess.run([sys.executable, sys.argv[0], *command], check=True, capture_output=True)
+            self.stdout.write(f"{'migrate':<10}{(time.perf_counter() - started) * 1000:>10.0f}")
+
+    def run_server(self, server):
+        """
+        Starts one fresh interpreter for ``server`` and returns its timings in seconds.
+        """
+        result = subprocess.run(
+            [sys.executable, '-c', STARTUP_SCRIPT.format(server=server)],
+            env=os.environ, capture_output=True, text=True,
+        )
+        if result.returncode:
+            raise CommandError(f'{server} run failed:\n{result.stderr}')
+        return json.loads(result.stdout.strip().splitlines()[-1])
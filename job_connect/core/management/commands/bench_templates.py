@@ -0,0 +1,114 @@
+import statistics
+import time
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import AnonymousUser
+from django.core.cache import cache
+from django.core.management.base import BaseCommand
+from django.template import Engine, RequestContext
+from django.template.backends.django import get_installed_libraries
+from django.test import RequestFactory, override_settings
+from django.utils import timezone
+
+from applicant.models import ApplicantProfile
+from application.models import Application
+from job.models import Job
+
+UNCACHED_LOADERS = [
+    'django.template.loaders.filesystem.Loader',
+    'django.template.loaders.app_directories.Loader',
+]
+CONFIGURATIONS = {
+    'uncached loader': {'loaders': UNCACHED_LOADERS, 'fragments': False, 'warm': False},
+    'cached loader': {'loaders': [('django.template.loaders.cached.Loader', UNCACHED_LOADERS)], 'fragments': False, 'warm': False},
+    'fragments cold': {'loaders': [('django.template.loaders.cached.Loader', UNCACHED_LOADERS)], 'fragments': True, 'warm': False},
+    'fragments warm': {'loaders': [('django.template.loaders.cached.Loader', UNCACHED_LOADERS)], 'fragments': True, 'warm': True},
+}
+"""Template loaders and fragment cache state for each measured configuration."""
+
+
+class Command(BaseCommand):
+    """
+    Measures how long the job and application listings take to render.
+
+    The listings are rendered with ``--rows`` in-memory objects (no database
+    access, so only template work is timed) under each configuration: a fresh
+    parse per render (the uncached loader), the cached loader, and the
+    cached loader with row fragments either missing from the cache (cold, every
+    render starts from an empty cache) or already cached (warm).
+    """
+    help = 'Benchmark listing render time with the cached loader and fragment caching.'
+
+    def add_arguments(self, parser):
+        """
+        Adds command line arguments.
+
+        Args:
+            parser (argparse.ArgumentParser): The argument parser.
+        """
+        parser.add_argument('--rows', type=int, default=500, help='Rows per listing.')
+        parser.add_argument('--renders', type=int, default=20, help='Renders per listing and configuration.')
+
+    def handle(self, *args, **options):
+        """
+        Renders each listing under each configuration and prints the median render time.
+        """
+        listings = self.get_listings(options['rows'])
+        request = RequestFactory().get('/')
+        request.user = AnonymousUser()
+        self.stdout.write(f"{'configuration':<18}" + ''.join(f'{name + " ms":>22}' for name in listings))
+        for label, configuration in CONFIGURATIONS.items():
+            engine = Engine(
+                loaders=configuration['loaders'],
+                libraries=get_installed_libraries(),
+                context_processors=settings.TEMPLATES[0]['OPTIONS']['context_processors'],
+            )
+            timeout = settings.FRAGMENT_CACHE_TIMEOUT if configuration['fragments'] else 0
+            timings = []
+            with override_settings(FRAGMENT_CACHE_TIMEOUT=timeout):
+                for template_name, context in listings.values():
+                    timings.append(self.time_renders(engine, template_name, context, request, configuration, options['renders']))
+            self.stdout.write(f'{label:<18}' + ''.join(f'{timing:>22.1f}' for timing in timings))
+        cache.clear()
+
+    def get_listings(self, rows):
+        """
+        Builds the unsaved objects each listing template renders.
+
+        Returns:
+            dict: Mapping of listing name to ``(template_name, context)``.
+        """
+        now = timezone.now()
+        User = get_user_model()
+        jobs = [
+            Job(pk=index, title=f'Software Engineer {index}', location='Denver, CO', posted_date=now, updated_at=now)
+            for index in range(1, rows + 1)
+        ]
+        applications = [
+            Application(
+                pk=index, job=jobs[0], application_date=now, updated_at=now, status='reviewed',
+                applicant=ApplicantProfile(user=User(username=f'applicant{index}')),
+                cover_letter='I have shipped Django services for years.\nHappy to talk.' * 5,
+            )
+            for index in range(1, rows + 1)
+        ]
+        return {
+            'job list': ('job/job_list.html', {'jobs': jobs}),
+            'applications list': ('application/job_applications_list.html', {'job': jobs[0], 'applications': applications}),
+        }
+
+    def time_renders(self, engine, template_name, context, request, configuration, renders):
+        """
+        Returns the median render time in milliseconds.
+        """
+        timings = []
+        if configuration['warm']:
+            engine.get_template(template_name).render(RequestContext(request, context))
+        for _ in range(renders):
+            if configuration['fragments'] and not configuration['warm']:
+                cache.clear()
+            started = time.perf_counter()
+            engine.get_template(template_name).render(RequestContext(request, context))
+            timings.append(time.perf_counter() - started)
+        return statistics.median(timings) * 1000
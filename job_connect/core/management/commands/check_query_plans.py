@@ -0,0 +1,42 @@
+from django.core.management.base import BaseCommand, CommandError
+from core.query_plans import check_query_plans
+
+
+class Command(BaseCommand):
+    """
+    Explains the hot list queries and fails if any reads a table with a full scan.
+
+    Run it against a seeded database; with ``--repeat`` it also times each
+    query, which is how the index changes are benchmarked (run it before and
+    after migrating).
+    """
+    help = 'Check that the hot queries are served by indexes.'
+
+    def add_arguments(self, parser):
+        """
+        Adds the ``--repeat`` and ``--plans`` options.
+        """
+        parser.add_argument('--repeat', type=int, default=0, help='Run each query this many times and report the mean.')
+        parser.add_argument('--plans', action='store_true', help='Print every plan, not only failing ones.')
+
+    def handle(self, *args, **options):
+        """
+        Prints one line per query and raises ``CommandError`` when a query scans a table.
+
+        Sorts are reported but allowed: ordering rows gathered for several
+        keys (e.g. all of a recruiter's jobs) cannot come from one index.
+        """
+        failed = []
+        for name, plan, scans, sorted_rows, mean_ms in check_query_plans(options['repeat']):
+            timing = f'{mean_ms:>9.2f} ms' if mean_ms is not None else ''
+            status = f"full scan of {', '.join(scans)}" if scans else 'ok'
+            if sorted_rows:
+                status += ', sorts'
+            self.stdout.write(f'{name:<28}{timing}  {status}')
+            if scans or options['plans']:
+                for line in plan.splitlines():
+                    self.stdout.write(f'    {line}')
+            if scans:
+                failed.append(name)
+        if failed:
+            raise CommandError(f"Queries without a supporting index: {', '.join(failed)}.")
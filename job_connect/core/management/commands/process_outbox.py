@@ -0,0 +1,49 @@
+import time
+
+from django.core.management.base import BaseCommand
+from core.outbox import DEFAULT_BATCH_SIZE, outbox_lag, process_outbox
+
+
+class Command(BaseCommand):
+    """
+    Applies pending outbox records to their consumers (e.g. the job search index).
+
+    Run it once to drain the outbox, or with ``--loop`` as a long-running
+    worker. Records are only deleted after their batch has been applied, so
+    a crashed or killed worker never loses changes.
+    """
+    help = 'Consume the transactional outbox.'
+
+    def add_arguments(self, parser):
+        """
+        Adds command line arguments.
+
+        Args:
+            parser (argparse.ArgumentParser): The argument parser.
+        """
+        parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE, help='Records applied per transaction.')
+        parser.add_argument('--loop', action='store_true', help='Keep polling for new records.')
+        parser.add_argument('--interval', type=float, default=1.0, help='Seconds to sleep when the outbox is empty (with --loop).')
+        parser.add_argument('--stats', action='store_true', help='Only print lag metrics.')
+
+    def handle(self, *args, **options):
+        """
+        Drains the outbox, once or continuously.
+        """
+        if options['stats']:
+            lag = outbox_lag()
+            last_run = lag['last_run_age_seconds']
+            self.stdout.write(f"pending: {lag['pending']}  oldest: {lag['oldest_age_seconds']:.1f}s  "
+                              f"last run: {'never' if last_run is None else f'{last_run:.1f}s ago'}")
+            for topic, count in sorted(lag['pending_by_topic'].items()):
+                self.stdout.write(f"  {topic}: {count}")
+            return
+
+        while True:
+            consumed = process_outbox(options['batch_size'])
+            if consumed:
+                self.stdout.write(f'Applied {consumed} outbox records.')
+            if not options['loop']:
+                break
+            if not consumed:
+                time.sleep(options['interval'])
@@ -0,0 +1,48 @@
+import time
+
+from django.conf import settings
+from django.contrib.sessions.models import Session
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+
+class Command(BaseCommand):
+    """
+    Deletes expired database sessions in small batches.
+
+    Unlike ``clearsessions``, which issues a single ``DELETE`` over the whole
+    table, each batch is its own short statement, so the purge never holds
+    locks on ``django_session`` for long while users are logging in.
+    """
+    help = 'Delete expired sessions in batches.'
+
+    def add_arguments(self, parser):
+        """
+        Adds command line arguments.
+
+        Args:
+            parser (argparse.ArgumentParser): The argument parser.
+        """
+        parser.add_argument('--batch-size', type=int, default=5000, help='Sessions deleted per statement.')
+        parser.add_argument('--pause', type=float, default=0.0, help='Seconds to sleep between batches.')
+
+    def handle(self, *args, **options):
+        """
+        Deletes expired sessions until none are left.
+        """
+        if not settings.SESSION_ENGINE.endswith('db'):
+            self.stdout.write(f'{settings.SESSION_ENGINE} does not store sessions in the database; nothing to purge.')
+            return
+
+        now = timezone.now()
+        deleted = 0
+        while True:
+            keys = list(
+                Session.objects.filter(expire_date__lt=now).values_list('session_key', flat=True)[:options['batch_size']]
+            )
+            if not keys:
+                break
+            deleted += Session.objects.filter(session_key__in=keys).delete()[0]
+            if options['pause']:
+                time.sleep(options['pause'])
+        self.stdout.write(self.style.SUCCESS(f'Deleted {deleted} expired sessions.'))
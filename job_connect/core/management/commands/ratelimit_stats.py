@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+from core.ratelimit import ratelimit_stats
+
+
+class Command(BaseCommand):
+    """
+    Prints how many rate-limited requests each scope allowed and shed.
+
+    The counters live in the default cache, so with the local-memory cache
+    they only cover the process running the command; point ``REDIS_URL`` at a
+    shared cache to see totals across workers.
+    """
+    help = 'Show rate limiter counters.'
+
+    def handle(self, *args, **options):
+        """
+        Prints one line per scope.
+        """
+        for scope, counts in sorted(ratelimit_stats().items()):
+            total = counts['allowed'] + counts['shed']
+            share = counts['shed'] / total * 100 if total else 0
+            self.stdout.write(f"{scope}: allowed {counts['allowed']}  shed {counts['shed']} ({share:.1f}%)")
@@ -0,0 +1,114 @@
+import random
+import uuid
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from applicant.models import ApplicantProfile, Skill
+from application.models import Application
+from job.models import Job
+from recruiter.models import RecruiterProfile
+
+CITIES = ['Denver, CO', 'Boulder, CO', 'Austin, TX', 'Seattle, WA', 'New York, NY', 'Boston, MA',
+          'San Francisco, CA', 'Chicago, IL', 'Atlanta, GA', 'Remote']
+STATUSES = [status for status, _ in Application._meta.get_field('status').choices]
+
+
+class Command(BaseCommand):
+    """
+    Seeds the database with synthetic users, profiles, skills, jobs and applications.
+
+    Used to produce realistic volumes for the benchmark commands. Every seeded
+    user shares the password ``password`` and has a username starting with
+    ``seed-``.
+    """
+    help = 'Bulk-create synthetic applicants, recruiters, skills and jobs for benchmarking.'
+
+    def add_arguments(self, parser):
+        """
+        Adds command line arguments.
+
+        Args:
+            parser (argparse.ArgumentParser): The argument parser.
+        """
+        parser.add_argument('--applicants', type=int, default=1000)
+        parser.add_argument('--recruiters', type=int, default=50)
+        parser.add_argument('--jobs', type=int, default=500)
+        parser.add_argument('--skills', type=int, default=200)
+        parser.add_argument('--skills-per-applicant', type=int, default=8)
+        parser.add_argument('--skills-per-job', type=int, default=5)
+        parser.add_argument('--applications-per-applicant', type=int, default=0)
+        parser.add_argument('--batch-size', type=int, default=5000)
+        parser.add_argument('--seed', type=int, default=None, help='Random seed for reproducible data.')
+
+    def handle(self, *args, **options):
+        """
+        Creates the data in batches.
+        """
+        rng = random.Random(options['seed'])
+        batch_size = options['batch_size']
+        tag = uuid.uuid4().hex[:6]
+        password = make_password('password')
+        User = get_user_model()
+
+        skills = list(Skill.objects.values_list('id', flat=True))
+        missing = options['skills'] - len(skills)
+        if missing > 0:
+            Skill.objects.bulk_create([Skill(name=f'seed-skill-{tag}-{i}') for i in range(missing)], batch_size=batch_size)
+            skills = list(Skill.objects.values_list('id', flat=True))
+
+        def create_users(kind, count):
+            users = [User(username=f'seed-{tag}-{kind[0]}{i}', password=password, user_type=kind) for i in range(count)]
+            User.objects.bulk_create(users, batch_size=batch_size)
+            return list(User.objects.filter(username__startswith=f'seed-{tag}-{kind[0]}').order_by('pk').values_list('pk', flat=True))
+
+        with transaction.atomic():
+            recruiter_users = create_users('recruiter', options['recruiters'])
+            RecruiterProfile.objects.bulk_create([
+                RecruiterProfile(user_id=user_id, company_name=f'Seed Company {i}', location=rng.choice(CITIES))
+                for i, user_id in enumerate(recruiter_users)
+            ], batch_size=batch_size)
+            recruiters = list(RecruiterProfile.objects.filter(user_id__in=recruiter_users).values_list('pk', flat=True))
+
+            jobs = []
+            for i in range(options['jobs']):
+                job = Job(recruiter_id=rng.choice(recruiters), title=f'Seed Job {i}', description='Seeded job posting.',
+                          location=rng.choice(CITIES))
+                job.geocode_location()
+                jobs.append(job)
+            jobs = Job.objects.bulk_create(jobs, batch_size=batch_size)
+            Job.skills_required.through.objects.bulk_create([
+                Job.skills_required.through(job_id=job.pk, skill_id=skill_id)
+                for job in jobs
+                for skill_id in rng.sample(skills, min(options['skills_per_job'], len(skills)))
+            ], batch_size=batch_size)
+
+        created = 0
+        while created < options['applicants']:
+            count = min(batch_size, options['applicants'] - created)
+            with transaction.atomic():
+                users = [User(username=f'seed-{tag}-a{created + i}', password=password, user_type='applicant')
+                         for i in range(count)]
+                User.objects.bulk_create(users)
+                user_ids = User.objects.filter(username__in=[user.username for user in users]).values_list('pk', flat=True)
+                profiles = ApplicantProfile.objects.bulk_create([
+                    ApplicantProfile(user_id=user_id, headline='Seeded applicant', summary='Seeded.') for user_id in user_ids
+                ])
+                ApplicantProfile.skills.through.objects.bulk_create([
+                    ApplicantProfile.skills.through(applicantprofile_id=profile.pk, skill_id=skill_id)
+                    for profile in profiles
+                    for skill_id in rng.sample(skills, min(options['skills_per_applicant'], len(skills)))
+                ])
+                Application.objects.bulk_create([
+                    Application(applicant_id=profile.pk, job_id=job.pk, status=rng.choice(STATUSES))
+                    for profile in profiles
+                    for job in rng.sample(jobs, min(options['applications_per_applicant'], len(jobs)))
+                ])
+            created += count
+            self.stdout.write(f'  {created} applicants...')
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Seeded {options['recruiters']} recruiters, {options['jobs']} jobs and {options['applicants']} applicants "
+            f"(usernames seed-{tag}-*, password 'password')."
+        ))
@@ -0,0 +1,46 @@
+from django.core.management.base import BaseCommand
+from core.models import SlowQuery
+
+ORDERINGS = {'total': '-total_ms', 'calls': '-calls', 'max': '-max_ms'}
+
+
+class Command(BaseCommand):
+    """
+    Prints the slowest statement shapes recorded by the slow query log.
+
+    Each line shows the call count, total, mean and longest duration, where
+    the statement was last issued from and its normalized SQL; ``--plans``
+    adds the latest captured plan.
+    """
+    help = 'Show the slow query log.'
+
+    def add_arguments(self, parser):
+        """
+        Adds the ``--limit``, ``--order``, ``--plans`` and ``--reset`` options.
+        """
+        parser.add_argument('--limit', type=int, default=10, help='Number of statements to show.')
+        parser.add_argument('--order', choices=ORDERINGS, default='total', help='Sort by total, calls or max time.')
+        parser.add_argument('--plans', action='store_true', help='Print the captured plans.')
+        parser.add_argument('--reset', action='store_true', help='Delete the log after printing it.')
+
+    def handle(self, *args, **options):
+        """
+        Prints one block per statement shape.
+        """
+        rows = SlowQuery.objects.order_by(ORDERINGS[options['order']])[:options['limit']]
+        if not rows:
+            self.stdout.write('No slow queries recorded.')
+        for row in rows:
+            self.stdout.write(
+                f'{row.calls:>6} calls  total {row.total_ms:>9.1f} ms  mean {row.total_ms / row.calls:>8.1f} ms'
+                f'  max {row.max_ms:>8.1f} ms  {row.view or "-"}  {row.frame or "-"}'
+            )
+            self.stdout.write(f'    {row.normalized_sql}')
+            if options['plans'] and row.plan:
+                label = 'EXPLAIN ANALYZE' if row.plan_analyzed else 'EXPLAIN'
+                self.stdout.write(f'    {label}:')
+                for line in row.plan.splitlines():
+                    self.stdout.write(f'      {line}')
+        if options['reset']:
+            deleted, _ = SlowQuery.objects.all().delete()
+            self.stdout.write(f'Deleted {deleted} slow query records.')
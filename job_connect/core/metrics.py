@@ -0,0 +1,364 @@
+"""
+Application metrics in the Prometheus text exposition format.
+
+``MetricsMiddleware`` times every request and counts its database queries and
+query time per URL name. Counts are accumulated in process and flushed to the
+``metrics`` cache at most every ``METRICS_FLUSH_INTERVAL`` seconds as one
+``incr`` per changed series. That alias holds nothing else, so the counters
+are never culled to make room for other entries. It must be shared (Redis,
+via ``REDIS_URL``) when running several workers: the ``/metrics`` endpoint
+then reports all workers together, whichever worker answers the scrape.
+With the local-memory fallback each worker only reports its own requests,
+and ``check_shared_metrics_cache`` warns about it. Series are keyed by URL name, which is the same in every worker.
+Every name is read on each scrape, so no series index has to be kept in
+sync.
+
+The scrape adds these, read from where they are already maintained:
+
+* the anonymous page cache hit/miss counters (``job.cache``);
+* rate limiter decisions (``core.ratelimit``);
+* outbox queue depth and age (``core.outbox``);
+* active sessions, counted at most every ``METRICS_GAUGE_TTL`` seconds;
+* domain gauges from ``core.counters``, which are maintained incrementally
+  instead of counted per scrape.
+
+Database time is measured with ``connection.execute_wrapper`` in the request
+thread. Async views run their queries in other threads, so their requests
+are timed but their queries are not counted.
+"""
+import hmac
+import threading
+import time
+from collections import Counter
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.contrib.sessions.models import Session
+from django.core import checks
+from django.core.cache import cache, caches
+from django.core.cache.backends.locmem import LocMemCache
+from django.db import connection
+from django.http import HttpResponse, HttpResponseForbidden
+from django.urls import get_resolver
+from django.urls.resolvers import URLPattern, URLResolver
+from django.utils import timezone
+
+from core import counters, outbox
+from core.ratelimit import client_ip, ratelimit_stats
+from job.cache import page_cache_stats
+
+METRICS_CACHE = 'metrics'
+METRIC_KEY = 'metrics:{metric}:{view}:{label}'
+SESSIONS_KEY = 'metrics:active-sessions'
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+UNRESOLVED = '<unresolved>'
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+"""Upper bounds in seconds of the request latency histogram buckets (plus ``+Inf``)."""
+
+MICROSECONDS = 1_000_000
+"""Durations are accumulated as integer microseconds so they can be ``incr``-ed."""
+
+_pending = Counter()
+_lock = threading.Lock()
+_last_flush = time.monotonic()
+
+
+def get_metrics_cache():
+    """
+    Returns the cache holding the shared counters, falling back to the default cache.
+    """
+    return caches[METRICS_CACHE] if METRICS_CACHE in settings.CACHES else cache
+
+
+def record_request(view, duration, queries, query_time):
+    """
+    Adds one request to the in-process counters and flushes them when due.
+
+    Args:
+        view (str): URL name of the view, or ``<unresolved>``.
+        duration (float): Request time in seconds.
+        queries (int): Number of database queries.
+        query_time (float): Time spent in database queries in seconds.
+    """
+    global _last_flush
+    bucket = next((str(bound) for bound in LATENCY_BUCKETS if duration <= bound), '+Inf')
+    with _lock:
+        _pending[METRIC_KEY.format(metric='latency', view=view, label=bucket)] += 1
+        _pending[METRIC_KEY.format(metric='latency', view=view, label='sum')] += int(duration * MICROSECONDS)
+        if queries:
+            _pending[METRIC_KEY.format(metric='db', view=view, label='queries')] += queries
+            _pending[METRIC_KEY.format(metric='db', view=view, label='time')] += int(query_time * MICROSECONDS)
+        due = time.monotonic() - _last_flush >= getattr(settings, 'METRICS_FLUSH_INTERVAL', 10)
+    if due:
+        flush()
+
+
+def flush():
+    """
+    Adds the in-process counters to the shared ones in the cache and clears them.
+    """
+    global _last_flush
+    with _lock:
+        pending = dict(_pending)
+        _pending.clear()
+        _last_flush = time.monotonic()
+    metrics_cache = get_metrics_cache()
+    for key, value in pending.items():
+        if not metrics_cache.add(key, value, None):
+            try:
+                metrics_cache.incr(key, value)
+            except ValueError:
+                metrics_cache.set(key, value, None)
+
+
+def view_names():
+    """
+    Returns every namespaced URL name of the project, plus ``<unresolved>``.
+
+    Returns:
+        list: The view labels used by the request metrics.
+    """
+    names = []
+
+    def collect(patterns, namespace):
+        for pattern in patterns:
+            if isinstance(pattern, URLResolver):
+                collect(pattern.url_patterns, f'{namespace}{pattern.namespace}:' if pattern.namespace else namespace)
+            elif isinstance(pattern, URLPattern) and pattern.name:
+                names.append(namespace + pattern.name)
+
+    collect(get_resolver().url_patterns, '')
+    return sorted(set(names)) + [UNRESOLVED]
+
+
+def active_sessions():
+    """
+    Returns the number of unexpired database sessions, recounted at most every ``METRICS_GAUGE_TTL`` seconds.
+
+    Returns:
+        int: The count, or ``None`` when sessions are not stored in the database.
+    """
+    if settings.SESSION_ENGINE.rsplit('.', 1)[-1] not in ('db', 'cached_db'):
+        return None
+    return cache.get_or_set(
+        SESSIONS_KEY,
+        lambda: Session.objects.filter(expire_date__gt=timezone.now()).count(),
+        getattr(settings, 'METRICS_GAUGE_TTL', 60),
+    )
+
+
+def _escape(value):
+    """
+    Escapes a label value.
+    """
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+class Exposition:
+    """
+    Accumulates metric families as exposition-format lines.
+    """
+
+    def __init__(self):
+        self.lines = []
+
+    def family(self, name, kind, help_text):
+        """
+        Starts a metric family with its ``HELP`` and ``TYPE`` lines.
+        """
+        self.lines += [f'# HELP {name} {help_text}', f'# TYPE {name} {kind}']
+
+    def sample(self, name, value, **labels):
+        """
+        Adds one sample with its labels.
+        """
+        label_text = ','.join(f'{key}="{_escape(label)}"' for key, label in labels.items())
+        self.lines.append(f'{name}{{{label_text}}} {value}' if labels else f'{name} {value}')
+
+    def render(self):
+        """
+        Returns the exposition text.
+        """
+        return '\n'.join(self.lines) + '\n'
+
+
+def render_metrics():
+    """
+    Renders all metrics in the text exposition format.
+
+    Returns:
+        str: The exposition.
+    """
+    flush()
+    views = view_names()
+    keys = {
+        METRIC_KEY.format(metric='latency', view=view, label=label)
+        for view in views for label in [str(bound) for bound in LATENCY_BUCKETS] + ['+Inf', 'sum']
+    } | {
+        METRIC_KEY.format(metric='db', view=view, label=label) for view in views for label in ('queries', 'time')
+    }
+    values = get_metrics_cache().get_many(list(keys))
+
+    def value(metric, view, label):
+        return values.get(METRIC_KEY.format(metric=metric, view=view, label=label), 0)
+
+    out = Exposition()
+    out.family('jobconnect_request_duration_seconds', 'histogram', 'Request latency by URL name.')
+    for view in views:
+        buckets = [(str(bound), value('latency', view, str(bound))) for bound in LATENCY_BUCKETS]
+        buckets.append(('+Inf', value('latency', view, '+Inf')))
+        if not any(count for _, count in buckets):
+            continue
+        cumulative = 0
+        for bound, count in buckets:
+            cumulative += count
+            out.sample('jobconnect_request_duration_seconds_bucket', cumulative, view=view, le=bound)
+        out.sample('jobconnect_request_duration_seconds_sum', value('latency', view, 'sum') / MICROSECONDS, view=view)
+        out.sample('jobconnect_request_duration_seconds_count', cumulative, view=view)
+
+    out.family('jobconnect_db_queries_total', 'counter', 'Database queries run by requests, by URL name.')
+    for view in views:
+        if value('db', view, 'queries'):
+            out.sample('jobconnect_db_queries_total', value('db', view, 'queries'), view=view)
+    out.family('jobconnect_db_query_seconds_total', 'counter', 'Time spent in database queries, by URL name.')
+    for view in views:
+        if value('db', view, 'queries'):
+            out.sample('jobconnect_db_query_seconds_total', value('db', view, 'time') / MICROSECONDS, view=view)
+
+    page_cache = page_cache_stats()
+    out.family('jobconnect_page_cache_requests_total', 'counter', 'Anonymous job page cache lookups by result.')
+    out.sample('jobconnect_page_cache_requests_total', page_cache['hits'], result='hit')
+    out.sample('jobconnect_page_cache_requests_total', page_cache['misses'], result='miss')
+
+    out.family('jobconnect_ratelimit_requests_total', 'counter', 'Rate limited requests by scope and outcome.')
+    for scope, outcomes in ratelimit_stats().items():
+        for outcome, count in outcomes.items():
+            out.sample('jobconnect_ratelimit_requests_total', count, scope=scope, outcome=outcome)
+
+    lag = outbox.outbox_lag()
+    out.family('jobconnect_outbox_pending', 'gauge', 'Outbox records waiting to be processed, by topic.')
+    for topic, count in sorted(lag['pending_by_topic'].items()):
+        out.sample('jobconnect_outbox_pending', count, topic=topic)
+    out.family('jobconnect_outbox_oldest_age_seconds', 'gauge', 'Age of the oldest waiting outbox record.')
+    out.sample('jobconnect_outbox_oldest_age_seconds', lag['oldest_age_seconds'])
+
+    sessions = active_sessions()
+    if sessions is not None:
+        out.family('jobconnect_active_sessions', 'gauge', 'Unexpired database sessions.')
+        out.sample('jobconnect_active_sessions', sessions)
+
+    out.family('jobconnect_active_jobs', 'gauge', 'Active job postings.')
+    out.sample('jobconnect_active_jobs', counters.get_count('active_jobs'))
+    out.family('jobconnect_pending_applications', 'gauge', 'Applications waiting for review.')
+    out.sample('jobconnect_pending_applications', counters.get_count('pending_applications'))
+    return out.render()
+
+
+def metrics_view(request):
+    """
+    Serves the metrics to clients in ``METRICS_ALLOWED_IPS`` or presenting ``METRICS_TOKEN``.
+
+    Args:
+        request (django.http.HttpRequest): The scrape request.
+
+    Returns:
+        django.http.HttpResponse: The exposition, or ``403``.
+    """
+    token = getattr(settings, 'METRICS_TOKEN', '')
+    authorized = client_ip(request) in settings.METRICS_ALLOWED_IPS or (
+        token and hmac.compare_digest(request.headers.get('Authorization', '').encode(), f'Bearer {token}'.encode())
+    )
+    if not authorized:
+        return HttpResponseForbidden()
+    return HttpResponse(render_metrics(), content_type=CONTENT_TYPE)
+
+
+@checks.register(checks.Tags.caches)
+def check_shared_metrics_cache(app_configs, **kwargs):
+    """
+    Warns when production metrics are kept in a per-process cache.
+    """
+    if settings.DEBUG or not isinstance(get_metrics_cache(), LocMemCache):
+        return []
+    return [checks.Warning(
+        'Metrics are stored in a local-memory cache, so /metrics only reports the worker that answers the scrape.',
+        hint='Set REDIS_URL to share the metrics cache between workers.',
+        id='core.W002',
+    )]
+
+
+class MetricsMiddleware:
+    """
+    Records request latency and database work per URL name.
+
+    Place it near the top of ``MIDDLEWARE`` so the timing covers the other
+    middleware. Works in both sync and async mode.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        """
+        Initializes the middleware.
+
+        Args:
+            get_response (callable): The next middleware or view.
+        """
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        """
+        Times the request and counts its queries.
+
+        Args:
+            request (django.http.HttpRequest): The current request.
+
+        Returns:
+            django.http.HttpResponse: The response.
+        """
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        queries = QueryTimer()
+        started = time.perf_counter()
+        with connection.execute_wrapper(queries):
+            response = self.get_response(request)
+        record_request(self.view_name(request), time.perf_counter() - started, queries.count, queries.time)
+        return response
+
+    async def __acall__(self, request):
+        """
+        Times the request in async mode.
+        """
+        started = time.perf_counter()
+        response = await self.get_response(request)
+        record_request(self.view_name(request), time.perf_counter() - started, 0, 0)
+        return response
+
+    @staticmethod
+    def view_name(request):
+        """
+        Returns the namespaced URL name of the resolved view.
+        """
+        match = getattr(request, 'resolver_match', None)
+        return match.view_name if match and match.url_name else UNRESOLVED
+
+
+class QueryTimer:
+    """
+    ``execute_wrapper`` that counts queries and the time spent in them.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.time = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.count += 1
+            self.time += time.perf_counter() - started
@@ -0,0 +1,49 @@
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.utils.functional import SimpleLazyObject
+from core.roles import resolve_roles
+
+
+class UserRoleMiddleware:
+    """
+    Attaches the user's roles to the request as ``request.roles``.
+
+    The roles are resolved on first access only, so requests that never
+    check permissions pay nothing. Must come after ``AuthenticationMiddleware``.
+    Works in both sync and async mode, so it does not force async views onto
+    a thread under ASGI; async views use ``core.roles.aget_roles`` instead of
+    touching ``request.roles``.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        """
+        Initializes the middleware.
+
+        Args:
+            get_response (callable): The next middleware or view.
+        """
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        """
+        Sets ``request.roles`` and calls the next handler.
+
+        Args:
+            request (django.http.HttpRequest): The current request.
+
+        Returns:
+            django.http.HttpResponse: The response.
+        """
+        request.roles = SimpleLazyObject(lambda: resolve_roles(request))
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        return self.get_response(request)
+
+    async def __acall__(self, request):
+        """
+        Awaits the next handler in async mode.
+        """
+        return await self.get_response(request)
@@ -0,0 +1,34 @@
+# Generated by Django 5.2 on 2026-10-19 14:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0003_role_groups'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SlowQuery',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('fingerprint', models.CharField(max_length=32, unique=True)),
+                ('normalized_sql', models.TextField()),
+                ('sample_sql', models.TextField()),
+                ('calls', models.PositiveIntegerField(default=0)),
+                ('total_ms', models.FloatField(default=0)),
+                ('max_ms', models.FloatField(default=0)),
+                ('view', models.CharField(blank=True, max_length=200)),
+                ('frame', models.CharField(blank=True, max_length=300)),
+                ('plan', models.TextField(blank=True)),
+                ('plan_analyzed', models.BooleanField(default=False)),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+from django.contrib.auth.mixins import LoginRequiredMixin, UserPassesTestMixin
+from core.roles import get_roles
+
+
+class RecruiterRequiredMixin(LoginRequiredMixin, UserPassesTestMixin):
+    """
+    Mixin to restrict access to views only to recruiters.
+    """
+
+    def test_func(self):
+        """
+        Checks if the current user is a recruiter.
+
+        Returns:
+            bool: True if the user is a recruiter, False otherwise.
+        """
+        return get_roles(self.request).is_recruiter
+
@@ -72,3 +72,81 @@ class BaseModel(models.Model):
         abstract = True
 
 
+class ProfileQuerySet(models.QuerySet):
+    """
+    Queryset for role profiles, which signup creates empty.
+
+    Profile models name the required field that marks them as filled in with
+    ``COMPLETE_FIELD``.
+    """
+
+    def complete(self):
+        """
+        Returns the profiles that have been filled in.
+        """
+        return self.exclude(**{self.model.COMPLETE_FIELD: ''})
+
+
+class OutboxEvent(BaseModel):
+    """
+    A change record written in the same transaction as the change it describes.
+
+    Consumers (see ``core.outbox``) read these in id order, apply them to
+    derived stores such as search indexes, and delete them once applied.
+
+    Attributes:
+        topic (django.db.models.CharField): What kind of object changed (e.g. 'job', 'recruiter').
+        object_id (django.db.models.BigIntegerField): Primary key of the changed object.
+        action (django.db.models.CharField): 'upsert' or 'delete'.
+    """
+    ACTION_CHOICES = (
+        ('upsert', 'Upsert'),
+        ('delete', 'Delete'),
+    )
+    topic = models.CharField(max_length=50)
+    object_id = models.BigIntegerField()
+    action = models.CharField(max_length=10, choices=ACTION_CHOICES, default='upsert')
+
+    def __str__(self):
+        """
+        Returns a string representation of the event.
+        """
+        return f"{self.action} {self.topic}:{self.object_id}"
+
+
+class SlowQuery(BaseModel):
+    """
+    Aggregated statistics for one shape of slow SQL statement.
+
+    Rows are written by ``core.slow_queries`` for statements slower than
+    ``SLOW_QUERY_THRESHOLD_MS``; statements that differ only in literal values
+    share a fingerprint and therefore a row.
+
+    Attributes:
+        fingerprint (django.db.models.CharField): Hash of the normalized SQL.
+        normalized_sql (django.db.models.TextField): The SQL with literals and placeholders replaced by ``?``.
+        sample_sql (django.db.models.TextField): The most recent slow statement, normalized unless ``SLOW_QUERY_CAPTURE_PARAMS`` keeps a ``SELECT``'s parameters.
+        calls (django.db.models.PositiveIntegerField): Number of slow executions recorded.
+        total_ms (django.db.models.FloatField): Summed duration of those executions.
+        max_ms (django.db.models.FloatField): Longest execution.
+        view (django.db.models.CharField): URL name of the view that last ran it, if any.
+        frame (django.db.models.CharField): Project source line that last ran it.
+        plan (django.db.models.TextField): Latest captured ``EXPLAIN`` output.
+        plan_analyzed (django.db.models.BooleanField): Whether ``plan`` came from ``EXPLAIN ANALYZE``.
+    """
+    fingerprint = models.CharField(max_length=32, unique=True)
+    normalized_sql = models.TextField()
+    sample_sql = models.TextField()
+    calls = models.PositiveIntegerField(default=0)
+    total_ms = models.FloatField(default=0)
+    max_ms = models.FloatField(default=0)
+    view = models.CharField(max_length=200, blank=True)
+    frame = models.CharField(max_length=300, blank=True)
+    plan = models.TextField(blank=True)
+    plan_analyzed = models.BooleanField(default=False)
+
+    def __str__(self):
+        """
+        Returns a string representation of the slow query.
+        """
+        return f"{self.fingerprint[:8]} x{self.calls} {self.normalized_sql[:60]}"
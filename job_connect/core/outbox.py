@@ -0,0 +1,145 @@
+"""
+Transactional outbox for keeping derived stores (search indexes and the like) in sync.
+
+Writers call ``record_change`` from inside the transaction that modifies the
+data, so the change record commits or rolls back together with the change
+itself. Consumers call ``process_outbox``, which claims a batch of records in
+id order, hands the object ids to the handler registered for each topic and
+deletes the records in the same transaction. If a handler fails the batch is
+rolled back and retried later, so every change is applied at least once;
+handlers must therefore be idempotent, which is easiest when they re-read the
+current state of the objects rather than trusting the recorded action.
+"""
+import logging
+import time
+from collections import defaultdict
+
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.db.models import Count, Min
+from django.utils import timezone
+
+from core.models import OutboxEvent
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 500
+LAST_RUN_KEY = 'outbox:last-run'
+
+_handlers = {}
+
+
+def register_handler(topic, handler):
+    """
+    Registers the function that applies changes for a topic.
+
+    Args:
+        topic (str): The topic, e.g. ``'job'``.
+        handler (callable): Called as ``handler(object_ids)`` with a set of primary keys.
+    """
+    _handlers[topic] = handler
+
+
+def record_change(topic, object_id, action='upsert'):
+    """
+    Records a change to a single object.
+
+    Args:
+        topic (str): The topic of the changed object.
+        object_id (int): Primary key of the changed object.
+        action (str): ``'upsert'`` or ``'delete'``.
+    """
+    OutboxEvent.objects.create(topic=topic, object_id=object_id, action=action)
+
+
+def record_changes(topic, object_ids, action='upsert'):
+    """
+    Records a change to several objects of the same topic with one INSERT.
+
+    Args:
+        topic (str): The topic of the changed objects.
+        object_ids (iterable): Primary keys of the changed objects.
+        action (str): ``'upsert'`` or ``'delete'``.
+    """
+    OutboxEvent.objects.bulk_create([
+        OutboxEvent(topic=topic, object_id=object_id, action=action) for object_id in set(object_ids)
+    ])
+
+
+def process_batch(batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Claims and applies one batch of outbox records.
+
+    Records are locked with ``SKIP LOCKED`` where the database supports it, so
+    several consumers can run side by side without applying the same batch.
+    Duplicate changes to the same object within a batch are applied once.
+
+    Args:
+        batch_size (int): Maximum number of records to claim.
+
+    Returns:
+        int: Number of records consumed.
+    """
+    with transaction.atomic():
+        queryset = OutboxEvent.objects.order_by('pk')
+        if connection.features.has_select_for_update_skip_locked:
+            queryset = queryset.select_for_update(skip_locked=True)
+        events = list(queryset.values_list('pk', 'topic', 'object_id')[:batch_size])
+        if not events:
+            return 0
+
+        by_topic = defaultdict(set)
+        for _, topic, object_id in events:
+            by_topic[topic].add(object_id)
+        for topic, object_ids in by_topic.items():
+            handler = _handlers.get(topic)
+            if handler is None:
+                logger.warning('No outbox handler for topic %r; dropping %d changes.', topic, len(object_ids))
+                continue
+            handler(object_ids)
+
+        OutboxEvent.objects.filter(pk__in=[pk for pk, _, _ in events]).delete()
+    cache.set(LAST_RUN_KEY, time.time(), timeout=None)
+    return len(events)
+
+
+def process_outbox(batch_size=DEFAULT_BATCH_SIZE, max_batches=None):
+    """
+    Applies outbox records until the outbox is empty.
+
+    Args:
+        batch_size (int): Records claimed per transaction.
+        max_batches (int, optional): Stop after this many batches.
+
+    Returns:
+        int: Total number of records consumed.
+    """
+    total = batches = 0
+    while max_batches is None or batches < max_batches:
+        consumed = process_batch(batch_size)
+        if not consumed:
+            break
+        total += consumed
+        batches += 1
+    return total
+
+
+def outbox_lag():
+    """
+    Reports how far the consumers are behind the writers.
+
+    Returns:
+        dict: ``pending`` (records waiting), ``oldest_age_seconds`` (age of the oldest
+        waiting record, 0.0 when empty), ``pending_by_topic`` and ``last_run_age_seconds``
+        (None if no consumer has run since the cache was cleared).
+    """
+    rows = OutboxEvent.objects.order_by().values('topic').annotate(count=Count('pk'), oldest=Min('created_at'))
+    counts = {row['topic']: row['count'] for row in rows}
+    oldest = min((row['oldest'] for row in rows), default=None)
+    last_run = cache.get(LAST_RUN_KEY)
+    return {
+        'pending': sum(counts.values()),
+        'pending_by_topic': counts,
+        'oldest_age_seconds': (timezone.now() - oldest).total_seconds() if oldest else 0.0,
+        'last_run_age_seconds': time.time() - last_run if last_run is not None else None,
+    }
@@ -0,0 +1,158 @@
+"""
+Plan checks for the hot query patterns.
+
+``HOT_QUERIES`` mirrors the list queries the busiest views run, with
+parameters taken from rows already in the database. ``check_query_plans``
+explains each one and reports the tables it reads with a full scan, which
+means no index serves the filter or ordering, and whether it sorts rows
+instead of reading them from an index in order. The counts maintained by
+``core.counters`` are checked too, since reconciling them runs the same
+filter over the whole table. Run ``manage.py check_query_plans``
+against a seeded database (``seed_data --applications-per-applicant 5``) after
+changing a model's indexes or one of these queries.
+
+On PostgreSQL the check disables sequential scans for the ``EXPLAIN``, so a
+small seeded table cannot hide a missing index: the planner only falls back
+to a sequential scan when no index applies at all.
+"""
+import re
+import time
+
+from django.apps import apps
+from django.db import connection, transaction
+
+from application.models import Application
+from core.counters import COUNTERS
+from job.models import Job
+from recruiter.models import RecruiterProfile
+
+FULL_SCAN_PATTERNS = {
+    'sqlite': re.compile(r'\bSCAN (\w+)$', re.MULTILINE),
+    'postgresql': re.compile(r'\bSeq Scan on (\w+)'),
+}
+"""Per backend, a pattern matching a full table scan in ``EXPLAIN`` output; group 1 is the table."""
+
+SORT_PATTERNS = {
+    'sqlite': re.compile(r'USE TEMP B-TREE FOR ORDER BY'),
+    'postgresql': re.compile(r'\bSort Key:'),
+}
+"""Per backend, a pattern matching a sort step in ``EXPLAIN`` output."""
+
+
+def _first(queryset, field):
+    """
+    Returns ``field`` of the first row of ``queryset``, used as a sample query parameter.
+    """
+    return queryset.order_by('pk').values_list(field, flat=True).first()
+
+
+def recruiter_jobs():
+    """
+    A recruiter's postings, newest first (``recruiter_job_list``, ``RecruiterJobList``).
+    """
+    return Job.objects.filter(recruiter_id=_first(Job.objects.all(), 'recruiter_id')).order_by('-posted_date')
+
+
+def job_list():
+    """
+    The first page of the public job listing (``job_list``).
+    """
+    return Job.objects.order_by('-posted_date')[:20]
+
+
+def applicant_applications():
+    """
+    An applicant's applications, newest first (``applicant_applications``).
+    """
+    applicant_id = _first(Application.objects.all(), 'applicant_id')
+    return Application.objects.filter(applicant_id=applicant_id).order_by('-application_date')
+
+
+def recruiter_applications():
+    """
+    Applications to a recruiter's postings, newest first (``job_applications_list``).
+    """
+    user_id = _first(RecruiterProfile.objects.filter(jobs__applications__isnull=False), 'user_id')
+    jobs = Job.objects.filter(recruiter__user_id=user_id)
+    return Application.objects.filter(job__in=jobs).order_by('-created_at')
+
+
+def counted_rows(name):
+    """
+    Returns a function building the rows a ``core.counters`` count covers.
+    """
+    def build():
+        label, conditions = COUNTERS[name]
+        return apps.get_model(label)._default_manager.filter(**conditions).values('pk')
+    return build
+
+
+COUNT_QUERIES = {f'{name}_count': counted_rows(name) for name in COUNTERS}
+"""Counts are timed with ``count()`` rather than by fetching their rows."""
+
+HOT_QUERIES = {
+    'recruiter_jobs': recruiter_jobs,
+    'job_list': job_list,
+    'applicant_applications': applicant_applications,
+    'recruiter_applications': recruiter_applications,
+    **COUNT_QUERIES,
+}
+"""Query name to a function building the queryset."""
+
+
+def full_scans(plan, vendor):
+    """
+    Returns the tables a plan reads with a full scan.
+
+    Args:
+        plan (str): ``QuerySet.explain()`` output.
+        vendor (str): The database vendor, e.g. ``sqlite``.
+
+    Returns:
+        list: Table names; empty when every table is read through an index, or the backend is not supported.
+    """
+    pattern = FULL_SCAN_PATTERNS.get(vendor)
+    return pattern.findall(plan) if pattern else []
+
+
+def sorts(plan, vendor):
+    """
+    Returns whether a plan sorts rows instead of reading them in index order.
+    """
+    pattern = SORT_PATTERNS.get(vendor)
+    return bool(pattern and pattern.search(plan))
+
+
+def explain(queryset):
+    """
+    Returns the plan of a queryset, with sequential scans discouraged on PostgreSQL.
+    """
+    with transaction.atomic():
+        if connection.vendor == 'postgresql':
+            with connection.cursor() as cursor:
+                cursor.execute('SET LOCAL enable_seqscan = off')
+        return queryset.explain()
+
+
+def check_query_plans(repeat=0):
+    """
+    Explains, and optionally times, every query in ``HOT_QUERIES``.
+
+    Args:
+        repeat (int): How many times to run each query for the timing; 0 skips timing.
+
+    Returns:
+        list: ``(name, plan, full scans, whether it sorts, mean milliseconds or None)`` per query.
+    """
+    results = []
+    for name, build in HOT_QUERIES.items():
+        queryset = build()
+        plan = explain(queryset)
+        mean_ms = None
+        if repeat:
+            started = time.perf_counter()
+            for _ in range(repeat):
+                queryset.count() if name in COUNT_QUERIES else list(queryset.all())
+            mean_ms = (time.perf_counter() - started) / repeat * 1000
+        results.append((name, plan, full_scans(plan, connection.vendor), sorts(plan, connection.vendor), mean_ms))
+    return results
@@ -0,0 +1,184 @@
+"""
+Rate limiting for expensive anonymous endpoints.
+
+Login and signup hash a password on every attempt, so a credential-stuffing
+burst can take all the CPU. ``rate_limit(scope)`` wraps a view and checks a
+token bucket per key (client IP, submitted username) before the view runs;
+a request that finds any of its buckets empty gets a ``429`` with
+``Retry-After`` and never reaches the form, the database or the hasher.
+
+Each bucket holds up to ``limit`` tokens and refills continuously at
+``limit / period`` tokens per second, which behaves like a sliding window
+without the burst at window edges of fixed counters. Bucket state lives in
+the default cache, so limits are shared by all workers when the cache is
+shared (Redis) and per process with the local-memory cache. Reads and writes
+are not atomic across workers; concurrent requests may occasionally get a
+token more than the limit, which is fine for shedding load.
+
+Limits are configured per scope in ``RATE_LIMITS`` as
+``{key: (limit, period_seconds)}``; ``ratelimit_stats`` reports how many
+requests each scope allowed and shed.
+"""
+import functools
+import inspect
+import logging
+import time
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse
+
+logger = logging.getLogger(__name__)
+
+BUCKET_KEY = 'ratelimit:{scope}:{key}:{value}'
+STATS_KEY = 'ratelimit:stats:{scope}:{outcome}'
+STATS_TIMEOUT = None
+
+
+def client_ip(request):
+    """
+    Returns the client address, honouring ``RATELIMIT_TRUSTED_PROXIES`` hops of ``X-Forwarded-For``.
+
+    Args:
+        request (django.http.HttpRequest): The current request.
+
+    Returns:
+        str: The client IP address.
+    """
+    proxies = getattr(settings, 'RATELIMIT_TRUSTED_PROXIES', 0)
+    forwarded = request.META.get('HTTP_X_FORWARDED_FOR')
+    if proxies and forwarded:
+        hops = [hop.strip() for hop in forwarded.split(',') if hop.strip()]
+        if hops:
+            return hops[-min(proxies, len(hops))]
+    return request.META.get('REMOTE_ADDR', '')
+
+
+KEY_FUNCTIONS = {
+    'ip': client_ip,
+    'username': lambda request: request.POST.get('username', '').strip().casefold(),
+}
+"""How each bucket key is derived from a request."""
+
+
+def _record(scope, outcome):
+    """
+    Increments the allowed or shed counter of a scope.
+    """
+    key = STATS_KEY.format(scope=scope, outcome=outcome)
+    if not cache.add(key, 1, STATS_TIMEOUT):
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.set(key, 1, STATS_TIMEOUT)
+
+
+def check_rate_limit(request, scope):
+    """
+    Takes a token from every bucket of ``scope`` that applies to the request.
+
+    Args:
+        request (django.http.HttpRequest): The current request.
+        scope (str): A key of ``RATE_LIMITS``.
+
+    Returns:
+        float: 0 if the request is allowed, otherwise the seconds until it would be.
+    """
+    now = time.time()
+    buckets = {}
+    for key, (limit, period) in settings.RATE_LIMITS.get(scope, {}).items():
+        value = KEY_FUNCTIONS[key](request)
+        if value:
+            buckets[BUCKET_KEY.format(scope=scope, key=key, value=value)] = (limit, period)
+    if not buckets:
+        return 0
+
+    states = cache.get_many(list(buckets))
+    updated, retry_after = {}, 0
+    for cache_key, (limit, period) in buckets.items():
+        tokens, stamp = states.get(cache_key, (limit, now))
+        rate = limit / period
+        tokens = min(limit, tokens + (now - stamp) * rate)
+        if tokens < 1:
+            retry_after = max(retry_after, (1 - tokens) / rate)
+        updated[cache_key] = (tokens, now)
+
+    if retry_after:
+        _record(scope, 'shed')
+        logger.warning('Rate limit %r exceeded by %s.', scope, client_ip(request))
+        return retry_after
+    longest = max(period for _, period in buckets.values())
+    cache.set_many({key: (tokens - 1, stamp) for key, (tokens, stamp) in updated.items()}, longest)
+    _record(scope, 'allowed')
+    return 0
+
+
+def rate_limited_response(retry_after):
+    """
+    Returns the ``429 Too Many Requests`` response.
+
+    Args:
+        retry_after (float): Seconds until the client may retry.
+
+    Returns:
+        django.http.HttpResponse: The response.
+    """
+    response = HttpResponse('Too many attempts. Please try again later.', status=429, content_type='text/plain')
+    response['Retry-After'] = str(max(1, round(retry_after)))
+    return response
+
+
+def rate_limit(scope, methods=('POST',)):
+    """
+    Decorates a sync or async view so requests over the ``scope`` limits are rejected before it runs.
+
+    Args:
+        scope (str): A key of ``RATE_LIMITS``.
+        methods (tuple): HTTP methods that are limited; others pass through.
+
+    Returns:
+        callable: The decorator.
+    """
+    def decorator(view):
+        def limited(request):
+            if not settings.RATELIMIT_ENABLED or request.method not in methods:
+                return 0
+            return check_rate_limit(request, scope)
+
+        if inspect.iscoroutinefunction(view):
+            @functools.wraps(view)
+            async def async_wrapper(request, *args, **kwargs):
+                retry_after = await sync_to_async(limited)(request)
+                if retry_after:
+                    return rate_limited_response(retry_after)
+                return await view(request, *args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(view)
+        def wrapper(request, *args, **kwargs):
+            retry_after = limited(request)
+            if retry_after:
+                return rate_limited_response(retry_after)
+            return view(request, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def ratelimit_stats():
+    """
+    Returns how many limited requests each scope allowed and shed.
+
+    Returns:
+        dict: Mapping of scope to ``{'allowed': int, 'shed': int}``.
+    """
+    keys = {
+        STATS_KEY.format(scope=scope, outcome=outcome): (scope, outcome)
+        for scope in settings.RATE_LIMITS
+        for outcome in ('allowed', 'shed')
+    }
+    values = cache.get_many(list(keys))
+    stats = {scope: {'allowed': 0, 'shed': 0} for scope in settings.RATE_LIMITS}
+    for key, (scope, outcome) in keys.items():
+        stats[scope][outcome] = values.get(key, 0)
+    return stats
@@ -0,0 +1,191 @@
+"""
+Per-user role resolution shared by every permission check.
+
+Whether a user is a recruiter or an applicant depends on which profile
+rows exist, so checking it used to cost a query per ``hasattr`` call. The
+``UserRoleMiddleware`` exposes ``request.roles``, resolved lazily on first
+use and stored in the session together with a per-user version number kept
+in the cache. Creating or deleting a profile bumps that version, so every
+session of the user re-resolves its roles once; otherwise authorization
+costs one cache read and no queries.
+
+The version only reaches every worker through a shared cache (``REDIS_URL``).
+With the per-process local-memory cache a bump is seen by one worker only,
+so stored roles are also trusted for at most ``ROLES_MAX_AGE`` seconds, which
+bounds how long another worker keeps using revoked roles.
+"""
+import time
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import transaction
+
+from applicant.models import ApplicantProfile
+from recruiter.models import RecruiterProfile
+
+ROLES_SESSION_KEY = '_user_roles'
+ROLES_VERSION_KEY = 'core:roles-version:{}'
+
+
+class UserRoles:
+    """
+    The profiles a user has.
+
+    Attributes:
+        recruiter_id (int): Primary key of the user's complete recruiter profile, or None.
+        applicant_id (int): Primary key of the user's complete applicant profile, or None.
+    """
+    __slots__ = ('recruiter_id', 'applicant_id')
+
+    def __init__(self, recruiter_id=None, applicant_id=None):
+        """
+        Initializes the roles.
+        """
+        self.recruiter_id = recruiter_id
+        self.applicant_id = applicant_id
+
+    @property
+    def is_recruiter(self):
+        """
+        Returns True if the user has a complete recruiter profile.
+        """
+        return self.recruiter_id is not None
+
+    @property
+    def is_applicant(self):
+        """
+        Returns True if the user has a complete applicant profile.
+        """
+        return self.applicant_id is not None
+
+
+def get_roles_version(user_id):
+    """
+    Returns the current roles version of a user.
+
+    Args:
+        user_id (int): Primary key of the user.
+
+    Returns:
+        int: The version (0 if roles were never invalidated).
+    """
+    return cache.get(ROLES_VERSION_KEY.format(user_id), 0)
+
+
+def _bump_roles_version(user_id):
+    """
+    Moves a user to a new roles version.
+    """
+    key = ROLES_VERSION_KEY.format(user_id)
+    if not cache.add(key, 1, timeout=None):
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.set(key, 1, timeout=None)
+
+
+def invalidate_roles(user_id):
+    """
+    Forces every session of a user to re-resolve its roles.
+
+    The version is bumped now and again on commit, so a concurrent request
+    that resolved the old rows before the commit is not trusted either.
+
+    Args:
+        user_id (int): Primary key of the user.
+    """
+    _bump_roles_version(user_id)
+    transaction.on_commit(lambda: _bump_roles_version(user_id))
+
+
+def load_roles(user):
+    """
+    Reads a user's profile ids from the database in one query.
+
+    A profile only counts once it is complete: signup creates it empty, and
+    the user is sent to the profile create view until it is filled in.
+
+    Args:
+        user (core.models.User): An authenticated user.
+
+    Returns:
+        UserRoles: The user's roles.
+    """
+    row = get_user_model().objects.filter(pk=user.pk).values_list(
+        'recruiter_profile__id', f'recruiter_profile__{RecruiterProfile.COMPLETE_FIELD}',
+        'applicant_profile__id', f'applicant_profile__{ApplicantProfile.COMPLETE_FIELD}',
+    ).first()
+    if not row:
+        return UserRoles()
+    recruiter_id, recruiter_complete, applicant_id, applicant_complete = row
+    return UserRoles(recruiter_id if recruiter_complete else None, applicant_id if applicant_complete else None)
+
+
+def resolve_roles(request):
+    """
+    Returns the roles of the request's user, from the session when still current.
+
+    Args:
+        request (django.http.HttpRequest): The current request.
+
+    Returns:
+        UserRoles: The user's roles; anonymous users have none.
+    """
+    user = request.user
+    if not user.is_authenticated:
+        return UserRoles()
+    session = getattr(request, 'session', None)
+    version = get_roles_version(user.pk)
+    stored = session.get(ROLES_SESSION_KEY) if session is not None else None
+    now = time.time()
+    if (stored and stored['user'] == user.pk and stored['version'] == version
+            and now - stored.get('resolved_at', 0) < settings.ROLES_MAX_AGE):
+        return UserRoles(stored['recruiter'], stored['applicant'])
+
+    roles = load_roles(user)
+    if session is not None:
+        session[ROLES_SESSION_KEY] = {
+            'user': user.pk,
+            'version': version,
+            'resolved_at': now,
+            'recruiter': roles.recruiter_id,
+            'applicant': roles.applicant_id,
+        }
+    return roles
+
+
+def get_roles(request):
+    """
+    Returns ``request.roles``, resolving it directly when the middleware did not run.
+
+    Args:
+        request (django.http.HttpRequest): The current request.
+
+    Returns:
+        UserRoles: The user's roles.
+    """
+    roles = getattr(request, 'roles', None)
+    if roles is None:
+        roles = request.roles = resolve_roles(request)
+    return roles
+
+
+async def aget_roles(request):
+    """
+    Async counterpart of ``get_roles`` for async views.
+
+    Loads the user with ``request.auser()`` (so templates can read
+    ``request.user`` without touching the database) and resolves the roles,
+    which may read the session or run one query, in a worker thread.
+
+    Args:
+        request (django.http.HttpRequest): The current request.
+
+    Returns:
+        UserRoles: The user's roles.
+    """
+    request.user = await request.auser()
+    roles = request.roles = await sync_to_async(resolve_roles)(request)
+    return roles
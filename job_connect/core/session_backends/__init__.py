@@ -0,0 +1,55 @@
+"""
+Session backends that coalesce redundant writes.
+
+Django re-saves a session whenever it was marked modified, even if the
+values written are the ones it already held (for example the role cache in
+``core.roles`` being refreshed with identical ids), and on every request when
+``SESSION_SAVE_EVERY_REQUEST`` is on. These backends remember what was loaded
+and skip the write when nothing changed. With ``SESSION_SAVE_EVERY_REQUEST``
+an unchanged session is still re-saved, to slide its expiry, but at most
+once every ``SESSION_REFRESH_INTERVAL`` seconds.
+"""
+import copy
+import time
+
+from django.conf import settings
+
+REFRESHED_KEY = '_session_refreshed'
+
+
+class CoalescingSessionMixin:
+    """
+    Skips ``save()`` when the session data is unchanged since it was loaded.
+    """
+
+    def load(self):
+        """
+        Loads the session and remembers a copy of what was stored.
+        """
+        data = super().load()
+        self._loaded_data = copy.deepcopy(data)
+        return data
+
+    def _needs_save(self):
+        """
+        Returns True if the session differs from the stored copy or is due for an expiry refresh.
+        """
+        loaded = getattr(self, '_loaded_data', None)
+        if loaded is None or self._session_cache != loaded:
+            return True
+        if not settings.SESSION_SAVE_EVERY_REQUEST:
+            return False
+        interval = getattr(settings, 'SESSION_REFRESH_INTERVAL', settings.SESSION_COOKIE_AGE // 2)
+        return time.time() - loaded.get(REFRESHED_KEY, 0) >= interval
+
+    def save(self, must_create=False):
+        """
+        Saves the session unless the write would be redundant.
+        """
+        if not must_create and self.session_key and hasattr(self, '_session_cache') and not self._needs_save():
+            return
+        if settings.SESSION_SAVE_EVERY_REQUEST and hasattr(self, '_session_cache'):
+            self._session_cache[REFRESHED_KEY] = int(time.time())
+        super().save(must_create=must_create)
+        if hasattr(self, '_session_cache'):
+            self._loaded_data = copy.deepcopy(self._session_cache)
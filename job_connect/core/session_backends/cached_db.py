@@ -0,0 +1,11 @@
+from django.contrib.sessions.backends.cached_db import SessionStore as CachedDBStore
+from core.session_backends import CoalescingSessionMixin
+
+
+class SessionStore(CoalescingSessionMixin, CachedDBStore):
+    """
+    Write-through cached database sessions that skip redundant writes.
+
+    Reads are served from the cache and only fall back to the database on a
+    miss; writes still go to both so sessions survive a cache flush.
+    """
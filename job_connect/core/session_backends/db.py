@@ -0,0 +1,8 @@
+from django.contrib.sessions.backends.db import SessionStore as DBStore
+from core.session_backends import CoalescingSessionMixin
+
+
+class SessionStore(CoalescingSessionMixin, DBStore):
+    """
+    Database-backed sessions that skip redundant writes.
+    """
@@ -0,0 +1,13 @@
+from django.contrib.auth.models import Group
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from core.signup import clear_group_ids
+
+
+@receiver(post_save, sender=Group)
+@receiver(post_delete, sender=Group)
+def clear_group_ids_on_change(sender, **kwargs):
+    """
+    Drops the cached role group ids when groups change in this process.
+    """
+    clear_group_ids()
@@ -0,0 +1,91 @@
+"""
+Account signup.
+
+A signup creates the user, adds them to their role group and creates an
+empty role profile in one transaction, so a failure part-way never leaves a
+user without a group or profile behind. The role groups are seeded by the
+``core.0003_role_groups`` data migration and their ids are cached per process,
+so the group membership is a single ``INSERT`` into the through table rather
+than a ``Group`` lookup plus ``user.groups.add`` (which also re-reads the
+existing memberships). A signup issues four statements: the user, the group
+link, the profile and the profile's outbox row for search indexing.
+
+The empty profile is completed by the profile create views. Until then it
+grants no role (``core.roles`` only counts complete profiles), so the user is
+sent to the create view, and it is left out of the API and candidate search.
+"""
+import logging
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group
+from django.db import transaction
+
+from applicant.models import ApplicantProfile
+from recruiter.models import RecruiterProfile
+
+logger = logging.getLogger(__name__)
+
+ROLE_GROUPS = {
+    'applicant': 'Applicant',
+    'recruiter': 'Recruiter',
+}
+"""Group name for each ``User.user_type``."""
+
+ROLE_PROFILES = {
+    'applicant': ApplicantProfile,
+    'recruiter': RecruiterProfile,
+}
+
+_group_ids = {}
+
+
+def get_group_id(role):
+    """
+    Returns the id of a role's group, loading all role groups on first use.
+
+    A group missing from the database (the data migration was not applied) is
+    created and logged.
+
+    Args:
+        role (str): ``applicant`` or ``recruiter``.
+
+    Returns:
+        int: Primary key of the group.
+    """
+    group_id = _group_ids.get(role)
+    if group_id is not None:
+        return group_id
+    ids = dict(Group.objects.filter(name__in=ROLE_GROUPS.values()).values_list('name', 'pk'))
+    for name in ROLE_GROUPS.values():
+        if name not in ids:
+            logger.warning('Group %r does not exist; creating it.', name)
+            ids[name] = Group.objects.get_or_create(name=name)[0].pk
+    _group_ids.update({role_name: ids[group_name] for role_name, group_name in ROLE_GROUPS.items()})
+    return ids[ROLE_GROUPS[role]]
+
+
+def clear_group_ids():
+    """
+    Forgets the cached group ids so the next signup reloads them.
+    """
+    _group_ids.clear()
+
+
+def signup(form, role):
+    """
+    Creates a user from a validated signup form together with their group membership and empty profile.
+
+    Args:
+        form (django.contrib.auth.forms.UserCreationForm): A validated signup form.
+        role (str): ``applicant`` or ``recruiter``.
+
+    Returns:
+        core.models.User: The new user.
+    """
+    User = get_user_model()
+    group_id = get_group_id(role)
+    with transaction.atomic():
+        user = form.save()
+        User.groups.through.objects.create(user_id=user.pk, group_id=group_id)
+        ROLE_PROFILES[role].objects.create(user=user)
+    return user
@@ -0,0 +1,290 @@
+"""
+Slow query log.
+
+Every database connection gets an ``execute_wrapper`` (installed when the
+connection opens) that times each statement. Statements slower than
+``SLOW_QUERY_THRESHOLD_MS`` are logged to the ``core.slow_queries`` logger
+together with the URL name of the view being served and the project source
+line that issued them, and aggregated into a ``SlowQuery`` row per fingerprint
+(the SQL with literals and placeholders normalized away, so ``IN`` lists of any
+length and different ids share a row).
+
+For ``SELECT`` statements the plan is captured too: a plain ``EXPLAIN``, or on
+backends that support it ``EXPLAIN ANALYZE`` for ``SLOW_QUERY_ANALYZE_RATE`` of
+them (it runs the query again, so keep the rate low). The plan is captured in a
+savepoint, so a failure there never breaks the caller's transaction.
+
+Only the normalized SQL is kept as the sample, since parameters of writes
+carry password hashes, session data and personal details; with
+``SLOW_QUERY_CAPTURE_PARAMS`` on, ``SELECT`` samples keep their parameters.
+Records are counted in process like ``core.metrics`` and written at most every
+``SLOW_QUERY_FLUSH_INTERVAL`` seconds from an ``on_commit`` callback, so the
+``SlowQuery`` rows are never locked for the length of the caller's transaction
+(records counted since the last flush are lost if a worker dies).
+
+``manage.py slow_queries`` prints the top offenders.
+"""
+import contextvars
+import hashlib
+import logging
+import os
+import random
+import re
+import sys
+import threading
+import time
+
+from django.conf import settings
+from django.db import DatabaseError, IntegrityError, transaction
+from django.db.models import F
+from django.db.models.functions import Greatest
+from django.utils.deprecation import MiddlewareMixin
+
+logger = logging.getLogger(__name__)
+
+current_view = contextvars.ContextVar('current_view', default='')
+"""URL name of the view being served in this context, set by ``SlowQueryMiddleware``."""
+
+_recording = contextvars.ContextVar('slow_query_recording', default=False)
+
+IN_LIST_RE = re.compile(r'\bIN\s*\((?:\s*(?:%s|\?|[\d.]+|\'(?:[^\']|\'\')*\')\s*,?)+\)', re.IGNORECASE)
+STRING_RE = re.compile(r"'(?:[^']|'')*'")
+NUMBER_RE = re.compile(r'(?<![\w."])-?\b\d+(?:\.\d+)?\b')
+PLACEHOLDER_RE = re.compile(r'%s|%\(\w+\)s')
+SPACE_RE = re.compile(r'\s+')
+RECORDED_STATEMENTS = ('SELECT', 'INSERT', 'UPDATE', 'DELETE', 'WITH')
+"""Statement types that are recorded; transaction control and schema changes are not."""
+SKIPPED_PATHS = (os.path.dirname(os.__file__), os.sep + 'site-packages' + os.sep, __file__.removesuffix('c'))
+
+_pending = {}
+_lock = threading.Lock()
+_last_flush = time.monotonic()
+
+
+def get_flush_interval():
+    """
+    Returns the longest time buffered records wait before they are written.
+    """
+    return getattr(settings, 'SLOW_QUERY_FLUSH_INTERVAL', 10)
+
+
+def normalize_sql(sql):
+    """
+    Replaces literals and placeholders with ``?`` and collapses ``IN`` lists and whitespace.
+
+    Args:
+        sql (str): The SQL statement.
+
+    Returns:
+        str: The normalized statement.
+    """
+    sql = IN_LIST_RE.sub('IN (...)', sql)
+    sql = STRING_RE.sub('?', sql)
+    sql = PLACEHOLDER_RE.sub('?', sql)
+    sql = NUMBER_RE.sub('?', sql)
+    return SPACE_RE.sub(' ', sql).strip()
+
+
+def fingerprint(normalized_sql):
+    """
+    Returns the fingerprint of a normalized statement.
+    """
+    return hashlib.md5(normalized_sql.encode(), usedforsecurity=False).hexdigest()
+
+
+def calling_frame():
+    """
+    Returns ``path:line in function`` of the innermost project frame outside this module.
+
+    Returns:
+        str: The frame, or an empty string when only library code is on the stack.
+    """
+    base_dir = str(settings.BASE_DIR)
+    frame = sys._getframe(1)
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if filename.startswith(base_dir) and not any(path in filename for path in SKIPPED_PATHS):
+            return f'{os.path.relpath(filename, base_dir)}:{frame.f_lineno} in {frame.f_code.co_name}'
+        frame = frame.f_back
+    return ''
+
+
+def explain(connection, sql, params, analyze):
+    """
+    Returns the plan of a ``SELECT`` statement.
+
+    Args:
+        connection (django.db.backends.base.base.BaseDatabaseWrapper): The connection that ran it.
+        sql (str): The statement.
+        params (list): Its parameters.
+        analyze (bool): Use ``EXPLAIN ANALYZE`` if the backend supports it.
+
+    Returns:
+        tuple: ``(plan text, whether it was analyzed)``.
+    """
+    prefix, analyzed = connection.ops.explain_query_prefix(), False
+    if analyze:
+        try:
+            prefix, analyzed = connection.ops.explain_query_prefix(analyze=True), True
+        except ValueError:  # :no-index: The backend has no ANALYZE option (e.g. SQLite)
+            pass
+    with connection.cursor() as cursor:
+        cursor.execute(f'{prefix} {sql}', params)
+        rows = cursor.fetchall()
+    return '\n'.join(' '.join(str(column) for column in row) for row in rows), analyzed
+
+
+def record_slow_query(connection, sql, params, duration_ms, view, frame):
+    """
+    Logs a slow statement and counts it towards its ``SlowQuery`` row.
+
+    The row is written by ``flush_slow_queries``, scheduled once the buffer is
+    due to run after the caller's transaction commits.
+
+    Args:
+        connection (django.db.backends.base.base.BaseDatabaseWrapper): The connection that ran it.
+        sql (str): The statement.
+        params (list): Its parameters.
+        duration_ms (float): How long it took.
+        view (str): URL name of the view being served, if any.
+        frame (str): Project source line that issued it.
+    """
+    global _last_flush
+    normalized = normalize_sql(sql)
+    logger.warning('Slow query (%.1f ms) in %s at %s: %s', duration_ms, view or '-', frame or '-', normalized)
+
+    plan, analyzed = '', False
+    is_select = sql.lstrip()[:6].upper() == 'SELECT'
+    if is_select and connection.features.supports_explaining_query_execution:
+        analyze = random.random() < getattr(settings, 'SLOW_QUERY_ANALYZE_RATE', 0)
+        plan, analyzed = explain(connection, sql, params, analyze)
+
+    sample = normalized
+    if is_select and getattr(settings, 'SLOW_QUERY_CAPTURE_PARAMS', False):
+        sample = f'{sql}\n-- params: {params!r}'
+    fields = {'sample_sql': sample, 'view': view, 'frame': frame[:300]}
+    if plan:
+        fields.update(plan=plan, plan_analyzed=analyzed)
+
+    with _lock:
+        entry = _pending.setdefault(
+            (connection.alias, fingerprint(normalized)),
+            {'normalized_sql': normalized, 'calls': 0, 'total_ms': 0.0, 'max_ms': 0.0},
+        )
+        entry.update(fields, calls=entry['calls'] + 1, total_ms=entry['total_ms'] + duration_ms, max_ms=max(entry['max_ms'], duration_ms))
+        due = time.monotonic() - _last_flush >= get_flush_interval()
+        if due:
+            _last_flush = time.monotonic()  # :no-index: Schedule one flush per interval, not one per statement
+    if due:
+        transaction.on_commit(flush_slow_queries, using=connection.alias)
+
+
+def _write_slow_query(alias, key, entry):
+    """
+    Adds one buffered record to its ``SlowQuery`` row, creating it if needed.
+    """
+    from core.models import SlowQuery
+
+    fields = {name: value for name, value in entry.items() if name not in ('normalized_sql', 'calls', 'total_ms', 'max_ms')}
+    rows = SlowQuery.objects.using(alias).filter(fingerprint=key)
+    updates = {
+        'calls': F('calls') + entry['calls'], 'total_ms': F('total_ms') + entry['total_ms'],
+        'max_ms': Greatest('max_ms', entry['max_ms']), **fields,
+    }
+    if rows.update(**updates):
+        return
+    try:
+        with transaction.atomic(using=alias):
+            SlowQuery.objects.using(alias).create(fingerprint=key, **entry)
+    except IntegrityError:  # :no-index: Another process created the row first
+        rows.update(**updates)
+
+
+def flush_slow_queries():
+    """
+    Writes the buffered slow query records, one short transaction per row.
+    """
+    global _last_flush
+    with _lock:
+        pending = dict(_pending)
+        _pending.clear()
+        _last_flush = time.monotonic()
+    token = _recording.set(True)
+    try:
+        for (alias, key), entry in pending.items():
+            try:
+                with transaction.atomic(using=alias):
+                    _write_slow_query(alias, key, entry)
+            except DatabaseError:
+                logger.exception('Could not record a slow query.')
+    finally:
+        _recording.reset(token)
+
+
+class SlowQueryLogger:
+    """
+    ``execute_wrapper`` that records statements slower than the threshold.
+    """
+
+    def __init__(self, connection):
+        """
+        Initializes the wrapper.
+
+        Args:
+            connection (django.db.backends.base.base.BaseDatabaseWrapper): The wrapped connection.
+        """
+        self.connection = connection
+
+    def __call__(self, execute, sql, params, many, context):
+        """
+        Runs the statement and records it if it was slow.
+        """
+        threshold = getattr(settings, 'SLOW_QUERY_THRESHOLD_MS', None)
+        if not threshold or _recording.get():
+            return execute(sql, params, many, context)
+        started = time.perf_counter()
+        result = execute(sql, params, many, context)
+        duration_ms = (time.perf_counter() - started) * 1000
+        if duration_ms >= threshold and self.should_record(sql, many):
+            token = _recording.set(True)
+            try:
+                with transaction.atomic(using=self.connection.alias):
+                    record_slow_query(self.connection, sql, params, duration_ms, current_view.get(), calling_frame())
+            except DatabaseError:
+                logger.exception('Could not record a slow query.')
+            finally:
+                _recording.reset(token)
+        return result
+
+    def should_record(self, sql, many):
+        """
+        Returns whether a slow statement is recorded: single DML statements outside a broken transaction.
+        """
+        return not many and not self.connection.needs_rollback and sql.lstrip().upper().startswith(RECORDED_STATEMENTS)
+
+
+def install_slow_query_logger(sender, connection, **kwargs):
+    """
+    Adds the slow query wrapper to a newly opened connection (``connection_created`` receiver).
+    """
+    if not any(isinstance(wrapper, SlowQueryLogger) for wrapper in connection.execute_wrappers):
+        connection.execute_wrappers.append(SlowQueryLogger(connection))
+
+
+class SlowQueryMiddleware(MiddlewareMixin):
+    """
+    Makes the URL name of the view being served available to the slow query log.
+    """
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        """
+        Records the resolved URL name for the rest of the request.
+        """
+        current_view.set(request.resolver_match.view_name if request.resolver_match else '')
+
+    def process_response(self, request, response):
+        """
+        Clears the URL name once the response is ready.
+        """
+        current_view.set('')
+        return response
@@ -0,0 +1,289 @@
+"""
+Production static files: hashed, precompressed and served without Django.
+
+``PrecompressedManifestStaticFilesStorage`` is Django's manifest storage
+(``collectstatic`` writes ``styles.<hash>.css`` next to ``styles.css`` and
+templates link the hashed name) that also writes ``.gz`` and, when the
+optional ``brotli`` package is installed, ``.br`` variants of text assets at
+build time.
+
+``StaticFilesMiddleware`` is WSGI middleware placed in front of the Django
+application (see ``job_connect/wsgi.py``). It indexes ``STATIC_ROOT`` once at
+startup and answers requests under ``STATIC_URL`` itself: it picks the
+smallest variant the client accepts, sends hashed files with a one-year
+``immutable`` cache lifetime, answers ``If-None-Match`` with ``304`` and
+hands the open file to the server's ``wsgi.file_wrapper``, which gunicorn and
+uWSGI turn into ``sendfile``. Static requests never reach Django's request
+handling, middleware or URL resolver. ``ASGIStaticFilesMiddleware`` does the
+same in front of ``job_connect/asgi.py`` for ``SERVER_MODE=asgi``.
+"""
+import gzip
+import json
+import logging
+import mimetypes
+import os
+from dataclasses import dataclass, field
+from http import HTTPStatus
+from pathlib import Path
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.staticfiles.storage import ManifestStaticFilesStorage
+
+from core.compression import negotiate_encoding
+
+try:
+    import brotli
+except ImportError:  # :no-index: Optional; only gzip variants are written without it
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+COMPRESSIBLE_EXTENSIONS = frozenset({
+    '.css', '.js', '.mjs', '.map', '.json', '.svg', '.txt', '.html', '.xml', '.ico', '.ttf', '.otf', '.eot',
+})
+MIN_COMPRESS_SIZE = 256
+ENCODINGS = (('br', '.br'), ('gzip', '.gz'))
+IMMUTABLE_MAX_AGE = 60 * 60 * 24 * 365
+CHUNK_SIZE = 64 * 1024
+
+
+def compress_file(path):
+    """
+    Writes ``.gz`` (and ``.br`` when available) variants of a file if they are smaller.
+
+    Args:
+        path (str): Absolute path of the file.
+
+    Returns:
+        list: Paths of the variants written.
+    """
+    data = Path(path).read_bytes()
+    if len(data) < MIN_COMPRESS_SIZE:
+        return []
+    variants = [(path + '.gz', gzip.compress(data, compresslevel=9, mtime=0))]
+    if brotli is not None:
+        variants.append((path + '.br', brotli.compress(data, quality=11)))
+    written = []
+    for variant_path, compressed in variants:
+        if len(compressed) < len(data) * 0.95:
+            Path(variant_path).write_bytes(compressed)
+            written.append(variant_path)
+    return written
+
+
+class PrecompressedManifestStaticFilesStorage(ManifestStaticFilesStorage):
+    """
+    Manifest storage that also precompresses text assets during ``collectstatic``.
+    """
+
+    def post_process(self, paths, dry_run=False, **options):
+        """
+        Hashes files as usual, then writes compressed variants of the originals and hashed copies.
+        """
+        yield from super().post_process(paths, dry_run=dry_run, **options)
+        if dry_run:
+            return
+        names = set(paths) | set(self.hashed_files.values())
+        written = 0
+        for name in sorted(names):
+            if os.path.splitext(name)[1].lower() in COMPRESSIBLE_EXTENSIONS and self.exists(name):
+                written += len(compress_file(self.path(name)))
+        logger.info('Wrote %d precompressed static files.', written)
+
+
+@dataclass
+class StaticFile:
+    """
+    A file under ``STATIC_ROOT`` and its precompressed variants.
+    """
+    content_type: str
+    immutable: bool
+    variants: dict = field(default_factory=dict)
+    """Mapping of content encoding to ``(path, size, etag)``; ``identity`` is the original."""
+
+
+def load_hashed_names(root):
+    """
+    Returns the hashed file names listed in the ``collectstatic`` manifest.
+
+    Args:
+        root (pathlib.Path): ``STATIC_ROOT``.
+
+    Returns:
+        set: Hashed relative paths; empty when there is no manifest.
+    """
+    manifest = root / ManifestStaticFilesStorage.manifest_name
+    if not manifest.exists():
+        return set()
+    return set(json.loads(manifest.read_text()).get('paths', {}).values())
+
+
+def index_static_root(root):
+    """
+    Scans ``STATIC_ROOT`` into a lookup of URL path to ``StaticFile``.
+
+    Args:
+        root (pathlib.Path): ``STATIC_ROOT``.
+
+    Returns:
+        dict: Mapping of path relative to ``STATIC_URL`` to ``StaticFile``.
+    """
+    hashed = load_hashed_names(root)
+    suffixes = tuple(suffix for _, suffix in ENCODINGS)
+    files = {}
+    for path in root.rglob('*'):
+        if not path.is_file() or path.name.endswith(suffixes):
+            continue
+        name = path.relative_to(root).as_posix()
+        content_type, _ = mimetypes.guess_type(name)
+        static_file = StaticFile(
+            content_type=content_type or 'application/octet-stream',
+            immutable=name in hashed,
+        )
+        for encoding, suffix in (('identity', ''),) + ENCODINGS:
+            variant = path.with_name(path.name + suffix)
+            if variant.exists():
+                stat = variant.stat()
+                static_file.variants[encoding] = (str(variant), stat.st_size, f'"{int(stat.st_mtime):x}-{stat.st_size:x}"')
+        files[name] = static_file
+    return files
+
+
+class StaticFilesMiddleware:
+    """
+    WSGI middleware that serves collected static files before Django sees the request.
+
+    Paths under ``STATIC_URL`` that are not in ``STATIC_ROOT`` fall through to
+    the wrapped application (which answers 404). The index is built once, so
+    files added after startup are only served after a restart, which is how
+    ``collectstatic`` output is deployed anyway.
+    """
+
+    def __init__(self, application, root=None, prefix=None, max_age=None):
+        """
+        Indexes the static root.
+
+        Args:
+            application (callable): The wrapped WSGI application.
+            root (str, optional): Directory to serve; defaults to ``STATIC_ROOT``.
+            prefix (str, optional): URL prefix; defaults to ``STATIC_URL``.
+            max_age (int, optional): Cache lifetime in seconds for unhashed files; defaults to ``STATIC_MAX_AGE``.
+        """
+        self.application = application
+        self.prefix = '/' + (prefix or settings.STATIC_URL).strip('/') + '/'
+        self.max_age = settings.STATIC_MAX_AGE if max_age is None else max_age
+        root = Path(root or settings.STATIC_ROOT)
+        self.files = index_static_root(root) if root.is_dir() else {}
+        logger.info('Serving %d static files from %s.', len(self.files), root)
+
+    def respond(self, path, method, accept_encoding='', if_none_match=''):
+        """
+        Decides how to answer a request for ``path``.
+
+        Args:
+            path (str): Request path.
+            method (str): Request method.
+            accept_encoding (str): The ``Accept-Encoding`` header.
+            if_none_match (str): The ``If-None-Match`` header.
+
+        Returns:
+            tuple: ``(status code, headers, file path or None)``, or ``None`` if the
+            request should be passed to the wrapped application.
+        """
+        static_file = self.files.get(path[len(self.prefix):]) if path.startswith(self.prefix) else None
+        if static_file is None:
+            return None
+        if method not in ('GET', 'HEAD'):
+            return 405, [('Allow', 'GET, HEAD'), ('Content-Length', '0')], None
+
+        offered = [name for name, _ in ENCODINGS if name in static_file.variants]
+        encoding = negotiate_encoding(accept_encoding, offered) or 'identity'
+        file_path, size, etag = static_file.variants[encoding]
+        cache_control = (
+            f'public, max-age={IMMUTABLE_MAX_AGE}, immutable' if static_file.immutable
+            else f'public, max-age={self.max_age}'
+        )
+        headers = [
+            ('Cache-Control', cache_control),
+            ('ETag', etag),
+            ('Vary', 'Accept-Encoding'),
+        ]
+        if etag in if_none_match:
+            return 304, headers, None
+
+        headers += [('Content-Type', static_file.content_type), ('Content-Length', str(size))]
+        if encoding != 'identity':
+            headers.append(('Content-Encoding', encoding))
+        return 200, headers, None if method == 'HEAD' else file_path
+
+    def __call__(self, environ, start_response):
+        """
+        Serves a static file or passes the request on.
+        """
+        response = self.respond(
+            environ.get('PATH_INFO', ''), environ['REQUEST_METHOD'],
+            environ.get('HTTP_ACCEPT_ENCODING', ''), environ.get('HTTP_IF_NONE_MATCH', ''),
+        )
+        if response is None:
+            return self.application(environ, start_response)
+        status, headers, file_path = response
+        start_response(f'{status} {HTTPStatus(status).phrase}', headers)
+        if file_path is None:
+            return []
+        file = open(file_path, 'rb')
+        file_wrapper = environ.get('wsgi.file_wrapper')
+        if file_wrapper is not None:
+            return file_wrapper(file, CHUNK_SIZE)
+        return _iter_file(file)
+
+
+class ASGIStaticFilesMiddleware(StaticFilesMiddleware):
+    """
+    ASGI version of ``StaticFilesMiddleware``, placed in front of ``job_connect/asgi.py``.
+
+    Files are read in chunks in a worker thread so the event loop is not blocked.
+    """
+
+    async def __call__(self, scope, receive, send):
+        """
+        Serves a static file or passes the request on.
+        """
+        if scope['type'] != 'http':
+            return await self.application(scope, receive, send)
+        request_headers = dict(scope.get('headers', ()))
+        response = self.respond(
+            scope['path'], scope['method'],
+            request_headers.get(b'accept-encoding', b'').decode('latin-1'),
+            request_headers.get(b'if-none-match', b'').decode('latin-1'),
+        )
+        if response is None:
+            return await self.application(scope, receive, send)
+        status, headers, file_path = response
+        await send({
+            'type': 'http.response.start',
+            'status': status,
+            'headers': [(name.lower().encode('latin-1'), value.encode('latin-1')) for name, value in headers],
+        })
+        if file_path is None:
+            await send({'type': 'http.response.body', 'body': b''})
+            return
+        file = await sync_to_async(open, thread_sensitive=False)(file_path, 'rb')
+        try:
+            while True:
+                chunk = await sync_to_async(file.read, thread_sensitive=False)(CHUNK_SIZE)
+                more_body = len(chunk) == CHUNK_SIZE
+                await send({'type': 'http.response.body', 'body': chunk, 'more_body': more_body})
+                if not more_body:
+                    break
+        finally:
+            file.close()
+
+
+def _iter_file(file):
+    """
+    Yields a file in chunks and closes it, for servers without ``wsgi.file_wrapper``.
+    """
+    with file:
+        while chunk := file.read(CHUNK_SIZE):
+            yield chunk
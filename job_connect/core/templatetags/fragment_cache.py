@@ -0,0 +1,88 @@
+"""
+Per-object template fragment caching; see ``core.fragments``.
+"""
+from django import template
+from django.core.cache import cache
+
+from core.fragments import PREFETCH_KEY, fragment_key, get_fragment_timeout, source_hash
+
+register = template.Library()
+
+
+class FragmentCacheNode(template.Node):
+    """
+    Renders its body once per object version and serves it from the cache afterwards.
+    """
+
+    def __init__(self, nodelist, name, obj, source):
+        self.nodelist = nodelist
+        self.name = name
+        self.obj = obj
+        self.source = source
+
+    def render(self, context):
+        timeout = get_fragment_timeout()
+        if not timeout:
+            return self.nodelist.render(context)
+        key = fragment_key(self.name.resolve(context), self.source, self.obj.resolve(context))
+        prefetched = context.render_context.get(PREFETCH_KEY, {})
+        content = prefetched[key] if key in prefetched else cache.get(key)
+        if content is None:
+            content = self.nodelist.render(context)
+            cache.set(key, content, timeout)
+        return content
+
+
+class PrefetchFragmentsNode(template.Node):
+    """
+    Loads the cached fragments of a list of objects with one cache round trip.
+    """
+
+    def __init__(self, name, objects, source):
+        self.name = name
+        self.objects = objects
+        self.source = source
+
+    def render(self, context):
+        if not get_fragment_timeout():
+            return ''
+        name = self.name.resolve(context)
+        keys = [fragment_key(name, self.source, obj) for obj in self.objects.resolve(context) or ()]
+        found = cache.get_many(keys)
+        prefetched = context.render_context.setdefault(PREFETCH_KEY, {})
+        prefetched.update({key: found.get(key) for key in keys})
+        return ''
+
+
+@register.tag
+def fragment_cache(parser, token):
+    """
+    Caches the enclosed fragment per object.
+
+    Usage::
+
+        {% fragment_cache 'job_row' job %}...{% endfragment_cache %}
+    """
+    bits = token.split_contents()
+    if len(bits) != 3:
+        raise template.TemplateSyntaxError(f"'{bits[0]}' takes a fragment name and an object.")
+    nodelist = parser.parse(('endfragment_cache',))
+    parser.delete_first_token()
+    return FragmentCacheNode(
+        nodelist, parser.compile_filter(bits[1]), parser.compile_filter(bits[2]), source_hash(parser.origin),
+    )
+
+
+@register.tag
+def prefetch_fragments(parser, token):
+    """
+    Loads the ``fragment_cache`` fragments of every object in a list before the loop renders them.
+
+    Usage::
+
+        {% prefetch_fragments 'job_row' jobs %}
+    """
+    bits = token.split_contents()
+    if len(bits) != 3:
+        raise template.TemplateSyntaxError(f"'{bits[0]}' takes a fragment name and a list of objects.")
+    return PrefetchFragmentsNode(parser.compile_filter(bits[1]), parser.compile_filter(bits[2]), source_hash(parser.origin))
@@ -0,0 +1,100 @@
+import gzip
+from django.http import HttpResponse, StreamingHttpResponse
+from django.test import RequestFactory, SimpleTestCase
+from core.compression import CompressionMiddleware, min_size_for, negotiate_encoding
+
+PAGE = ('<tr><td>Software Engineer</td><td>Remote</td></tr>' * 100).encode()
+
+
+class CompressionTest(SimpleTestCase):
+    """
+    Tests for encoding negotiation and the compression middleware.
+    """
+
+    def respond(self, response, accept_encoding='gzip, deflate, br'):
+        """
+        Passes a response through the middleware for a request with the given Accept-Encoding.
+        """
+        request = RequestFactory().get('/', HTTP_ACCEPT_ENCODING=accept_encoding)
+        return CompressionMiddleware(lambda request: response)(request)
+
+    def test_negotiate_encoding(self):
+        """
+        Test that q-values, wildcards and server preference decide the encoding.
+        """
+        self.assertEqual(negotiate_encoding('gzip, br', ['br', 'gzip']), 'br')
+        self.assertEqual(negotiate_encoding('br;q=0.5, gzip', ['br', 'gzip']), 'gzip')
+        self.assertEqual(negotiate_encoding('*', ['br', 'gzip']), 'br')
+        self.assertEqual(negotiate_encoding('gzip;q=0, identity', ['gzip']), None)
+        self.assertEqual(negotiate_encoding('', ['br', 'gzip']), None)
+
+    def test_min_size_for_uses_longest_prefix(self):
+        """
+        Test that the most specific media type threshold applies and unlisted types are skipped.
+        """
+        self.assertEqual(min_size_for('text/html; charset=utf-8'), 1024)
+        self.assertEqual(min_size_for('text/csv'), 512)
+        self.assertIsNone(min_size_for('image/png'))
+
+    def test_large_html_is_gzipped(self):
+        """
+        Test that a large HTML page is gzipped with Vary, Content-Length and a weak ETag.
+        """
+        response = HttpResponse(PAGE)
+        response['ETag'] = '"abc"'
+        response = self.respond(response, 'gzip')
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertEqual(response['Vary'], 'Accept-Encoding')
+        self.assertEqual(response['ETag'], 'W/"abc"')
+        self.assertEqual(int(response['Content-Length']), len(response.content))
+        self.assertEqual(gzip.decompress(response.content), PAGE)
+
+    def test_small_and_binary_responses_untouched(self):
+        """
+        Test that bodies under the threshold and non-text types are not compressed.
+        """
+        small = self.respond(HttpResponse(b'<p>hello</p>' * 50))
+        image = self.respond(HttpResponse(PAGE, content_type='image/png'))
+        for response in (small, image):
+            self.assertFalse(response.has_header('Content-Encoding'))
+            self.assertFalse(response.has_header('Vary'))
+
+    def test_identity_client_gets_vary(self):
+        """
+        Test that a client without gzip gets the original body, marked as varying by encoding.
+        """
+        response = self.respond(HttpResponse(PAGE), 'identity')
+        self.assertEqual(response.content, PAGE)
+        self.assertEqual(response['Vary'], 'Accept-Encoding')
+
+    def test_no_transform_respected(self):
+        """
+        Test that responses marked no-transform are not compressed.
+        """
+        response = HttpResponse(PAGE)
+        response['Cache-Control'] = 'no-transform'
+        self.assertFalse(self.respond(response).has_header('Content-Encoding'))
+
+    def test_streaming_response_compressed_as_one_stream(self):
+        """
+        Test that a streaming export is compressed chunk by chunk into one gzip stream.
+        """
+        rows = [f'{index},Software Engineer,Remote\n'.encode() for index in range(200)]
+        response = self.respond(StreamingHttpResponse(iter(rows), content_type='text/csv'), 'gzip')
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertFalse(response.has_header('Content-Length'))
+        chunks = list(response.streaming_content)
+        self.assertGreater(len(chunks), 1)
+        self.assertEqual(gzip.decompress(b''.join(chunks)), b''.join(rows))
+
+    async def test_async_streaming_response(self):
+        """
+        Test that async streaming content is compressed too.
+        """
+        async def rows():
+            for index in range(200):
+                yield f'{index},Software Engineer\n'.encode()
+
+        response = self.respond(StreamingHttpResponse(rows(), content_type='text/csv'), 'gzip')
+        body = b''.join([chunk async for chunk in response.streaming_content])
+        self.assertEqual(gzip.decompress(body).count(b'\n'), 200)
@@ -0,0 +1,115 @@
+from unittest.mock import patch
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.template.loader import render_to_string
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from core.fragments import check_cached_template_loader
+from job.models import Job
+from recruiter.models import RecruiterProfile
+
+User = get_user_model()
+
+
+@override_settings(JOB_PAGE_CACHE_TIMEOUT=0)
+class FragmentCacheTest(TestCase):
+    """
+    Tests for per-object fragment caching of listing rows.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        """
+        Set up a recruiter with two jobs.
+        """
+        user = User.objects.create_user(username='fragment-recruiter', password='password')
+        recruiter = RecruiterProfile.objects.create(user=user, company_name='Test Corp')
+        cls.job = Job.objects.create(recruiter=recruiter, title='Backend Engineer', location='Denver, CO')
+        Job.objects.create(recruiter=recruiter, title='Data Engineer', location='Austin, TX')
+
+    def setUp(self):
+        """
+        Start every test with an empty cache.
+        """
+        cache.clear()
+
+    def render_jobs(self):
+        """
+        Renders the job listing for all jobs.
+        """
+        return render_to_string('job/job_list.html', {'jobs': list(Job.objects.order_by('pk'))})
+
+    def test_rows_served_from_cache(self):
+        """
+        Test that a second render takes unchanged rows from the cache instead of rendering them.
+        """
+        first = self.render_jobs()
+        with patch('django.urls.reverse', wraps=reverse) as reverse_url:
+            second = self.render_jobs()
+        self.assertEqual(first, second)
+        self.assertNotIn('job:job_detail', [call.args[0] for call in reverse_url.call_args_list])
+
+    def test_rows_prefetched_in_one_round_trip(self):
+        """
+        Test that cached rows are loaded with a single get_many and no per-row get.
+        """
+        self.render_jobs()
+        with patch('core.templatetags.fragment_cache.cache', wraps=cache) as fragment_cache:
+            self.render_jobs()
+        self.assertEqual(fragment_cache.get_many.call_count, 1)
+        self.assertEqual(fragment_cache.get.call_count, 0)
+
+    def test_saved_object_rerendered(self):
+        """
+        Test that saving an object moves its key so the row shows the new values.
+        """
+        self.assertIn('Backend Engineer', self.render_jobs())
+        self.job.title = 'Platform Engineer'
+        self.job.save()
+        html = self.render_jobs()
+        self.assertIn('Platform Engineer', html)
+        self.assertNotIn('Backend Engineer', html)
+
+    @override_settings(FRAGMENT_CACHE_TIMEOUT=0)
+    def test_disabled(self):
+        """
+        Test that a zero timeout renders rows without touching the cache.
+        """
+        with patch.object(cache, 'get_many') as get_many, patch.object(cache, 'set') as set_:
+            self.assertIn('Backend Engineer', self.render_jobs())
+        get_many.assert_not_called()
+        set_.assert_not_called()
+
+    def test_distance_rendered_outside_fragment(self):
+        """
+        Test that the per-request distance is not frozen into the cached row.
+        """
+        self.render_jobs()
+        job = Job.objects.get(pk=self.job.pk)
+        job.distance_km = 12
+        html = render_to_string('job/job_list.html', {'jobs': [job]})
+        self.assertIn('12 km away', html)
+
+
+class CachedTemplateLoaderCheckTest(TestCase):
+    """
+    Tests for the cached template loader system check.
+    """
+
+    def test_configured_loaders_pass(self):
+        """
+        Test that the project's template settings pass the check.
+        """
+        with override_settings(DEBUG=False):
+            self.assertEqual(check_cached_template_loader(None), [])
+
+    def test_uncached_loader_warns_in_production(self):
+        """
+        Test that explicit loaders without the cached loader are reported when DEBUG is off.
+        """
+        templates = [{
+            'BACKEND': 'django.template.backends.django.DjangoTemplates',
+            'OPTIONS': {'loaders': ['django.template.loaders.app_directories.Loader']},
+        }]
+        with override_settings(DEBUG=False, TEMPLATES=templates):
+            self.assertEqual([warning.id for warning in check_cached_template_loader(None)], ['core.W001'])
@@ -0,0 +1,123 @@
+import threading
+from unittest.mock import patch
+from asgiref.sync import async_to_sync, sync_to_async
+from django.contrib.auth import authenticate, get_user_model
+from django.contrib.auth.models import AnonymousUser
+from django.contrib.sessions.backends.db import SessionStore
+from django.test import RequestFactory, TestCase, override_settings
+from django.urls import reverse
+from core.hashers import run_in_hash_pool
+from core.views import alogin_view
+
+User = get_user_model()
+
+PBKDF2_POLICY = ['core.hashers.TunedPBKDF2PasswordHasher', 'core.hashers.TunedScryptPasswordHasher']
+SCRYPT_POLICY = ['core.hashers.TunedScryptPasswordHasher', 'core.hashers.TunedPBKDF2PasswordHasher']
+
+
+@override_settings(PASSWORD_HASHERS=PBKDF2_POLICY, PASSWORD_PBKDF2_ITERATIONS=1000, PASSWORD_SCRYPT_WORK_FACTOR=2 ** 10)
+class PasswordHashingPolicyTest(TestCase):
+    """
+    Tests for the tunable password hashers and rehash-on-login.
+    """
+
+    def setUp(self):
+        """
+        Set up a user with a password hashed by the PBKDF2 policy.
+        """
+        self.user = User.objects.create_user(username='hashuser', password='testpassword', user_type='applicant')
+
+    def test_cost_comes_from_settings(self):
+        """
+        Test that the tuned hasher uses the configured iteration count.
+        """
+        self.assertTrue(self.user.password.startswith('pbkdf2_sha256$1000$'))
+
+    def test_cost_change_rehashes_on_login(self):
+        """
+        Test that raising the cost upgrades the stored hash on the next login.
+        """
+        with override_settings(PASSWORD_PBKDF2_ITERATIONS=2000):
+            self.assertIsNotNone(authenticate(username='hashuser', password='testpassword'))
+        self.user.refresh_from_db()
+        self.assertTrue(self.user.password.startswith('pbkdf2_sha256$2000$'))
+
+    def test_policy_change_rehashes_on_login(self):
+        """
+        Test that switching the preferred hasher migrates the hash on login and keeps old hashes valid.
+        """
+        with override_settings(PASSWORD_HASHERS=SCRYPT_POLICY):
+            self.assertIsNotNone(authenticate(username='hashuser', password='testpassword'))
+            self.user.refresh_from_db()
+            self.assertTrue(self.user.password.startswith('scrypt$1024$'))
+            self.assertIsNotNone(authenticate(username='hashuser', password='testpassword'))
+
+    def test_wrong_password_is_not_rehashed(self):
+        """
+        Test that a failed login leaves the stored hash alone.
+        """
+        password = self.user.password
+        with override_settings(PASSWORD_HASHERS=SCRYPT_POLICY):
+            self.assertIsNone(authenticate(username='hashuser', password='wrong'))
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.password, password)
+
+
+async def run_inline(func, *args):
+    """
+    Stands in for ``run_in_hash_pool`` on the test thread so the view sees the test transaction.
+    """
+    return await sync_to_async(func)(*args)
+
+
+class HashPoolTest(TestCase):
+    """
+    Tests for the password verification thread pool.
+    """
+
+    def test_runs_in_pool_thread(self):
+        """
+        Test that work submitted to the pool runs off the calling thread.
+        """
+        name = async_to_sync(run_in_hash_pool)(lambda: threading.current_thread().name)
+        self.assertTrue(name.startswith('password-hash'))
+
+
+@override_settings(PASSWORD_HASHERS=PBKDF2_POLICY, PASSWORD_PBKDF2_ITERATIONS=1000)
+@patch('core.views.run_in_hash_pool', run_inline)
+class ThreadPoolLoginViewTest(TestCase):
+    """
+    Tests for the login view used when logins are validated in the password thread pool.
+    """
+
+    def setUp(self):
+        """
+        Set up a user.
+        """
+        self.user = User.objects.create_user(username='pooluser', password='testpassword', user_type='applicant')
+
+    def login(self, password):
+        """
+        Calls the view with the given password and returns the request and response.
+        """
+        request = RequestFactory().post(reverse('core:login'), {'username': 'pooluser', 'password': password})
+        request.session = SessionStore()
+        request.user = AnonymousUser()
+        return request, async_to_sync(alogin_view)(request)
+
+    def test_valid_login_redirects_by_user_type(self):
+        """
+        Test that valid credentials log the user in and redirect to their dashboard.
+        """
+        request, response = self.login('testpassword')
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(response.url, reverse('applicant:applicant_dashboard'))
+        self.assertEqual(request.session['_auth_user_id'], str(self.user.pk))
+
+    def test_invalid_login_renders_form(self):
+        """
+        Test that wrong credentials re-render the form with an error.
+        """
+        request, response = self.login('wrong')
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn('_auth_user_id', request.session)
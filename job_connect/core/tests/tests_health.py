@@ -0,0 +1,47 @@
+import tempfile
+from pathlib import Path
+from django.test import TestCase, override_settings
+
+
+class HealthCheckTest(TestCase):
+    """
+    Tests for the liveness and readiness probes.
+    """
+
+    def test_liveness_does_not_touch_database(self):
+        """
+        Test that the liveness probe answers 200 without any query.
+        """
+        with self.assertNumQueries(0):
+            response = self.client.get('/healthz')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['status'], 'ok')
+        self.assertEqual(response['Cache-Control'], 'no-store')
+
+    def test_probe_skips_host_validation(self):
+        """
+        Test that probes addressed to the container IP are answered even though the host is not allowed.
+        """
+        response = self.client.get('/healthz', HTTP_HOST='10.1.2.3:8000')
+        self.assertEqual(response.status_code, 200)
+
+    def test_readiness_reports_draining(self):
+        """
+        Test that readiness fails while the drain file exists and liveness keeps passing.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            drain_file = Path(directory) / 'drain'
+            with override_settings(HEALTH_DRAIN_FILE=str(drain_file)):
+                self.assertEqual(self.client.get('/readyz').status_code, 200)
+                drain_file.touch()
+                response = self.client.get('/readyz')
+                self.assertEqual(response.status_code, 503)
+                self.assertEqual(response.json()['status'], 'draining')
+                self.assertEqual(self.client.get('/healthz').status_code, 200)
+
+    async def test_async_probe(self):
+        """
+        Test that the probes are answered under the ASGI handler.
+        """
+        response = await self.async_client.get('/healthz')
+        self.assertEqual(response.status_code, 200)
@@ -0,0 +1,175 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from applicant.models import ApplicantProfile
+from application.models import Application
+from core import metrics
+from core.counters import get_count
+from job.models import Job
+from recruiter.models import RecruiterProfile
+
+User = get_user_model()
+
+
+@override_settings(METRICS_FLUSH_INTERVAL=0, METRICS_ALLOWED_IPS=['127.0.0.1'], METRICS_TOKEN='scrape-token')
+class MetricsEndpointTest(TestCase):
+    """
+    Tests for the /metrics endpoint and the request metrics.
+    """
+
+    def setUp(self):
+        """
+        Start from empty shared and in-process counters.
+        """
+        cache.clear()
+        metrics.flush()
+        cache.clear()
+        metrics.get_metrics_cache().clear()
+        self.url = reverse('metrics')
+
+    def scrape(self, **extra):
+        """
+        Returns the exposition text.
+        """
+        response = self.client.get(self.url, **extra)
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response['Content-Type'].startswith('text/plain; version=0.0.4'))
+        return response.content.decode()
+
+    def test_access_restricted(self):
+        """
+        Test that other addresses need the bearer token.
+        """
+        self.assertEqual(self.client.get(self.url, REMOTE_ADDR='203.0.113.9').status_code, 403)
+        self.scrape(REMOTE_ADDR='203.0.113.9', HTTP_AUTHORIZATION='Bearer scrape-token')
+        self.assertEqual(self.client.get(self.url, REMOTE_ADDR='203.0.113.9', HTTP_AUTHORIZATION='Bearer scrape').status_code, 403)
+
+    def test_request_latency_and_queries_per_view(self):
+        """
+        Test that requests are counted in the latency histogram and database counters of their URL name.
+        """
+        self.client.get(reverse('job:job_list'))
+        self.client.get(reverse('job:job_list'))
+        body = self.scrape()
+        self.assertIn('jobconnect_request_duration_seconds_count{view="job:job_list"} 2', body)
+        self.assertIn('jobconnect_request_duration_seconds_bucket{view="job:job_list",le="+Inf"} 2', body)
+        self.assertIn('jobconnect_db_queries_total{view="job:job_list"}', body)
+
+    def test_unresolved_requests_grouped(self):
+        """
+        Test that 404s for unknown paths share one series.
+        """
+        self.client.get('/no-such-page/')
+        self.assertIn('jobconnect_request_duration_seconds_count{view="<unresolved>"} 1', self.scrape())
+
+    def test_counters_survive_default_cache_culling(self):
+        """
+        Test that request counters live outside the default cache, so clearing or culling it keeps them.
+        """
+        self.client.get(reverse('job:job_list'))
+        metrics.flush()
+        cache.clear()
+        self.assertIn('jobconnect_request_duration_seconds_count{view="job:job_list"} 1', self.scrape())
+
+    def test_local_memory_metrics_cache_reported(self):
+        """
+        Test that the system check warns about a per-process metrics cache.
+        """
+        self.assertEqual([warning.id for warning in metrics.check_shared_metrics_cache(None)], ['core.W002'])
+
+    def test_exports_cache_queue_and_domain_gauges(self):
+        """
+        Test that cache, rate limit, outbox, session and domain metrics are exported.
+        """
+        body = self.scrape()
+        for line in (
+            'jobconnect_page_cache_requests_total{result="hit"} 0',
+            'jobconnect_ratelimit_requests_total{scope="login",outcome="shed"} 0',
+            'jobconnect_outbox_oldest_age_seconds ',
+            'jobconnect_active_sessions ',
+            'jobconnect_active_jobs ',
+            'jobconnect_pending_applications ',
+        ):
+            self.assertIn('\n' + line, body)
+
+
+class MaintainedCounterTest(TestCase):
+    """
+    Tests for the counters behind the domain gauges.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        """
+        Set up a recruiter, an applicant and a job.
+        """
+        recruiter = RecruiterProfile.objects.create(
+            user=User.objects.create_user(username='counter-recruiter', password='password'), company_name='Test Corp',
+        )
+        cls.applicant = ApplicantProfile.objects.create(
+            user=User.objects.create_user(username='counter-applicant', password='password'), headline='Developer',
+        )
+        cls.recruiter = recruiter
+        cls.job = Job.objects.create(recruiter=recruiter, title='Backend Engineer')
+
+    def setUp(self):
+        """
+        Start with uncached counts.
+        """
+        cache.clear()
+
+    def test_cached_count_needs_no_query(self):
+        """
+        Test that only the first read counts rows.
+        """
+        with self.assertNumQueries(1):
+            count = get_count('active_jobs')
+        self.assertEqual(count, Job.objects.filter(is_active=True).count())
+        with self.assertNumQueries(0):
+            self.assertEqual(get_count('active_jobs'), count)
+
+    def test_job_changes_adjust_active_count(self):
+        """
+        Test that creating, deactivating and deleting jobs adjust the count after commit.
+        """
+        count = get_count('active_jobs')
+        with self.captureOnCommitCallbacks(execute=True):
+            job = Job.objects.create(recruiter=self.recruiter, title='Data Engineer')
+        self.assertEqual(get_count('active_jobs'), count + 1)
+        with self.captureOnCommitCallbacks(execute=True):
+            job.is_active = False
+            job.save()
+        self.assertEqual(get_count('active_jobs'), count)
+        with self.captureOnCommitCallbacks(execute=True):
+            Job.objects.get(pk=job.pk).delete()
+        self.assertEqual(get_count('active_jobs'), count)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.job.delete()
+        self.assertEqual(get_count('active_jobs'), count - 1)
+
+    def test_application_status_adjusts_pending_count(self):
+        """
+        Test that reviewing an application takes it out of the pending count.
+        """
+        count = get_count('pending_applications')
+        with self.captureOnCommitCallbacks(execute=True):
+            application = Application.objects.create(applicant=self.applicant, job=self.job)
+        self.assertEqual(get_count('pending_applications'), count + 1)
+        with self.captureOnCommitCallbacks(execute=True):
+            application = Application.objects.get(pk=application.pk)
+            application.status = 'reviewed'
+            application.save()
+        self.assertEqual(get_count('pending_applications'), count)
+
+    def test_deferred_field_resets_count(self):
+        """
+        Test that saving an instance loaded without the counted field drops the count for a recount.
+        """
+        count = get_count('active_jobs')
+        with self.captureOnCommitCallbacks(execute=True):
+            job = Job.objects.only('title').get(pk=self.job.pk)
+            job.title = 'Senior Backend Engineer'
+            job.save()
+        self.assertIsNone(cache.get('counter:active_jobs'))
+        self.assertEqual(get_count('active_jobs'), count)
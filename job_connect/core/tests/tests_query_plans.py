@@ -0,0 +1,75 @@
+from io import StringIO
+from unittest import mock
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+from applicant.models import ApplicantProfile
+from application.models import Application
+from core import query_plans
+from job.models import Job
+from recruiter.models import RecruiterProfile
+
+User = get_user_model()
+
+
+class PlanParsingTest(TestCase):
+    """
+    Tests for reading full scans and sorts from EXPLAIN output.
+    """
+
+    def test_sqlite(self):
+        """
+        Test that only scans without an index count as full scans.
+        """
+        plan = '4 0 0 SCAN job_job\n5 0 0 SCAN application_application USING INDEX x\n8 0 0 SEARCH t USING INDEX y (a=?)'
+        self.assertEqual(query_plans.full_scans(plan, 'sqlite'), ['job_job'])
+        self.assertFalse(query_plans.sorts(plan, 'sqlite'))
+        self.assertTrue(query_plans.sorts('32 0 0 USE TEMP B-TREE FOR ORDER BY', 'sqlite'))
+
+    def test_postgresql(self):
+        """
+        Test that sequential scans are reported with their table.
+        """
+        plan = 'Sort  (cost=1..2)\n  Sort Key: posted_date DESC\n  ->  Seq Scan on job_job  (cost=0..1)'
+        self.assertEqual(query_plans.full_scans(plan, 'postgresql'), ['job_job'])
+        self.assertTrue(query_plans.sorts(plan, 'postgresql'))
+        self.assertEqual(query_plans.full_scans('Index Scan using job_posted_idx on job_job', 'postgresql'), [])
+
+
+class CheckQueryPlansCommandTest(TestCase):
+    """
+    Tests for the check_query_plans management command.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        """
+        Create a recruiter with a posting and an application to it.
+        """
+        recruiter = RecruiterProfile.objects.create(
+            user=User.objects.create_user(username='plans-recruiter', password='password'), company_name='Test Corp',
+        )
+        applicant = ApplicantProfile.objects.create(
+            user=User.objects.create_user(username='plans-applicant', password='password'), headline='Developer',
+        )
+        Application.objects.create(applicant=applicant, job=Job.objects.create(recruiter=recruiter, title='Engineer'))
+
+    def test_hot_queries_use_indexes(self):
+        """
+        Test that every hot query is served by an index.
+        """
+        out = StringIO()
+        call_command('check_query_plans', '--repeat', '1', stdout=out)
+        output = out.getvalue()
+        for name in query_plans.HOT_QUERIES:
+            self.assertIn(name, output)
+        self.assertNotIn('full scan', output)
+
+    def test_full_scan_fails(self):
+        """
+        Test that a query reading a whole table fails the check.
+        """
+        with mock.patch.dict(query_plans.HOT_QUERIES, {'unindexed': lambda: Job.objects.filter(title='Engineer')}):
+            with self.assertRaisesMessage(CommandError, 'unindexed'):
+                call_command('check_query_plans', stdout=StringIO())
@@ -0,0 +1,94 @@
+from unittest.mock import patch
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from core.ratelimit import ratelimit_stats
+
+User = get_user_model()
+
+LIMITS = {
+    'login': {'ip': (3, 60), 'username': (2, 60)},
+    'signup': {'ip': (1, 3600)},
+}
+
+
+@override_settings(RATELIMIT_ENABLED=True, RATE_LIMITS=LIMITS)
+class RateLimitTest(TestCase):
+    """
+    Tests for login and signup rate limiting.
+    """
+
+    def setUp(self):
+        """
+        Set up empty buckets and counters.
+        """
+        cache.clear()
+        self.login_url = reverse('core:login')
+
+    def login(self, username, ip='10.0.0.1'):
+        """
+        Posts a login attempt from ``ip``.
+        """
+        return self.client.post(self.login_url, {'username': username, 'password': 'wrong'}, REMOTE_ADDR=ip)
+
+    def test_username_bucket_sheds_before_hashing(self):
+        """
+        Test that attempts over the per-username limit get a 429 without authenticating.
+        """
+        self.assertEqual(self.login('victim').status_code, 200)
+        self.assertEqual(self.login('victim', ip='10.0.0.2').status_code, 200)
+        with patch('django.contrib.auth.forms.authenticate') as authenticate:
+            response = self.login('victim', ip='10.0.0.3')
+        self.assertEqual(response.status_code, 429)
+        self.assertIn('Retry-After', response)
+        authenticate.assert_not_called()
+        self.assertEqual(ratelimit_stats()['login'], {'allowed': 2, 'shed': 1})
+
+    def test_ip_bucket(self):
+        """
+        Test that one address spraying usernames is limited per IP.
+        """
+        statuses = [self.login(f'user{i}').status_code for i in range(4)]
+        self.assertEqual(statuses, [200, 200, 200, 429])
+        self.assertEqual(self.login('user9', ip='10.0.0.9').status_code, 200)
+
+    def test_bucket_refills(self):
+        """
+        Test that tokens come back as time passes.
+        """
+        with patch('core.ratelimit.time.time', return_value=1000.0):
+            self.login('victim')
+            self.login('victim')
+            self.assertEqual(self.login('victim').status_code, 429)
+        with patch('core.ratelimit.time.time', return_value=1031.0):
+            self.assertEqual(self.login('victim').status_code, 200)
+
+    def test_get_is_not_limited(self):
+        """
+        Test that viewing the form does not use tokens.
+        """
+        for _ in range(5):
+            self.assertEqual(self.client.get(self.login_url, REMOTE_ADDR='10.0.0.1').status_code, 200)
+        self.assertEqual(ratelimit_stats()['login'], {'allowed': 0, 'shed': 0})
+
+    def test_signup_limit(self):
+        """
+        Test that signups are limited per IP before the user is created.
+        """
+        data = {'username': 'first', 'password1': 'testpassword123', 'password2': 'testpassword123'}
+        self.client.post(reverse('core:applicant_signup'), data, REMOTE_ADDR='10.0.0.1')
+        data['username'] = 'second'
+        response = self.client.post(reverse('core:recruiter_signup'), data, REMOTE_ADDR='10.0.0.1')
+        self.assertEqual(response.status_code, 429)
+        self.assertFalse(User.objects.filter(username='second').exists())
+
+    @override_settings(RATELIMIT_TRUSTED_PROXIES=1)
+    def test_forwarded_address_behind_proxy(self):
+        """
+        Test that the address added by a trusted proxy is used as the client IP.
+        """
+        for i in range(3):
+            self.client.post(self.login_url, {'username': f'u{i}', 'password': 'x'}, HTTP_X_FORWARDED_FOR='spoofed, 10.1.1.1')
+        response = self.client.post(self.login_url, {'username': 'u9', 'password': 'x'}, HTTP_X_FORWARDED_FOR='10.1.1.1')
+        self.assertEqual(response.status_code, 429)
@@ -0,0 +1,76 @@
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.contrib.auth import get_user_model
+from applicant.models import ApplicantProfile
+from recruiter.models import RecruiterProfile
+from core.roles import ROLES_SESSION_KEY, ROLES_VERSION_KEY
+
+User = get_user_model()
+
+
+class UserRoleMiddlewareTest(TestCase):
+    """
+    Tests for session-cached role resolution.
+    """
+
+    def setUp(self):
+        """
+        Set up a logged-in user without profiles.
+        """
+        cache.clear()
+        self.user = User.objects.create_user(username='roleuser', password='testpassword')
+        self.client.login(username='roleuser', password='testpassword')
+
+    def role_queries(self, url):
+        """
+        Requests a URL and returns the queries that touched profile tables.
+        """
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(url)
+        return [query['sql'] for query in queries if 'profile' in query['sql'] and 'LEFT OUTER JOIN' in query['sql']]
+
+    def test_roles_resolved_once_then_served_from_session(self):
+        """
+        Test that the first check loads the roles and later requests reuse the session copy.
+        """
+        url = reverse('recruiter:candidate_search')
+        self.assertEqual(len(self.role_queries(url)), 1)
+        self.assertEqual(self.role_queries(url), [])
+        self.assertIsNone(self.client.session[ROLES_SESSION_KEY]['recruiter'])
+
+    def test_profile_creation_invalidates_roles(self):
+        """
+        Test that creating or deleting a profile is picked up by existing sessions.
+        """
+        url = reverse('recruiter:candidate_search')
+        self.assertEqual(self.client.get(url).status_code, 302)
+        profile = RecruiterProfile.objects.create(user=self.user, company_name='Roles Co')
+        self.assertEqual(self.client.get(url).status_code, 200)
+        self.assertEqual(self.client.session[ROLES_SESSION_KEY]['recruiter'], profile.pk)
+        profile.delete()
+        self.assertEqual(self.client.get(url).status_code, 302)
+
+    def test_stored_roles_expire_without_version_bump(self):
+        """
+        Test that a worker that missed a version bump re-reads the roles once they are older than ROLES_MAX_AGE.
+        """
+        url = reverse('recruiter:candidate_search')
+        self.assertEqual(self.client.get(url).status_code, 302)
+        version = cache.get(ROLES_VERSION_KEY.format(self.user.pk), 0)
+        RecruiterProfile.objects.create(user=self.user, company_name='Roles Co')
+        cache.set(ROLES_VERSION_KEY.format(self.user.pk), version, timeout=None)  # :no-index: The bump went to another worker's cache
+        self.assertEqual(self.client.get(url).status_code, 302)
+        with override_settings(ROLES_MAX_AGE=0):
+            self.assertEqual(self.client.get(url).status_code, 200)
+
+    def test_applicant_role_used_for_profile_pages(self):
+        """
+        Test that applicant pages use the resolved applicant profile id.
+        """
+        profile = ApplicantProfile.objects.create(user=self.user, headline='Role headline', summary='Summary')
+        response = self.client.get(reverse('applicant:applicant_profile_view'))
+        self.assertContains(response, 'Role headline')
+        self.assertEqual(self.client.session[ROLES_SESSION_KEY]['applicant'], profile.pk)
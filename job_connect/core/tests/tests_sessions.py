@@ -0,0 +1,72 @@
+from datetime import timedelta
+from io import StringIO
+from django.contrib.sessions.models import Session
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from core.session_backends.db import SessionStore
+
+
+class CoalescingSessionTest(TestCase):
+    """
+    Tests for the write-coalescing session backend and the purge command.
+    """
+
+    def setUp(self):
+        """
+        Set up a stored session.
+        """
+        session = SessionStore()
+        session['role'] = {'recruiter': 1}
+        session.save()
+        self.session_key = session.session_key
+
+    def writes(self, session):
+        """
+        Saves a session and returns the number of write statements issued.
+        """
+        with CaptureQueriesContext(connection) as queries:
+            session.save()
+        return sum(query['sql'].startswith(('UPDATE', 'INSERT')) for query in queries)
+
+    def test_unchanged_session_is_not_rewritten(self):
+        """
+        Test that re-assigning identical data does not write the session.
+        """
+        session = SessionStore(self.session_key)
+        session['role'] = {'recruiter': 1}
+        self.assertTrue(session.modified)
+        self.assertEqual(self.writes(session), 0)
+
+    def test_changed_session_is_written(self):
+        """
+        Test that a real change is saved.
+        """
+        session = SessionStore(self.session_key)
+        session['role'] = {'recruiter': 2}
+        self.assertEqual(self.writes(session), 1)
+        self.assertEqual(SessionStore(self.session_key)['role'], {'recruiter': 2})
+
+    @override_settings(SESSION_SAVE_EVERY_REQUEST=True, SESSION_REFRESH_INTERVAL=3600)
+    def test_expiry_refresh_is_rate_limited(self):
+        """
+        Test that with SESSION_SAVE_EVERY_REQUEST an unchanged session is refreshed once per interval.
+        """
+        session = SessionStore(self.session_key)
+        session['role']
+        self.assertEqual(self.writes(session), 1)
+        session = SessionStore(self.session_key)
+        session['role']
+        self.assertEqual(self.writes(session), 0)
+
+    def test_purge_sessions_deletes_only_expired(self):
+        """
+        Test that purge_sessions removes expired sessions in batches and keeps live ones.
+        """
+        past = timezone.now() - timedelta(days=1)
+        Session.objects.bulk_create([Session(session_key=f'expired{i}', session_data='', expire_date=past) for i in range(5)])
+        with override_settings(SESSION_ENGINE='core.session_backends.db'):
+            call_command('purge_sessions', batch_size=2, stdout=StringIO())
+        self.assertEqual(list(Session.objects.values_list('session_key', flat=True)), [self.session_key])
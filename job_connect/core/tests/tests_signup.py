@@ -0,0 +1,115 @@
+from unittest.mock import patch
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from applicant.models import ApplicantProfile
+from core.forms import ApplicantSignUpForm, RecruiterSignUpForm
+from core.signup import clear_group_ids, get_group_id, signup
+from recruiter.models import RecruiterProfile
+
+User = get_user_model()
+
+
+class SignupServiceTest(TestCase):
+    """
+    Tests for the signup service.
+    """
+
+    def setUp(self):
+        """
+        Set up empty group id caches.
+        """
+        clear_group_ids()
+        self.addCleanup(clear_group_ids)
+
+    def form(self, form_class, username):
+        """
+        Returns a validated signup form.
+        """
+        form = form_class({'username': username, 'password1': 'testpassword123', 'password2': 'testpassword123'})
+        self.assertTrue(form.is_valid(), form.errors)
+        return form
+
+    def test_role_groups_are_seeded(self):
+        """
+        Test that the data migration creates the role groups.
+        """
+        self.assertEqual(Group.objects.filter(name__in=['Applicant', 'Recruiter']).count(), 2)
+
+    def test_signup_creates_user_group_and_profile(self):
+        """
+        Test that an applicant signup creates the membership and an empty profile without Group lookups.
+        """
+        get_group_id('applicant')
+        form = self.form(ApplicantSignUpForm, 'fastapplicant')
+        with CaptureQueriesContext(connection) as queries:
+            user = signup(form, 'applicant')
+        self.assertFalse(any('auth_group"' in query['sql'] and query['sql'].startswith('SELECT') for query in queries))
+        self.assertTrue(user.groups.filter(name='Applicant').exists())
+        profile = ApplicantProfile.objects.get(user=user)
+        self.assertFalse(profile.is_complete)
+
+    def test_recruiter_signup(self):
+        """
+        Test that a recruiter signup creates the recruiter group membership and profile.
+        """
+        user = signup(self.form(RecruiterSignUpForm, 'fastrecruiter'), 'recruiter')
+        self.assertEqual(user.user_type, 'recruiter')
+        self.assertTrue(user.groups.filter(name='Recruiter').exists())
+        self.assertTrue(RecruiterProfile.objects.filter(user=user).exists())
+
+    def test_signup_is_atomic(self):
+        """
+        Test that a failure creating the profile leaves no user behind.
+        """
+        form = self.form(ApplicantSignUpForm, 'brokenapplicant')
+        with patch.object(ApplicantProfile.objects, 'create', side_effect=RuntimeError):
+            with self.assertRaises(RuntimeError):
+                signup(form, 'applicant')
+        self.assertFalse(User.objects.filter(username='brokenapplicant').exists())
+
+    def test_missing_group_is_recreated(self):
+        """
+        Test that a deleted role group is recreated instead of failing the signup.
+        """
+        Group.objects.filter(name='Recruiter').delete()
+        user = signup(self.form(RecruiterSignUpForm, 'lonerecruiter'), 'recruiter')
+        self.assertTrue(user.groups.filter(name='Recruiter').exists())
+
+    def test_signup_then_complete_profile(self):
+        """
+        Test that the profile create view completes the empty profile made at signup.
+        """
+        self.client.post(reverse('core:recruiter_signup'), {
+            'username': 'newrecruiter', 'password1': 'testpassword123', 'password2': 'testpassword123',
+        })
+        url = reverse('recruiter:recruiter_profile_create')
+        self.assertEqual(self.client.get(url).status_code, 200)
+        response = self.client.post(url, {'company_name': 'New Co'})
+        self.assertRedirects(response, reverse('recruiter:recruiter_dashboard'), fetch_redirect_response=False)
+        profile = RecruiterProfile.objects.get(user__username='newrecruiter')
+        self.assertEqual(profile.company_name, 'New Co')
+        self.assertRedirects(self.client.get(url), reverse('recruiter:recruiter_profile_update'), fetch_redirect_response=False)
+
+    def test_incomplete_profile_grants_no_role(self):
+        """
+        Test that a new recruiter is sent to complete their profile and is hidden from the API until then.
+        """
+        self.client.post(reverse('core:recruiter_signup'), {
+            'username': 'halfrecruiter', 'password1': 'testpassword123', 'password2': 'testpassword123',
+        })
+        profile = RecruiterProfile.objects.get(user__username='halfrecruiter')
+        create_job = reverse('job:job_create')
+        self.assertRedirects(
+            self.client.get(create_job), reverse('recruiter:recruiter_profile_create'), fetch_redirect_response=False,
+        )
+        recruiters = self.client.get('/api/v1/recruiters/', {'limit': 100}).json()['data']
+        self.assertNotIn(profile.pk, [recruiter['id'] for recruiter in recruiters])
+
+        self.client.post(reverse('recruiter:recruiter_profile_create'), {'company_name': 'Half Co'})
+        self.assertEqual(self.client.get(create_job).status_code, 200)
+        recruiters = self.client.get('/api/v1/recruiters/', {'limit': 100}).json()['data']
+        self.assertIn(profile.pk, [recruiter['id'] for recruiter in recruiters])
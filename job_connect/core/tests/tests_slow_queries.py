@@ -0,0 +1,128 @@
+from io import StringIO
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from core.models import SlowQuery
+from core.slow_queries import fingerprint, flush_slow_queries, normalize_sql
+
+User = get_user_model()
+
+
+class NormalizeSqlTest(TestCase):
+    """
+    Tests for statement fingerprinting.
+    """
+
+    def test_literals_and_in_lists_normalized(self):
+        """
+        Test that statements differing only in literal values and IN list length share a fingerprint.
+        """
+        first = normalize_sql("SELECT * FROM t WHERE id IN (%s, %s, %s) AND name = 'a'  AND n > 10")
+        second = normalize_sql("SELECT * FROM t WHERE id IN (%s)\n AND name = 'it''s' AND n > 3")
+        self.assertEqual(first, 'SELECT * FROM t WHERE id IN (...) AND name = ? AND n > ?')
+        self.assertEqual(fingerprint(first), fingerprint(second))
+
+    def test_identifiers_kept(self):
+        """
+        Test that digits inside identifiers are not replaced.
+        """
+        self.assertEqual(normalize_sql('SELECT "t2"."col1" FROM t2'), 'SELECT "t2"."col1" FROM t2')
+
+
+@override_settings(SLOW_QUERY_THRESHOLD_MS=0.000001, SLOW_QUERY_ANALYZE_RATE=0, SLOW_QUERY_FLUSH_INTERVAL=3600)
+class SlowQueryLogTest(TestCase):
+    """
+    Tests for recording slow statements.
+    """
+
+    def setUp(self):
+        """
+        Start from an empty buffer.
+        """
+        flush_slow_queries()
+        SlowQuery.objects.all().delete()
+
+    def test_statements_aggregated_with_plan_and_frame(self):
+        """
+        Test that repeated statements share a row with their plan and the project line that issued them.
+        """
+        with self.assertLogs('core.slow_queries', 'WARNING'):
+            User.objects.filter(username='slow-query-a').exists()
+            User.objects.filter(username='slow-query-b').exists()
+        flush_slow_queries()
+        row = SlowQuery.objects.get(normalized_sql__contains='"username" = ?', normalized_sql__startswith='SELECT')
+        self.assertEqual(row.calls, 2)
+        self.assertGreaterEqual(row.total_ms, row.max_ms)
+        self.assertEqual(row.sample_sql, row.normalized_sql)
+        self.assertTrue(row.plan)
+        self.assertFalse(row.plan_analyzed)
+        self.assertTrue(row.frame.startswith('core/tests/tests_slow_queries.py:'))
+
+    @override_settings(SLOW_QUERY_CAPTURE_PARAMS=True)
+    def test_params_kept_only_for_selects(self):
+        """
+        Test that the opt-in keeps the parameters of SELECTs but never those of writes.
+        """
+        user = User.objects.create_user(username='slow-query-params', password='secret-password')
+        User.objects.filter(username='slow-query-params').exists()
+        flush_slow_queries()
+        samples = list(SlowQuery.objects.values_list('sample_sql', flat=True))
+        self.assertTrue(any("'slow-query-params'" in sample for sample in samples if sample.startswith('SELECT')))
+        self.assertFalse(any(user.password in sample for sample in samples))
+
+    @override_settings(SLOW_QUERY_FLUSH_INTERVAL=0)
+    def test_rows_written_after_commit(self):
+        """
+        Test that rows are written once the caller's transaction commits, not inside it.
+        """
+        with self.captureOnCommitCallbacks() as callbacks:
+            User.objects.filter(username='slow-query-commit').exists()
+            self.assertFalse(SlowQuery.objects.filter(normalized_sql__contains='"username" = ?').exists())
+        self.assertTrue(callbacks)
+        callbacks[0]()
+        self.assertTrue(SlowQuery.objects.filter(normalized_sql__contains='"username" = ?').exists())
+
+    def test_view_recorded(self):
+        """
+        Test that statements issued while serving a request record the view's URL name.
+        """
+        self.client.get(reverse('job:job_list'))
+        flush_slow_queries()
+        self.assertTrue(SlowQuery.objects.filter(view='job:job_list').exists())
+
+
+@override_settings(SLOW_QUERY_THRESHOLD_MS=0)
+class SlowQueryLogDisabledTest(TestCase):
+    """
+    Tests for the slow query log when it is turned off.
+    """
+
+    def test_disabled(self):
+        """
+        Test that a zero threshold records nothing.
+        """
+        User.objects.filter(username='slow-query-off').exists()
+        self.assertFalse(SlowQuery.objects.exists())
+
+class SlowQueriesCommandTest(TestCase):
+    """
+    Tests for the slow_queries management command.
+    """
+
+    def test_report_and_reset(self):
+        """
+        Test that the report lists the statements with their plans and that --reset clears the log.
+        """
+        SlowQuery.objects.create(
+            fingerprint='a' * 32, normalized_sql='SELECT ? FROM job_job', sample_sql='SELECT 1 FROM job_job',
+            calls=4, total_ms=800, max_ms=350, view='job:job_list', frame='job/views.py:10 in job_list',
+            plan='SCAN job_job',
+        )
+        out = StringIO()
+        call_command('slow_queries', '--plans', '--reset', stdout=out)
+        output = out.getvalue()
+        self.assertIn('4 calls  total     800.0 ms  mean    200.0 ms  max    350.0 ms  job:job_list', output)
+        self.assertIn('SELECT ? FROM job_job', output)
+        self.assertIn('SCAN job_job', output)
+        self.assertFalse(SlowQuery.objects.exists())
@@ -0,0 +1,165 @@
+import shutil
+import tempfile
+from pathlib import Path
+from asgiref.sync import async_to_sync
+from django.core.management import call_command
+from django.test import SimpleTestCase, override_settings
+from core.staticfiles import ASGIStaticFilesMiddleware, IMMUTABLE_MAX_AGE, StaticFilesMiddleware, compress_file
+
+PIPELINE_STORAGES = {
+    'default': {'BACKEND': 'django.core.files.storage.FileSystemStorage'},
+    'staticfiles': {'BACKEND': 'core.staticfiles.PrecompressedManifestStaticFilesStorage'},
+}
+
+
+def fallback(environ, start_response):
+    """
+    Stands in for the Django application behind the middleware.
+    """
+    start_response('404 Not Found', [('Content-Type', 'text/plain')])
+    return [b'django']
+
+
+async def asgi_fallback(scope, receive, send):
+    """
+    Stands in for the Django ASGI application behind the middleware.
+    """
+    await send({'type': 'http.response.start', 'status': 404, 'headers': [(b'content-type', b'text/plain')]})
+    await send({'type': 'http.response.body', 'body': b'django'})
+
+
+class StaticFilesTest(SimpleTestCase):
+    """
+    Tests for the precompressing storage and the static files middleware.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Run collectstatic with the pipeline storage into a temporary STATIC_ROOT.
+        """
+        super().setUpClass()
+        cls.root = Path(tempfile.mkdtemp())
+        cls.addClassCleanup(shutil.rmtree, cls.root)
+        with override_settings(STATIC_ROOT=cls.root, STORAGES=PIPELINE_STORAGES):
+            call_command('collectstatic', interactive=False, verbosity=0)
+        cls.hashed = next(path for path in (cls.root / 'core/css').glob('styles.*.css'))
+
+    def request(self, path, method='GET', **headers):
+        """
+        Calls the middleware and returns the status, headers and body.
+        """
+        middleware = StaticFilesMiddleware(fallback, root=self.root, prefix='/static/', max_age=60)
+        environ = {'PATH_INFO': path, 'REQUEST_METHOD': method, **headers}
+        captured = {}
+
+        def start_response(status, response_headers):
+            captured['status'], captured['headers'] = status, dict(response_headers)
+
+        body = b''.join(middleware(environ, start_response))
+        return captured['status'], captured['headers'], body
+
+    def test_collectstatic_writes_gzip_variants(self):
+        """
+        Test that collectstatic writes gzip variants of the original and hashed stylesheets.
+        """
+        self.assertTrue((self.root / 'core/css/styles.css.gz').exists())
+        self.assertTrue(self.hashed.with_name(self.hashed.name + '.gz').exists())
+
+    def test_compress_file_skips_small_files(self):
+        """
+        Test that files too small to benefit are not compressed.
+        """
+        small = self.root / 'small.txt'
+        small.write_text('tiny')
+        self.assertEqual(compress_file(str(small)), [])
+
+    def test_hashed_file_served_gzipped_and_immutable(self):
+        """
+        Test that a hashed file is served gzipped with a far-future immutable lifetime.
+        """
+        name = self.hashed.relative_to(self.root).as_posix()
+        status, headers, body = self.request(f'/static/{name}', HTTP_ACCEPT_ENCODING='gzip, deflate')
+        self.assertEqual(status, '200 OK')
+        self.assertEqual(headers['Content-Encoding'], 'gzip')
+        self.assertEqual(headers['Cache-Control'], f'public, max-age={IMMUTABLE_MAX_AGE}, immutable')
+        self.assertEqual(headers['Vary'], 'Accept-Encoding')
+        self.assertEqual(body, self.hashed.with_name(self.hashed.name + '.gz').read_bytes())
+
+    def test_refused_encoding_not_served(self):
+        """
+        Test that an encoding refused with q=0, or only named inside another token, is not used.
+        """
+        name = self.hashed.relative_to(self.root).as_posix()
+        for accept_encoding in ('gzip;q=0, deflate', 'x-gzip-like'):
+            status, headers, body = self.request(f'/static/{name}', HTTP_ACCEPT_ENCODING=accept_encoding)
+            self.assertEqual(status, '200 OK')
+            self.assertNotIn('Content-Encoding', headers)
+            self.assertEqual(body, self.hashed.read_bytes())
+
+    def test_unhashed_file_served_uncompressed(self):
+        """
+        Test that an unhashed name gets the short lifetime and clients without gzip get the original.
+        """
+        status, headers, body = self.request('/static/core/css/styles.css')
+        self.assertEqual(status, '200 OK')
+        self.assertNotIn('Content-Encoding', headers)
+        self.assertEqual(headers['Cache-Control'], 'public, max-age=60')
+        self.assertEqual(headers['Content-Type'], 'text/css')
+        self.assertEqual(body, (self.root / 'core/css/styles.css').read_bytes())
+
+    def test_matching_etag_returns_not_modified(self):
+        """
+        Test that a matching If-None-Match is answered with 304 and no body.
+        """
+        _, headers, _ = self.request('/static/core/css/styles.css')
+        status, _, body = self.request('/static/core/css/styles.css', HTTP_IF_NONE_MATCH=headers['ETag'])
+        self.assertEqual(status, '304 Not Modified')
+        self.assertEqual(body, b'')
+
+    def test_unknown_paths_fall_through(self):
+        """
+        Test that paths outside the index are handled by the wrapped application.
+        """
+        for path in ('/static/missing.css', '/jobs/'):
+            status, _, body = self.request(path)
+            self.assertEqual(status, '404 Not Found')
+            self.assertEqual(body, b'django')
+
+    def test_unsafe_method_not_allowed(self):
+        """
+        Test that methods other than GET and HEAD are rejected.
+        """
+        status, headers, _ = self.request('/static/core/css/styles.css', method='POST')
+        self.assertEqual(status, '405 Method Not Allowed')
+        self.assertEqual(headers['Allow'], 'GET, HEAD')
+
+    def asgi_request(self, path, method='GET', headers=()):
+        """
+        Calls the ASGI middleware and returns the status, headers and body.
+        """
+        middleware = ASGIStaticFilesMiddleware(asgi_fallback, root=self.root, prefix='/static/', max_age=60)
+        scope = {'type': 'http', 'path': path, 'method': method, 'headers': list(headers)}
+        messages = []
+
+        async def send(message):
+            messages.append(message)
+
+        async_to_sync(middleware)(scope, None, send)
+        start, bodies = messages[0], messages[1:]
+        return start['status'], dict(start['headers']), b''.join(message['body'] for message in bodies)
+
+    def test_asgi_serves_static_files(self):
+        """
+        Test that the ASGI middleware serves the gzipped hashed file and passes other paths on.
+        """
+        name = self.hashed.relative_to(self.root).as_posix()
+        status, headers, body = self.asgi_request(f'/static/{name}', headers=[(b'accept-encoding', b'gzip')])
+        self.assertEqual(status, 200)
+        self.assertEqual(headers[b'content-encoding'], b'gzip')
+        self.assertEqual(headers[b'cache-control'], f'public, max-age={IMMUTABLE_MAX_AGE}, immutable'.encode())
+        self.assertEqual(body, self.hashed.with_name(self.hashed.name + '.gz').read_bytes())
+
+        status, _, body = self.asgi_request(f'/static/{name}', headers=[(b'accept-encoding', b'gzip'), (b'if-none-match', headers[b'etag'])])
+        self.assertEqual((status, body), (304, b''))
+        self.assertEqual(self.asgi_request('/jobs/')[2], b'django')
@@ -219,7 +219,7 @@ class ApplicantSignUpViewTest(TestCase):
         """
         Set up data for the whole class
         """
-        Group.objects.create(name='Applicant')
+        Group.objects.get_or_create(name='Applicant')  # Seeded by core.0003_role_groups
 
     def setUp(self):
         """
@@ -257,7 +257,7 @@ class RecruiterSignUpViewTest(TestCase):
         """
         Set up data for the whole class
         """
-        Group.objects.create(name='Recruiter')
+        Group.objects.get_or_create(name='Recruiter')  # Seeded by core.0003_role_groups
 
     def setUp(self):
         """
@@ -1,3 +1,4 @@
+from django.conf import settings
 from django.urls import path
 from . import views
 
@@ -6,7 +7,7 @@ app_name = 'core'
 urlpatterns = [
     path('signup/applicant/', views.applicant_signup, name='applicant_signup'),
     path('signup/recruiter/', views.recruiter_signup, name='recruiter_signup'),
-    path('login/', views.login_view, name='login'),
+    path('login/', views.alogin_view if settings.PASSWORD_VERIFY_IN_THREAD_POOL else views.login_view, name='login'),
     path('logout/', views.logout_view, name='logout'),
     path('', views.home, name='home'),
 
@@ -1,70 +1,92 @@
-from django.contrib.auth.models import Group
 from django.shortcuts import render, redirect
-from django.contrib.auth import login, logout
+from asgiref.sync import sync_to_async
+from django.contrib.auth import alogin, login, logout
 from django.contrib.auth.forms import UserCreationForm, AuthenticationForm
 from applicant.forms import ApplicantProfileForm
 from recruiter.forms import RecruiterProfileForm
 from core.forms import ApplicantSignUpForm, RecruiterSignUpForm
+from core.hashers import run_in_hash_pool
+from core.ratelimit import rate_limit
+from core.signup import signup
 from django.contrib.auth.decorators import login_required
 
+@rate_limit('signup')
 def applicant_signup(request):
     if request.method == 'POST':
         form = ApplicantSignUpForm(request.POST)
         if form.is_valid():
-            user = form.save()  # Create the user
-            # Assign the user to the 'Applicant' group
-            try:
-                applicant_group = Group.objects.get(name='Applicant')
-                user.groups.add(applicant_group)
-            except Group.DoesNotExist:
-                print("Error: Applicant group does not exist!")
-                # Create the group if it doesn't exist:
-                applicant_group = Group.objects.create(name='Applicant')
-                user.groups.add(applicant_group)
-
+            user = signup(form, 'applicant')  # Create the user, 'Applicant' group membership and empty profile
             login(request, user)
-            return redirect('applicant:applicant_profile_create')  # Redirect to create profile
+            return redirect('applicant:applicant_profile_create')  # Redirect to complete the profile
     else:
         form = ApplicantSignUpForm()
     return render(request, 'core/applicant_signup.html', {'form': form})
 
+@rate_limit('signup')
 def recruiter_signup(request):
     if request.method == 'POST':
         form = RecruiterSignUpForm(request.POST)
         if form.is_valid():
-            user = form.save()
-            # Assign the user to the 'Recruiter' group
-            try:
-                recruiter_group = Group.objects.get(name='Recruiter')
-                user.groups.add(recruiter_group)
-            except Group.DoesNotExist:
-                print("Error: Recruiter group does not exist!")
-                # Create the group if it doesn't exist:
-                recruiter_group = Group.objects.create(name='Recruiter')
-                user.groups.add(recruiter_group)
-
+            user = signup(form, 'recruiter')  # Create the user, 'Recruiter' group membership and empty profile
             login(request, user)
-            return redirect('recruiter:recruiter_profile_create') # Redirect to create profile
+            return redirect('recruiter:recruiter_profile_create') # Redirect to complete the profile
     else:
         form = RecruiterSignUpForm()
     return render(request, 'core/recruiter_signup.html', {'form': form})
 
+def login_redirect(user):
+    """
+    Redirects a user who just logged in to the dashboard for their role.
+
+    Args:
+        user (core.models.User): The logged-in user.
+
+    Returns:
+        django.http.HttpResponseRedirect: Redirect to the applicant or recruiter dashboard, or the home page.
+    """
+    if user.is_applicant():
+        return redirect('applicant:applicant_dashboard') # Define applicant dashboard URL
+    elif user.is_recruiter():
+        return redirect('recruiter:recruiter_dashboard') # Define recruiter dashboard URL
+    else:
+        return redirect('core:home') # Default redirect
+
+@rate_limit('login')
 def login_view(request):
     if request.method == 'POST':
         form = AuthenticationForm(request, data=request.POST)
         if form.is_valid():
             user = form.get_user()
             login(request, user)
-            if user.is_applicant():
-                return redirect('applicant:applicant_dashboard') # Define applicant dashboard URL
-            elif user.is_recruiter():
-                return redirect('recruiter:recruiter_dashboard') # Define recruiter dashboard URL
-            else:
-                return redirect('core:home') # Default redirect
+            return login_redirect(user)
     else:
         form = AuthenticationForm()
     return render(request, 'core/login.html', {'form': form})
 
+@rate_limit('login')
+async def alogin_view(request):
+    """
+    Async version of ``login_view``.
+
+    The form (user lookup and password hashing) is validated in the password
+    thread pool so the event loop keeps serving other requests.
+
+    Args:
+        request (django.http.HttpRequest): HttpRequest object.
+
+    Returns:
+        django.http.HttpResponse: HttpResponse object.
+    """
+    if request.method == 'POST':
+        form = AuthenticationForm(request, data=request.POST)
+        if await run_in_hash_pool(form.is_valid):
+            user = form.get_user()
+            await alogin(request, user)
+            return login_redirect(user)
+    else:
+        form = AuthenticationForm()
+    return await sync_to_async(render)(request, 'core/login.html', {'form': form})
+
 def home(request):
     return render(request, 'core/index.html')
 
@@ -1,10 +1,29 @@
 #!/bin/bash
+# Usage: docker-entrypoint.sh [web|migrate|dev]
+#   web      Production server: gunicorn with preloaded, pre-forked workers (see gunicorn.conf.py).
+#   migrate  One-shot migration step; run it once per deploy before starting web containers.
+#   dev      Previous behaviour: migrate on start, then Django's autoreloading development server.
+set -e
 
-# Set up DB
-echo "Migrate from SQLite to PostgreSQL"
-python3 manage.py makemigrations --merge --noinput
-python3 manage.py migrate
+migrate() {
+    echo "Applying migrations"
+    python3 manage.py migrate --noinput
+}
 
-# Start server
-echo "Starting server"
-python3 manage.py runserver 0.0.0.0:8000
\ No newline at end of file
+case "${1:-dev}" in
+    web)
+        echo "Starting gunicorn"
+        exec gunicorn -c gunicorn.conf.py
+        ;;
+    migrate)
+        migrate
+        ;;
+    dev)
+        migrate
+        echo "Starting development server"
+        exec python3 manage.py runserver 0.0.0.0:8000
+        ;;
+    *)
+        exec "$@"
+        ;;
+esac
@@ -0,0 +1,71 @@
+"""
+Gunicorn configuration for ``docker-entrypoint.sh web``.
+
+Every setting can be overridden with an environment variable, so the same
+image is tuned per deployment without a rebuild:
+
+* ``SERVER_MODE`` - ``wsgi`` (threaded sync workers, the default) or ``asgi``
+  (uvicorn workers running ``job_connect.asgi``; use with ``ASYNC_VIEWS=1``).
+* ``WEB_CONCURRENCY`` - worker processes; defaults to ``2 * CPUs + 1``.
+* ``GUNICORN_THREADS`` - threads per sync worker.
+* ``GUNICORN_KEEPALIVE`` - seconds an idle keep-alive connection is held open.
+* ``GUNICORN_TIMEOUT`` / ``GUNICORN_GRACEFUL_TIMEOUT`` - seconds before a
+  silent worker is killed / an exiting worker's requests are abandoned.
+* ``GUNICORN_MAX_REQUESTS`` - requests after which a worker is recycled.
+* ``REDIS_URL`` - shared cache. Required with more than one worker: cache
+  versions, cached sessions, role versions, rate limits and metrics live in
+  the cache, and the local-memory fallback is private to each worker.
+
+The application is imported once in the master (``preload_app``) and the
+workers are forked from it, so Django's setup cost is paid once and the
+workers share its memory pages. Database connections are never opened during
+import; ``post_fork`` closes any that were, so workers do not share a socket.
+
+Graceful operations: ``kill -TERM <master>`` stops accepting connections and
+lets workers finish in-flight requests for ``graceful_timeout`` seconds;
+``kill -HUP <master>`` replaces the workers with freshly forked ones (reloading
+this file); ``kill -USR2 <master>`` starts a new master with the new code next
+to the old one for zero-downtime deploys of a preloaded app.
+"""
+import multiprocessing
+import os
+
+SERVER_MODE = os.environ.get('SERVER_MODE', 'wsgi')
+
+bind = os.environ.get('GUNICORN_BIND', '0.0.0.0:8000')
+wsgi_app = 'job_connect.asgi:application' if SERVER_MODE == 'asgi' else 'job_connect.wsgi:application'
+worker_class = 'uvicorn_worker.UvicornWorker' if SERVER_MODE == 'asgi' else 'gthread'
+workers = int(os.environ.get('WEB_CONCURRENCY', multiprocessing.cpu_count() * 2 + 1))
+threads = int(os.environ.get('GUNICORN_THREADS', 4))
+preload_app = True
+
+keepalive = int(os.environ.get('GUNICORN_KEEPALIVE', 5))
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', 30))
+graceful_timeout = int(os.environ.get('GUNICORN_GRACEFUL_TIMEOUT', 30))
+max_requests = int(os.environ.get('GUNICORN_MAX_REQUESTS', 2000))
+max_requests_jitter = max_requests // 10
+
+# Heartbeat files on tmpfs; the container's /tmp may be an overlay on disk.
+worker_tmp_dir = '/dev/shm' if os.path.isdir('/dev/shm') else None
+accesslog = '-'
+errorlog = '-'
+forwarded_allow_ips = os.environ.get('FORWARDED_ALLOW_IPS', '127.0.0.1')
+
+
+def on_starting(server):
+    """
+    Warns when several workers would each fall back to a private local-memory cache.
+    """
+    if workers > 1 and not os.environ.get('REDIS_URL'):
+        server.log.warning(
+            'Starting %d workers without REDIS_URL: each keeps its own cache, so invalidation, '
+            'rate limits and metrics are not shared between them.', workers,
+        )
+
+
+def post_fork(server, worker):
+    """
+    Drops any database connection inherited from the master.
+    """
+    from django.db import connections
+    connections.close_all()
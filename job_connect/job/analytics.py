@@ -0,0 +1,324 @@
+"""
+Per-job analytics: event capture and incremental rollups.
+
+Capture is cheap and append-only. ``JobEvent`` rows are written for:
+
+* detail page views, counted in process per job and hour and written with one
+  ``bulk_create`` at most every ``ANALYTICS_FLUSH_INTERVAL`` seconds (views
+  counted since the last flush are lost if a worker dies);
+* applications and status changes, written by signal handlers in the
+  transaction that makes the change, so they commit or roll back with it.
+
+``aggregate_events`` consumes events in id order like the outbox consumer.
+It claims a batch (``SKIP LOCKED`` where supported), adds it to the
+``JobHourlyStats`` and ``JobDailyStats`` rows of the periods it touches with
+additive upserts, and deletes the batch in the same transaction. Each event
+is therefore counted exactly once, and the cost of a run depends only on the
+events since the last one. The recruiter dashboard reads only the daily
+rollups (``recruiter_summary``).
+"""
+import threading
+import time
+from collections import Counter, defaultdict
+from datetime import timedelta
+from functools import wraps
+
+from asgiref.sync import iscoroutinefunction, sync_to_async
+from django.conf import settings
+from django.db import IntegrityError, connection, transaction
+from django.db.models import F, Sum
+from django.utils import timezone
+
+from job.models import Job, JobDailyStats, JobEvent, JobHourlyStats
+
+DEFAULT_BATCH_SIZE = 1000
+
+UPSERT_BATCH_SIZE = 50
+"""Rollup rows per upsert statement (11 parameters each, within SQLite's limit)."""
+
+STATUS_COLUMNS = ('reviewed', 'shortlisted', 'interviewing', 'offered', 'rejected')
+"""Statuses with a rollup column counting the applications moved to them."""
+
+STAT_COLUMNS = ('views', 'applications', 'reviews', 'review_seconds') + STATUS_COLUMNS
+
+_pending_views = Counter()
+_lock = threading.Lock()
+_last_flush = time.monotonic()
+
+
+def get_flush_interval():
+    """
+    Returns the longest time buffered views wait before they are written.
+    """
+    return getattr(settings, 'ANALYTICS_FLUSH_INTERVAL', 10)
+
+
+def hour_start(moment):
+    """
+    Returns the start of the hour containing ``moment``, in the current time zone.
+    """
+    return timezone.localtime(moment).replace(minute=0, second=0, microsecond=0)
+
+
+def day_start(moment):
+    """
+    Returns the start of the day containing ``moment``, in the current time zone.
+    """
+    return timezone.localtime(moment).replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+def record_job_view(job_id):
+    """
+    Counts one view of a job and writes the buffered views when due.
+
+    Args:
+        job_id (int): Primary key of the viewed job.
+    """
+    global _last_flush
+    with _lock:
+        _pending_views[(job_id, hour_start(timezone.now()))] += 1
+        due = time.monotonic() - _last_flush >= get_flush_interval()
+    if due:
+        flush_views()
+
+
+def flush_views():
+    """
+    Writes the buffered views as one event per job and hour.
+    """
+    global _last_flush
+    with _lock:
+        pending = dict(_pending_views)
+        _pending_views.clear()
+        _last_flush = time.monotonic()
+    if not pending:
+        return
+    existing = set(Job.all_objects.filter(pk__in={job_id for job_id, _ in pending}).values_list('pk', flat=True))
+    JobEvent.objects.bulk_create([
+        JobEvent(job_id=job_id, kind=JobEvent.VIEW, count=count, occurred_at=hour)
+        for (job_id, hour), count in pending.items() if job_id in existing
+    ])
+
+
+def track_job_view(view_func):
+    """
+    Counts successful GETs of a job detail view (``pk`` in the URL), including ones served from the page cache.
+
+    Apply it outside ``cache_anonymous_page``. Works for sync and async views.
+    """
+    if iscoroutinefunction(view_func):
+        @wraps(view_func)
+        async def _async_wrapped(request, *args, **kwargs):
+            response = await view_func(request, *args, **kwargs)
+            if request.method == 'GET' and response.status_code in (200, 304):
+                await sync_to_async(record_job_view)(kwargs['pk'])
+            return response
+        return _async_wrapped
+
+    @wraps(view_func)
+    def _wrapped(request, *args, **kwargs):
+        response = view_func(request, *args, **kwargs)
+        if request.method == 'GET' and response.status_code in (200, 304):
+            record_job_view(kwargs['pk'])
+        return response
+    return _wrapped
+
+
+def record_application(application):
+    """
+    Records a new application (``post_save`` of a created ``Application``).
+    """
+    JobEvent.objects.create(job_id=application.job_id, kind=JobEvent.APPLY, occurred_at=application.created_at)
+
+
+def record_status_change(application, previous_status):
+    """
+    Records a status change; the first change away from ``pending`` also records the time to review.
+
+    Args:
+        application (application.models.Application): The saved application.
+        previous_status (str): Its status when it was loaded.
+    """
+    review_seconds = None
+    if previous_status == 'pending':
+        review_seconds = (timezone.now() - application.created_at).total_seconds()
+    JobEvent.objects.create(
+        job_id=application.job_id, kind=JobEvent.STATUS, status=application.status, review_seconds=review_seconds,
+    )
+
+
+def event_deltas(event):
+    """
+    Returns the rollup column increments an event stands for.
+
+    Args:
+        event (tuple): ``(kind, count, status, review_seconds)``.
+
+    Returns:
+        dict: Column name to increment.
+    """
+    kind, count, status, review_seconds = event
+    if kind == JobEvent.VIEW:
+        return {'views': count}
+    if kind == JobEvent.APPLY:
+        return {'applications': count}
+    deltas = {status: count} if status in STATUS_COLUMNS else {}
+    if review_seconds is not None:
+        deltas.update(reviews=count, review_seconds=review_seconds)
+    return deltas
+
+
+def _add_to_rollup(model, job_id, period_start, deltas):
+    """
+    Adds increments to one rollup row, creating it if needed.
+    """
+    updates = {column: F(column) + value for column, value in deltas.items()}
+    if model.objects.filter(job_id=job_id, period_start=period_start).update(**updates):
+        return
+    try:
+        with transaction.atomic():
+            model.objects.create(job_id=job_id, period_start=period_start, **deltas)
+    except IntegrityError:  # :no-index: Another aggregator created the row first
+        model.objects.filter(job_id=job_id, period_start=period_start).update(**updates)
+
+
+def _add_to_rollups(model, rollups):
+    """
+    Adds increments to rollup rows.
+
+    Where the backend supports ``ON CONFLICT``, all rows go in multi-row
+    ``INSERT ... ON CONFLICT (job_id, period_start) DO UPDATE SET col = col + excluded.col``
+    statements, so new and existing rows cost the same and concurrent
+    aggregators cannot lose increments. ``bulk_create(update_conflicts=True)``
+    can only overwrite columns, not add to them. Other backends fall back to one
+    update per row.
+
+    Args:
+        model (type): ``JobHourlyStats`` or ``JobDailyStats``.
+        rollups (dict): ``(job_id, period_start)`` to a dict of column increments.
+    """
+    rollups = [(key, deltas) for key, deltas in rollups.items() if deltas]
+    if not connection.features.supports_update_conflicts_with_target:
+        for (job_id, period_start), deltas in rollups:
+            _add_to_rollup(model, job_id, period_start, dict(deltas))
+        return
+
+    meta = model._meta
+    qn = connection.ops.quote_name
+    table = qn(meta.db_table)
+    names = ('job', 'period_start') + STAT_COLUMNS
+    columns = ', '.join(qn(meta.get_field(name).column) for name in names)
+    updates = ', '.join(f'{qn(column)} = {table}.{qn(column)} + excluded.{qn(column)}' for column in STAT_COLUMNS)
+    row = f"({', '.join(['%s'] * len(names))})"
+    with connection.cursor() as cursor:
+        for start in range(0, len(rollups), UPSERT_BATCH_SIZE):
+            batch = rollups[start:start + UPSERT_BATCH_SIZE]
+            params = [
+                value
+                for (job_id, period_start), deltas in batch
+                for value in (job_id, connection.ops.adapt_datetimefield_value(period_start), *(deltas.get(column, 0) for column in STAT_COLUMNS))
+            ]
+            cursor.execute(
+                f"INSERT INTO {table} ({columns}) VALUES {', '.join([row] * len(batch))} "
+                f"ON CONFLICT ({', '.join(qn(meta.get_field(name).column) for name in names[:2])}) DO UPDATE SET {updates}",
+                params,
+            )
+
+
+def aggregate_batch(batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Claims one batch of events, adds it to the rollups and deletes it.
+
+    Args:
+        batch_size (int): Maximum number of events to claim.
+
+    Returns:
+        int: Number of events consumed.
+    """
+    with transaction.atomic():
+        queryset = JobEvent.objects.order_by('pk')
+        if connection.features.has_select_for_update_skip_locked:
+            queryset = queryset.select_for_update(skip_locked=True)
+        events = list(queryset.values_list('pk', 'job_id', 'occurred_at', 'kind', 'count', 'status', 'review_seconds')[:batch_size])
+        if not events:
+            return 0
+
+        hourly = defaultdict(Counter)
+        daily = defaultdict(Counter)
+        for _, job_id, occurred_at, *event in events:
+            deltas = event_deltas(event)
+            hourly[(job_id, hour_start(occurred_at))].update(deltas)
+            daily[(job_id, day_start(occurred_at))].update(deltas)
+        _add_to_rollups(JobHourlyStats, hourly)
+        _add_to_rollups(JobDailyStats, daily)
+
+        JobEvent.objects.filter(pk__in=[event[0] for event in events]).delete()
+    return len(events)
+
+
+def aggregate_events(batch_size=DEFAULT_BATCH_SIZE, max_batches=None):
+    """
+    Rolls up events until none are left.
+
+    Args:
+        batch_size (int): Events consumed per transaction.
+        max_batches (int, optional): Stop after this many batches.
+
+    Returns:
+        int: Total number of events consumed.
+    """
+    total = batches = 0
+    while max_batches is None or batches < max_batches:
+        consumed = aggregate_batch(batch_size)
+        if not consumed:
+            break
+        total += consumed
+        batches += 1
+    return total
+
+
+def recruiter_summary(recruiter_id, days=30):
+    """
+    Summarizes a recruiter's jobs over the last ``days`` days from the daily rollups.
+
+    Args:
+        recruiter_id (int): Primary key of the recruiter profile.
+        days (int): Number of days covered, including today.
+
+    Returns:
+        dict: ``jobs`` (per-job totals with ``conversion`` percentages by status and
+        ``avg_review_hours``) and ``daily`` (``date``, ``views`` and ``applications``
+        per day, oldest first, with ``bar`` as a percentage of the busiest day).
+    """
+    since = day_start(timezone.now()) - timedelta(days=days - 1)
+    rollups = JobDailyStats.objects.filter(job__recruiter_id=recruiter_id, period_start__gte=since)
+    sums = {column: Sum(column) for column in STAT_COLUMNS}
+
+    titles = dict(Job.objects.filter(recruiter_id=recruiter_id).values_list('pk', 'title'))
+    jobs = []
+    for row in rollups.values('job_id').annotate(**sums).order_by('-applications', 'job_id'):
+        if row['job_id'] not in titles:
+            continue
+        applications = row['applications']
+        jobs.append({
+            **row,
+            'title': titles[row['job_id']],
+            'conversion': {
+                status: round(row[status] / applications * 100, 1) if applications else 0.0 for status in STATUS_COLUMNS
+            },
+            'avg_review_hours': round(row['review_seconds'] / row['reviews'] / 3600, 1) if row['reviews'] else None,
+        })
+
+    per_day = {
+        timezone.localtime(row['period_start']).date(): row
+        for row in rollups.values('period_start').annotate(views=Sum('views'), applications=Sum('applications'))
+    }
+    dates = [(since + timedelta(days=offset)).date() for offset in range(days)]
+    daily = [
+        {'date': date, 'views': per_day.get(date, {}).get('views', 0), 'applications': per_day.get(date, {}).get('applications', 0)}
+        for date in dates
+    ]
+    busiest = max((day['applications'] for day in daily), default=0)
+    for day in daily:
+        day['bar'] = round(day['applications'] / busiest * 100) if busiest else 0
+    return {'jobs': jobs, 'daily': daily}
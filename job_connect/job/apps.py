@@ -4,3 +4,9 @@ from django.apps import AppConfig
 class JobConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'job'
+
+    def ready(self):
+        """
+        Registers signal handlers.
+        """
+        from job import signals  # noqa: F401
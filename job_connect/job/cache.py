@@ -0,0 +1,199 @@
+"""
+Rendered-page cache for anonymous job browsing.
+
+Pages are cached per URL under a global "job catalog version" that is bumped
+whenever a job (or something rendered alongside it) changes, so stale entries
+are never served and never need to be deleted individually. Cached entries
+carry a strong ETag and a Last-Modified date, so conditional requests from
+browsers are answered with ``304 Not Modified`` straight from the cache.
+"""
+import hashlib
+from functools import wraps
+
+from asgiref.sync import iscoroutinefunction, sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
+from django.utils.http import http_date
+
+CATALOG_VERSION_KEY = 'job:catalog-version'
+HITS_KEY = 'job:page-cache:hits'
+MISSES_KEY = 'job:page-cache:misses'
+
+
+def get_page_cache_timeout():
+    """
+    Returns the page cache timeout in seconds; 0 disables the cache.
+    """
+    return getattr(settings, 'JOB_PAGE_CACHE_TIMEOUT', 300)
+
+
+def get_catalog_version():
+    """
+    Returns the current job catalog version.
+
+    Returns:
+        int: The catalog version.
+    """
+    cache.add(CATALOG_VERSION_KEY, 1, timeout=None)
+    return cache.get(CATALOG_VERSION_KEY, 1)
+
+
+def bump_catalog_version():
+    """
+    Invalidates every cached job page by moving to a new catalog version.
+    """
+    cache.add(CATALOG_VERSION_KEY, 1, timeout=None)
+    try:
+        cache.incr(CATALOG_VERSION_KEY)
+    except ValueError:
+        cache.set(CATALOG_VERSION_KEY, 2, timeout=None)
+
+
+def invalidate_catalog():
+    """
+    Bumps the catalog version now and again once the current transaction commits.
+
+    The second bump discards pages rendered by concurrent requests that read
+    the old rows after the first bump but before the commit.
+    """
+    bump_catalog_version()
+    transaction.on_commit(bump_catalog_version)
+
+
+def _count(key):
+    """
+    Increments a hit/miss counter.
+    """
+    if not cache.add(key, 1, timeout=None):
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.set(key, 1, timeout=None)
+
+
+def page_cache_stats():
+    """
+    Returns hit/miss counters for the anonymous page cache.
+
+    Returns:
+        dict: ``hits``, ``misses`` and ``hit_ratio`` (0.0 when there is no traffic).
+    """
+    counts = cache.get_many([HITS_KEY, MISSES_KEY])
+    hits = counts.get(HITS_KEY, 0)
+    misses = counts.get(MISSES_KEY, 0)
+    total = hits + misses
+    return {'hits': hits, 'misses': misses, 'hit_ratio': hits / total if total else 0.0}
+
+
+def reset_page_cache_stats():
+    """
+    Resets the hit/miss counters.
+    """
+    cache.delete_many([HITS_KEY, MISSES_KEY])
+
+
+def _page_key(request, version):
+    """
+    Builds the cache key for a request under a catalog version.
+    """
+    path_hash = hashlib.md5(request.get_full_path().encode()).hexdigest()
+    return f'job:page:{version}:{request.method}:{path_hash}'
+
+
+def _finalize(request, response, entry, status):
+    """
+    Adds validators and caching headers, then applies conditional GET handling.
+    """
+    response['ETag'] = entry['etag']
+    if entry['last_modified'] is not None:
+        response['Last-Modified'] = http_date(entry['last_modified'])
+    response['X-Page-Cache'] = status
+    patch_vary_headers(response, ['Cookie'])
+    patch_cache_control(response, max_age=0, must_revalidate=True)
+    return get_conditional_response(
+        request,
+        etag=entry['etag'],
+        last_modified=entry['last_modified'],
+        response=response,
+    )
+
+
+def _entry_for(response, modified):
+    """
+    Builds the cache entry for a freshly rendered response.
+    """
+    return {
+        'content': response.content,
+        'content_type': response['Content-Type'],
+        'etag': '"%s"' % hashlib.md5(response.content).hexdigest(),
+        'last_modified': int(modified.timestamp()) if modified else None,
+    }
+
+
+def cache_anonymous_page(last_modified_func=None):
+    """
+    Caches the rendered output of a view for anonymous GET and HEAD requests.
+
+    Authenticated users, other methods and non-200 responses bypass the cache.
+    Async views get an async wrapper that uses the cache's async API.
+
+    Args:
+        last_modified_func (callable, optional): Called as ``func(request, *args, **kwargs)``
+            on a cache miss and returns a timezone-aware datetime (or None) for ``Last-Modified``.
+
+    Returns:
+        callable: A view decorator.
+    """
+    def decorator(view_func):
+        if iscoroutinefunction(view_func):
+            @wraps(view_func)
+            async def _async_wrapped(request, *args, **kwargs):
+                timeout = get_page_cache_timeout()
+                if not timeout or request.method not in ('GET', 'HEAD') or (await request.auser()).is_authenticated:
+                    return await view_func(request, *args, **kwargs)
+
+                key = _page_key(request, await sync_to_async(get_catalog_version)())
+                entry = await cache.aget(key)
+                if entry is not None:
+                    await sync_to_async(_count)(HITS_KEY)
+                    response = HttpResponse(entry['content'], content_type=entry['content_type'])
+                    return _finalize(request, response, entry, 'hit')
+
+                await sync_to_async(_count)(MISSES_KEY)
+                response = await view_func(request, *args, **kwargs)
+                if response.status_code != 200 or response.streaming:
+                    return response
+                modified = await sync_to_async(last_modified_func)(request, *args, **kwargs) if last_modified_func else None
+                entry = _entry_for(response, modified)
+                await cache.aset(key, entry, timeout)
+                return _finalize(request, response, entry, 'miss')
+            return _async_wrapped
+
+        @wraps(view_func)
+        def _wrapped(request, *args, **kwargs):
+            timeout = get_page_cache_timeout()
+            if not timeout or request.method not in ('GET', 'HEAD') or request.user.is_authenticated:
+                return view_func(request, *args, **kwargs)
+
+            key = _page_key(request, get_catalog_version())
+            entry = cache.get(key)
+            if entry is not None:
+                _count(HITS_KEY)
+                response = HttpResponse(entry['content'], content_type=entry['content_type'])
+                return _finalize(request, response, entry, 'hit')
+
+            _count(MISSES_KEY)
+            response = view_func(request, *args, **kwargs)
+            if response.status_code != 200 or response.streaming:
+                return response
+            if hasattr(response, 'render') and callable(response.render):
+                response.render()
+            modified = last_modified_func(request, *args, **kwargs) if last_modified_func else None
+            entry = _entry_for(response, modified)
+            cache.set(key, entry, timeout)
+            return _finalize(request, response, entry, 'miss')
+        return _wrapped
+    return decorator
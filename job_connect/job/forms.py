@@ -1,7 +1,8 @@
 from django import forms
+from applicant.forms import SkillInputMixin
 from job.models import Job
 
-class JobForm(forms.ModelForm):
+class JobForm(SkillInputMixin, forms.ModelForm):
     """
     Form for creating and updating Job postings.
 
@@ -15,7 +16,9 @@ class JobForm(forms.ModelForm):
         application_deadline (django.forms.DateField): The deadline for applications.
         is_active (django.forms.BooleanField): Whether the job posting is active.
         skills_required (django.forms.ModelMultipleChoiceField): The skills required for the job.
+        new_skills (django.forms.CharField): Other required skills, separated by commas.
     """
+    skills_field = 'skills_required'
     is_active = forms.BooleanField(initial=True)
     # :no-index: Set initial, and it will be required by default
 
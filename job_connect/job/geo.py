@@ -0,0 +1,359 @@
+"""
+Offline geocoding and geohash helpers for job locations.
+
+Locations are free text, so they are resolved against a small gazetteer that
+ships with the app (``job/data/gazetteer.csv``) instead of calling out to a
+geocoding service. Resolved coordinates are stored on ``Job`` together with a
+geohash, and radius searches are answered by first narrowing to the geohash
+cells that cover the search area (an indexed prefix match) and only then
+computing exact distances for the remaining rows. A search area that
+crosses the antimeridian is split into one box on each side of it.
+"""
+import csv
+import math
+import re
+from functools import lru_cache
+from pathlib import Path
+
+from django.db.models import ExpressionWrapper, F, FloatField, Q
+from django.db.models.functions import ASin, Cos, Power, Radians, Sin, Sqrt
+
+GAZETTEER_PATH = Path(__file__).resolve().parent / 'data' / 'gazetteer.csv'
+
+EARTH_RADIUS_KM = 6371.0088
+
+GEOHASH_PRECISION = 9
+"""Precision of the geohash stored on each job (roughly 5m x 5m cells)."""
+
+MAX_COVER_CELLS = 16
+"""Upper bound on the number of geohash prefixes used to cover a search area."""
+
+_BASE32 = '0123456789bcdefghjkmnpqrstuvwxyz'
+
+US_STATES = {
+    'alabama': 'AL', 'alaska': 'AK', 'arizona': 'AZ', 'arkansas': 'AR', 'california': 'CA',
+    'colorado': 'CO', 'connecticut': 'CT', 'delaware': 'DE', 'district of columbia': 'DC',
+    'florida': 'FL', 'georgia': 'GA', 'hawaii': 'HI', 'idaho': 'ID', 'illinois': 'IL',
+    'indiana': 'IN', 'iowa': 'IA', 'kansas': 'KS', 'kentucky': 'KY', 'louisiana': 'LA',
+    'maine': 'ME', 'maryland': 'MD', 'massachusetts': 'MA', 'michigan': 'MI', 'minnesota': 'MN',
+    'mississippi': 'MS', 'missouri': 'MO', 'montana': 'MT', 'nebraska': 'NE', 'nevada': 'NV',
+    'new hampshire': 'NH', 'new jersey': 'NJ', 'new mexico': 'NM', 'new york': 'NY',
+    'north carolina': 'NC', 'north dakota': 'ND', 'ohio': 'OH', 'oklahoma': 'OK', 'oregon': 'OR',
+    'pennsylvania': 'PA', 'rhode island': 'RI', 'south carolina': 'SC', 'south dakota': 'SD',
+    'tennessee': 'TN', 'texas': 'TX', 'utah': 'UT', 'vermont': 'VT', 'virginia': 'VA',
+    'washington': 'WA', 'west virginia': 'WV', 'wisconsin': 'WI', 'wyoming': 'WY',
+}
+
+CITY_ALIASES = {
+    'nyc': 'new york',
+    'new york city': 'new york',
+    'la': 'los angeles',
+    'sf': 'san francisco',
+    'washington dc': 'washington',
+    'saint louis': 'st louis',
+    'st paul': 'saint paul',
+}
+
+
+def _normalize(text):
+    """
+    Lowercases a location fragment and strips punctuation other than commas.
+
+    Args:
+        text (str): Free-text location fragment.
+
+    Returns:
+        str: The normalized fragment.
+    """
+    text = text.lower().replace('.', '')
+    text = re.sub(r'[^\w\s,]', ' ', text)
+    return re.sub(r'\s+', ' ', text).strip()
+
+
+@lru_cache(maxsize=1)
+def load_gazetteer():
+    """
+    Loads the bundled gazetteer into an in-memory lookup table.
+
+    The file is read once per process. Each place is reachable by its bare
+    name (the most populous place wins on collisions) and by ``name|region``
+    and ``name|country``.
+
+    Returns:
+        dict: Mapping of lookup key to a ``(latitude, longitude)`` tuple.
+    """
+    places = {}
+    with open(GAZETTEER_PATH, newline='', encoding='utf-8') as handle:
+        rows = sorted(csv.DictReader(handle), key=lambda row: -int(row['population'] or 0))
+    for row in rows:
+        name = _normalize(row['name'])
+        coords = (float(row['latitude']), float(row['longitude']))
+        for key in (name, f"{name}|{row['region'].lower()}", f"{name}|{row['country'].lower()}"):
+            places.setdefault(key, coords)
+    return places
+
+
+@lru_cache(maxsize=4096)
+def geocode(location):
+    """
+    Resolves a free-text location to coordinates using the bundled gazetteer.
+
+    Accepts forms such as ``"Denver"``, ``"Denver, CO"``,
+    ``"Denver, Colorado"`` and ``"Toronto, Canada"``. Unknown places, including
+    "Remote", resolve to ``None``.
+
+    Args:
+        location (str): The location as entered by a user.
+
+    Returns:
+        tuple or None: A ``(latitude, longitude)`` tuple, or None if the location is unknown.
+    """
+    if not location:
+        return None
+    places = load_gazetteer()
+    parts = [part.strip() for part in _normalize(location).split(',') if part.strip()]
+    if not parts:
+        return None
+    city = CITY_ALIASES.get(parts[0], parts[0])
+    for qualifier in parts[1:]:
+        qualifier = US_STATES.get(qualifier, qualifier)
+        if qualifier in ('usa', 'united states'):
+            qualifier = 'us'
+        coords = places.get(f'{city}|{qualifier.lower()}')
+        if coords:
+            return coords
+    return places.get(city)
+
+
+def encode_geohash(latitude, longitude, precision=GEOHASH_PRECISION):
+    """
+    Encodes a coordinate pair as a geohash string.
+
+    Args:
+        latitude (float): Latitude in degrees.
+        longitude (float): Longitude in degrees.
+        precision (int): Number of characters in the resulting hash.
+
+    Returns:
+        str: The geohash.
+    """
+    lat_range = [-90.0, 90.0]
+    lon_range = [-180.0, 180.0]
+    chars = []
+    bits = 0
+    bit_count = 0
+    even = True
+    while len(chars) < precision:
+        value, bounds = (longitude, lon_range) if even else (latitude, lat_range)
+        mid = (bounds[0] + bounds[1]) / 2
+        bits <<= 1
+        if value >= mid:
+            bits |= 1
+            bounds[0] = mid
+        else:
+            bounds[1] = mid
+        even = not even
+        bit_count += 1
+        if bit_count == 5:
+            chars.append(_BASE32[bits])
+            bits = 0
+            bit_count = 0
+    return ''.join(chars)
+
+
+def geohash_cell_size(precision):
+    """
+    Returns the size of a geohash cell in degrees.
+
+    Args:
+        precision (int): Geohash length.
+
+    Returns:
+        tuple: ``(lat_degrees, lon_degrees)`` covered by one cell.
+    """
+    lon_bits = math.ceil(precision * 5 / 2)
+    lat_bits = precision * 5 - lon_bits
+    return 180.0 / (2 ** lat_bits), 360.0 / (2 ** lon_bits)
+
+
+def _box_deltas(latitude, radius_km):
+    """
+    Returns the ``(latitude, longitude)`` half-widths in degrees of the box enclosing a circle.
+    """
+    cos_lat = max(math.cos(math.radians(latitude)), 1e-6)
+    return (
+        math.degrees(radius_km / EARTH_RADIUS_KM),
+        min(math.degrees(radius_km / (EARTH_RADIUS_KM * cos_lat)), 180.0),
+    )
+
+
+def bounding_box(latitude, longitude, radius_km):
+    """
+    Computes the lat/lon bounding box enclosing a circle.
+
+    Args:
+        latitude (float): Centre latitude in degrees.
+        longitude (float): Centre longitude in degrees.
+        radius_km (float): Radius in kilometres.
+
+    Returns:
+        tuple: ``(south, west, north, east)`` in degrees, clamped to valid ranges
+        (use ``bounding_boxes`` for circles crossing the antimeridian).
+    """
+    lat_delta, lon_delta = _box_deltas(latitude, radius_km)
+    return (
+        max(latitude - lat_delta, -90.0),
+        max(longitude - lon_delta, -180.0),
+        min(latitude + lat_delta, 90.0),
+        min(longitude + lon_delta, 180.0),
+    )
+
+
+def bounding_boxes(latitude, longitude, radius_km):
+    """
+    Computes the bounding boxes enclosing a circle, wrapping around the antimeridian.
+
+    A circle crossing longitude ±180 gets one box on each side of it, and one
+    reaching a pole covers every longitude.
+
+    Args:
+        latitude (float): Centre latitude in degrees.
+        longitude (float): Centre longitude in degrees.
+        radius_km (float): Radius in kilometres.
+
+    Returns:
+        list: One or two ``(south, west, north, east)`` tuples in degrees.
+    """
+    lat_delta, lon_delta = _box_deltas(latitude, radius_km)
+    south, north = max(latitude - lat_delta, -90.0), min(latitude + lat_delta, 90.0)
+    west, east = longitude - lon_delta, longitude + lon_delta
+    if lon_delta >= 180.0 or south <= -90.0 or north >= 90.0:
+        return [(south, -180.0, north, 180.0)]
+    if west < -180.0:
+        return [(south, west + 360.0, north, 180.0), (south, -180.0, north, east)]
+    if east > 180.0:
+        return [(south, west, north, 180.0), (south, -180.0, north, east - 360.0)]
+    return [(south, west, north, east)]
+
+
+def covering_cells(south, west, north, east, max_cells=MAX_COVER_CELLS):
+    """
+    Finds the geohash prefixes that together cover a bounding box.
+
+    The finest precision whose covering stays within ``max_cells`` is used, so
+    small search areas map to a handful of long prefixes and large areas to a
+    handful of short ones.
+
+    Args:
+        south (float): Southern edge in degrees.
+        west (float): Western edge in degrees.
+        north (float): Northern edge in degrees.
+        east (float): Eastern edge in degrees.
+        max_cells (int): Maximum number of prefixes to return.
+
+    Returns:
+        list: Sorted geohash prefixes.
+    """
+    best = ['']
+    for precision in range(1, GEOHASH_PRECISION + 1):
+        lat_step, lon_step = geohash_cell_size(precision)
+        rows = math.floor(north / lat_step) - math.floor(south / lat_step) + 1
+        cols = math.floor(east / lon_step) - math.floor(west / lon_step) + 1
+        if rows * cols > max_cells:
+            break
+        cells = set()
+        for row in range(rows):
+            lat = min(south + row * lat_step, north)
+            for col in range(cols):
+                lon = min(west + col * lon_step, east)
+                cells.add(encode_geohash(lat, lon, precision))
+            cells.add(encode_geohash(lat, east, precision))
+        for col in range(cols):
+            cells.add(encode_geohash(north, min(west + col * lon_step, east), precision))
+        cells.add(encode_geohash(north, east, precision))
+        best = sorted(cells)
+    return best
+
+
+def haversine_km(lat1, lon1, lat2, lon2):
+    """
+    Great-circle distance between two points.
+
+    Args:
+        lat1 (float): Latitude of the first point.
+        lon1 (float): Longitude of the first point.
+        lat2 (float): Latitude of the second point.
+        lon2 (float): Longitude of the second point.
+
+    Returns:
+        float: Distance in kilometres.
+    """
+    dlat = math.radians(lat2 - lat1)
+    dlon = math.radians(lon2 - lon1)
+    a = math.sin(dlat / 2) ** 2 + math.cos(math.radians(lat1)) * math.cos(math.radians(lat2)) * math.sin(dlon / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+def _geohash_filter(cells):
+    """
+    Builds an OR of indexed prefix matches for a set of geohash cells.
+    """
+    query = Q()
+    for cell in cells:
+        query |= Q(geohash__startswith=cell)
+    return query
+
+
+def _bbox_filter(south, west, north, east):
+    """
+    Builds the geohash prefix and coordinate range filter for a bounding box.
+    """
+    return _geohash_filter(covering_cells(south, west, north, east)) & Q(
+        latitude__range=(south, north), longitude__range=(west, east),
+    )
+
+
+def within_bbox(queryset, south, west, north, east):
+    """
+    Restricts a Job queryset to a bounding box.
+
+    Args:
+        queryset (django.db.models.query.QuerySet): Job queryset to filter.
+        south (float): Southern edge in degrees.
+        west (float): Western edge in degrees.
+        north (float): Northern edge in degrees.
+        east (float): Eastern edge in degrees.
+
+    Returns:
+        django.db.models.query.QuerySet: The filtered queryset.
+    """
+    return queryset.filter(_bbox_filter(south, west, north, east))
+
+
+def within_radius(queryset, latitude, longitude, radius_km):
+    """
+    Restricts a Job queryset to jobs within ``radius_km`` of a point.
+
+    The geohash prefixes narrow the scan to the covering cells of each
+    bounding box (two across the antimeridian); the exact haversine distance
+    is then annotated as ``distance_km`` and filtered on.
+
+    Args:
+        queryset (django.db.models.query.QuerySet): Job queryset to filter.
+        latitude (float): Centre latitude in degrees.
+        longitude (float): Centre longitude in degrees.
+        radius_km (float): Search radius in kilometres.
+
+    Returns:
+        django.db.models.query.QuerySet: The filtered queryset annotated with ``distance_km``.
+    """
+    box_filter = Q()
+    for box in bounding_boxes(latitude, longitude, radius_km):
+        box_filter |= _bbox_filter(*box)
+    queryset = queryset.filter(box_filter)
+    lat0 = math.radians(latitude)
+    dlat = Radians(F('latitude')) - lat0
+    dlon = Radians(F('longitude')) - math.radians(longitude)
+    a = Power(Sin(dlat / 2), 2) + math.cos(lat0) * Cos(Radians(F('latitude'))) * Power(Sin(dlon / 2), 2)
+    distance = ExpressionWrapper(2 * EARTH_RADIUS_KM * ASin(Sqrt(a)), output_field=FloatField())
+    return queryset.annotate(distance_km=distance).filter(distance_km__lte=radius_km)
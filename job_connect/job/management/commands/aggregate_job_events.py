@@ -0,0 +1,37 @@
+import time
+
+from django.core.management.base import BaseCommand
+from job.analytics import DEFAULT_BATCH_SIZE, aggregate_events
+
+
+class Command(BaseCommand):
+    """
+    Folds pending job analytics events into the hourly and daily rollups.
+
+    Run it periodically, or with ``--loop`` as a long-running worker. Events are
+    deleted in the transaction that adds them to the rollups, so each one is
+    counted exactly once even if the worker is killed.
+    """
+    help = 'Aggregate job analytics events into rollups.'
+
+    def add_arguments(self, parser):
+        """
+        Adds command line arguments.
+
+        Args:
+            parser (argparse.ArgumentParser): The argument parser.
+        """
+        parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE, help='Events aggregated per transaction.')
+        parser.add_argument('--loop', action='store_true', help='Keep polling for new events.')
+        parser.add_argument('--interval', type=float, default=60.0, help='Seconds to sleep between runs (with --loop).')
+
+    def handle(self, *args, **options):
+        """
+        Aggregates the pending events, once or continuously.
+        """
+        while True:
+            consumed = aggregate_events(options['batch_size'])
+            self.stdout.write(f'Aggregated {consumed} events.')
+            if not options['loop']:
+                break
+            time.sleep(options['interval'])
@@ -0,0 +1,154 @@
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management.base import BaseCommand, CommandError
+from django.test import AsyncClient, Client, override_settings
+from django.urls import reverse
+from job.models import Job
+
+
+def check(response):
+    """
+    Fails the run on any non-200 response so errors are not timed as throughput.
+    """
+    if response.status_code != 200:
+        raise CommandError(f'{response.request["PATH_INFO"]} returned {response.status_code}.')
+
+
+HANDLERS = {
+    'wsgi': '0',
+    'asgi': '1',
+}
+"""``ASYNC_VIEWS`` value used for each handler."""
+
+
+class Command(BaseCommand):
+    """
+    Compares concurrent read throughput of the sync views under WSGI and the async views under ASGI.
+
+    Each handler runs in a fresh process so the URLconf picks up
+    ``ASYNC_VIEWS``: ``wsgi`` drives the sync views through Django's WSGI
+    handler from a pool of ``--concurrency`` threads, ``asgi`` drives the
+    async views through the ASGI handler from ``--concurrency`` concurrent
+    tasks on one event loop. Requests cycle over the anonymous job list, a
+    job detail page and a keyword search on the seeded dataset (run
+    ``seed_data`` first). The anonymous page cache is disabled unless
+    ``--page-cache`` is given, so the numbers measure the views themselves.
+    """
+    help = 'Benchmark concurrent read throughput under WSGI and ASGI.'
+
+    def add_arguments(self, parser):
+        """
+        Adds command line arguments.
+
+        Args:
+            parser (argparse.ArgumentParser): The argument parser.
+        """
+        parser.add_argument('--requests', type=int, default=600, help='Requests per handler.')
+        parser.add_argument('--concurrency', type=int, default=20, help='Concurrent clients.')
+        parser.add_argument('--query', default='engineer', help='Keyword used for the search page.')
+        parser.add_argument('--page-cache', action='store_true', help='Keep the anonymous page cache enabled.')
+        parser.add_argument('--handler', choices=HANDLERS, help='Run one handler in this process (used internally).')
+
+    def handle(self, *args, **options):
+        """
+        Runs each handler in a subprocess and prints a table, or runs one handler when ``--handler`` is given.
+        """
+        if options['handler']:
+            self.stdout.write(json.dumps(self.run_handler(options)))
+            return
+
+        self.stdout.write(f"{'handler':<10}{'req/s':>10}{'p50 ms':>10}{'p95 ms':>10}")
+        for handler, async_views in HANDLERS.items():
+            env = dict(os.environ, ASYNC_VIEWS=async_views)
+            if not options['page_cache']:
+                env['JOB_PAGE_CACHE_TIMEOUT'] = '0'
+            command = [
+                sys.executable, sys.argv[0], 'bench_views', '--handler', handler,
+                '--requests', str(options['requests']), '--concurrency', str(options['concurrency']),
+                '--query', options['query'],
+            ]
+            result = subprocess.run(command, env=env, capture_output=True, text=True)
+            if result.returncode:
+                raise CommandError(f'{handler} run failed:\n{result.stderr}')
+            stats = json.loads(result.stdout.strip().splitlines()[-1])
+            self.stdout.write(f"{handler:<10}{stats['rate']:>10.1f}{stats['p50']:>10.1f}{stats['p95']:>10.1f}")
+
+    def get_paths(self, query):
+        """
+        Returns the URLs requested in turn.
+        """
+        job_id = Job.objects.order_by('-posted_date').values_list('pk', flat=True).first()
+        if job_id is None:
+            raise CommandError('No jobs found; run seed_data first.')
+        return [
+            reverse('job:job_list'),
+            reverse('job:job_detail', args=[job_id]),
+            f"{reverse('job:job_search')}?q={query}",
+        ]
+
+    def run_handler(self, options):
+        """
+        Times the requests in this process with the handler selected by ``--handler``.
+
+        Returns:
+            dict: ``rate`` in requests per second and ``p50``/``p95`` latency in milliseconds.
+        """
+        paths = self.get_paths(options['query'])
+        total, concurrency = options['requests'], options['concurrency']
+        with override_settings(ALLOWED_HOSTS=['testserver']):
+            if options['handler'] == 'asgi':
+                latencies, elapsed = asyncio.run(self.run_asgi(paths, total, concurrency))
+            else:
+                latencies, elapsed = self.run_wsgi(paths, total, concurrency)
+        latencies.sort()
+        return {
+            'rate': total / elapsed,
+            'p50': latencies[len(latencies) // 2] * 1000,
+            'p95': latencies[int(len(latencies) * 0.95)] * 1000,
+        }
+
+    def run_wsgi(self, paths, total, concurrency):
+        """
+        Sends ``total`` requests from ``concurrency`` threads through the WSGI handler.
+        """
+        def worker(count):
+            client, latencies = Client(), []
+            for index in range(count):
+                started = time.perf_counter()
+                check(client.get(paths[index % len(paths)]))
+                latencies.append(time.perf_counter() - started)
+            return latencies
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(concurrency) as pool:
+            results = list(pool.map(worker, self.split(total, concurrency)))
+        return [latency for result in results for latency in result], time.perf_counter() - started
+
+    async def run_asgi(self, paths, total, concurrency):
+        """
+        Sends ``total`` requests from ``concurrency`` tasks through the ASGI handler.
+        """
+        async def worker(count):
+            client, latencies = AsyncClient(), []
+            for index in range(count):
+                started = time.perf_counter()
+                check(await client.get(paths[index % len(paths)]))
+                latencies.append(time.perf_counter() - started)
+            return latencies
+
+        started = time.perf_counter()
+        results = await asyncio.gather(*(worker(count) for count in self.split(total, concurrency)))
+        return [latency for result in results for latency in result], time.perf_counter() - started
+
+    @staticmethod
+    def split(total, parts):
+        """
+        Splits ``total`` requests as evenly as possible over ``parts`` clients.
+        """
+        return [total // parts + (1 if index < total % parts else 0) for index in range(parts)]
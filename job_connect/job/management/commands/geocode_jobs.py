@@ -0,0 +1,47 @@
+from django.core.management.base import BaseCommand
+from job.models import Job
+
+
+class Command(BaseCommand):
+    """
+    Backfills coordinates and geohashes for existing jobs.
+
+    Jobs are geocoded when saved, so this is only needed for rows created
+    before geocoding existed or after the gazetteer has been extended.
+    """
+    help = 'Geocode job locations using the bundled gazetteer.'
+
+    def add_arguments(self, parser):
+        """
+        Adds command line arguments.
+
+        Args:
+            parser (argparse.ArgumentParser): The argument parser.
+        """
+        parser.add_argument('--batch-size', type=int, default=1000, help='Rows written per UPDATE batch.')
+        parser.add_argument('--all', action='store_true', help='Re-geocode jobs that already have coordinates.')
+
+    def handle(self, *args, **options):
+        """
+        Geocodes jobs in batches and writes them back with ``bulk_update``.
+        """
+        batch_size = options['batch_size']
+        queryset = Job.objects.select_related('recruiter').order_by('pk')
+        if not options['all']:
+            queryset = queryset.filter(geohash='')
+
+        batch = []
+        updated = resolved = 0
+        for job in queryset.iterator(chunk_size=batch_size):
+            job.geocode_location()
+            batch.append(job)
+            resolved += job.latitude is not None
+            if len(batch) >= batch_size:
+                Job.objects.bulk_update(batch, ['latitude', 'longitude', 'geohash'])
+                updated += len(batch)
+                batch = []
+        if batch:
+            Job.objects.bulk_update(batch, ['latitude', 'longitude', 'geohash'])
+            updated += len(batch)
+
+        self.stdout.write(self.style.SUCCESS(f'Geocoded {updated} jobs ({resolved} resolved).'))
@@ -0,0 +1,29 @@
+from django.core.management.base import BaseCommand
+from job.cache import get_catalog_version, page_cache_stats, reset_page_cache_stats
+
+
+class Command(BaseCommand):
+    """
+    Reports the hit ratio of the anonymous job page cache.
+    """
+    help = 'Show (and optionally reset) anonymous job page cache statistics.'
+
+    def add_arguments(self, parser):
+        """
+        Adds command line arguments.
+
+        Args:
+            parser (argparse.ArgumentParser): The argument parser.
+        """
+        parser.add_argument('--reset', action='store_true', help='Reset the counters after printing them.')
+
+    def handle(self, *args, **options):
+        """
+        Prints the counters.
+        """
+        stats = page_cache_stats()
+        self.stdout.write(f"catalog version: {get_catalog_version()}")
+        self.stdout.write(f"hits: {stats['hits']}  misses: {stats['misses']}  hit ratio: {stats['hit_ratio']:.1%}")
+        if options['reset']:
+            reset_page_cache_stats()
+            self.stdout.write('Counters reset.')
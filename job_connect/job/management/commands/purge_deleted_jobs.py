@@ -0,0 +1,30 @@
+from django.core.management.base import BaseCommand
+from job.purge import purge_deleted_jobs
+
+
+class Command(BaseCommand):
+    """
+    Removes soft-deleted jobs and their applications in small batches.
+
+    Run it periodically (or continuously with a pause); each batch is its own
+    transaction, so it never holds locks for long and can be interrupted.
+    """
+    help = 'Purge soft-deleted jobs in throttled batches.'
+
+    def add_arguments(self, parser):
+        """
+        Adds command line arguments.
+
+        Args:
+            parser (argparse.ArgumentParser): The argument parser.
+        """
+        parser.add_argument('--batch-size', type=int, default=500, help='Rows deleted per transaction.')
+        parser.add_argument('--pause', type=float, default=0.05, help='Seconds to sleep between batches.')
+        parser.add_argument('--limit', type=int, default=None, help='Purge at most this many jobs.')
+
+    def handle(self, *args, **options):
+        """
+        Purges the deleted jobs and reports the totals.
+        """
+        jobs, rows = purge_deleted_jobs(options['batch_size'], options['pause'], options['limit'])
+        self.stdout.write(self.style.SUCCESS(f'Purged {jobs} jobs and {rows} dependent rows.'))
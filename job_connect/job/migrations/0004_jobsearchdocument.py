@@ -0,0 +1,24 @@
+# Generated by Django 5.2 on 2026-10-19 11:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('job', '0003_job_geo'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='JobSearchDocument',
+            fields=[
+                ('job_id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('recruiter_id', models.BigIntegerField(db_index=True)),
+                ('is_active', models.BooleanField(default=True)),
+                ('posted_date', models.DateTimeField(db_index=True)),
+                ('content', models.TextField()),
+                ('indexed_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.2 on 2026-10-19 14:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('job', '0004_jobsearchdocument'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(fields=['-posted_date'], name='job_posted_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(fields=['recruiter', '-posted_date'], name='job_recruiter_posted_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['-posted_date'], name='job_active_posted_idx'),
+        ),
+    ]
@@ -0,0 +1,67 @@
+# Generated by Django 5.2 on 2026-10-19 14:31
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('job', '0006_job_deleted_at'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='JobEvent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('view', 'View'), ('apply', 'Apply'), ('status', 'Status change')], max_length=10)),
+                ('count', models.PositiveIntegerField(default=1)),
+                ('status', models.CharField(blank=True, max_length=50)),
+                ('review_seconds', models.FloatField(blank=True, null=True)),
+                ('occurred_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('job', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='events', to='job.job')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='JobDailyStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('period_start', models.DateTimeField()),
+                ('views', models.PositiveIntegerField(default=0)),
+                ('applications', models.PositiveIntegerField(default=0)),
+                ('reviews', models.PositiveIntegerField(default=0)),
+                ('review_seconds', models.FloatField(default=0)),
+                ('reviewed', models.PositiveIntegerField(default=0)),
+                ('shortlisted', models.PositiveIntegerField(default=0)),
+                ('interviewing', models.PositiveIntegerField(default=0)),
+                ('offered', models.PositiveIntegerField(default=0)),
+                ('rejected', models.PositiveIntegerField(default=0)),
+                ('job', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_stats', to='job.job')),
+            ],
+            options={
+                'unique_together': {('job', 'period_start')},
+            },
+        ),
+        migrations.CreateModel(
+            name='JobHourlyStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('period_start', models.DateTimeField()),
+                ('views', models.PositiveIntegerField(default=0)),
+                ('applications', models.PositiveIntegerField(default=0)),
+                ('reviews', models.PositiveIntegerField(default=0)),
+                ('review_seconds', models.FloatField(default=0)),
+                ('reviewed', models.PositiveIntegerField(default=0)),
+                ('shortlisted', models.PositiveIntegerField(default=0)),
+                ('interviewing', models.PositiveIntegerField(default=0)),
+                ('offered', models.PositiveIntegerField(default=0)),
+                ('rejected', models.PositiveIntegerField(default=0)),
+                ('job', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='hourly_stats', to='job.job')),
+            ],
+            options={
+                'unique_together': {('job', 'period_start')},
+            },
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.2 on 2026-10-19 15:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('job', '0007_analytics'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='JobTerm',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('term', models.CharField(max_length=64)),
+                ('job_id', models.BigIntegerField(db_index=True)),
+            ],
+            options={
+                'unique_together': {('term', 'job_id')},
+            },
+        ),
+    ]
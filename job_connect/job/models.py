@@ -1,8 +1,23 @@
 from django.db import models
+from django.utils import timezone
 #from django.conf import settings
 from core.models import BaseModel
 from applicant.models import Skill
 from recruiter.models import RecruiterProfile
+from job.geo import encode_geohash, geocode
+
+
+class JobManager(models.Manager):
+    """
+    Default manager for jobs, leaving out soft-deleted ones.
+    """
+
+    def get_queryset(self):
+        """
+        Returns the jobs that have not been deleted.
+        """
+        return super().get_queryset().filter(deleted_at__isnull=True)
+
 
 class Job(BaseModel):
     """
@@ -30,6 +45,16 @@ class Job(BaseModel):
     :type is_active: django.db.models.BooleanField
     :param skills_required: The skills required for the job.
     :type skills_required: django.db.models.ManyToManyField
+    :param latitude: Latitude resolved from ``location`` by the offline geocoder.
+    :type latitude: django.db.models.FloatField
+    :param longitude: Longitude resolved from ``location`` by the offline geocoder.
+    :type longitude: django.db.models.FloatField
+    :param geohash: Geohash of the resolved coordinates, indexed for radius searches.
+    :type geohash: django.db.models.CharField
+    :param deleted_at: When the recruiter deleted the job; ``purge_deleted_jobs`` removes it later.
+    :type deleted_at: django.db.models.DateTimeField
+
+    ``Job.objects`` leaves out deleted jobs; ``Job.all_objects`` includes them.
     """
     recruiter = models.ForeignKey(RecruiterProfile, on_delete=models.CASCADE, related_name='jobs')
     title = models.CharField(max_length=255)
@@ -42,6 +67,69 @@ class Job(BaseModel):
     application_deadline = models.DateField(null=True, blank=True)
     is_active = models.BooleanField(default=True)
     skills_required = models.ManyToManyField(Skill, blank=True, related_name='required_in_jobs')
+    latitude = models.FloatField(null=True, blank=True, editable=False)
+    longitude = models.FloatField(null=True, blank=True, editable=False)
+    geohash = models.CharField(max_length=12, blank=True, db_index=True, editable=False)
+    deleted_at = models.DateTimeField(null=True, blank=True, editable=False)
+
+    objects = JobManager()
+    all_objects = models.Manager()
+
+    class Meta:
+        """
+        Meta class for the Job model.
+
+        Indexes the listing orders: newest first overall, per recruiter, and
+        among active postings (which also serves the active job count), plus
+        the deleted jobs waiting to be purged.
+        """
+        indexes = [
+            models.Index(fields=['-posted_date'], name='job_posted_idx'),
+            models.Index(fields=['recruiter', '-posted_date'], name='job_recruiter_posted_idx'),
+            models.Index(
+                fields=['-posted_date'], condition=models.Q(is_active=True, deleted_at__isnull=True),
+                name='job_active_posted_idx',
+            ),
+            models.Index(fields=['deleted_at'], condition=models.Q(deleted_at__isnull=False), name='job_deleted_idx'),
+        ]
+
+    def geocode_location(self):
+        """
+        Resolves ``location`` (or the recruiter's location as a fallback) to coordinates.
+
+        Unresolvable locations such as "Remote" clear the stored coordinates.
+        """
+        coords = geocode(self.location)
+        if coords is None and self.recruiter_id:
+            coords = geocode(self.recruiter.location)
+        if coords is None:
+            self.latitude = self.longitude = None
+            self.geohash = ''
+        else:
+            self.latitude, self.longitude = coords
+            self.geohash = encode_geohash(*coords)
+
+    def save(self, *args, **kwargs):
+        """
+        Geocodes the location before saving, unless ``update_fields`` excludes it.
+        """
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None or 'location' in update_fields:
+            self.geocode_location()
+            if update_fields is not None:
+                kwargs['update_fields'] = set(update_fields) | {'latitude', 'longitude', 'geohash'}
+        super().save(*args, **kwargs)
+
+    def soft_delete(self):
+        """
+        Hides the job everywhere at once by marking it deleted (and inactive).
+
+        Its applications and other rows stay until ``purge_deleted_jobs``
+        removes them in small batches.
+        """
+        self.deleted_at = timezone.now()
+        self.is_active = False
+        self.save(update_fields=['deleted_at', 'is_active', 'updated_at'])
 
     def __str__(self):
         """
@@ -50,4 +138,184 @@ class Job(BaseModel):
         Returns:
             str: The title of the job.
         """
-        return self.title
\ No newline at end of file
+        return self.title
+
+
+class JobSearchDocument(models.Model):
+    """
+    Denormalized, search-ready copy of a job, maintained from the outbox.
+
+    Rows are written only by ``job.search_index``; nothing links to them, so
+    the index can be dropped and rebuilt with ``reindex_jobs`` at any time.
+
+    :param job_id: Primary key of the indexed job.
+    :type job_id: django.db.models.BigIntegerField
+    :param recruiter_id: Primary key of the recruiter who posted the job.
+    :type recruiter_id: django.db.models.BigIntegerField
+    :param is_active: Copy of ``Job.is_active``.
+    :type is_active: django.db.models.BooleanField
+    :param posted_date: Copy of ``Job.posted_date``.
+    :type posted_date: django.db.models.DateTimeField
+    :param content: Lower-cased title, description, requirements, location, company and skill names.
+    :type content: django.db.models.TextField
+    :param indexed_at: When the document was last written.
+    :type indexed_at: django.db.models.DateTimeField
+    """
+    job_id = models.BigIntegerField(primary_key=True)
+    recruiter_id = models.BigIntegerField(db_index=True)
+    is_active = models.BooleanField(default=True)
+    posted_date = models.DateTimeField(db_index=True)
+    content = models.TextField()
+    indexed_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        """
+        Returns a string representation of the document.
+        """
+        return f"Search document for job {self.job_id}"
+
+
+class JobTerm(models.Model):
+    """
+    One posting in the job inverted index: a term and a job whose document contains it.
+
+    Rows are written only by ``job.search_index``, next to the job's
+    ``JobSearchDocument``.
+
+    :param term: The indexed term.
+    :type term: django.db.models.CharField
+    :param job_id: Primary key of the job containing the term.
+    :type job_id: django.db.models.BigIntegerField
+    """
+    term = models.CharField(max_length=64)
+    job_id = models.BigIntegerField(db_index=True)
+
+    class Meta:
+        """
+        Metadata for the JobTerm model.
+        """
+        unique_together = ('term', 'job_id')
+
+    def __str__(self):
+        """
+        Returns a string representation of the posting.
+        """
+        return f"{self.term} -> {self.job_id}"
+
+
+class JobEvent(models.Model):
+    """
+    An analytics event for a job, appended by ``job.analytics`` and consumed by its aggregator.
+
+    Views are buffered in process and written as one event per job and hour
+    with their ``count``; applications and status changes are written in the
+    transaction that makes them.
+
+    :param job: The job the event is about.
+    :type job: job.models.Job
+    :param kind: ``view``, ``apply`` or ``status``.
+    :type kind: django.db.models.CharField
+    :param count: Number of occurrences the event stands for.
+    :type count: django.db.models.PositiveIntegerField
+    :param status: The new status, for status changes.
+    :type status: django.db.models.CharField
+    :param review_seconds: Time from application to first review, for the first status change of an application.
+    :type review_seconds: django.db.models.FloatField
+    :param occurred_at: When the event happened (the start of the hour, for buffered views).
+    :type occurred_at: django.db.models.DateTimeField
+    """
+    VIEW = 'view'
+    APPLY = 'apply'
+    STATUS = 'status'
+
+    job = models.ForeignKey(Job, on_delete=models.CASCADE, related_name='events')
+    kind = models.CharField(max_length=10, choices=((VIEW, 'View'), (APPLY, 'Apply'), (STATUS, 'Status change')))
+    count = models.PositiveIntegerField(default=1)
+    status = models.CharField(max_length=50, blank=True)
+    review_seconds = models.FloatField(null=True, blank=True)
+    occurred_at = models.DateTimeField(default=timezone.now)
+
+    def __str__(self):
+        """
+        Returns a string representation of the event.
+        """
+        return f"{self.kind} x{self.count} for job {self.job_id}"
+
+
+class JobStats(models.Model):
+    """
+    Rolled-up analytics of a job for one period, maintained by ``job.analytics``.
+
+    :param period_start: Start of the period (hour or day, in ``TIME_ZONE``).
+    :type period_start: django.db.models.DateTimeField
+    :param views: Detail page views.
+    :type views: django.db.models.PositiveIntegerField
+    :param applications: Applications received.
+    :type applications: django.db.models.PositiveIntegerField
+    :param reviews: Applications given their first status change.
+    :type reviews: django.db.models.PositiveIntegerField
+    :param review_seconds: Summed time from application to first status change of those applications.
+    :type review_seconds: django.db.models.FloatField
+    :param reviewed: Applications moved to ``reviewed``; likewise for the other status columns.
+    :type reviewed: django.db.models.PositiveIntegerField
+    """
+    period_start = models.DateTimeField()
+    views = models.PositiveIntegerField(default=0)
+    applications = models.PositiveIntegerField(default=0)
+    reviews = models.PositiveIntegerField(default=0)
+    review_seconds = models.FloatField(default=0)
+    reviewed = models.PositiveIntegerField(default=0)
+    shortlisted = models.PositiveIntegerField(default=0)
+    interviewing = models.PositiveIntegerField(default=0)
+    offered = models.PositiveIntegerField(default=0)
+    rejected = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        """
+        Meta class for the JobStats models.
+        """
+        abstract = True
+
+
+class JobHourlyStats(JobStats):
+    """
+    Hourly analytics of a job.
+
+    :param job: The job.
+    :type job: job.models.Job
+    """
+    job = models.ForeignKey(Job, on_delete=models.CASCADE, related_name='hourly_stats')
+
+    class Meta:
+        """
+        Meta class for the JobHourlyStats model.
+        """
+        unique_together = ('job', 'period_start')
+
+    def __str__(self):
+        """
+        Returns a string representation of the rollup.
+        """
+        return f"Job {self.job_id} hour {self.period_start:%Y-%m-%d %H:00}"
+
+
+class JobDailyStats(JobStats):
+    """
+    Daily analytics of a job, read by the recruiter dashboard.
+
+    :param job: The job.
+    :type job: job.models.Job
+    """
+    job = models.ForeignKey(Job, on_delete=models.CASCADE, related_name='daily_stats')
+
+    class Meta:
+        """
+        Meta class for the JobDailyStats model.
+        """
+        unique_together = ('job', 'period_start')
+
+    def __str__(self):
+        """
+        Returns a string representation of the rollup.
+        """
+        return f"Job {self.job_id} day {self.period_start:%Y-%m-%d}"
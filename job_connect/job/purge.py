@@ -0,0 +1,107 @@
+"""
+Background removal of soft-deleted jobs.
+
+Deleting a job from the site only marks it (``Job.soft_delete``): the default
+manager hides it immediately, and it counts as inactive. Deleting the row
+itself would cascade to every application, archived application,
+recommendation and skill link in one statement, holding locks for as long as
+that takes. ``purge_deleted_jobs`` does it in small steps instead. For each
+deleted job it removes the rows of every relation to ``Job`` in batches of
+``batch_size``, each in its own transaction and with an optional pause in
+between. The job itself goes last, once nothing refers to it.
+
+Batches delete through the ORM, so signal handlers (maintained counters,
+search index and page cache invalidation) see every row that goes.
+"""
+import logging
+import time
+
+from django.db import transaction
+
+from job.models import Job
+
+logger = logging.getLogger(__name__)
+
+
+def dependent_querysets(job_id):
+    """
+    Returns querysets of the rows referring to a job.
+
+    Hidden relations (``related_name='+'``) and the skill link table are included.
+
+    Args:
+        job_id (int): Primary key of the job.
+
+    Returns:
+        list: One queryset per related model.
+    """
+    return [
+        relation.related_model._base_manager.filter(**{relation.field.name: job_id})
+        for relation in Job._meta.get_fields(include_hidden=True)
+        if relation.one_to_many and relation.auto_created and not relation.concrete
+    ]
+
+
+def delete_in_batches(queryset, batch_size, pause):
+    """
+    Deletes the rows of a queryset a batch at a time.
+
+    Args:
+        queryset (django.db.models.query.QuerySet): The rows to delete.
+        batch_size (int): Rows deleted per transaction.
+        pause (float): Seconds to sleep between batches.
+
+    Returns:
+        int: Number of rows deleted, not counting cascades.
+    """
+    deleted = 0
+    while True:
+        ids = list(queryset.order_by('pk').values_list('pk', flat=True)[:batch_size])
+        if not ids:
+            return deleted
+        with transaction.atomic():
+            queryset.model._base_manager.filter(pk__in=ids).delete()
+        deleted += len(ids)
+        if pause:
+            time.sleep(pause)
+
+
+def purge_job(job_id, batch_size=500, pause=0.0):
+    """
+    Removes a soft-deleted job and everything referring to it.
+
+    Args:
+        job_id (int): Primary key of the job.
+        batch_size (int): Rows deleted per transaction.
+        pause (float): Seconds to sleep between batches.
+
+    Returns:
+        int: Number of dependent rows deleted.
+    """
+    deleted = sum(delete_in_batches(queryset, batch_size, pause) for queryset in dependent_querysets(job_id))
+    with transaction.atomic():
+        Job.all_objects.filter(pk=job_id, deleted_at__isnull=False).delete()
+    return deleted
+
+
+def purge_deleted_jobs(batch_size=500, pause=0.0, limit=None):
+    """
+    Purges soft-deleted jobs, oldest deletion first.
+
+    Args:
+        batch_size (int): Rows deleted per transaction.
+        pause (float): Seconds to sleep between batches.
+        limit (int): Purge at most this many jobs; ``None`` purges them all.
+
+    Returns:
+        tuple: ``(jobs purged, dependent rows deleted)``.
+    """
+    job_ids = Job.all_objects.filter(deleted_at__isnull=False).order_by('deleted_at').values_list('pk', flat=True)
+    if limit is not None:
+        job_ids = job_ids[:limit]
+    jobs = rows = 0
+    for job_id in list(job_ids):
+        rows += purge_job(job_id, batch_size, pause)
+        jobs += 1
+    logger.info('Purged %d deleted jobs and %d dependent rows.', jobs, rows)
+    return jobs, rows
@@ -0,0 +1,146 @@
+"""
+Job search index maintained through the transactional outbox.
+
+Job views never touch the index directly: the signals in ``job.signals``
+record outbox changes for jobs, their required skills, skills and recruiter
+profiles, and the ``process_outbox`` consumer calls the handlers below to
+bring ``JobSearchDocument`` rows and their ``JobTerm`` postings up to date.
+Handlers rebuild documents from the current database state, so applying a
+change twice, or out of order, is harmless.
+
+``search`` intersects the posting lists of the query's terms, tokenized the
+same way as candidate search (``applicant.search.tokenize``), so it reads only
+the indexed postings of those terms and matches whole words: "java" does not
+match "javascript".
+"""
+from collections import defaultdict
+
+from django.db import transaction
+from django.db.models import Count
+
+from applicant.search import TERM_BATCH_SIZE, tokenize
+from core.outbox import register_handler
+from job.models import Job, JobSearchDocument, JobTerm
+
+JOB_TOPIC = 'job'
+RECRUITER_TOPIC = 'recruiter'
+SKILL_TOPIC = 'skill'
+
+DOCUMENT_FIELDS = ['recruiter_id', 'is_active', 'posted_date', 'content', 'indexed_at']
+
+
+def build_documents(job_ids):
+    """
+    Builds search documents for the given jobs from the database.
+
+    Args:
+        job_ids (iterable): Primary keys of the jobs to index.
+
+    Returns:
+        list: Unsaved ``JobSearchDocument`` instances for the jobs that still exist.
+    """
+    job_ids = list(job_ids)
+    skills = defaultdict(list)
+    through = Job.skills_required.through.objects.filter(job_id__in=job_ids)
+    for job_id, name in through.values_list('job_id', 'skill__name'):
+        skills[job_id].append(name)
+
+    rows = Job.objects.filter(pk__in=job_ids).values_list(
+        'pk', 'recruiter_id', 'is_active', 'posted_date', 'title', 'description', 'requirements',
+        'location', 'recruiter__company_name',
+    )
+    documents = []
+    for pk, recruiter_id, is_active, posted_date, *text in rows:
+        content = '\n'.join(part for part in text + skills[pk] if part)
+        documents.append(JobSearchDocument(
+            job_id=pk,
+            recruiter_id=recruiter_id,
+            is_active=is_active,
+            posted_date=posted_date,
+            content=content.lower(),
+        ))
+    return documents
+
+
+def index_jobs(job_ids):
+    """
+    Upserts documents and postings for existing jobs and removes those of deleted ones.
+
+    Args:
+        job_ids (iterable): Primary keys of the jobs that changed.
+
+    Returns:
+        int: Number of documents written.
+    """
+    job_ids = set(job_ids)
+    documents = build_documents(job_ids)
+    postings = [
+        JobTerm(term=term, job_id=document.job_id) for document in documents for term in tokenize(document.content)
+    ]
+    with transaction.atomic():
+        JobTerm.objects.filter(job_id__in=job_ids).delete()
+        JobTerm.objects.bulk_create(postings, batch_size=TERM_BATCH_SIZE)
+        JobSearchDocument.objects.bulk_create(
+            documents,
+            update_conflicts=True,
+            unique_fields=['job_id'],
+            update_fields=DOCUMENT_FIELDS,
+        )
+        missing = job_ids - {document.job_id for document in documents}
+        if missing:
+            JobSearchDocument.objects.filter(job_id__in=missing).delete()
+    return len(documents)
+
+
+def index_recruiters(recruiter_ids):
+    """
+    Re-indexes every job posted by the given recruiters.
+
+    Args:
+        recruiter_ids (iterable): Primary keys of the recruiter profiles that changed.
+    """
+    index_jobs(Job.objects.filter(recruiter_id__in=list(recruiter_ids)).values_list('pk', flat=True))
+
+
+def index_skills(skill_ids):
+    """
+    Re-indexes every job that requires one of the given skills.
+
+    Args:
+        skill_ids (iterable): Primary keys of the skills that changed.
+    """
+    through = Job.skills_required.through.objects.filter(skill_id__in=list(skill_ids))
+    index_jobs(through.values_list('job_id', flat=True).distinct())
+
+
+def search(query, queryset=None):
+    """
+    Finds jobs whose indexed content contains every word of ``query``.
+
+    The matching job ids come from one indexed ``GROUP BY`` over the postings
+    of the query's terms. A query with no searchable terms does not filter.
+
+    Args:
+        query (str): Free-text search query.
+        queryset (django.db.models.query.QuerySet, optional): Job queryset to restrict; defaults to all jobs.
+
+    Returns:
+        django.db.models.query.QuerySet: The matching jobs.
+    """
+    queryset = Job.objects.all() if queryset is None else queryset
+    terms = tokenize(query)
+    if not terms:
+        return queryset
+    matches = (
+        JobTerm.objects.filter(term__in=terms)
+        .values('job_id')
+        .annotate(matched=Count('term'))
+        .filter(matched=len(terms))
+        .values('job_id')
+    )
+    return queryset.filter(pk__in=matches)
+
+
+register_handler(JOB_TOPIC, index_jobs)
+register_handler(RECRUITER_TOPIC, index_recruiters)
+register_handler(SKILL_TOPIC, index_skills)
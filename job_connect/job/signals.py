@@ -0,0 +1,109 @@
+from django.db.models.signals import m2m_changed, post_delete, post_init, post_save, pre_delete
+from django.dispatch import receiver
+from applicant.models import Skill
+from application.models import Application
+from core.outbox import record_change, record_changes
+from job.analytics import record_application, record_status_change
+from job.cache import invalidate_catalog
+from job.models import Job
+from job.search_index import JOB_TOPIC, RECRUITER_TOPIC, SKILL_TOPIC
+from recruiter.models import RecruiterProfile
+
+
+@receiver(post_save, sender=Job)
+@receiver(post_delete, sender=Job)
+@receiver(post_save, sender=RecruiterProfile)
+@receiver(post_save, sender=Skill)
+@receiver(post_delete, sender=Skill)
+def invalidate_job_pages(sender, **kwargs):
+    """
+    Bumps the job catalog version when anything rendered on job pages changes.
+    """
+    invalidate_catalog()
+
+
+@receiver(m2m_changed, sender=Job.skills_required.through)
+def invalidate_job_pages_on_skills_change(sender, action, **kwargs):
+    """
+    Bumps the job catalog version when a job's required skills change.
+    """
+    if action in ('post_add', 'post_remove', 'post_clear'):
+        invalidate_catalog()
+
+
+@receiver(post_save, sender=Job)
+def record_job_saved(sender, instance, **kwargs):
+    """
+    Queues a search index update for a saved job.
+    """
+    record_change(JOB_TOPIC, instance.pk)
+
+
+@receiver(post_delete, sender=Job)
+def record_job_deleted(sender, instance, **kwargs):
+    """
+    Queues removal of a deleted job from the search index.
+    """
+    record_change(JOB_TOPIC, instance.pk, action='delete')
+
+
+@receiver(m2m_changed, sender=Job.skills_required.through)
+def record_job_skills_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    """
+    Queues search index updates for jobs whose required skills changed.
+
+    Changes made from the skill side (``skill.required_in_jobs``) touch every
+    affected job; for ``clear()`` those jobs are collected before the links go.
+    """
+    if not reverse:
+        if action in ('post_add', 'post_remove', 'post_clear'):
+            record_change(JOB_TOPIC, instance.pk)
+    elif action in ('post_add', 'post_remove') and pk_set:
+        record_changes(JOB_TOPIC, pk_set)
+    elif action == 'pre_clear':
+        record_changes(JOB_TOPIC, instance.required_in_jobs.values_list('pk', flat=True))
+
+
+@receiver(post_save, sender=RecruiterProfile)
+def record_recruiter_saved(sender, instance, **kwargs):
+    """
+    Queues search index updates for the jobs of a changed recruiter.
+    """
+    record_change(RECRUITER_TOPIC, instance.pk)
+
+
+@receiver(post_save, sender=Skill)
+def record_skill_saved(sender, instance, created, **kwargs):
+    """
+    Queues search index updates for jobs requiring a renamed skill.
+    """
+    if not created:
+        record_change(SKILL_TOPIC, instance.pk)
+
+
+@receiver(pre_delete, sender=Skill)
+def record_skill_deleted(sender, instance, **kwargs):
+    """
+    Queues search index updates for jobs requiring a skill that is about to be deleted.
+    """
+    record_changes(JOB_TOPIC, instance.required_in_jobs.values_list('pk', flat=True))
+
+
+@receiver(post_init, sender=Application)
+def remember_application_status(sender, instance, **kwargs):
+    """
+    Remembers an application's status as loaded, to detect changes on save.
+    """
+    instance._analytics_status = instance.__dict__.get('status')
+
+
+@receiver(post_save, sender=Application)
+def record_application_event(sender, instance, created, **kwargs):
+    """
+    Appends an analytics event for a new application or a changed status.
+    """
+    previous, instance._analytics_status = instance._analytics_status, instance.status
+    if created:
+        record_application(instance)
+    elif previous is not None and previous != instance.status:
+        record_status_change(instance, previous)
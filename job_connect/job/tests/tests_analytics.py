@@ -0,0 +1,98 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from applicant.models import ApplicantProfile
+from application.models import Application
+from job.analytics import aggregate_events, day_start, flush_views, hour_start, recruiter_summary
+from job.models import Job, JobDailyStats, JobEvent, JobHourlyStats
+from recruiter.models import RecruiterProfile
+
+User = get_user_model()
+
+
+@override_settings(ANALYTICS_FLUSH_INTERVAL=0)
+class JobAnalyticsTest(TestCase):
+    """
+    Tests for job analytics capture, rollups and the recruiter dashboard.
+    """
+
+    def setUp(self):
+        """
+        Set up a recruiter with a job and two applicants.
+        """
+        cache.clear()
+        flush_views()
+        JobEvent.objects.all().delete()
+        self.user = User.objects.create_user(username='analytics-recruiter', password='password')
+        self.recruiter = RecruiterProfile.objects.create(user=self.user, company_name='Test Corp')
+        self.job = Job.objects.create(recruiter=self.recruiter, title='Tracked Role', location='Denver, CO')
+        self.applicants = [
+            ApplicantProfile.objects.create(
+                user=User.objects.create_user(username=f'analytics-applicant-{i}', password='password'), headline='Developer',
+            )
+            for i in range(2)
+        ]
+
+    def test_views_are_counted_including_cache_hits(self):
+        """
+        Test that detail page views, cached or not, become view events.
+        """
+        url = reverse('job:job_detail', kwargs={'pk': self.job.pk})
+        self.client.get(url)
+        self.assertEqual(self.client.get(url)['X-Page-Cache'], 'hit')
+        self.client.get(reverse('job:job_detail', kwargs={'pk': 0}))
+        self.assertEqual(sum(JobEvent.objects.filter(job=self.job, kind=JobEvent.VIEW).values_list('count', flat=True)), 2)
+
+        aggregate_events()
+        self.assertEqual(JobHourlyStats.objects.get(job=self.job, period_start=hour_start(timezone.now())).views, 2)
+        self.assertFalse(JobEvent.objects.exists())
+
+    def test_applications_and_status_changes_roll_up(self):
+        """
+        Test that applies and status changes are counted once, with the time to first review.
+        """
+        first = Application.objects.create(applicant=self.applicants[0], job=self.job)
+        Application.objects.create(applicant=self.applicants[1], job=self.job)
+        Application.objects.filter(pk=first.pk).update(created_at=timezone.now() - timedelta(hours=2))
+        first = Application.objects.get(pk=first.pk)
+        first.status = 'reviewed'
+        first.save()
+        first.status = 'offered'
+        first.save()
+        first.save()
+
+        self.assertEqual(aggregate_events(batch_size=2), 4)
+        self.assertEqual(aggregate_events(), 0)
+        daily = JobDailyStats.objects.get(job=self.job, period_start=day_start(timezone.now()))
+        self.assertEqual((daily.applications, daily.reviewed, daily.offered, daily.rejected), (2, 1, 1, 0))
+        self.assertEqual(daily.reviews, 1)
+        self.assertAlmostEqual(daily.review_seconds, 7200, delta=60)
+        self.assertEqual(JobHourlyStats.objects.get(job=self.job).applications, 2)
+
+        job = recruiter_summary(self.recruiter.pk)['jobs'][0]
+        self.assertEqual(job['conversion']['offered'], 50.0)
+        self.assertEqual(job['avg_review_hours'], 2.0)
+
+    def test_dashboard_reads_rollups(self):
+        """
+        Test that the dashboard shows the rolled-up figures, not the raw events.
+        """
+        Application.objects.create(applicant=self.applicants[0], job=self.job)
+        self.client.force_login(self.user)
+        url = reverse('recruiter:recruiter_dashboard')
+        self.assertContains(self.client.get(url), 'No activity yet.')
+
+        call_command('aggregate_job_events', stdout=StringIO())
+        response = self.client.get(url)
+        self.assertContains(response, 'Tracked Role')
+        summary = response.context['analytics']
+        self.assertEqual(len(summary['daily']), 30)
+        self.assertEqual(summary['daily'][-1]['applications'], 1)
+        self.assertEqual(summary['daily'][-1]['bar'], 100)
@@ -0,0 +1,115 @@
+from asgiref.sync import async_to_sync
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import AnonymousUser
+from django.core.cache import cache
+from django.http import Http404
+from django.test import RequestFactory, TestCase, override_settings
+from django.urls import reverse
+from applicant.models import ApplicantProfile, Skill
+from applicant.views import aapplicant_profile_view
+from job.models import Job
+from job.views import ajob_detail, ajob_list, ajob_search
+from recruiter.models import RecruiterProfile
+
+User = get_user_model()
+
+
+def as_user(request, user):
+    """
+    Attaches ``user`` to a factory request the way ``AuthenticationMiddleware`` would.
+    """
+    async def auser():
+        return user
+    request.user = user
+    request.auser = auser
+    return request
+
+
+@override_settings(JOB_PAGE_CACHE_TIMEOUT=0)
+class AsyncJobViewTest(TestCase):
+    """
+    Tests for the async job list, detail and search views.
+    """
+
+    def setUp(self):
+        """
+        Set up a recruiter with a job requiring a skill.
+        """
+        cache.clear()
+        self.factory = RequestFactory()
+        user = User.objects.create_user(username='asyncrecruiter', password='testpassword')
+        self.recruiter = RecruiterProfile.objects.create(user=user, company_name='Async Corp')
+        self.job = Job.objects.create(recruiter=self.recruiter, title='Async Engineer', location='Denver, CO')
+        self.job.skills_required.add(Skill.objects.create(name='Asyncio'))
+
+    def get(self, view, path, **kwargs):
+        """
+        Calls an async view anonymously and returns the response.
+        """
+        return async_to_sync(view)(as_user(self.factory.get(path), AnonymousUser()), **kwargs)
+
+    def test_list(self):
+        """
+        Test that the async list renders the same template and jobs as the sync view.
+        """
+        response = self.get(ajob_list, reverse('job:job_list'))
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, 'Async Engineer')
+
+    @override_settings(ANALYTICS_FLUSH_INTERVAL=3600)  # Keep the buffered view out of the query count
+    def test_detail_loads_everything_up_front(self):
+        """
+        Test that the detail page runs one query for the job and one for its skills.
+        """
+        with self.assertNumQueries(2):
+            response = self.get(ajob_detail, reverse('job:job_detail', args=[self.job.pk]), pk=self.job.pk)
+        self.assertContains(response, 'Async Corp')
+        self.assertContains(response, 'Asyncio')
+
+    def test_detail_missing_job(self):
+        """
+        Test that an unknown job raises 404.
+        """
+        with self.assertRaises(Http404):
+            self.get(ajob_detail, '/jobs/0/', pk=0)
+
+    def test_search(self):
+        """
+        Test that the async search filters by keyword and keeps the query in the context.
+        """
+        response = self.get(ajob_search, reverse('job:job_search') + '?q=async')
+        self.assertContains(response, 'Async Engineer')
+        self.assertContains(response, 'value="async"')
+        response = self.get(ajob_search, reverse('job:job_search') + '?q=nomatch')
+        self.assertNotContains(response, 'Async Engineer')
+
+
+class AsyncProfileViewTest(TestCase):
+    """
+    Tests for the async applicant profile view.
+    """
+
+    def setUp(self):
+        """
+        Set up an applicant with a profile.
+        """
+        cache.clear()
+        self.user = User.objects.create_user(username='asyncapplicant', password='testpassword', user_type='applicant')
+        self.request = RequestFactory().get(reverse('applicant:applicant_profile_view'))
+        self.request.session = self.client.session
+
+    def test_profile_rendered_from_snapshot(self):
+        """
+        Test that the async view renders the applicant's profile.
+        """
+        ApplicantProfile.objects.create(user=self.user, headline='Async headline', summary='Summary')
+        response = async_to_sync(aapplicant_profile_view)(as_user(self.request, self.user))
+        self.assertContains(response, 'Async headline')
+
+    def test_missing_profile_redirects(self):
+        """
+        Test that an applicant without a profile is sent to create one.
+        """
+        response = async_to_sync(aapplicant_profile_view)(as_user(self.request, self.user))
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(response.url, reverse('applicant:applicant_profile_create'))
@@ -0,0 +1,106 @@
+from django.contrib.auth import get_user_model
+from django.test import SimpleTestCase, TestCase
+from job import geo
+from job.models import Job
+from recruiter.models import RecruiterProfile
+
+User = get_user_model()
+
+
+class GeocodeTest(SimpleTestCase):
+    """
+    Tests for the offline gazetteer lookup.
+    """
+
+    def test_geocode_city_with_state_code(self):
+        """
+        Test that "City, ST" resolves to the matching place.
+        """
+        lat, lon = geo.geocode('Portland, ME')
+        self.assertAlmostEqual(lat, 43.6591, places=3)
+        self.assertAlmostEqual(lon, -70.2568, places=3)
+
+    def test_geocode_city_with_state_name(self):
+        """
+        Test that full state names are accepted as qualifiers.
+        """
+        self.assertEqual(geo.geocode('Portland, Oregon'), geo.geocode('Portland, OR'))
+
+    def test_geocode_bare_city_prefers_most_populous(self):
+        """
+        Test that an ambiguous bare name resolves to the most populous place.
+        """
+        self.assertEqual(geo.geocode('portland'), geo.geocode('Portland, OR'))
+
+    def test_geocode_alias_and_unknown(self):
+        """
+        Test that common aliases resolve and unknown places return None.
+        """
+        self.assertEqual(geo.geocode('NYC'), geo.geocode('New York, NY'))
+        self.assertIsNone(geo.geocode('Remote'))
+        self.assertIsNone(geo.geocode(''))
+
+
+class GeohashTest(SimpleTestCase):
+    """
+    Tests for geohash encoding and area covering.
+    """
+
+    def test_encode_geohash_known_value(self):
+        """
+        Test encoding against a well-known reference geohash.
+        """
+        self.assertEqual(geo.encode_geohash(57.64911, 10.40744, 11), 'u4pruydqqvj')
+
+    def test_covering_cells_contain_points_in_box(self):
+        """
+        Test that every point inside a bounding box falls under one of the covering prefixes.
+        """
+        box = geo.bounding_box(39.7392, -104.9903, 100)
+        cells = geo.covering_cells(*box)
+        self.assertLessEqual(len(cells), geo.MAX_COVER_CELLS)
+        south, west, north, east = box
+        for i in range(11):
+            for j in range(11):
+                lat = south + (north - south) * i / 10
+                lon = west + (east - west) * j / 10
+                point = geo.encode_geohash(lat, lon)
+                self.assertTrue(any(point.startswith(cell) for cell in cells))
+
+    def test_bounding_boxes_split_at_antimeridian(self):
+        """
+        Test that a circle crossing longitude 180 is covered by a box on each side of it.
+        """
+        (_, west, _, east), (_, west2, _, east2) = geo.bounding_boxes(-16.8, 179.9, 50)
+        self.assertEqual((east, west2), (180.0, -180.0))
+        self.assertAlmostEqual(west, 179.43, places=2)
+        self.assertAlmostEqual(east2, -179.63, places=2)
+        self.assertEqual(len(geo.bounding_boxes(39.7392, -104.9903, 100)), 1)
+        self.assertEqual(geo.bounding_boxes(89.5, 0, 100)[0][1:4:2], (-180.0, 180.0))
+
+    def test_haversine_km(self):
+        """
+        Test the distance between Denver and Boulder is about 40km.
+        """
+        distance = geo.haversine_km(39.7392, -104.9903, 40.0150, -105.2705)
+        self.assertAlmostEqual(distance, 39, delta=2)
+
+
+class RadiusSearchTest(TestCase):
+    """
+    Tests for radius searches over stored job coordinates.
+    """
+
+    def test_radius_search_across_antimeridian(self):
+        """
+        Test that a search near longitude 180 finds jobs on the other side of it.
+        """
+        recruiter = RecruiterProfile.objects.create(
+            user=User.objects.create_user(username='geo-recruiter', password='password'), company_name='Test Corp',
+        )
+        places = {'east': (-16.8, -179.9), 'west': (-16.8, 179.8), 'far': (-16.8, -178.0)}
+        for title, (lat, lon) in places.items():
+            job = Job.objects.create(recruiter=recruiter, title=title, location='Remote')
+            Job.objects.filter(pk=job.pk).update(latitude=lat, longitude=lon, geohash=geo.encode_geohash(lat, lon))
+        found = geo.within_radius(Job.objects.all(), -16.8, 179.95, 50)
+        self.assertEqual(sorted(found.values_list('title', flat=True)), ['east', 'west'])
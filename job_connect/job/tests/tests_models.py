@@ -81,3 +81,48 @@ class JobModelTest(TestCase):
             location='Austin'
         )
         self.assertEqual(str(job), 'UX Designer')
+
+    def test_job_location_is_geocoded_on_save(self):
+        """
+        Test that a known location is resolved to coordinates and a geohash on save.
+        """
+        job = Job.objects.create(
+            recruiter=self.recruiter_profile,
+            title='Site Engineer',
+            description='Build things.',
+            location='Denver, CO'
+        )
+        self.assertAlmostEqual(job.latitude, 39.7392, places=3)
+        self.assertAlmostEqual(job.longitude, -104.9903, places=3)
+        self.assertEqual(len(job.geohash), 9)
+        self.assertTrue(job.geohash.startswith('9xj'))
+
+    def test_job_location_falls_back_to_recruiter_location(self):
+        """
+        Test that an unknown job location falls back to the recruiter's location.
+        """
+        self.recruiter_profile.location = 'Boston, Massachusetts'
+        self.recruiter_profile.save()
+        job = Job.objects.create(
+            recruiter=self.recruiter_profile,
+            title='Remote Analyst',
+            description='Work from anywhere.',
+            location='Remote'
+        )
+        self.assertAlmostEqual(job.latitude, 42.3601, places=3)
+
+    def test_job_unknown_location_clears_coordinates(self):
+        """
+        Test that changing to an unresolvable location clears stored coordinates.
+        """
+        job = Job.objects.create(
+            recruiter=self.recruiter_profile,
+            title='Nomad',
+            description='Anywhere.',
+            location='Austin'
+        )
+        job.location = 'Remote'
+        job.save(update_fields=['location'])
+        job.refresh_from_db()
+        self.assertIsNone(job.latitude)
+        self.assertEqual(job.geohash, '')
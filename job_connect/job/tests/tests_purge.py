@@ -0,0 +1,88 @@
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+
+from applicant.models import ApplicantProfile, JobRecommendation, Skill
+from application.models import Application
+from core.counters import get_count
+from core.outbox import process_outbox
+from job.models import Job, JobEvent, JobSearchDocument
+from job.purge import purge_deleted_jobs
+from recruiter.models import RecruiterProfile
+
+User = get_user_model()
+
+
+class SoftDeleteTest(TestCase):
+    """
+    Tests for soft-deleting jobs and purging them in the background.
+    """
+
+    def setUp(self):
+        """
+        Set up a recruiter with a job that has skills and pending applications.
+        """
+        cache.clear()
+        self.user = User.objects.create_user(username='purge-recruiter', password='password')
+        self.recruiter = RecruiterProfile.objects.create(user=self.user, company_name='Test Corp')
+        self.job = Job.objects.create(recruiter=self.recruiter, title='Popular Role', location='Denver, CO')
+        self.job.skills_required.add(Skill.objects.create(name='purge-skill'))
+        for i in range(3):
+            applicant = ApplicantProfile.objects.create(
+                user=User.objects.create_user(username=f'purge-applicant-{i}', password='password'), headline='Developer',
+            )
+            Application.objects.create(applicant=applicant, job=self.job)
+        JobRecommendation.objects.create(applicant=applicant, job=self.job, score=1)
+
+    def test_delete_view_hides_job_without_removing_rows(self):
+        """
+        Test that deleting from the site hides the job at once and keeps its applications for the purger.
+        """
+        active, pending = get_count('active_jobs'), get_count('pending_applications')
+        self.client.force_login(self.user)
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(reverse('job:job_delete', kwargs={'pk': self.job.pk}))
+        self.assertEqual(response.status_code, 302)
+        self.assertFalse(Job.objects.filter(pk=self.job.pk).exists())
+        deleted = Job.all_objects.get(pk=self.job.pk)
+        self.assertIsNotNone(deleted.deleted_at)
+        self.assertFalse(deleted.is_active)
+        self.assertEqual(Application.objects.filter(job_id=self.job.pk).count(), 3)
+        self.assertEqual(get_count('active_jobs'), active - 1)
+        self.assertEqual(get_count('pending_applications'), pending)
+        self.assertEqual(self.client.get(reverse('job:job_detail', kwargs={'pk': self.job.pk})).status_code, 404)
+
+    def test_purge_removes_job_and_dependents(self):
+        """
+        Test that the purger removes the applications, skill links, analytics events and the job, keeping counters exact.
+        """
+        process_outbox()
+        self.assertTrue(JobSearchDocument.objects.filter(job_id=self.job.pk).exists())
+        pending = get_count('pending_applications')
+        with self.captureOnCommitCallbacks(execute=True):
+            self.job.soft_delete()
+        process_outbox()
+        self.assertFalse(JobSearchDocument.objects.filter(job_id=self.job.pk).exists())
+
+        with self.captureOnCommitCallbacks(execute=True):
+            jobs, rows = purge_deleted_jobs(batch_size=2)
+        self.assertEqual((jobs, rows), (1, 8))
+        self.assertFalse(Job.all_objects.filter(pk=self.job.pk).exists())
+        self.assertFalse(Application.objects.filter(job_id=self.job.pk).exists())
+        self.assertFalse(Job.skills_required.through.objects.filter(job_id=self.job.pk).exists())
+        self.assertFalse(JobRecommendation.objects.filter(job_id=self.job.pk).exists())
+        self.assertFalse(JobEvent.objects.filter(job_id=self.job.pk).exists())
+        self.assertEqual(get_count('pending_applications'), pending - 3)
+
+    def test_command_leaves_live_jobs(self):
+        """
+        Test that the command only purges deleted jobs.
+        """
+        out = StringIO()
+        call_command('purge_deleted_jobs', '--pause', '0', stdout=out)
+        self.assertIn('Purged 0 jobs', out.getvalue())
+        self.assertTrue(Job.objects.filter(pk=self.job.pk).exists())
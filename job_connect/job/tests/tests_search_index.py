@@ -0,0 +1,109 @@
+from io import StringIO
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+
+from applicant.models import Skill
+from core.models import OutboxEvent
+from core.outbox import outbox_lag, process_outbox
+from job import search_index
+from job.models import Job, JobSearchDocument, JobTerm
+from recruiter.models import RecruiterProfile
+
+User = get_user_model()
+
+
+class JobSearchOutboxTest(TestCase):
+    """
+    Tests for keeping the job search index in sync through the outbox.
+    """
+
+    def setUp(self):
+        """
+        Set up a recruiter with one job requiring one skill.
+        """
+        self.user = User.objects.create_user(username='outboxrecruiter', password='testpassword')
+        self.recruiter = RecruiterProfile.objects.create(user=self.user, company_name='Acme Rockets')
+        self.skill = Skill.objects.create(name='Fortran')
+        self.job = Job.objects.create(recruiter=self.recruiter, title='Flight Engineer', description='Build rockets.', location='Denver, CO')
+        self.job.skills_required.add(self.skill)
+
+    def test_changes_are_recorded_not_applied_inline(self):
+        """
+        Test that saving a job only writes outbox records until the consumer runs.
+        """
+        self.assertTrue(OutboxEvent.objects.filter(topic='job', object_id=self.job.pk).exists())
+        self.assertFalse(JobSearchDocument.objects.exists())
+        self.assertEqual(outbox_lag()['pending_by_topic'].get('job'), OutboxEvent.objects.filter(topic='job').count())
+
+    def test_consumer_builds_document_and_drains_outbox(self):
+        """
+        Test that the consumer indexes title, company and skills and deletes applied records.
+        """
+        process_outbox()
+        document = JobSearchDocument.objects.get(job_id=self.job.pk)
+        self.assertIn('flight engineer', document.content)
+        self.assertIn('acme rockets', document.content)
+        self.assertIn('fortran', document.content)
+        self.assertEqual(outbox_lag()['pending'], 0)
+        self.assertEqual(list(search_index.search('ROCKETS fortran')), [self.job])
+        self.assertFalse(search_index.search('cobol').exists())
+
+    def test_search_matches_whole_terms(self):
+        """
+        Test that search intersects term postings instead of matching substrings.
+        """
+        Job.objects.create(recruiter=self.recruiter, title='JavaScript Developer', description='Frontend work at Google.')
+        java = Job.objects.create(recruiter=self.recruiter, title='Java Developer', description='Go and Java services.')
+        process_outbox()
+        self.assertEqual(list(search_index.search('java')), [java])
+        self.assertEqual(list(search_index.search('go developer')), [java])
+        self.assertTrue(JobTerm.objects.filter(job_id=self.job.pk, term='fortran').exists())
+
+        java.delete()
+        process_outbox()
+        self.assertFalse(JobTerm.objects.filter(job_id=java.pk).exists())
+
+    def test_recruiter_skill_and_delete_changes_propagate(self):
+        """
+        Test that recruiter renames, skill removal and job deletion reach the index.
+        """
+        process_outbox()
+        self.recruiter.company_name = 'Orbital Inc'
+        self.recruiter.save()
+        self.job.skills_required.remove(self.skill)
+        process_outbox()
+        content = JobSearchDocument.objects.get(job_id=self.job.pk).content
+        self.assertIn('orbital inc', content)
+        self.assertNotIn('fortran', content)
+
+        self.job.delete()
+        process_outbox()
+        self.assertFalse(JobSearchDocument.objects.filter(job_id=self.job.pk).exists())
+
+    def test_failed_batch_is_retried(self):
+        """
+        Test that records stay in the outbox when applying them fails.
+        """
+        pending = OutboxEvent.objects.count()
+        with mock.patch.dict('core.outbox._handlers', {'job': mock.Mock(side_effect=RuntimeError)}):
+            with self.assertRaises(RuntimeError):
+                process_outbox()
+        self.assertEqual(OutboxEvent.objects.count(), pending)
+        process_outbox()
+        self.assertTrue(JobSearchDocument.objects.filter(job_id=self.job.pk).exists())
+
+    def test_reindex_command_rebuilds_index(self):
+        """
+        Test that reindex_jobs indexes every job and removes stale documents.
+        """
+        JobSearchDocument.objects.create(job_id=Job.objects.order_by('-pk')[0].pk + 1000, recruiter_id=self.recruiter.pk,
+                                         posted_date=self.job.posted_date, content='stale')
+        call_command('reindex_jobs', batch_size=1, stdout=StringIO())
+        self.assertEqual(
+            set(JobSearchDocument.objects.values_list('job_id', flat=True)),
+            set(Job.objects.values_list('pk', flat=True)),
+        )
+        self.assertTrue(JobSearchDocument.objects.filter(job_id=self.job.pk).exists())
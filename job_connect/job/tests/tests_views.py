@@ -1,10 +1,12 @@
-from django.test import TestCase, Client
+from django.test import TestCase, Client, override_settings
 from django.urls import reverse
 from job.models import Job, Skill
 from recruiter.models import RecruiterProfile
 from django.contrib.auth import get_user_model
 from datetime import datetime, timedelta, date
 from django.utils import timezone
+from django.core.cache import cache
+from job.cache import page_cache_stats, reset_page_cache_stats
 import time
 
 
@@ -38,6 +40,7 @@ class JobListViewTest(TestCase):
         """
         Set up the client and URLs for each test.
         """
+        cache.clear()  # :no-index: Anonymous job pages are cached across requests
         self.client = Client()
         self.list_url = reverse('job:job_list')
 
@@ -93,6 +96,7 @@ class JobDetailViewTest(TestCase):
         """
         Set up the client and URLs for each test.
         """
+        cache.clear()  # :no-index: Anonymous job pages are cached across requests
         self.client = Client()
         self.detail_url = reverse('job:job_detail', kwargs={'pk': self.job.pk})
         self.invalid_detail_url = reverse('job:job_detail', kwargs={'pk': 999}) # :no-index: An ID that likely doesn't exist
@@ -479,6 +483,7 @@ class JobSearchViewTest(TestCase):
         """
         Set up the test environment for JobSearchViewTest.
         """
+        cache.clear()  # :no-index: Anonymous job pages are cached across requests
         self.client = Client()
         self.search_url = reverse('job:job_search')
 
@@ -645,4 +650,160 @@ class RecruiterJobListTest(TestCase):
         self.assertEqual(jobs[0].title, 'New Job')
         self.assertEqual(jobs[1].title, 'Recruiter 1 Job 2')
         self.assertEqual(jobs[2].title, 'Recruiter 1 Job 1')
-        self.assertEqual(jobs[3].title, 'Old Job')
\ No newline at end of file
+        self.assertEqual(jobs[3].title, 'Old Job')
+
+class JobSearchNearViewTest(TestCase):
+    """
+    Tests for the ``near`` radius filter on JobSearchView.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        """
+        Set up jobs in and around Denver plus one far away and one remote.
+        """
+        user = User.objects.create_user(username='geouser', password='testpassword')
+        recruiter = RecruiterProfile.objects.create(user=user, company_name='Geo Corp')
+        Job.objects.create(recruiter=recruiter, title='Denver Python Job', description='Python.', location='Denver, CO')
+        Job.objects.create(recruiter=recruiter, title='Boulder Job', description='Java.', location='Boulder, Colorado')
+        Job.objects.create(recruiter=recruiter, title='Springs Job', description='Go.', location='Colorado Springs')
+        Job.objects.create(recruiter=recruiter, title='Boston Job', description='Python.', location='Boston, MA')
+        Job.objects.create(recruiter=recruiter, title='Remote Job', description='Python.', location='Remote')
+
+    def setUp(self):
+        """
+        Set up the client and search URL.
+        """
+        cache.clear()  # :no-index: Anonymous job pages are cached across requests
+        self.client = Client()
+        self.search_url = reverse('job:job_search')
+
+    def test_near_default_radius(self):
+        """
+        Test that only jobs within the default radius are returned, nearest first.
+        """
+        response = self.client.get(self.search_url, {'near': 'Denver'})
+        self.assertEqual(response.status_code, 200)
+        titles = [job.title for job in response.context['jobs']]
+        self.assertEqual(titles, ['Denver Python Job', 'Boulder Job'])
+        self.assertContains(response, 'km away')
+
+    def test_near_custom_radius(self):
+        """
+        Test that a larger radius includes more distant jobs.
+        """
+        response = self.client.get(self.search_url, {'near': 'Denver, CO', 'radius': '150'})
+        titles = [job.title for job in response.context['jobs']]
+        self.assertEqual(titles, ['Denver Python Job', 'Boulder Job', 'Springs Job'])
+
+    def test_near_non_finite_radius(self):
+        """
+        Test that a NaN or infinite radius falls back to the default radius.
+        """
+        for radius in ('nan', 'inf', '-inf'):
+            response = self.client.get(self.search_url, {'near': 'Denver, CO', 'radius': radius})
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.context['radius'], 50)
+            titles = [job.title for job in response.context['jobs']]
+            self.assertEqual(titles, ['Denver Python Job', 'Boulder Job'])
+
+    def test_near_combined_with_query(self):
+        """
+        Test that keyword and location filters are combined.
+        """
+        response = self.client.get(self.search_url, {'q': 'Python', 'near': 'Denver'})
+        titles = [job.title for job in response.context['jobs']]
+        self.assertEqual(titles, ['Denver Python Job'])
+
+    def test_near_unknown_place(self):
+        """
+        Test that an unknown place yields no results and a message.
+        """
+        response = self.client.get(self.search_url, {'near': 'Atlantis'})
+        self.assertEqual(len(response.context['jobs']), 0)
+        self.assertTrue(response.context['near_unresolved'])
+
+
+class JobPageCacheTest(TestCase):
+    """
+    Tests for the anonymous page cache on job list, detail and search pages.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        """
+        Set up a recruiter with one job.
+        """
+        user = User.objects.create_user(username='cacheuser', password='testpassword')
+        cls.recruiter = RecruiterProfile.objects.create(user=user, company_name='Cache Corp')
+        cls.job = Job.objects.create(recruiter=cls.recruiter, title='Cached Job', description='Cached.', location='Denver')
+
+    def setUp(self):
+        """
+        Start every test with an empty cache and zeroed counters.
+        """
+        cache.clear()
+        reset_page_cache_stats()
+        self.client = Client()
+        self.list_url = reverse('job:job_list')
+        self.detail_url = reverse('job:job_detail', kwargs={'pk': self.job.pk})
+
+    def test_second_anonymous_request_is_served_from_cache(self):
+        """
+        Test that a repeated anonymous request is a cache hit with identical content.
+        """
+        first = self.client.get(self.list_url)
+        second = self.client.get(self.list_url)
+        self.assertEqual(first['X-Page-Cache'], 'miss')
+        self.assertEqual(second['X-Page-Cache'], 'hit')
+        self.assertEqual(first.content, second.content)
+        self.assertEqual(first['ETag'], second['ETag'])
+        self.assertIn('Last-Modified', second)
+        stats = page_cache_stats()
+        self.assertEqual((stats['hits'], stats['misses']), (1, 1))
+        self.assertEqual(stats['hit_ratio'], 0.5)
+
+    @override_settings(ANALYTICS_FLUSH_INTERVAL=3600)  # Keep the buffered view out of the query count
+    def test_if_none_match_returns_304_without_rendering(self):
+        """
+        Test that a matching If-None-Match is answered with 304 and no template rendering.
+        """
+        etag = self.client.get(self.detail_url)['ETag']
+        with self.assertNumQueries(0):
+            response = self.client.get(self.detail_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response['ETag'], etag)
+        self.assertFalse(response.templates)
+
+    def test_job_change_invalidates_cached_pages(self):
+        """
+        Test that saving a job bumps the catalog version so the next request re-renders.
+        """
+        first = self.client.get(self.detail_url)
+        self.job.title = 'Renamed Job'
+        self.job.save()
+        response = self.client.get(self.detail_url, HTTP_IF_NONE_MATCH=first['ETag'])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['X-Page-Cache'], 'miss')
+        self.assertContains(response, 'Renamed Job')
+        self.assertNotEqual(response['ETag'], first['ETag'])
+
+    def test_search_pages_are_cached_per_query(self):
+        """
+        Test that different query strings get separate cache entries.
+        """
+        search_url = reverse('job:job_search')
+        self.client.get(search_url, {'q': 'Cached'})
+        response = self.client.get(search_url, {'q': 'Nothing'})
+        self.assertEqual(response['X-Page-Cache'], 'miss')
+        self.assertNotContains(response, 'Cached Job')
+
+    def test_authenticated_requests_bypass_cache(self):
+        """
+        Test that logged-in users always get a freshly rendered page.
+        """
+        self.client.force_login(self.recruiter.user)
+        self.client.get(self.list_url)
+        response = self.client.get(self.list_url)
+        self.assertNotIn('X-Page-Cache', response)
+        self.assertEqual(page_cache_stats()['hits'], 0)
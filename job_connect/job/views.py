@@ -1,26 +1,44 @@
+import math
 from django.shortcuts import render, redirect, get_object_or_404
+from asgiref.sync import sync_to_async
 from django.http import Http404, HttpResponseForbidden, HttpResponseRedirect
-from django.contrib.auth.mixins import LoginRequiredMixin, UserPassesTestMixin
+from django.contrib.auth.mixins import LoginRequiredMixin
+from core.mixins import RecruiterRequiredMixin as BaseRecruiterRequiredMixin
+from core.roles import get_roles
 from django.views.generic import ListView, DetailView, CreateView, UpdateView, DeleteView
 from job.models import Job
 from job.forms import JobForm
-from django.db.models import Q
+from job import geo
+from job.analytics import track_job_view
+from job.cache import cache_anonymous_page
+from job import search_index
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Max, Q
 from django.urls import reverse, reverse_lazy
+from django.utils.decorators import method_decorator
 
 
-class RecruiterRequiredMixin(LoginRequiredMixin, UserPassesTestMixin):
+def latest_job_update(request, *args, **kwargs):
     """
-    Mixin to restrict access to views only to recruiters.
+    Returns the most recent ``updated_at`` across all jobs, used as Last-Modified for listings.
     """
+    return Job.objects.aggregate(latest=Max('updated_at'))['latest']
 
-    def test_func(self):
-        """
-        Checks if the current user is a recruiter.
 
-        Returns:
-            bool: True if the user is a recruiter, False otherwise.
-        """
-        return hasattr(self.request.user, 'recruiter_profile')
+def job_updated_at(request, pk, *args, **kwargs):
+    """
+    Returns the ``updated_at`` of a single job, used as Last-Modified for its detail page.
+    """
+    return Job.objects.filter(pk=pk).values_list('updated_at', flat=True).first()
+
+
+class RecruiterRequiredMixin(BaseRecruiterRequiredMixin):
+    """
+    Mixin to restrict access to views only to recruiters.
+
+    Authenticated users without a recruiter profile are sent to create one.
+    """
 
     def handle_no_permission(self):
         """
@@ -31,6 +49,7 @@ class RecruiterRequiredMixin(LoginRequiredMixin, UserPassesTestMixin):
             return redirect(reverse('recruiter:recruiter_profile_create'))
         return super().handle_no_permission()
 
+@method_decorator(cache_anonymous_page(latest_job_update), name='dispatch')
 class JobListView(ListView):
     """
     Displays a list of all active jobs.
@@ -40,6 +59,8 @@ class JobListView(ListView):
     context_object_name = 'jobs'
     ordering = ['-posted_date']
 
+@method_decorator(track_job_view, name='dispatch')
+@method_decorator(cache_anonymous_page(job_updated_at), name='dispatch')
 class JobDetailView(DetailView):
     """
     Displays the details of a specific job.
@@ -67,8 +88,9 @@ class JobCreateView(RecruiterRequiredMixin, CreateView):
         Returns:
             django.shortcuts.redirect: A redirect to the success URL.
         """
-        form.instance.recruiter = self.request.user.recruiter_profile
-        self.object = form.save()
+        form.instance.recruiter_id = get_roles(self.request).recruiter_id
+        with transaction.atomic():  # :no-index: Job, its skills and their outbox records commit together
+            self.object = form.save()
         return HttpResponseRedirect(self.get_success_url())
 
 class JobUpdateView(UpdateView):
@@ -95,13 +117,14 @@ class JobUpdateView(UpdateView):
         if not request.user.is_authenticated:
             return self.handle_no_permission(request)
 
-        if not hasattr(request.user, 'recruiter_profile'):
+        roles = get_roles(request)
+        if not roles.is_recruiter:
             recruiter_mixin = RecruiterRequiredMixin()
             recruiter_mixin.request = request
             return recruiter_mixin.handle_no_permission()  # :no-index: Do not pass request here
 
         job = get_object_or_404(Job, pk=kwargs['pk'])
-        if job.recruiter.user != request.user:
+        if job.recruiter_id != roles.recruiter_id:
             return HttpResponseForbidden("You are not authorized to update this job.")
 
         return super().dispatch(request, *args, **kwargs)
@@ -122,7 +145,8 @@ class JobUpdateView(UpdateView):
         Returns:
             django.shortcuts.redirect: A redirect to the success URL.
         """
-        self.object = form.save()
+        with transaction.atomic():  # :no-index: Job, its skills and their outbox records commit together
+            self.object = form.save()
         return HttpResponseRedirect(self.get_success_url())
 
 class JobDeleteView(LoginRequiredMixin, DeleteView):
@@ -141,13 +165,14 @@ class JobDeleteView(LoginRequiredMixin, DeleteView):
         if not request.user.is_authenticated:
             return self.handle_no_permission(request)
 
-        if not hasattr(request.user, 'recruiter_profile'):
+        roles = get_roles(request)
+        if not roles.is_recruiter:
             recruiter_mixin = RecruiterRequiredMixin()
             recruiter_mixin.request = request
             return recruiter_mixin.handle_no_permission() # :no-index: Do not pass request here
 
         job = get_object_or_404(Job, pk=kwargs['pk'])
-        if job.recruiter.user != request.user:
+        if job.recruiter_id != roles.recruiter_id:
             raise Http404("You are not authorized to delete this job.")
 
         return super().dispatch(request, *args, **kwargs)
@@ -158,32 +183,71 @@ class JobDeleteView(LoginRequiredMixin, DeleteView):
         """
         return redirect('core:login') # :no-index: Replace 'your_login_url_name'
 
+    def form_valid(self, form):
+        """
+        Soft-deletes the job; ``purge_deleted_jobs`` removes it and its applications later.
+        """
+        self.object.soft_delete()
+        return HttpResponseRedirect(self.get_success_url())
+
 
+@method_decorator(cache_anonymous_page(latest_job_update), name='dispatch')
 class JobSearchView(ListView):
     """
     Displays a list of jobs that match a search query.
+
+    Supports ``q`` for keyword matching and ``near`` (plus an optional
+    ``radius`` in kilometres) for finding jobs around a place.
     """
     model = Job
     template_name = 'job/job_list.html'
     context_object_name = 'jobs'
+    default_radius_km = 50
+    max_radius_km = 500
+
+    def get_radius(self):
+        """
+        Parses the ``radius`` parameter, falling back to the default on bad or non-finite input.
+
+        Returns:
+            float: The search radius in kilometres.
+        """
+        try:
+            radius = float(self.request.GET.get('radius', self.default_radius_km))
+        except ValueError:
+            return self.default_radius_km
+        if not math.isfinite(radius):
+            return self.default_radius_km
+        return min(max(radius, 1), self.max_radius_km)
 
     def get_queryset(self):
         """
-        Filters the queryset based on the search query.
+        Filters the queryset based on the search query and location.
 
         Returns:
             django.db.models.query.QuerySet: The filtered queryset.
         """
         query = self.request.GET.get('q')
-        if query:
-            return Job.objects.filter(
+        near = self.request.GET.get('near', '').strip()
+        if query and getattr(settings, 'JOB_SEARCH_USE_INDEX', False):
+            queryset = search_index.search(query)
+        elif query:
+            queryset = Job.objects.filter(
                 Q(title__icontains=query) | Q(description__icontains=query) | Q(location__icontains=query) | Q(skills_required__name__icontains=query)
-            ).distinct().order_by('-posted_date')
-        return Job.objects.all().order_by('-posted_date')
+            ).distinct()
+        else:
+            queryset = Job.objects.all()
+
+        if near:
+            coords = geo.geocode(near)
+            if coords is None:
+                return Job.objects.none()
+            return geo.within_radius(queryset, coords[0], coords[1], self.get_radius()).order_by('distance_km', '-posted_date')
+        return queryset.order_by('-posted_date')
 
     def get_context_data(self, **kwargs):
         """
-        Adds the search query to the context.
+        Adds the search query and location parameters to the context.
 
         Args:
             kwargs (dict): Keyword arguments.
@@ -193,6 +257,11 @@ class JobSearchView(ListView):
         """
         context = super().get_context_data(**kwargs)
         context['search_query'] = self.request.GET.get('q', '')
+        near = self.request.GET.get('near', '').strip()
+        context['near'] = near
+        if near:
+            context['radius'] = self.get_radius()
+            context['near_unresolved'] = geo.geocode(near) is None
         return context
 
 class RecruiterJobList(RecruiterRequiredMixin, ListView):
@@ -211,4 +280,67 @@ class RecruiterJobList(RecruiterRequiredMixin, ListView):
         Returns:
             django.db.models.query.QuerySet: The filtered queryset.
         """
-        return Job.objects.filter(recruiter=self.request.user.recruiter_profile).order_by('-posted_date')
\ No newline at end of file
+        return Job.objects.filter(recruiter_id=get_roles(self.request).recruiter_id).order_by('-posted_date')
+
+
+@cache_anonymous_page(latest_job_update)
+async def ajob_list(request):
+    """
+    Async version of ``JobListView``, routed when ``ASYNC_VIEWS`` is on.
+
+    Reuses the class-based view for the queryset and context and only fetches
+    the rows with the async ORM.
+
+    Args:
+        request (django.http.HttpRequest): HttpRequest object.
+
+    Returns:
+        django.http.HttpResponse: The rendered job list.
+    """
+    request.user = await request.auser()
+    view = JobListView(request=request, args=(), kwargs={})
+    jobs = [job async for job in view.get_queryset()]
+    return render(request, view.template_name, view.get_context_data(object_list=jobs))
+
+
+@track_job_view
+@cache_anonymous_page(job_updated_at)
+async def ajob_detail(request, pk):
+    """
+    Async version of ``JobDetailView``, routed when ``ASYNC_VIEWS`` is on.
+
+    The recruiter and required skills are loaded up front so the template
+    never queries.
+
+    Args:
+        request (django.http.HttpRequest): HttpRequest object.
+        pk (int): Primary key of the job.
+
+    Returns:
+        django.http.HttpResponse: The rendered job detail page.
+    """
+    request.user = await request.auser()
+    view = JobDetailView(request=request, args=(), kwargs={'pk': pk})
+    try:
+        view.object = await Job.objects.select_related('recruiter').prefetch_related('skills_required').aget(pk=pk)
+    except Job.DoesNotExist:
+        raise Http404('No job found matching the query')
+    return render(request, view.template_name, view.get_context_data(object=view.object))
+
+
+@cache_anonymous_page(latest_job_update)
+async def ajob_search(request):
+    """
+    Async version of ``JobSearchView``, routed when ``ASYNC_VIEWS`` is on.
+
+    Args:
+        request (django.http.HttpRequest): HttpRequest object.
+
+    Returns:
+        django.http.HttpResponse: The rendered search results.
+    """
+    request.user = await request.auser()
+    view = JobSearchView(request=request, args=(), kwargs={})
+    queryset = await sync_to_async(view.get_queryset)()  # :no-index: May load the gazetteer file
+    jobs = [job async for job in queryset]
+    return render(request, view.template_name, view.get_context_data(object_list=jobs))
@@ -9,8 +9,14 @@ https://docs.djangoproject.com/en/5.2/howto/deployment/asgi/
 
 import os
 
+from django.conf import settings
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'job_connect.settings')
 
 application = get_asgi_application()
+
+if settings.STATIC_PIPELINE:
+    # Serve collected, precompressed static files before Django's request handling.
+    from core.staticfiles import ASGIStaticFilesMiddleware
+    application = ASGIStaticFilesMiddleware(application)
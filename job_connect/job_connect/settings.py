@@ -10,6 +10,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.2/ref/settings/
 """
 
+import os
 from pathlib import Path
 
 # :no-index: Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -42,38 +43,103 @@ INSTALLED_APPS = [
     'recruiter',
     'job',
     'application',
+    'api',
     #'messaging',
 ]
 
 MIDDLEWARE = [
+    'core.health.HealthCheckMiddleware',
+    'core.metrics.MetricsMiddleware',
     'django.middleware.security.SecurityMiddleware',
+    'core.compression.CompressionMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'core.middleware.UserRoleMiddleware',
+    'core.slow_queries.SlowQueryMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
 
+# Metrics (core.metrics). /metrics answers clients in METRICS_ALLOWED_IPS or
+# sending "Authorization: Bearer $METRICS_TOKEN". Workers add their request
+# counters to the shared cache every METRICS_FLUSH_INTERVAL seconds; gauges that
+# need a query are recomputed at most every METRICS_GAUGE_TTL seconds, and
+# maintained counts (core.counters) are recounted every COUNTER_RECONCILE_SECONDS.
+METRICS_ALLOWED_IPS = os.environ.get('METRICS_ALLOWED_IPS', '127.0.0.1').split(',')
+METRICS_TOKEN = os.environ.get('METRICS_TOKEN', '')
+METRICS_FLUSH_INTERVAL = int(os.environ.get('METRICS_FLUSH_INTERVAL', 10))
+METRICS_GAUGE_TTL = 60
+COUNTER_RECONCILE_SECONDS = 3600
+
+# Slow query log (core.slow_queries). Statements taking at least
+# SLOW_QUERY_THRESHOLD_MS are logged and aggregated into core.SlowQuery rows with
+# their plan; 0 turns the log off. SLOW_QUERY_ANALYZE_RATE is the share of slow
+# SELECTs re-run under EXPLAIN ANALYZE on backends that support it. Records are
+# buffered per process and written at most every SLOW_QUERY_FLUSH_INTERVAL
+# seconds, after the current transaction commits. Only the normalized SQL is
+# stored; SLOW_QUERY_CAPTURE_PARAMS=1 also keeps the parameters of SELECTs, which
+# can contain personal data.
+SLOW_QUERY_THRESHOLD_MS = float(os.environ.get('SLOW_QUERY_THRESHOLD_MS', 200))
+SLOW_QUERY_ANALYZE_RATE = float(os.environ.get('SLOW_QUERY_ANALYZE_RATE', 0.05))
+SLOW_QUERY_FLUSH_INTERVAL = int(os.environ.get('SLOW_QUERY_FLUSH_INTERVAL', 10))
+SLOW_QUERY_CAPTURE_PARAMS = os.environ.get('SLOW_QUERY_CAPTURE_PARAMS', '') == '1'
+
+# Response compression (core.compression.CompressionMiddleware). Encodings in
+# server preference order; 'br' is used only when the brotli package is
+# installed. Only media types listed in COMPRESSION_MIN_SIZES are compressed,
+# and only when the body is at least that many bytes (longest prefix wins).
+COMPRESSION_ENCODINGS = ['br', 'gzip']
+COMPRESSION_MIN_SIZES = {
+    'text/html': 1024,
+    'text/': 512,
+    'application/json': 512,
+    'application/javascript': 512,
+    'application/xml': 512,
+    'image/svg+xml': 512,
+}
+COMPRESSION_BROTLI_QUALITY = 5
+
 ROOT_URLCONF = 'job_connect.urls'
 
+# Probe paths answered by core.health.HealthCheckMiddleware without touching the
+# database. While HEALTH_DRAIN_FILE exists the readiness probe reports 503, so a
+# pre-stop hook can `touch` it to take the instance out of rotation.
+HEALTH_CHECK_PATHS = {
+    '/healthz': 'liveness',
+    '/readyz': 'readiness',
+}
+HEALTH_DRAIN_FILE = os.environ.get('HEALTH_DRAIN_FILE', '/tmp/job_connect.drain')
+
 LOGIN_URL = 'core:login'
 
 TEMPLATES = [
     {
         'BACKEND': 'django.template.backends.django.DjangoTemplates',
         'DIRS': [],
-        'APP_DIRS': True,
         'OPTIONS': {
             'context_processors': [
                 'django.template.context_processors.request',
                 'django.contrib.auth.context_processors.auth',
                 'django.contrib.messages.context_processors.messages',
             ],
+            # Parse each template once per process; the development server's
+            # autoreloader clears this cache when a template changes.
+            'loaders': [
+                ('django.template.loaders.cached.Loader', [
+                    'django.template.loaders.filesystem.Loader',
+                    'django.template.loaders.app_directories.Loader',
+                ]),
+            ],
         },
     },
 ]
 
+# Seconds a rendered listing row ({% fragment_cache %}, see core.fragments)
+# stays cached; keys change with the object's updated_at (0 disables it).
+FRAGMENT_CACHE_TIMEOUT = int(os.environ.get('FRAGMENT_CACHE_TIMEOUT', 3600))
+
 WSGI_APPLICATION = 'job_connect.wsgi.application'
 
 
@@ -92,6 +158,82 @@ DATABASES = {
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+# The local-memory cache is per process; point REDIS_URL at a shared Redis when
+# running more than one worker so page-cache invalidation reaches all of them.
+
+# Metrics counters (core.metrics) get their own alias so that culling the
+# fragment-heavy default cache never evicts them, which Prometheus would read
+# as counter resets.
+
+if os.environ.get('REDIS_URL'):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': os.environ['REDIS_URL'],
+        },
+        'metrics': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': os.environ['REDIS_URL'],
+        },
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'job-connect',
+            # The default of 300 entries cannot hold one listing's row fragments.
+            'OPTIONS': {'MAX_ENTRIES': 10000},
+        },
+        'metrics': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'job-connect-metrics',
+            # About 15 keys per URL name; far more than the project will ever have.
+            'OPTIONS': {'MAX_ENTRIES': 100000},
+        },
+    }
+
+# Seconds a session trusts its stored roles (core.roles) before re-reading the
+# profiles. Profile changes invalidate them at once through the cache; this
+# bounds how stale they get in workers that do not share that cache.
+ROLES_MAX_AGE = int(os.environ.get('ROLES_MAX_AGE', 60))
+
+# Sessions
+# https://docs.djangoproject.com/en/5.2/topics/http/sessions/
+# SESSION_BACKEND picks the store: 'db', 'cached_db' (reads from the cache,
+# writes through to the database), 'cache' (cache only, sessions are lost on
+# eviction) or 'signed_cookies' (no server-side storage). The default is
+# 'cached_db' with a shared cache (REDIS_URL) and 'db' otherwise: with the
+# per-process local-memory cache a logout or key rotation in one worker would
+# leave the old session cached in the others. The db-backed stores skip writes
+# when the session data did not change.
+
+SESSION_BACKENDS = {
+    'db': 'core.session_backends.db',
+    'cached_db': 'core.session_backends.cached_db',
+    'cache': 'django.contrib.sessions.backends.cache',
+    'signed_cookies': 'django.contrib.sessions.backends.signed_cookies',
+}
+SESSION_ENGINE = SESSION_BACKENDS[os.environ.get('SESSION_BACKEND', 'cached_db' if os.environ.get('REDIS_URL') else 'db')]
+
+# Seconds an anonymous job list/detail/search page stays cached (0 disables it).
+JOB_PAGE_CACHE_TIMEOUT = int(os.environ.get('JOB_PAGE_CACHE_TIMEOUT', 300))
+
+# Route the read-only pages (job list/detail/search, applicant profile, inbox)
+# to their async views. Only worth enabling when serving through asgi.py; under
+# WSGI each async view runs in its own event loop. Compare with ``bench_views``.
+ASYNC_VIEWS = os.environ.get('ASYNC_VIEWS', '') == '1'
+
+# Answer keyword job searches from the outbox-maintained search index
+# (run ``process_outbox`` continuously when enabled).
+JOB_SEARCH_USE_INDEX = os.environ.get('JOB_SEARCH_USE_INDEX', '') == '1'
+
+# ``archive_applications`` moves rejected and offered applications to inactive
+# jobs into the archive table once they have been unchanged this many days.
+ARCHIVE_APPLICATIONS_AFTER_DAYS = int(os.environ.get('ARCHIVE_APPLICATIONS_AFTER_DAYS', 180))
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -113,6 +255,59 @@ AUTH_PASSWORD_VALIDATORS = [
 ]
 
 
+# Password hashing
+# PASSWORD_HASHING_POLICY picks the preferred hasher: 'pbkdf2' (default),
+# 'scrypt' or 'argon2' (needs argon2-cffi). The other hashers stay installed
+# so existing hashes verify, and each password is re-hashed with the preferred
+# hasher and current cost on its next login. Run ``bench_logins`` before
+# changing a cost; it reports logins per second per core.
+
+PASSWORD_HASHING_POLICIES = {
+    'argon2': [
+        'core.hashers.TunedArgon2PasswordHasher',
+        'core.hashers.TunedScryptPasswordHasher',
+        'core.hashers.TunedPBKDF2PasswordHasher',
+    ],
+    'scrypt': [
+        'core.hashers.TunedScryptPasswordHasher',
+        'core.hashers.TunedPBKDF2PasswordHasher',
+        'core.hashers.TunedArgon2PasswordHasher',
+    ],
+    'pbkdf2': [
+        'core.hashers.TunedPBKDF2PasswordHasher',
+        'core.hashers.TunedScryptPasswordHasher',
+        'core.hashers.TunedArgon2PasswordHasher',
+    ],
+}
+PASSWORD_HASHERS = PASSWORD_HASHING_POLICIES[os.environ.get('PASSWORD_HASHING_POLICY', 'pbkdf2')] + [
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+]
+PASSWORD_PBKDF2_ITERATIONS = int(os.environ.get('PASSWORD_PBKDF2_ITERATIONS', 1_000_000))
+PASSWORD_SCRYPT_WORK_FACTOR = int(os.environ.get('PASSWORD_SCRYPT_WORK_FACTOR', 2 ** 14))
+PASSWORD_ARGON2_TIME_COST = int(os.environ.get('PASSWORD_ARGON2_TIME_COST', 2))
+PASSWORD_ARGON2_MEMORY_COST = int(os.environ.get('PASSWORD_ARGON2_MEMORY_COST', 102400))
+PASSWORD_ARGON2_PARALLELISM = int(os.environ.get('PASSWORD_ARGON2_PARALLELISM', 8))
+
+# Under ASGI, validate logins in a thread pool of PASSWORD_VERIFY_THREADS
+# workers so hashing does not block the event loop.
+PASSWORD_VERIFY_IN_THREAD_POOL = os.environ.get('PASSWORD_VERIFY_IN_THREAD_POOL', '') == '1'
+PASSWORD_VERIFY_THREADS = int(os.environ.get('PASSWORD_VERIFY_THREADS', 4))
+
+
+# Rate limiting
+# Login and signup POSTs are limited per client IP and submitted username with
+# token buckets held in the default cache: RATE_LIMITS maps each scope to
+# {key: (requests, period_seconds)}. Set RATELIMIT_TRUSTED_PROXIES to the
+# number of reverse proxies that append to X-Forwarded-For.
+
+RATELIMIT_ENABLED = os.environ.get('RATELIMIT_ENABLED', '1') == '1'
+RATELIMIT_TRUSTED_PROXIES = int(os.environ.get('RATELIMIT_TRUSTED_PROXIES', 0))
+RATE_LIMITS = {
+    'login': {'ip': (30, 60), 'username': (10, 300)},
+    'signup': {'ip': (10, 3600)},
+}
+
+
 # Internationalization
 # https://docs.djangoproject.com/en/5.2/topics/i18n/
 
@@ -129,6 +324,24 @@ USE_TZ = True
 # https://docs.djangoproject.com/en/5.2/howto/static-files/
 
 STATIC_URL = 'static/'
+STATIC_ROOT = Path(os.environ.get('STATIC_ROOT', BASE_DIR / 'staticfiles'))
+
+# STATIC_PIPELINE=1 (set in the Dockerfile) makes collectstatic write hashed,
+# gzip/brotli-precompressed files, and wsgi.py serve them ahead of Django with
+# far-future cache headers. Unhashed names are cached for STATIC_MAX_AGE seconds.
+STATIC_PIPELINE = os.environ.get('STATIC_PIPELINE', '') == '1'
+STATIC_MAX_AGE = int(os.environ.get('STATIC_MAX_AGE', 3600))
+STORAGES = {
+    'default': {
+        'BACKEND': 'django.core.files.storage.FileSystemStorage',
+    },
+    'staticfiles': {
+        'BACKEND': (
+            'core.staticfiles.PrecompressedManifestStaticFilesStorage' if STATIC_PIPELINE
+            else 'django.contrib.staticfiles.storage.StaticFilesStorage'
+        ),
+    },
+}
 
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
@@ -141,3 +354,8 @@ don't explicitly define a primary key in your Django models, Django will
 automatically create a 64-bit auto-incrementing integer field for you, 
 providing a larger range of values for your database records. 
 """
+
+# Job analytics (job.analytics). Workers buffer job detail views and append
+# them as events every ANALYTICS_FLUSH_INTERVAL seconds; run
+# ``aggregate_job_events`` periodically to fold events into the rollups.
+ANALYTICS_FLUSH_INTERVAL = int(os.environ.get('ANALYTICS_FLUSH_INTERVAL', 10))
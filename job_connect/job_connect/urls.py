@@ -1,5 +1,6 @@
 from django.contrib import admin
 from django.urls import path, include
+from core.metrics import metrics_view
 
 
 urlpatterns = [
@@ -9,5 +10,7 @@ urlpatterns = [
     path('recruiter/', include('recruiter.urls', namespace='recruiter')),
     path('jobs/', include('job.urls', namespace='job')),
     path('applications/', include('application.urls', namespace='application')),
+    path('api/v1/', include('api.urls', namespace='api')), # :no-index: Read-only JSON API
+    path('metrics', metrics_view, name='metrics'), # :no-index: Prometheus scrape endpoint
     # path('messages/', include('messaging.urls', namespace='messaging')), # Uncomment and namespace if you have this app
 ]
\ No newline at end of file
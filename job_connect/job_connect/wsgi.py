@@ -9,8 +9,14 @@ https://docs.djangoproject.com/en/5.2/howto/deployment/wsgi/
 
 import os
 
+from django.conf import settings
 from django.core.wsgi import get_wsgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'job_connect.settings')
 
 application = get_wsgi_application()
+
+if settings.STATIC_PIPELINE:
+    # Serve collected, precompressed static files before Django's request handling.
+    from core.staticfiles import StaticFilesMiddleware
+    application = StaticFilesMiddleware(application)
@@ -9,5 +9,10 @@ class Message(BaseModel):
     body = models.TextField()
     read = models.BooleanField(default=False)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['recipient', '-created_at'], name='message_recipient_created_idx'),
+        ]
+
     def __str__(self):
         return f"From {self.sender.username} to {self.recipient.username}: {self.subject}"
@@ -1,8 +1,9 @@
+from django.conf import settings
 from django.urls import path
 from . import views
 
 urlpatterns = [
-    path('inbox/', views.inbox, name='inbox'),
+    path('inbox/', views.ainbox if settings.ASYNC_VIEWS else views.inbox, name='inbox'),
     path('sent/', views.sent_messages, name='sent_messages'),
     path('compose/', views.compose_message, name='compose_message'),
     path('compose/<int:recipient_id>/', views.compose_message, name='compose_message_to'),
@@ -9,6 +9,13 @@ def inbox(request):
     messages = Message.objects.filter(recipient=request.user).order_by('-created_at')
     return render(request, 'messaging/inbox.html', {'messages': messages})
 
+@login_required
+async def ainbox(request):
+    # Async inbox, routed when ASYNC_VIEWS is on; senders are joined so the template never queries.
+    user = await request.auser()
+    messages = [message async for message in Message.objects.filter(recipient=user).select_related('sender').order_by('-created_at')]
+    return render(request, 'messaging/inbox.html', {'messages': messages})
+
 @login_required
 def sent_messages(request):
     messages = Message.objects.filter(sender=request.user).order_by('-created_at')
@@ -4,3 +4,9 @@ from django.apps import AppConfig
 class RecruiterConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'recruiter'
+
+    def ready(self):
+        """
+        Registers signal handlers.
+        """
+        from recruiter import signals  # noqa: F401
@@ -1,6 +1,6 @@
 from django.db import models
 from django.conf import settings
-from core.models import BaseModel
+from core.models import BaseModel, ProfileQuerySet
 
 class RecruiterProfile(BaseModel):
     """
@@ -24,6 +24,10 @@ class RecruiterProfile(BaseModel):
     location = models.CharField(max_length=255, blank=True)  # :no-index: Added location field
     # :no-index: Add other relevant fields like company logo, industry, etc.
 
+    COMPLETE_FIELD = 'company_name'
+
+    objects = ProfileQuerySet.as_manager()
+
     def __str__(self):
         """
         Returns the company name as its string representation.
@@ -31,4 +35,14 @@ class RecruiterProfile(BaseModel):
         Returns:
             str: The company name.
         """
-        return self.company_name
\ No newline at end of file
+        return self.company_name
+
+    @property
+    def is_complete(self):
+        """
+        Whether the profile has been filled in; signup creates it empty.
+
+        Returns:
+            bool: True once the company name is set.
+        """
+        return bool(getattr(self, self.COMPLETE_FIELD))
@@ -0,0 +1,15 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from core.roles import invalidate_roles
+from recruiter.models import RecruiterProfile
+
+
+@receiver(post_save, sender=RecruiterProfile)
+@receiver(post_delete, sender=RecruiterProfile)
+def invalidate_roles_on_profile_change(sender, instance, **kwargs):
+    """
+    Makes the owner's sessions re-resolve their roles when a profile is saved or deleted.
+
+    Saves count too because completing the empty profile created at signup grants the role.
+    """
+    invalidate_roles(instance.user_id)
@@ -3,6 +3,9 @@ from django.urls import reverse
 from django.contrib.auth import get_user_model
 from recruiter.models import RecruiterProfile
 from recruiter.forms import RecruiterProfileForm
+from django.core.cache import cache
+from applicant.models import ApplicantProfile, Skill
+from core.outbox import process_outbox
 
 User = get_user_model()
 
@@ -157,3 +160,41 @@ class RecruiterProfileViewTest(TestCase):
         self.assertEqual(response.status_code, 302)  # Expect a redirect
         expected_url = reverse('core:login') + '?next=' + reverse('recruiter:recruiter_profile_update')
         self.assertEqual(response.url, expected_url)
+
+
+class CandidateSearchViewTest(TestCase):
+    """
+    Tests for the recruiter candidate search view.
+    """
+
+    def setUp(self):
+        """
+        Set up a recruiter and an indexed applicant.
+        """
+        cache.clear()
+        self.user = User.objects.create_user(username='searchrecruiter', password='testpassword')
+        RecruiterProfile.objects.create(user=self.user, company_name='Search Co')
+        self.skill = Skill.objects.create(name='Rust')
+        profile = ApplicantProfile.objects.create(
+            user=User.objects.create_user(username='rustacean'), headline='Systems programmer', summary='Summary')
+        profile.skills.add(self.skill)
+        process_outbox()
+
+    def test_candidate_search_lists_matches(self):
+        """
+        Test that a recruiter sees applicants matching the query and skills.
+        """
+        self.client.login(username='searchrecruiter', password='testpassword')
+        response = self.client.get(reverse('recruiter:candidate_search'), {'q': 'systems', 'skills': [self.skill.pk]})
+        self.assertEqual(response.status_code, 200)
+        self.assertTemplateUsed(response, 'recruiter/candidate_search.html')
+        self.assertContains(response, 'rustacean')
+
+    def test_candidate_search_requires_recruiter(self):
+        """
+        Test that users without a recruiter profile are sent to create one.
+        """
+        User.objects.create_user(username='notrecruiter', password='testpassword')
+        self.client.login(username='notrecruiter', password='testpassword')
+        response = self.client.get(reverse('recruiter:candidate_search'))
+        self.assertRedirects(response, reverse('recruiter:recruiter_profile_create'))
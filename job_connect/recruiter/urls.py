@@ -14,5 +14,6 @@ urlpatterns = [
     path('jobs/<int:pk>/update/', views.JobUpdateView.as_view(), name='job_update'),
     path('jobs/<int:pk>/delete/', views.JobDeleteView.as_view(), name='job_delete'),
     path('jobs/<int:job_id>/applications/', views.job_applications_list, name='job_applications_list'),
+    path('candidates/', views.candidate_search, name='candidate_search'),
     path('applications/<int:pk>/update_status/', views.ApplicationUpdateStatusView.as_view(), name='application_update_status'),
 ]
\ No newline at end of file
@@ -1,30 +1,23 @@
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth.decorators import login_required
-from django.contrib.auth.mixins import LoginRequiredMixin, UserPassesTestMixin
+from django.contrib.auth.mixins import LoginRequiredMixin
+from core.mixins import RecruiterRequiredMixin
+from core.roles import get_roles
 from django.views.generic import CreateView, DetailView, UpdateView, DeleteView, ListView, FormView
 from django.urls import reverse_lazy, reverse
+from django.db import transaction
 from recruiter.models import RecruiterProfile
 from recruiter.forms import RecruiterProfileForm
+from job.analytics import recruiter_summary
 from job.models import Job
 from job.forms import JobForm
 from application.models import Application
 from application.forms import ApplicationStatusForm
+from applicant.models import Skill
+from applicant.profiles import get_profile_snapshots
+from applicant.search import search_candidates
 
 
-class RecruiterRequiredMixin(LoginRequiredMixin, UserPassesTestMixin):
-    """
-    Mixin to restrict access to views only to recruiters.
-    """
-
-    def test_func(self):
-        """
-        Checks if the current user is a recruiter.
-
-        Returns:
-            bool: True if the user is a recruiter, False otherwise.
-        """
-        return hasattr(self.request.user, 'recruiter_profile')
-
 class JobCreateView(RecruiterRequiredMixin, CreateView):
     """
     Allows a recruiter to create a new job posting.
@@ -44,8 +37,9 @@ class JobCreateView(RecruiterRequiredMixin, CreateView):
         Returns:
             django.shortcuts.redirect: A redirect to the success URL.
         """
-        form.instance.recruiter = self.request.user.recruiter_profile
-        return super().form_valid(form)
+        form.instance.recruiter_id = get_roles(self.request).recruiter_id
+        with transaction.atomic():  # :no-index: Job, its skills and their outbox records commit together
+            return super().form_valid(form)
 
 class JobDetailView(LoginRequiredMixin, DetailView):
     """
@@ -82,6 +76,19 @@ class JobUpdateView(RecruiterRequiredMixin, UpdateView):
         """
         return Job.objects.filter(recruiter__user=self.request.user)
 
+    def form_valid(self, form):
+        """
+        Saves the job and its skills in one transaction.
+
+        Args:
+            form: The form to be saved.
+
+        Returns:
+            django.shortcuts.redirect: A redirect to the success URL.
+        """
+        with transaction.atomic():
+            return super().form_valid(form)
+
     def get_success_url(self):
         """
         Returns the URL to redirect to after successful update.
@@ -110,6 +117,13 @@ class JobDeleteView(RecruiterRequiredMixin, DeleteView):
         """
         return Job.objects.filter(recruiter__user=self.request.user)
 
+    def form_valid(self, form):
+        """
+        Soft-deletes the job; ``purge_deleted_jobs`` removes it and its applications later.
+        """
+        self.object.soft_delete()
+        return redirect(self.get_success_url())
+
 class ApplicationUpdateStatusView(RecruiterRequiredMixin, FormView):
     """
     Allows a recruiter to update the status of an application.
@@ -125,7 +139,9 @@ class ApplicationUpdateStatusView(RecruiterRequiredMixin, FormView):
         Returns:
             application.models.Application: The application object.
         """
-        return get_object_or_404(Application, pk=self.kwargs['pk'], job__recruiter__user=self.request.user)
+        return get_object_or_404(
+            Application, pk=self.kwargs['pk'], job__recruiter__user=self.request.user, job__deleted_at__isnull=True,
+        )
 
     def get_success_url(self):
         """
@@ -176,11 +192,12 @@ def recruiter_dashboard(request):
     """
     recruiter_profile = RecruiterProfile.objects.get(user=request.user)
     job_postings = Job.objects.filter(recruiter=recruiter_profile)
-    applications = Application.objects.filter(job__recruiter=recruiter_profile) # Use recruiter_profile
+    applications = Application.objects.filter(job__recruiter=recruiter_profile, job__deleted_at__isnull=True) # Use recruiter_profile
 
     context = {
         'job_postings': job_postings,
         'applications': applications,
+        'analytics': recruiter_summary(recruiter_profile.pk),  # Read from the daily rollups only
     }
     return render(request, 'recruiter/recruiter_dashboard.html', context)
 
@@ -195,7 +212,7 @@ def recruiter_job_list(request):
     Returns:
         django.http.HttpResponse: HttpResponse object.
     """
-    if hasattr(request.user, 'recruiter_profile'):
+    if get_roles(request).is_recruiter:
         jobs = Job.objects.filter(recruiter__user=request.user).order_by('-posted_date')
         return render(request, 'job/recruiter_job_list.html', {'jobs': jobs})
     else:
@@ -213,7 +230,7 @@ def job_applications_list(request):
     Returns:
         django.http.HttpResponse: HttpResponse object.
     """
-    if hasattr(request.user, 'recruiter_profile'):
+    if get_roles(request).is_recruiter:
         jobs = Job.objects.filter(recruiter__user=request.user)
         applications = Application.objects.filter(job__in=jobs).order_by('-created_at')
         return render(request, 'application/job_applications_list.html', {'applications': applications})
@@ -231,17 +248,18 @@ def recruiter_profile_create(request):
     Returns:
         django.http.HttpResponse: HttpResponse object.
     """
-    if hasattr(request.user, 'recruiter_profile'):
+    profile = RecruiterProfile.objects.filter(user=request.user).first()  # :no-index: May be the empty one from signup
+    if profile is not None and profile.is_complete:
         return redirect('recruiter:recruiter_profile_update') # Profile already exists
     if request.method == 'POST':
-        profile_form = RecruiterProfileForm(request.POST, request.FILES)
+        profile_form = RecruiterProfileForm(request.POST, request.FILES, instance=profile)
         if profile_form.is_valid():
             profile = profile_form.save(commit=False)
             profile.user = request.user
             profile.save()
             return redirect('recruiter:recruiter_dashboard')
     else:
-        profile_form = RecruiterProfileForm()
+        profile_form = RecruiterProfileForm(instance=profile)
     return render(request, 'recruiter/recruiter_profile_create.html', {'profile_form': profile_form})
 
 @login_required
@@ -283,3 +301,48 @@ def recruiter_profile_view(request):
 
     profile = get_object_or_404(RecruiterProfile, user=request.user)
     return render(request, 'recruiter/recruiter_profile_view.html', {'profile': profile})
+
+
+CANDIDATES_PER_PAGE = 25
+
+
+@login_required
+def candidate_search(request):
+    """
+    Lets recruiters discover applicants by keywords and required skills.
+
+    Matching ids come from the candidate inverted index and the profiles are
+    rendered from cached snapshots.
+
+    Args:
+        request (django.http.HttpRequest): HttpRequest object.
+
+    Returns:
+        django.http.HttpResponse: HttpResponse object.
+    """
+    if not get_roles(request).is_recruiter:
+        return redirect('recruiter:recruiter_profile_create')
+
+    query = request.GET.get('q', '').strip()
+    skill_ids = sorted({int(value) for value in request.GET.getlist('skills') if value.isdigit()})
+    page = request.GET.get('page', '1')
+    page = max(int(page), 1) if page.isdigit() else 1
+
+    ids = search_candidates(query, skill_ids, limit=CANDIDATES_PER_PAGE + 1, offset=(page - 1) * CANDIDATES_PER_PAGE)
+    has_next = len(ids) > CANDIDATES_PER_PAGE
+    ids = ids[:CANDIDATES_PER_PAGE]
+    snapshots = get_profile_snapshots(ids)
+
+    params = request.GET.copy()
+    params.pop('page', None)
+    context = {
+        'query': query,
+        'skills': Skill.objects.order_by('name'),
+        'selected_skills': skill_ids,
+        'searched': bool(query or skill_ids),
+        'candidates': [snapshots[pk] for pk in ids if pk in snapshots],
+        'page': page,
+        'has_next': has_next,
+        'base_query': params.urlencode(),
+    }
+    return render(request, 'recruiter/candidate_search.html', context)